@@ -30,56 +30,85 @@ Design Principles:
 Version: 1.0 (ARCH-032)
 """
 
+from __future__ import annotations
+
 import argparse
-import asyncio
+import atexit
+import importlib
 import json
 import logging
 import os
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 # Add project root to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
-from dotenv import load_dotenv  # noqa: E402
+# Only stdlib is imported up front: each subcommand imports what it uses, so
+# `task`, `trace` and `metrics` start without loading the kernel, the LLM
+# providers or the config stack (see tests/performance/test_cli_import_time.py).
+if TYPE_CHECKING:
+    import asyncio
+
+    from vibe_core.kernel import VibeKernel
+    from vibe_core.metrics import MetricsFileExporter
+    from vibe_core.store.retention import RetentionPolicy
+
+# Names this module used to import eagerly, resolved on first attribute access
+_LAZY_IMPORTS = {
+    "load_dotenv": "dotenv",
+    "compose_steward_prompt": "apps.agency.prompts",
+    "CodingSpecialist": "apps.agency.specialists",
+    "PlanningSpecialist": "apps.agency.specialists",
+    "TestingSpecialist": "apps.agency.specialists",
+    "SimpleLLMAgent": "vibe_core.agents.llm_agent",
+    "SpecialistFactoryAgent": "vibe_core.agents.specialist_factory",
+    "SystemMaintenanceAgent": "vibe_core.agents.system_maintenance",
+    "InvariantChecker": "vibe_core.governance",
+    "SystemIntrospector": "vibe_core.introspection",
+    "VibeKernel": "vibe_core.kernel",
+    "ChainProvider": "vibe_core.llm",
+    "StewardProvider": "vibe_core.llm",
+    "GoogleProvider": "vibe_core.llm.google_adapter",
+    "SmartLocalProvider": "vibe_core.llm.smart_local_provider",
+    "ToolSafetyGuard": "vibe_core.runtime.tool_safety_guard",
+    "Task": "vibe_core.scheduling",
+    "AddTaskTool": "vibe_core.tools",
+    "CompleteTaskTool": "vibe_core.tools",
+    "DelegateTool": "vibe_core.tools",
+    "ListTasksTool": "vibe_core.tools",
+    "ReadFileTool": "vibe_core.tools",
+    "ToolRegistry": "vibe_core.tools",
+    "WriteFileTool": "vibe_core.tools",
+    "InspectResultTool": "vibe_core.tools.inspect_result",
+    "ListDirectoryTool": "vibe_core.tools.list_directory",
+    "SearchFileTool": "vibe_core.tools.search_file",
+    "get_config": "vibe_core.config",
+    "KernelOracle": "vibe_core.runtime.oracle",
+    "get_prompt_context": "vibe_core.runtime.prompt_context",
+    "InterfaceManager": "vibe_core.runtime.interface",
+    "InterfaceMode": "vibe_core.runtime.interface",
+    "MetricsFileExporter": "vibe_core.metrics",
+    "DEFAULT_HOT_DAYS": "vibe_core.store.retention",
+    "RetentionPolicy": "vibe_core.store.retention",
+    "JsonlSpanSink": "vibe_core.tracing",
+    "SQLiteSpanSink": "vibe_core.tracing",
+    "format_trace": "vibe_core.tracing",
+    "get_tracer": "vibe_core.tracing",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: keep `cli.VibeKernel` & co. importable without loading them at startup."""
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
 
-# Import Specialists (ARCH-036: Crew Assembly)
-from apps.agency.prompts import compose_steward_prompt  # noqa: E402
-from apps.agency.specialists import (  # noqa: E402
-    CodingSpecialist,
-    PlanningSpecialist,
-    TestingSpecialist,
-)
-from vibe_core.agents.llm_agent import SimpleLLMAgent  # noqa: E402
-from vibe_core.agents.specialist_factory import SpecialistFactoryAgent  # noqa: E402
-from vibe_core.agents.system_maintenance import SystemMaintenanceAgent  # noqa: E402
-from vibe_core.governance import InvariantChecker  # noqa: E402
-from vibe_core.introspection import SystemIntrospector  # noqa: E402
-from vibe_core.kernel import VibeKernel  # noqa: E402
-from vibe_core.llm import ChainProvider, StewardProvider  # noqa: E402
-from vibe_core.llm.google_adapter import GoogleProvider  # noqa: E402
-from vibe_core.llm.smart_local_provider import (  # noqa: E402
-    SmartLocalProvider,  # Offline orchestration (ARCH-041)
-)
-from vibe_core.runtime.tool_safety_guard import ToolSafetyGuard  # noqa: E402
-from vibe_core.scheduling import Task  # noqa: E402
-from vibe_core.tools import (  # noqa: E402
-    AddTaskTool,
-    CompleteTaskTool,
-    DelegateTool,
-    ListTasksTool,
-    ReadFileTool,
-    ToolRegistry,
-    WriteFileTool,
-)
-from vibe_core.tools.inspect_result import InspectResultTool  # noqa: E402
-from vibe_core.tools.list_directory import ListDirectoryTool  # noqa: E402
-from vibe_core.tools.search_file import SearchFileTool  # noqa: E402
-from vibe_core.config import get_config  # noqa: E402
-from vibe_core.runtime.oracle import KernelOracle  # noqa: E402
-from vibe_core.runtime.prompt_context import get_prompt_context  # noqa: E402
-from vibe_core.runtime.interface import InterfaceManager, InterfaceMode  # noqa: E402, ARCH-065
 
 # Setup logging
 logging.basicConfig(
@@ -89,6 +118,106 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def resolve_ledger_path() -> str:
+    """
+    Resolve the kernel ledger database path (ARCH-063).
+
+    Uses the Phoenix config data directory, falling back to LEDGER_DB_PATH
+    or data/vibe.db under the project root.
+    """
+    try:
+        from vibe_core.config import get_config
+
+        config = get_config()
+        return str(PROJECT_ROOT / config.paths.data_dir / "vibe.db")
+    except Exception:
+        # Fallback to environment or relative path
+        return os.getenv("LEDGER_DB_PATH", str(PROJECT_ROOT / "data" / "vibe.db"))
+
+
+def resolve_trace_db_path(ledger_path: str | None = None) -> Path:
+    """Span database path: VIBE_TRACE_DB, or traces.db next to the ledger."""
+    env_path = os.getenv("VIBE_TRACE_DB")
+    if env_path:
+        return Path(env_path)
+    return Path(ledger_path or resolve_ledger_path()).parent / "traces.db"
+
+
+def configure_trace_sinks(ledger_path: str) -> None:
+    """
+    Attach persistent span sinks to the process-wide tracer.
+
+    Spans always go to the in-memory ring buffer. They are also written to
+    the SQLite span database, and to a JSONL file if VIBE_TRACE_JSONL is set.
+    VIBE_TRACE=0 disables tracing.
+    """
+    from vibe_core.tracing import JsonlSpanSink, SQLiteSpanSink, get_tracer
+
+    tracer = get_tracer()
+    if os.getenv("VIBE_TRACE", "1") == "0":
+        tracer.enabled = False
+        logger.info("   - Tracing disabled (VIBE_TRACE=0)")
+        return
+    if any(isinstance(sink, SQLiteSpanSink) for sink in tracer.sinks):
+        return  # Idempotent boot
+
+    try:
+        tracer.add_sink(SQLiteSpanSink(resolve_trace_db_path(ledger_path)))
+        jsonl_path = os.getenv("VIBE_TRACE_JSONL")
+        if jsonl_path:
+            tracer.add_sink(JsonlSpanSink(jsonl_path))
+        logger.info("   - Tracing enabled (spans persisted)")
+    except Exception as e:
+        logger.warning(f"   - Tracing sinks unavailable, using ring buffer only: {e}")
+
+
+def resolve_metrics_path(ledger_path: str | None = None) -> Path:
+    """Metrics snapshot path: VIBE_METRICS_FILE, or metrics.prom next to the ledger."""
+    env_path = os.getenv("VIBE_METRICS_FILE")
+    if env_path:
+        return Path(env_path)
+    return Path(ledger_path or resolve_ledger_path()).parent / "metrics.prom"
+
+
+def resolve_retention_policy() -> RetentionPolicy | None:
+    """
+    Ledger retention from VIBE_LEDGER_HOT_DAYS (days kept live; unset or 0 = keep all).
+
+    Opt-in: older task history is rolled into archive/ next to the ledger
+    during idle ticks and stays reachable with include_archived=True.
+    VIBE_LEDGER_CONVERT_VACUUM=1 also converts an existing ledger to
+    incremental vacuum (one full VACUUM on the first pass).
+    """
+    from vibe_core.store.retention import RetentionPolicy
+
+    hot_days = int(os.getenv("VIBE_LEDGER_HOT_DAYS", "0"))
+    if hot_days <= 0:
+        return None
+    convert = os.getenv("VIBE_LEDGER_CONVERT_VACUUM", "0") == "1"
+    return RetentionPolicy(hot_days=hot_days, convert_existing=convert)
+
+
+_metrics_exporter: MetricsFileExporter | None = None
+
+
+def configure_metrics_export(ledger_path: str) -> None:
+    """
+    Periodically write the metrics registry as Prometheus text.
+
+    The snapshot is what `vibe metrics` and the monitor's /metrics route
+    serve; a final one is written at exit. VIBE_METRICS=0 disables export.
+    """
+    from vibe_core.metrics import MetricsFileExporter
+
+    global _metrics_exporter
+    if os.getenv("VIBE_METRICS", "1") == "0" or _metrics_exporter is not None:
+        return
+    _metrics_exporter = MetricsFileExporter(resolve_metrics_path(ledger_path))
+    _metrics_exporter.start()
+    atexit.register(_metrics_exporter.stop)
+    logger.info(f"   - Metrics exported to {_metrics_exporter.path}")
+
+
 def boot_kernel():
     """
     Boot the Vibe Agency OS.
@@ -114,6 +243,36 @@ def boot_kernel():
         >>> kernel.submit(agent_id="vibe-operator", payload={"user_message": "Hello"})
         >>> kernel.tick()
     """
+    from dotenv import load_dotenv
+
+    from apps.agency.prompts import compose_steward_prompt
+    from apps.agency.specialists import CodingSpecialist, PlanningSpecialist, TestingSpecialist
+    from vibe_core.agents.llm_agent import SimpleLLMAgent
+    from vibe_core.agents.specialist_factory import SpecialistFactoryAgent
+    from vibe_core.agents.system_maintenance import SystemMaintenanceAgent
+    from vibe_core.config import get_config
+    from vibe_core.governance import InvariantChecker
+    from vibe_core.kernel import VibeKernel
+    from vibe_core.llm import ChainProvider, StewardProvider
+    from vibe_core.llm.google_adapter import GoogleProvider
+    from vibe_core.llm.smart_local_provider import (
+        SmartLocalProvider,  # Offline orchestration (ARCH-041)
+    )
+    from vibe_core.runtime.prompt_context import get_prompt_context
+    from vibe_core.runtime.tool_safety_guard import ToolSafetyGuard
+    from vibe_core.tools import (
+        AddTaskTool,
+        CompleteTaskTool,
+        DelegateTool,
+        ListTasksTool,
+        ReadFileTool,
+        ToolRegistry,
+        WriteFileTool,
+    )
+    from vibe_core.tools.inspect_result import InspectResultTool
+    from vibe_core.tools.list_directory import ListDirectoryTool
+    from vibe_core.tools.search_file import SearchFileTool
+
     logger.info("🚀 VIBE AGENCY OS - BOOT SEQUENCE INITIATED")
 
     # Step 1: Load environment configuration
@@ -236,16 +395,16 @@ def boot_kernel():
     # Step 5: Initialize Kernel (ARCH-023)
     # Note: Boot is deferred until after all agents are registered
     # ARCH-063: Use environment variable or config-based path
-    try:
-        config = get_config()
-        ledger_path = str(PROJECT_ROOT / config.paths.data_dir / "vibe.db")
-    except Exception:
-        # Fallback to environment or relative path
-        ledger_path = os.getenv("LEDGER_DB_PATH", str(PROJECT_ROOT / "data" / "vibe.db"))
+    ledger_path = resolve_ledger_path()
 
-    kernel = VibeKernel(ledger_path=ledger_path)
+    kernel = VibeKernel(ledger_path=ledger_path, retention=resolve_retention_policy())
     logger.info(f"⚡ Kernel initialized (ledger: {ledger_path})")
 
+    # Step 5.1: Persist tracing spans next to the ledger (for `vibe trace <task_id>`)
+    configure_trace_sinks(ledger_path)
+    # Step 5.2: Export metrics next to the ledger (for `vibe metrics` and the monitor)
+    configure_metrics_export(ledger_path)
+
     # Step 5.5: Register Operator Agent
     kernel.register_agent(operator_agent)
     logger.info("   - Registered operator agent")
@@ -260,7 +419,7 @@ def boot_kernel():
     #   - Factory creates fresh specialist instance per task
     #   - Specialist is task-scoped (discarded after execution)
     #
-    guard = ToolSafetyGuard()
+    guard = ToolSafetyGuard(ledger=kernel.ledger)
 
     planning_factory = SpecialistFactoryAgent(
         specialist_class=PlanningSpecialist,
@@ -364,10 +523,67 @@ def print_kernel_help(kernel: VibeKernel) -> None:
         kernel: Booted VibeKernel instance
     """
     # ARCH-064: Use KernelOracle for single source of truth
+    from vibe_core.runtime.oracle import KernelOracle
+
     oracle = KernelOracle(kernel, PROJECT_ROOT)
     print(oracle.get_help_text())
 
 
+async def _tick_inbox_tasks(kernel: VibeKernel, interval: float = 0.1):
+    """Process tasks queued by the inbox watcher while the REPL is idle."""
+    import asyncio
+
+    while True:
+        while kernel.scheduler.get_queue_status()["pending_tasks"] > 0:
+            try:
+                kernel.tick()
+            except Exception as e:
+                logger.error(f"❌ Inbox task failed: {e}")
+            await asyncio.sleep(0)
+        try:
+            kernel.tick()  # Idle tick: lets the kernel run its periodic housekeeping
+        except Exception as e:
+            logger.error(f"❌ Idle tick (housekeeping) failed: {e}")
+        await asyncio.sleep(interval)
+
+
+async def _read_line(prompt: str) -> str:
+    """
+    Read one line of user input without blocking the event loop.
+
+    input() runs in a daemon thread that hands its result back to the loop.
+    Unlike asyncio.to_thread(), nothing waits to join that thread, so
+    Ctrl+C still exits promptly while input() is blocked.
+
+    Raises:
+        EOFError: On end of input (Ctrl+D)
+    """
+    import asyncio
+
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[str] = loop.create_future()
+
+    def reader() -> None:
+        try:
+            line = input(prompt)
+        except BaseException as e:  # EOFError, or KeyboardInterrupt off the main thread
+            loop.call_soon_threadsafe(_settle, future, None, e)
+        else:
+            loop.call_soon_threadsafe(_settle, future, line, None)
+
+    threading.Thread(target=reader, name="repl-input", daemon=True).start()
+    return await future
+
+
+def _settle(future: asyncio.Future, result: str | None, error: BaseException | None) -> None:
+    if future.done():  # The REPL was cancelled (Ctrl+C) while input() was pending
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
 async def _run_interactive_repl(kernel: VibeKernel):
     """
     Run the interactive REPL loop (user input → agent → result).
@@ -379,7 +595,11 @@ async def _run_interactive_repl(kernel: VibeKernel):
         kernel: Booted VibeKernel instance
     """
     # ARCH-062: Display HUD (Heads-Up Display)
-    from vibe_core.runtime.hud import StatusBar, CapabilitiesMenu, HintSystem
+    import asyncio
+
+    from apps.agency.prompts import compose_steward_prompt
+    from vibe_core.runtime.hud import CapabilitiesMenu, HintSystem, StatusBar
+    from vibe_core.scheduling import Task
 
     print("")
     # Render status bar with user info and system state
@@ -408,10 +628,16 @@ async def _run_interactive_repl(kernel: VibeKernel):
     print("What would you like to do?")
     print("")
 
+    # GAD-006: Messages dropped into workspace/inbox/ while we run become
+    # operator tasks. They are ticked on this event loop (the kernel stays
+    # single-threaded) while the prompt waits for input in a daemon thread.
+    kernel.start_inbox_watcher("vibe-operator", PROJECT_ROOT / "workspace" / "inbox")
+    inbox_ticker = asyncio.create_task(_tick_inbox_tasks(kernel))
+
     while True:
         try:
             # Get user input
-            cmd = input("\n👤 MISSION/COMMAND: ").strip()
+            cmd = (await _read_line("\n👤 MISSION/COMMAND: ")).strip()
 
             # ARCH-063: Kernel Help Interceptor (Pre-flight check)
             # If user asks for help, bypass LLM and show kernel truth directly
@@ -465,13 +691,21 @@ async def _run_interactive_repl(kernel: VibeKernel):
             # TODO: Display agent's response (requires ledger query)
             print(f"   ↳ [Task {task_id} completed]")
 
-        except KeyboardInterrupt:
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # Under asyncio.run(), Ctrl+C cancels this coroutine instead of
+            # raising KeyboardInterrupt
             print("\n\n👋 Operator interrupted. Goodbye!")
             break
+        except EOFError:
+            print("\n👋 End of input. Goodbye!")
+            break
         except Exception as e:
             logger.error(f"❌ Error: {e}", exc_info=True)
             print(f"   ↳ Error: {e}")
 
+    inbox_ticker.cancel()
+    kernel.shutdown()  # Stops the inbox watcher
+
 
 async def run_interactive(kernel: VibeKernel):
     """
@@ -503,6 +737,8 @@ async def run_interactive(kernel: VibeKernel):
         kernel: Booted VibeKernel instance
     """
     # ARCH-065: Detect interface mode
+    from vibe_core.runtime.interface import InterfaceManager, InterfaceMode
+
     mode = InterfaceManager.detect_mode()
 
     if mode == InterfaceMode.INTERACTIVE:
@@ -623,6 +859,8 @@ def handle_task_command(command: str, args_list: list[str] | None = None):
         >>> handle_task_command('list', ['pending'])
         >>> handle_task_command('complete', ['Fix Phoenix Config'])
     """
+    from vibe_core.tools.agenda_tools import AddTaskTool, CompleteTaskTool, ListTasksTool
+
     if args_list is None:
         args_list = []
 
@@ -679,6 +917,72 @@ def handle_task_command(command: str, args_list: list[str] | None = None):
         print(f"❌ Error: {e}")
 
 
+def display_trace(task_id: str, json_format: bool = False) -> int:
+    """
+    Show where a task spent its time (flame-style span breakdown).
+
+    Reads the span database written by the kernel (see configure_trace_sinks).
+    Works for top-level tasks and for tasks delegated from inside another task.
+
+    Args:
+        task_id: Task whose trace to display
+        json_format: Print the raw spans as JSON instead
+
+    Returns:
+        int: Exit code (0 = trace found, 1 = no spans recorded)
+    """
+    from vibe_core.tracing import SQLiteSpanSink, format_trace
+
+    trace_db = resolve_trace_db_path()
+    spans = []
+    if trace_db.exists():
+        sink = SQLiteSpanSink(trace_db)
+        try:
+            spans = sink.read_trace(task_id)
+        finally:
+            sink.close()
+
+    if json_format:
+        print(json.dumps([sp.to_dict() for sp in spans], indent=2, default=str))
+        return 0 if spans else 1
+
+    if not spans:
+        print(f"❌ No spans recorded for task {task_id} (span db: {trace_db})")
+        return 1
+
+    print(format_trace(spans))
+    return 0
+
+
+def display_metrics(json_format: bool = False) -> int:
+    """
+    Print the latest metrics snapshot (Prometheus text) written by the kernel.
+
+    Args:
+        json_format: Wrap the snapshot in JSON with its path and age
+
+    Returns:
+        int: Exit code (0 = snapshot found, 1 = no snapshot written yet)
+    """
+    metrics_path = resolve_metrics_path()
+    if not metrics_path.exists():
+        print(f"❌ No metrics snapshot yet (expected at {metrics_path}; boot the kernel first)")
+        return 1
+
+    exposition = metrics_path.read_text(encoding="utf-8")
+    if json_format:
+        age = time.time() - metrics_path.stat().st_mtime
+        print(
+            json.dumps(
+                {"path": str(metrics_path), "age_seconds": round(age, 1), "exposition": exposition},
+                indent=2,
+            )
+        )
+    else:
+        print(exposition, end="")
+    return 0
+
+
 def display_snapshot(kernel: VibeKernel, json_format: bool = False, write_file: bool = False):
     """
     Display system introspection snapshot (ARCH-038).
@@ -694,6 +998,8 @@ def display_snapshot(kernel: VibeKernel, json_format: bool = False, write_file:
         >>> kernel = boot_kernel()
         >>> display_snapshot(kernel, json_format=False, write_file=True)
     """
+    from vibe_core.introspection import SystemIntrospector
+
     introspector = SystemIntrospector(kernel)
 
     # Generate snapshot in requested format
@@ -749,6 +1055,10 @@ async def run_mission(kernel: VibeKernel, mission: str):
     print(f"Mission: {mission}")
     print("")
 
+    import asyncio
+
+    from vibe_core.scheduling import Task
+
     # Submit mission
     task = Task(agent_id="vibe-operator", payload={"user_message": mission})
     task_id = kernel.submit(task)
@@ -793,7 +1103,9 @@ def main():
         "  Interactive mode:  python apps/agency/cli.py\n"
         "  Mission mode:      python apps/agency/cli.py --mission 'Write a report'\n"
         "  Status check:      python apps/agency/cli.py --status [--json]\n"
-        "  System snapshot:   python apps/agency/cli.py --snapshot [--json] [--snapshot-file]\n",
+        "  System snapshot:   python apps/agency/cli.py --snapshot [--json] [--snapshot-file]\n"
+        "  Task trace:        python apps/agency/cli.py trace <task_id> [--json]\n"
+        "  Metrics:           python apps/agency/cli.py metrics [--json]\n",
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -828,11 +1140,11 @@ def main():
         help="Write snapshot to file (use with --snapshot)",
     )
 
-    # Task management subcommand (ARCH-045)
+    # Task management (ARCH-045), trace and metrics subcommands
     parser.add_argument(
         "task_command",
         nargs="?",
-        help="Task management command (task add|list|complete)",
+        help="Subcommand: task add|list|complete, trace <task_id>, or metrics",
     )
 
     parser.add_argument(
@@ -856,6 +1168,17 @@ def main():
             print("❌ Usage: task add|list|complete [args...]")
             return 1
 
+    # Trace breakdown of a task (reads the span db) - doesn't require kernel boot
+    if args.task_command == "trace":
+        if not args.task_args:
+            print("❌ Usage: trace <task_id> [--json]")
+            return 1
+        return display_trace(args.task_args[0], json_format=args.json)
+
+    # Latest metrics snapshot (Prometheus text) - doesn't require kernel boot
+    if args.task_command == "metrics":
+        return display_metrics(json_format=args.json)
+
     # Boot the system
     try:
         kernel = boot_kernel()
@@ -866,6 +1189,8 @@ def main():
         print("\n   Check logs for details.")
         return 1
 
+    import asyncio
+
     # Run appropriate mode
     try:
         if args.snapshot:
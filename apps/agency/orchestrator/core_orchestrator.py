@@ -29,7 +29,7 @@ import xml.etree.ElementTree as ET
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
@@ -38,6 +38,9 @@ from vibe_core.store.sqlite_store import SQLiteStore
 
 from .types import PlanningSubState, ProjectPhase
 
+if TYPE_CHECKING:
+    from vibe_core.ledger import VibeLedger
+
 # Initialize logger BEFORE using it
 logger = logging.getLogger(__name__)
 
@@ -265,6 +268,7 @@ class CoreOrchestrator:
         workflow_yaml: str = "apps/agency/orchestrator/state_machine/ORCHESTRATION_workflow_design.yaml",
         contracts_yaml: str = "apps/agency/orchestrator/contracts/ORCHESTRATION_data_contracts.yaml",
         execution_mode: str = "delegated",
+        ledger: "VibeLedger | None" = None,
     ):
         """
         Initialize core orchestrator.
@@ -274,6 +278,7 @@ class CoreOrchestrator:
             workflow_yaml: Path to workflow YAML (relative to repo_root)
             contracts_yaml: Path to contracts YAML (relative to repo_root)
             execution_mode: Execution mode - "delegated" (default, Claude Code integration) or "autonomous" (legacy)
+            ledger: Kernel ledger receiving Tool Safety Guard violations (optional)
         """
         self.repo_root = Path(repo_root)
         self.workflow_yaml_path = self.repo_root / workflow_yaml
@@ -322,7 +327,7 @@ class CoreOrchestrator:
         # Initialize Tool Safety Guard (ARCH-006: Required for specialists)
         from vibe_core.runtime.tool_safety_guard import ToolSafetyGuard
 
-        self.tool_safety_guard = ToolSafetyGuard()
+        self.tool_safety_guard = ToolSafetyGuard(ledger=ledger)
         logger.info("✅ Tool Safety Guard initialized")
 
         # ARCH-009: Initialize Agent Registry (HAP pattern)
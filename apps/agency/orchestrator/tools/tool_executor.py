@@ -34,7 +34,7 @@ class ToolExecutor:
     - GAD-509: Iron Dome prevents process-level "AI slop"
     """
 
-    def __init__(self, enable_iron_dome: bool = True, enable_soul: bool = True):
+    def __init__(self, enable_iron_dome: bool = True, enable_soul: bool = True, ledger=None):
         # Lazy-load tools to avoid errors if keys aren't set
         self.tools = {}
         self._initialized = False
@@ -44,7 +44,8 @@ class ToolExecutor:
         self.enable_soul = enable_soul
 
         # Layer 2: Iron Dome - Session-based safety rules (GAD-509)
-        self.iron_dome = ToolSafetyGuard(enable_strict_mode=enable_iron_dome)
+        # Violations go to the kernel ledger (ledger=kernel.ledger) when one is given
+        self.iron_dome = ToolSafetyGuard(enable_strict_mode=enable_iron_dome, ledger=ledger)
         self.enable_iron_dome = enable_iron_dome
 
     def _ensure_tools_initialized(self):
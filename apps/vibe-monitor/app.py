@@ -4,25 +4,29 @@ Vibe Monitor - System Status Dashboard
 ========================================
 
 A web dashboard that visualizes vibe-agency system status
-by consuming ./bin/vibe status --json output.
+(the ./bin/vibe status --json payload), served from an in-process
+status service instead of a subprocess per request.
 
 This is ARCH-019: The first native artifact built by the system itself.
 
 Routes:
   GET /           - Serve the dashboard HTML
-  GET /api/status - Execute vibe status and return JSON
+  GET /api/status - Current status snapshot as JSON
+  GET /api/events - Server-Sent Events (status, task, violation)
+  GET /metrics    - Kernel metrics snapshot (Prometheus text)
 
 Usage:
   python3 app.py
   # Then visit: http://localhost:5000
 """
 
-import json
 import logging
-import subprocess
+import os
+import threading
 from pathlib import Path
 
-from flask import Flask, jsonify, render_template
+from flask import Flask, Response, jsonify, render_template, stream_with_context
+from status_service import StatusService
 
 # Setup logging
 logging.basicConfig(
@@ -49,6 +53,22 @@ def get_repo_root():
     return Path(__file__).parent.parent.parent
 
 
+_status_service: StatusService | None = None
+_status_service_lock = threading.Lock()
+
+
+def get_status_service() -> StatusService:
+    """Get the process-wide status service, starting it on first use."""
+    global _status_service
+    with _status_service_lock:
+        if _status_service is None:
+            repo_root = get_repo_root()
+            ledger_path = os.getenv("LEDGER_DB_PATH", str(repo_root / "data" / "vibe.db"))
+            _status_service = StatusService(repo_root, ledger_path=ledger_path)
+            _status_service.start()
+        return _status_service
+
+
 @app.route("/")
 def index():
     """Serve the dashboard HTML."""
@@ -58,85 +78,24 @@ def index():
 @app.route("/api/status")
 def api_status():
     """
-    Execute './bin/vibe status --json' and return the parsed JSON.
+    Return the current system status (same JSON as './bin/vibe status --json').
+
+    Served from the status service's in-memory snapshot, which is refreshed
+    in the background when git, playbooks, environment or ledger change.
 
     Returns:
         JSON response with system status
 
     Error handling:
-        - Subprocess errors: Return 500 with error details
-        - JSON parse errors: Return 500 with error details
+        - vibe command missing: Return 500 with error details
+        - Unexpected errors: Return 500 with error details
     """
     try:
-        # Get repository root
-        repo_root = get_repo_root()
-        vibe_cmd = repo_root / "bin" / "vibe"
-
-        # Check if vibe command exists
-        if not vibe_cmd.exists():
-            logger.error(f"vibe command not found: {vibe_cmd}")
-            return (
-                jsonify({"error": "vibe command not found", "details": f"Expected at: {vibe_cmd}"}),
-                500,
-            )
-
-        # Execute: ./bin/vibe status --json
-        logger.info(f"Executing: {vibe_cmd} status --json")
-        result = subprocess.run(
-            ["python3", str(vibe_cmd), "status", "--json"],
-            cwd=repo_root,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
+        return jsonify(get_status_service().snapshot())
 
-        # Check for subprocess errors
-        if result.returncode != 0:
-            logger.error(f"vibe command failed with code {result.returncode}")
-            logger.error(f"stderr: {result.stderr}")
-            return (
-                jsonify(
-                    {
-                        "error": "vibe command execution failed",
-                        "return_code": result.returncode,
-                        "stderr": result.stderr,
-                        "stdout": result.stdout,
-                    }
-                ),
-                500,
-            )
-
-        # Parse JSON output
-        try:
-            status_data = json.loads(result.stdout)
-            logger.info("Successfully parsed vibe status JSON")
-            return jsonify(status_data)
-
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON: {e}")
-            logger.error(f"stdout: {result.stdout}")
-            return (
-                jsonify(
-                    {
-                        "error": "Failed to parse vibe status JSON",
-                        "details": str(e),
-                        "raw_output": result.stdout,
-                    }
-                ),
-                500,
-            )
-
-    except subprocess.TimeoutExpired:
-        logger.error("vibe command timed out")
-        return (
-            jsonify(
-                {
-                    "error": "vibe command timed out (10s)",
-                    "details": "The command took too long to execute",
-                }
-            ),
-            500,
-        )
+    except FileNotFoundError as e:
+        logger.error(str(e))
+        return jsonify({"error": "vibe command not found", "details": str(e)}), 500
 
     except Exception as e:
         logger.exception("Unexpected error in /api/status")
@@ -148,6 +107,42 @@ def api_status():
         )
 
 
+@app.route("/api/events")
+def api_events():
+    """
+    Server-Sent Events stream of status and ledger events.
+
+    Events:
+        status    - Full status snapshot (sent on connect and on change)
+        task      - Task row written to the ledger (task_id, agent_id, status, ...)
+        violation - Safety violation recorded by ToolSafetyGuard
+    """
+    return Response(
+        stream_with_context(get_status_service().stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.route("/metrics")
+def metrics():
+    """
+    Serve the kernel's latest metrics snapshot in Prometheus text format.
+
+    The kernel runs in the CLI process and writes metrics.prom next to the
+    ledger (or VIBE_METRICS_FILE); this route serves that file as-is.
+    """
+    repo_root = get_repo_root()
+    ledger_path = Path(os.getenv("LEDGER_DB_PATH", str(repo_root / "data" / "vibe.db")))
+    metrics_path = Path(os.getenv("VIBE_METRICS_FILE") or ledger_path.parent / "metrics.prom")
+    if not metrics_path.exists():
+        return Response("# no metrics snapshot yet\n", status=503, mimetype="text/plain")
+    return Response(
+        metrics_path.read_text(encoding="utf-8"),
+        content_type="text/plain; version=0.0.4; charset=utf-8",
+    )
+
+
 @app.route("/health")
 def health():
     """Health check endpoint."""
@@ -166,4 +161,4 @@ if __name__ == "__main__":
     logger.info("=" * 70)
 
     # Run Flask server
-    app.run(host="0.0.0.0", port=5000, debug=False)
+    app.run(host="0.0.0.0", port=5000, debug=False, threaded=True)
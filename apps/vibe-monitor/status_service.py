@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Vibe Monitor - In-Process Status Service
+========================================
+
+Keeps one long-lived status snapshot for the dashboard instead of booting
+`./bin/vibe status --json` in a subprocess on every HTTP request.
+
+- StatusService computes the status once (same code path as
+  `vibe status --json`, loaded in-process) and recomputes it from a
+  background thread only when a cheap fingerprint changes (git HEAD/index,
+  playbooks, .venv, provider env keys, ledger file) or the snapshot is
+  older than max_age.
+- A read-only view of the kernel ledger is tailed by rowid; new task rows
+  and safety violations are published as events.
+- EventBroker fans events out to subscribers (one bounded queue each), which
+  app.py streams as Server-Sent Events on /api/events.
+
+Framework-free: no Flask import, so the service can be tested and reused
+without the web layer.
+
+Usage:
+    service = StatusService(repo_root, ledger_path=repo_root / "data" / "vibe.db")
+    service.start()
+    service.snapshot()            # dict, served from memory
+    for chunk in service.stream():
+        ...                       # "event: task\\ndata: {...}\\n\\n"
+"""
+
+import hashlib
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 1.0  # Seconds between fingerprint / ledger checks
+MAX_SNAPSHOT_AGE = 30.0  # Recompute at least this often (catches working tree edits)
+KEEPALIVE_INTERVAL = 15.0  # SSE comment interval so proxies keep the stream open
+SUBSCRIBER_QUEUE_SIZE = 100
+LEDGER_TAIL_BATCH = 500
+
+# Provider keys read by `vibe status` (ARCH-035)
+PROVIDER_ENV_KEYS = ("GOOGLE_API_KEY", "ANTHROPIC_API_KEY", "OPENAI_API_KEY")
+
+
+# ============================================================================
+# EVENTS
+# ============================================================================
+
+
+class EventBroker:
+    """Fan-out of (event_type, data) to subscriber queues."""
+
+    def __init__(self, max_queued: int = SUBSCRIBER_QUEUE_SIZE):
+        self.max_queued = max_queued
+        self._subscribers: set[queue.Queue] = set()
+        self._lock = threading.Lock()
+        self._next_id = 0
+
+    def subscribe(self) -> queue.Queue:
+        q: queue.Queue = queue.Queue(maxsize=self.max_queued)
+        with self._lock:
+            self._subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q: queue.Queue) -> None:
+        with self._lock:
+            self._subscribers.discard(q)
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def publish(self, event_type: str, data: Any) -> int:
+        """
+        Deliver an event to every subscriber.
+
+        A slow subscriber never blocks the publisher: when its queue is full
+        the oldest queued event is dropped.
+
+        Returns:
+            Event id
+        """
+        with self._lock:
+            self._next_id += 1
+            event = (self._next_id, event_type, data)
+            for q in self._subscribers:
+                while True:
+                    try:
+                        q.put_nowait(event)
+                        break
+                    except queue.Full:
+                        try:
+                            q.get_nowait()
+                        except queue.Empty:
+                            pass
+            return self._next_id
+
+
+def format_sse(event_type: str, data: Any, event_id: int | None = None) -> str:
+    """Encode one Server-Sent Events message."""
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event_type}")
+    payload = json.dumps(data, default=str)
+    lines.extend(f"data: {line}" for line in payload.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+# ============================================================================
+# STATUS SOURCE
+# ============================================================================
+
+
+def load_status_source(repo_root: Path) -> Callable[[], dict]:
+    """
+    Load `bin/vibe` in-process and return its status function.
+
+    This is the same code `./bin/vibe status --json` runs, without the
+    interpreter boot per call.
+    """
+    vibe_cmd = Path(repo_root) / "bin" / "vibe"
+    if not vibe_cmd.exists():
+        raise FileNotFoundError(f"vibe command not found: {vibe_cmd}")
+
+    loader = importlib.machinery.SourceFileLoader("vibe_monitor_cli", str(vibe_cmd))
+    spec = importlib.util.spec_from_loader(loader.name, loader)
+    module = importlib.util.module_from_spec(spec)
+    loader.exec_module(module)
+    return module.VibeWrapper()._get_system_status
+
+
+# ============================================================================
+# STATUS SERVICE
+# ============================================================================
+
+
+class StatusService:
+    """Cached status snapshot plus a ledger event feed."""
+
+    def __init__(
+        self,
+        repo_root: Path | str,
+        ledger_path: Path | str | None = None,
+        status_source: Callable[[], dict] | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        max_age: float = MAX_SNAPSHOT_AGE,
+    ):
+        """
+        Args:
+            repo_root: Repository root (git, playbooks, .venv are checked here)
+            ledger_path: Kernel ledger SQLite file (opened read-only; may not exist yet)
+            status_source: Callable returning the status dict
+                           (default: VibeWrapper from bin/vibe, loaded lazily)
+            poll_interval: Seconds between background checks
+            max_age: Seconds after which the snapshot is recomputed regardless
+        """
+        self.repo_root = Path(repo_root)
+        self.ledger_path = Path(ledger_path) if ledger_path else None
+        self.poll_interval = poll_interval
+        self.max_age = max_age
+        self.broker = EventBroker()
+
+        self._status_source = status_source
+        self._lock = threading.Lock()
+        self._snapshot: dict[str, Any] | None = None
+        self._snapshot_at = 0.0
+        self._fingerprint: tuple | None = None
+        self._refreshes = 0
+
+        self._ledger: sqlite3.Connection | None = None
+        self._ledger_lock = threading.Lock()
+        self._task_cursor = 0  # Last seen task_history rowid
+        self._violation_cursor = 0  # Last seen safety_violations id
+
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    # Lifecycle -----------------------------------------------------------
+    def start(self) -> None:
+        """Start the background refresh thread (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vibe-monitor-status", daemon=True)
+        self._thread.start()
+        logger.info(f"📡 Status service started (poll every {self.poll_interval}s)")
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+        with self._ledger_lock:
+            if self._ledger:
+                self._ledger.close()
+                self._ledger = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll_once()
+            except Exception as e:
+                logger.warning(f"⚠️  Status refresh failed: {e}")
+            self._stop.wait(self.poll_interval)
+
+    # Snapshot ------------------------------------------------------------
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Current status snapshot.
+
+        Served from memory; computed synchronously only on first use.
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._refresh_locked(self._compute_fingerprint())
+            return self._snapshot
+
+    def poll_once(self) -> bool:
+        """
+        One background check: refresh the snapshot if inputs changed and
+        publish new ledger rows.
+
+        Returns:
+            True if the snapshot was recomputed
+        """
+        self._tail_ledger()
+
+        fingerprint = self._compute_fingerprint()
+        with self._lock:
+            stale = time.monotonic() - self._snapshot_at >= self.max_age
+            if self._snapshot is not None and fingerprint == self._fingerprint and not stale:
+                return False
+            previous = self._snapshot
+            self._refresh_locked(fingerprint)
+            snapshot = self._snapshot
+
+        if previous is None or _without_timestamp(previous) != _without_timestamp(snapshot):
+            self.broker.publish("status", snapshot)
+        return True
+
+    def _refresh_locked(self, fingerprint: tuple) -> None:
+        if self._status_source is None:
+            self._status_source = load_status_source(self.repo_root)
+        try:
+            status = dict(self._status_source())
+        except Exception as e:
+            logger.exception("Status computation failed")
+            status = {
+                "status": "degraded",
+                "timestamp": datetime.now().isoformat(),
+                "health": {},
+                "cartridges": [],
+                "errors": [f"Status computation failed: {e}"],
+                "next_actions": [],
+            }
+        status["ledger"] = self._ledger_summary()
+        self._snapshot = status
+        self._snapshot_at = time.monotonic()
+        self._fingerprint = fingerprint
+        self._refreshes += 1
+
+    def _compute_fingerprint(self) -> tuple:
+        """Cheap stat-based key over everything `vibe status` reads."""
+        paths = [
+            self.repo_root / ".git" / "HEAD",
+            self.repo_root / ".git" / "index",
+            self.repo_root / "playbooks" / "presets",
+            self.repo_root / ".venv",
+        ]
+        if self.ledger_path:
+            paths.append(self.ledger_path)
+        env = hashlib.sha256(
+            "\0".join(os.environ.get(key, "") for key in PROVIDER_ENV_KEYS).encode()
+        ).hexdigest()
+        return (*(_stat_key(p) for p in paths), env)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "refreshes": self._refreshes,
+            "snapshot_age_seconds": round(time.monotonic() - self._snapshot_at, 3)
+            if self._snapshot is not None
+            else None,
+            "subscribers": self.broker.subscriber_count,
+        }
+
+    # Ledger read view ----------------------------------------------------
+    def _ledger_conn(self) -> sqlite3.Connection | None:
+        """Read-only ledger connection, opened once the file exists."""
+        if self._ledger is not None:
+            return self._ledger
+        if not self.ledger_path or not self.ledger_path.exists():
+            return None
+        conn = sqlite3.connect(
+            f"file:{self.ledger_path}?mode=ro", uri=True, check_same_thread=False
+        )
+        conn.row_factory = sqlite3.Row
+        self._ledger = conn
+        # Start from the current end: the stream carries new events, not history
+        self._task_cursor = self._max_id(conn, "SELECT MAX(rowid) FROM task_history")
+        self._violation_cursor = self._max_id(conn, "SELECT MAX(id) FROM safety_violations")
+        return conn
+
+    @staticmethod
+    def _max_id(conn: sqlite3.Connection, sql: str) -> int:
+        try:
+            return conn.execute(sql).fetchone()[0] or 0
+        except sqlite3.OperationalError:  # Table not created yet
+            return 0
+
+    def _tail_ledger(self) -> int:
+        """
+        Publish task rows and safety violations written since the last poll.
+
+        task_history is written with INSERT OR REPLACE, so a task's state
+        change gets a new rowid; each poll publishes the latest state of every
+        task that changed since the previous one.
+
+        Returns:
+            Number of events published
+        """
+        with self._ledger_lock:
+            conn = self._ledger_conn()
+            if conn is None:
+                return 0
+            task_rows, violation_rows = self._new_ledger_rows(conn)
+
+        published = 0
+        for row in task_rows:
+            event = dict(row)
+            del event["seq"]
+            self.broker.publish("task", event)
+            published += 1
+        for row in violation_rows:
+            self.broker.publish("violation", dict(row))
+            published += 1
+        return published
+
+    def _new_ledger_rows(self, conn: sqlite3.Connection) -> tuple[list, list]:
+        try:
+            task_rows = conn.execute(
+                "SELECT rowid AS seq, task_id, agent_id, status, error_message, timestamp "
+                "FROM task_history WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                (self._task_cursor, LEDGER_TAIL_BATCH),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            task_rows = []
+        if task_rows:
+            self._task_cursor = task_rows[-1]["seq"]
+
+        try:
+            violation_rows = conn.execute(
+                "SELECT id, rule, severity, tool_name, message, timestamp "
+                "FROM safety_violations WHERE id > ? ORDER BY id LIMIT ?",
+                (self._violation_cursor, LEDGER_TAIL_BATCH),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            violation_rows = []
+        if violation_rows:
+            self._violation_cursor = violation_rows[-1]["id"]
+        return task_rows, violation_rows
+
+    def _ledger_summary(self) -> dict[str, Any]:
+        with self._ledger_lock:
+            conn = self._ledger_conn()
+            if conn is None:
+                return {"available": False}
+            try:
+                by_status = {
+                    row["status"]: row["count"]
+                    for row in conn.execute(
+                        "SELECT status, COUNT(*) AS count FROM task_history GROUP BY status"
+                    )
+                }
+            except sqlite3.OperationalError:
+                by_status = {}
+        return {
+            "available": True,
+            "total_tasks": sum(by_status.values()),
+            "by_status": by_status,
+        }
+
+    # SSE -----------------------------------------------------------------
+    def stream(
+        self, keepalive: float = KEEPALIVE_INTERVAL, max_events: int | None = None
+    ) -> Iterator[str]:
+        """
+        Server-Sent Events for one client.
+
+        The first message is the current snapshot ("status"); after that the
+        client receives "status", "task" and "violation" events as they
+        happen, plus comment lines every keepalive seconds.
+
+        Args:
+            keepalive: Seconds of silence before a keepalive comment
+            max_events: Stop after this many events (None = until disconnect)
+        """
+        q = self.broker.subscribe()
+        try:
+            yield format_sse("status", self.snapshot())
+            sent = 1
+            while max_events is None or sent < max_events:
+                try:
+                    event_id, event_type, data = q.get(timeout=keepalive)
+                except queue.Empty:
+                    yield ": keepalive\n\n"
+                    continue
+                yield format_sse(event_type, data, event_id)
+                sent += 1
+        finally:
+            self.broker.unsubscribe(q)
+
+
+def _stat_key(path: Path) -> tuple | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _without_timestamp(status: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in status.items() if k != "timestamp"}
+
+
+__all__ = ["EventBroker", "StatusService", "format_sse", "load_status_source"]
@@ -19,9 +19,14 @@ Part of: GAD-005-ADDITION Layer 0 (System Integrity Verification)
 
 import hashlib
 import json
+import mmap
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 
+MAX_HASH_WORKERS = 8
+
 # Critical files to include in integrity manifest
 # Format: (file_path, purpose, critical_flag)
 CRITICAL_FILES = {
@@ -75,8 +80,10 @@ def calculate_sha256(file_path: str) -> str:
     """
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        if os.fstat(f.fileno()).st_size == 0:
+            return sha256_hash.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            sha256_hash.update(mapped)
     return sha256_hash.hexdigest()
 
 
@@ -101,17 +108,26 @@ def generate_manifest(
         "trustedBaseline": {},
     }
 
+    # Always a full hash (this is the trusted baseline), but in parallel
+    present = [
+        file_path
+        for files in CRITICAL_FILES.values()
+        for file_path, _, _ in files
+        if Path(file_path).exists()
+    ]
+    with ThreadPoolExecutor(max_workers=MAX_HASH_WORKERS) as pool:
+        checksums = dict(zip(present, pool.map(calculate_sha256, present), strict=True))
+
     for category, files in CRITICAL_FILES.items():
         manifest["trustedBaseline"][category] = {}
 
         for file_path, purpose, critical in files:
             # Check file exists
-            if not Path(file_path).exists():
+            if file_path not in checksums:
                 print(f"⚠️  WARNING: {file_path} not found - skipping")
                 continue
 
-            # Calculate checksum
-            checksum = calculate_sha256(file_path)
+            checksum = checksums[file_path]
 
             # Add to manifest
             file_name = Path(file_path).name
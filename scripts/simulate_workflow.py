@@ -214,11 +214,12 @@ def simulate_neural_link():
     print("-" * 90)
 
     execution_log = []
+    run_context = executor.prepare_run()  # Config/system context resolved once per run
     for node_id in ["analyze_logs", "identify_root_cause", "generate_fix", "verify_fix"]:
         selected_agent = routing_map[node_id]
         node = nodes[node_id]
 
-        result = executor.execute_step(workflow, node_id)
+        result = executor.execute_step(workflow, node_id, run_context=run_context)
         execution_log.append(
             {
                 "node_id": node_id,
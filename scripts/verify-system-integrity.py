@@ -10,7 +10,17 @@ Purpose: Ensures "Who watches the watchmen?" - validates that the
          regulatory system itself has not been tampered with.
 
 Usage:
-    python scripts/verify-system-integrity.py
+    python scripts/verify-system-integrity.py             # cached (boot path)
+    python scripts/verify-system-integrity.py --paranoid  # re-hash everything
+
+Performance:
+    Digests are cached in a sidecar file (.vibe/state/integrity_digest_cache.json)
+    keyed by path and stat (size, mtime_ns, ctime_ns, inode). Only files whose
+    stat changed are re-hashed; cold files are hashed in a thread pool with
+    mmap-backed reads (hashlib releases the GIL on large buffers). Files
+    modified within the last RACY_WINDOW_SECONDS are never cached, so an edit
+    landing in the same timestamp tick as a hash cannot hide behind the cache.
+    --paranoid ignores the cache and re-hashes every file.
 
 Returns:
     Exit 0: All checks passed (integrity verified)
@@ -19,11 +29,21 @@ Returns:
 Part of: GAD-005-ADDITION Layer 0 (System Integrity Verification)
 """
 
+import argparse
 import hashlib
 import json
+import mmap
+import os
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+DIGEST_CACHE_PATH = ".vibe/state/integrity_digest_cache.json"
+DIGEST_CACHE_VERSION = 1
+RACY_WINDOW_SECONDS = 2.0  # Files modified this recently are re-hashed every time
+MAX_HASH_WORKERS = 8
+
 
 class SystemIntegrityError(Exception):
     """Raised when system integrity check fails."""
@@ -43,24 +63,107 @@ def calculate_sha256(file_path: str) -> str:
     """
     sha256_hash = hashlib.sha256()
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
+        if os.fstat(f.fileno()).st_size == 0:
+            return sha256_hash.hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            sha256_hash.update(mapped)
     return sha256_hash.hexdigest()
 
 
+def _stat_key(st: os.stat_result) -> list[int]:
+    return [st.st_size, st.st_mtime_ns, st.st_ctime_ns, st.st_ino]
+
+
+def _load_digest_cache(cache_path: str) -> dict:
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != DIGEST_CACHE_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def _save_digest_cache(cache_path: str, files: dict) -> None:
+    """Write the cache atomically (a torn cache would just be ignored, but still)."""
+    path = Path(cache_path)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"version": DIGEST_CACHE_VERSION, "files": files}))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # Read-only checkout: verification still works, just uncached
+
+
+def calculate_digests(
+    file_paths: list[str],
+    cache_path: str | None = DIGEST_CACHE_PATH,
+    paranoid: bool = False,
+    max_workers: int = MAX_HASH_WORKERS,
+) -> tuple[dict[str, str], dict[str, int]]:
+    """
+    SHA256 of many files, re-hashing only files whose stat changed.
+
+    Args:
+        file_paths: Existing files to hash
+        cache_path: Sidecar digest cache (None: no cache)
+        paranoid: Ignore cached digests and re-hash everything
+        max_workers: Thread pool size for cold files
+
+    Returns:
+        Tuple of (digests by path, stats with 'cached' and 'hashed' counts)
+    """
+    cached = {} if cache_path is None else _load_digest_cache(cache_path)
+    stats = {path: os.stat(path) for path in file_paths}
+
+    digests: dict[str, str] = {}
+    cold: list[str] = []
+    for path in file_paths:
+        entry = cached.get(path)
+        if not paranoid and entry and entry.get("stat") == _stat_key(stats[path]):
+            digests[path] = entry["sha256"]
+        else:
+            cold.append(path)
+
+    if len(cold) > 1 and max_workers > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(cold))) as pool:
+            digests.update(zip(cold, pool.map(calculate_sha256, cold), strict=True))
+    else:
+        digests.update((path, calculate_sha256(path)) for path in cold)
+
+    if cache_path is not None and (cold or set(cached) - set(file_paths)):
+        racy_after = time.time_ns() - int(RACY_WINDOW_SECONDS * 1e9)
+        files = {
+            path: {"stat": _stat_key(stats[path]), "sha256": digests[path]}
+            for path in file_paths
+            if stats[path].st_mtime_ns < racy_after and stats[path].st_ctime_ns < racy_after
+        }
+        if files != cached:
+            _save_digest_cache(cache_path, files)
+
+    return digests, {"cached": len(file_paths) - len(cold), "hashed": len(cold)}
+
+
 def verify_system_integrity(
     manifest_path: str = ".vibe/system_integrity_manifest.json",
+    paranoid: bool = False,
+    cache_path: str | None = DIGEST_CACHE_PATH,
 ) -> tuple[bool, dict]:
     """
     Verify that all critical system files match their trusted checksums.
 
     Args:
         manifest_path: Path to system integrity manifest
+        paranoid: Re-hash every file, ignoring the digest cache
+        cache_path: Sidecar digest cache (None: no cache)
 
     Returns:
         Tuple of (success: bool, report: dict)
         - success: True if all files verified, False otherwise
-        - report: Dict with keys 'verified', 'failed', 'missing'
+        - report: Dict with keys 'verified', 'failed', 'missing',
+          and 'digests' ({'cached': n, 'hashed': n})
 
     Raises:
         SystemIntegrityError: If manifest file not found
@@ -80,32 +183,37 @@ def verify_system_integrity(
     report = {"verified": [], "failed": [], "missing": []}
 
     # Verify each category (scripts, configs, core - not "hooks" as it's not in manifest)
-    for category in ["scripts", "configs", "core"]:
-        for name, spec in baseline.get(category, {}).items():
-            file_path = spec["path"]
-            expected_checksum = spec["sha256"]
-
-            # Check if file exists
-            if not Path(file_path).exists():
-                report["missing"].append({"file": file_path, "purpose": spec["purpose"]})
-                continue
-
-            # Calculate current checksum
-            current_checksum = calculate_sha256(file_path)
-
-            # Compare
-            if current_checksum == expected_checksum:
-                report["verified"].append(file_path)
-            else:
-                report["failed"].append(
-                    {
-                        "file": file_path,
-                        "purpose": spec["purpose"],
-                        "expected": expected_checksum,
-                        "actual": current_checksum,
-                        "critical": spec.get("critical", False),
-                    }
-                )
+    specs = [
+        spec
+        for category in ["scripts", "configs", "core"]
+        for spec in baseline.get(category, {}).values()
+    ]
+    present = [spec["path"] for spec in specs if Path(spec["path"]).is_file()]
+    digests, report["digests"] = calculate_digests(present, cache_path, paranoid)
+
+    for spec in specs:
+        file_path = spec["path"]
+        expected_checksum = spec["sha256"]
+
+        # Check if file exists
+        if file_path not in digests:
+            report["missing"].append({"file": file_path, "purpose": spec["purpose"]})
+            continue
+
+        # Compare
+        current_checksum = digests[file_path]
+        if current_checksum == expected_checksum:
+            report["verified"].append(file_path)
+        else:
+            report["failed"].append(
+                {
+                    "file": file_path,
+                    "purpose": spec["purpose"],
+                    "expected": expected_checksum,
+                    "actual": current_checksum,
+                    "critical": spec.get("critical", False),
+                }
+            )
 
     # Determine success
     success = len(report["failed"]) == 0 and len(report["missing"]) == 0
@@ -161,8 +269,16 @@ def print_integrity_report(success: bool, report: dict) -> None:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Verify system integrity (Layer 0)")
+    parser.add_argument(
+        "--paranoid",
+        action="store_true",
+        help="Re-hash every file, ignoring the digest cache",
+    )
+    args = parser.parse_args()
+
     try:
-        success, report = verify_system_integrity()
+        success, report = verify_system_integrity(paranoid=args.paranoid)
         print_integrity_report(success, report)
 
         if not success:
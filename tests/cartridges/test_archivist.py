@@ -6,12 +6,13 @@ Tests the knowledge base builder functionality.
 """
 
 import json
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from vibe_core.cartridges.archivist import ArchivistCartridge
+from vibe_core.cartridges.archivist import ArchivistCartridge, cartridge_main
 from vibe_core.cartridges.registry import CartridgeRegistry
 
 
@@ -21,7 +22,9 @@ class TestArchivistCartridge:
     @pytest.fixture
     def archivist(self):
         """Create an Archivist instance."""
-        return ArchivistCartridge()
+        archivist = ArchivistCartridge(index_db=":memory:")
+        yield archivist
+        archivist.close()
 
     @pytest.fixture
     def temp_documents(self):
@@ -148,6 +151,116 @@ class TestArchivistCartridge:
         assert "max_document_size_mb" in status
 
 
+class TestIncrementalIndex:
+    """Tests for incremental indexing, search and query."""
+
+    class CountingProvider:
+        """Provider that records how many texts it summarized."""
+
+        def __init__(self):
+            self.prompts = []
+
+        def generate(self, prompt, max_tokens):
+            self.prompts.append(prompt)
+            return f"summary {len(self.prompts)}"
+
+    @pytest.fixture
+    def archivist(self, tmp_path):
+        archivist = ArchivistCartridge(index_db=tmp_path / "archivist.db")
+        archivist.llm_provider = self.CountingProvider()
+        yield archivist
+        archivist.close()
+
+    @pytest.fixture
+    def docs(self, tmp_path):
+        folder = tmp_path / "docs"
+        (folder / "sub").mkdir(parents=True)
+        (folder / "kernel.md").write_text("# Kernel\n\nThe scheduler dispatches tasks.")
+        (folder / "ledger.txt").write_text("The ledger records every task result.")
+        (folder / "sub" / "notes.md").write_text("Loose notes about cartridges.")
+        return folder
+
+    def test_second_run_reprocesses_nothing(self, archivist, docs):
+        """Test unchanged documents are served from the index store."""
+        first = archivist.build_index(str(docs))
+        second = archivist.build_index(str(docs))
+
+        assert first["stats"]["reindexed"] == 3
+        assert second["stats"] == {"unchanged": 3, "reindexed": 0, "removed": 0, "failed": 0}
+        assert second["documents"] == first["documents"]
+        assert len(archivist.llm_provider.prompts) == 3
+
+    def test_only_changed_documents_are_summarized(self, archivist, docs):
+        """Test edits, touches and deletions are handled incrementally."""
+        archivist.build_index(str(docs))
+
+        (docs / "kernel.md").write_text("# Kernel\n\nRewritten from scratch.")
+        ledger = docs / "ledger.txt"
+        st = ledger.stat()
+        os.utime(ledger, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))  # Touched only
+        (docs / "sub" / "notes.md").unlink()
+
+        index = archivist.build_index(str(docs))
+
+        assert index["stats"] == {"unchanged": 0, "reindexed": 1, "removed": 1, "failed": 0}
+        assert len(archivist.llm_provider.prompts) == 4
+        assert [d["name"] for d in index["documents"]] == ["kernel.md", "ledger.txt"]
+        assert index["documents"][0]["preview"].endswith("Rewritten from scratch.")
+
+    def test_parallel_extraction_matches_serial(self, tmp_path, docs, monkeypatch):
+        """Test the process-pool path produces the same index."""
+        monkeypatch.setattr(cartridge_main, "PARALLEL_EXTRACT_THRESHOLD", 1)
+        serial = ArchivistCartridge(index_db=":memory:", max_workers=1)
+        parallel = ArchivistCartridge(index_db=":memory:", max_workers=2)
+        try:
+            assert (
+                parallel.build_index(str(docs))["documents"]
+                == serial.build_index(str(docs))["documents"]
+            )
+        finally:
+            serial.close()
+            parallel.close()
+
+    def test_search_and_query(self, archivist, docs):
+        """Test the index is searchable by text and queryable by metadata."""
+        archivist.build_index(str(docs))
+
+        hits = archivist.search("scheduler tasks")
+        assert [h["name"] for h in hits] == ["kernel.md"]
+        assert "scheduler" in hits[0]["snippet"]
+        assert archivist.search("nonexistent") == []
+
+        assert [d["name"] for d in archivist.query(format=".md")] == ["kernel.md", "notes.md"]
+        assert [d["name"] for d in archivist.query(folder=str(docs / "sub"))] == ["notes.md"]
+        assert [d["name"] for d in archivist.query(name="led*")] == ["ledger.txt"]
+
+    def test_search_follows_edits_and_deletions(self, archivist, docs):
+        """Test replaced and pruned documents leave no stale full-text rows."""
+        archivist.build_index(str(docs))
+        (docs / "kernel.md").write_text("# Kernel\n\nRewritten from scratch.")
+        (docs / "sub" / "notes.md").unlink()
+        archivist.build_index(str(docs))
+
+        assert archivist.search("scheduler") == []
+        assert archivist.search("cartridges") == []
+        assert [h["name"] for h in archivist.search("rewritten")] == ["kernel.md"]
+        rows = archivist.index_store.conn.execute("SELECT COUNT(*) FROM archivist_fts")
+        assert rows.fetchone()[0] == 2
+
+    def test_index_persists_across_instances(self, tmp_path, docs):
+        """Test a new Archivist reuses the on-disk index."""
+        db = tmp_path / "shared.db"
+        first = ArchivistCartridge(index_db=db)
+        first.build_index(str(docs))
+        first.close()
+
+        second = ArchivistCartridge(index_db=db)
+        try:
+            assert second.build_index(str(docs))["stats"]["unchanged"] == 3
+        finally:
+            second.close()
+
+
 class TestCartridgeRegistry:
     """Tests for cartridge registry integration."""
 
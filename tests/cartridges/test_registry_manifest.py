@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Tests for lazy cartridge discovery - ARCH-050
+
+Test Strategy:
+- Discovery parses cartridge files into a manifest without importing them
+- get_cartridge() imports a cartridge the first time it is requested
+- The manifest is persisted and reused until a file hash changes
+- A cartridge that fails to import is listed but raises on get_cartridge()
+"""
+
+import json
+import textwrap
+
+import pytest
+
+from vibe_core.cartridges.base import CartridgeBase
+from vibe_core.cartridges.registry import CartridgeRegistry
+
+CARTRIDGE_SOURCE = """
+from pathlib import Path
+
+from vibe_core.cartridges.base import CartridgeBase
+
+Path({marker!r}).write_text("imported")
+
+
+class EchoCartridge(CartridgeBase):
+    name = "echo"
+    version = "{version}"
+    description = "Echoes its input"
+"""
+
+
+def write_cartridge(root, name, source):
+    cartridge_dir = root / "vibe_core" / "cartridges" / name
+    cartridge_dir.mkdir(parents=True, exist_ok=True)
+    (cartridge_dir / "cartridge_main.py").write_text(textwrap.dedent(source))
+
+
+@pytest.fixture
+def vibe_root(tmp_path):
+    (tmp_path / ".vibe").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def marker(vibe_root):
+    marker = vibe_root / "imported.txt"
+    write_cartridge(vibe_root, "echo", CARTRIDGE_SOURCE.format(marker=str(marker), version="1.0"))
+    return marker
+
+
+class TestLazyDiscovery:
+    """Tests for manifest-based discovery."""
+
+    def test_listing_imports_nothing(self, vibe_root, marker):
+        registry = CartridgeRegistry(vibe_root=vibe_root)
+
+        assert registry.get_cartridge_names() == ["echo"]
+        spec = registry.list_cartridges()["echo"]
+        assert (spec.version, spec.class_name) == ("1.0", "EchoCartridge")
+        assert spec.description == "Echoes its input"
+        assert spec.name == "echo"
+        assert (spec.offline_capable, spec.requires_api) == (None, None)  # Not declared
+        assert not marker.exists()
+
+        cartridge = registry.get_cartridge("echo")
+        assert isinstance(cartridge, CartridgeBase)
+        assert type(cartridge).__name__ == "EchoCartridge"
+        assert marker.exists()
+
+    def test_manifest_is_reused_until_hash_changes(self, vibe_root, marker):
+        first = CartridgeRegistry(vibe_root=vibe_root).get_manifest()["echo"]
+        manifest = json.loads((vibe_root / ".vibe/state/cartridge_manifest.json").read_text())
+        assert manifest["cartridges"]["echo"]["file_hash"] == first.file_hash
+        assert manifest["cartridges"]["echo"]["entry_point"] == (
+            "vibe_core/cartridges/echo/cartridge_main.py"
+        )
+
+        assert CartridgeRegistry(vibe_root=vibe_root).get_manifest()["echo"] == first
+
+        write_cartridge(
+            vibe_root, "echo", CARTRIDGE_SOURCE.format(marker=str(marker), version="2.0")
+        )
+        changed = CartridgeRegistry(vibe_root=vibe_root).get_manifest()["echo"]
+        assert changed.version == "2.0"
+        assert changed.file_hash != first.file_hash
+        assert not marker.exists()
+
+    def test_broken_cartridge_is_listed_but_fails_on_load(self, vibe_root):
+        write_cartridge(
+            vibe_root,
+            "broken",
+            """
+            import module_that_does_not_exist
+
+            class BrokenCartridge(CartridgeBase):
+                description = "Cannot import"
+            """,
+        )
+        registry = CartridgeRegistry(vibe_root=vibe_root)
+
+        assert registry.list_cartridges()["broken"].description == "Cannot import"
+        with pytest.raises(ValueError, match="failed to load"):
+            registry.get_cartridge("broken")
+
+    def test_manifest_reads_class_name_and_flags(self, vibe_root):
+        write_cartridge(
+            vibe_root,
+            "web_tools",
+            """
+            class WebCartridge(CartridgeBase):
+                name = "web"
+                offline_capable = False
+                requires_api = True
+            """,
+        )
+        spec = CartridgeRegistry(vibe_root=vibe_root).list_cartridges()["web_tools"]
+
+        assert spec.name == "web"
+        assert (spec.offline_capable, spec.requires_api) == (False, True)
+
+    def test_registered_class_reports_its_own_spec(self, vibe_root):
+        class ToolCartridge(CartridgeBase):
+            name = "tooling"
+
+            def _load_tools(self):
+                return {"ping": lambda: "pong"}
+
+        registry = CartridgeRegistry(vibe_root=vibe_root)
+        registry.register_cartridge("tooling", ToolCartridge)
+        spec = registry.list_cartridges()["tooling"]
+
+        assert spec.tools == ["ping"]
+        assert spec.class_name == "ToolCartridge"
+
+    def test_directories_without_cartridge_class_are_skipped(self, vibe_root):
+        write_cartridge(vibe_root, "helpers", "def helper():\n    return 1\n")
+        assert CartridgeRegistry(vibe_root=vibe_root).get_cartridge_names() == []
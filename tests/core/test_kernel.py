@@ -12,7 +12,7 @@ from unittest.mock import patch
 import pytest
 
 from vibe_core.agent_protocol import VibeAgent
-from vibe_core.kernel import KernelStatus, VibeKernel
+from vibe_core.kernel import AgentLoad, KernelStatus, VibeKernel
 from vibe_core.scheduling import Task
 
 
@@ -326,6 +326,48 @@ class TestKernelStatus:
         status = kernel.get_status()
         assert status["kernel_status"] == "STOPPED"
 
+    def test_get_agent_load_tracks_completed_tasks(self):
+        """Test per-agent load/latency stats used for routing tie-breaks."""
+        kernel = VibeKernel(ledger_path=":memory:")
+        kernel.register_agent(DummyAgent(agent_id="agent-1"))
+        kernel.boot()
+
+        assert kernel.get_agent_load("agent-1").routing_key() == (0, 0.0)
+
+        kernel.submit(Task(agent_id="agent-1", payload={}))
+        kernel.tick()
+
+        load = kernel.get_agent_load("agent-1")
+        assert (load.in_flight, load.completed, load.failed) == (0, 1, 0)
+        assert load.avg_latency_seconds >= 0.0
+
+    def test_unregister_agent_removes_manifest(self):
+        """Test unregister_agent() drops the agent and its capability index entries."""
+        kernel = VibeKernel(ledger_path=":memory:")
+        agent = DummyAgent(agent_id="agent-1")
+        kernel.register_agent(agent)
+        kernel.boot()
+        assert len(kernel.find_agents_by_capability("dummy")) == 1
+
+        assert kernel.unregister_agent("agent-1") is agent
+        assert kernel.find_agents_by_capability("dummy") == []
+        assert kernel.unregister_agent("agent-1") is None
+        kernel.register_agent(agent)  # ID is free again
+
+    def test_agent_router_breaks_ties_by_live_load(self):
+        """Test the kernel's router tracks registered agents and prefers the idle one."""
+        kernel = VibeKernel(ledger_path=":memory:")
+        busy, idle = DummyAgent(agent_id="busy"), DummyAgent(agent_id="idle")
+        kernel.register_agent(busy)
+        kernel.register_agent(idle)
+        assert kernel.agent_router.find_best_agent_for_skills(["dummy"]) is busy
+
+        kernel._agent_load["busy"] = AgentLoad(in_flight=2)
+        assert kernel.agent_router.find_best_agent_for_skills(["dummy"]) is idle
+
+        kernel.unregister_agent("idle")
+        assert kernel.agent_router.list_agents() == [busy]
+
 
 class TestKernelIntegration:
     """Integration tests for complete kernel workflows."""
@@ -178,6 +178,19 @@ class TestVibeScheduler:
         assert result3.agent_id == "agent-A"
         assert result3.payload["msg"] == "from A2"
 
+    def test_higher_priority_runs_first_fifo_within_priority(self):
+        """Test that priority jumps the queue but equal priorities stay FIFO."""
+        scheduler = VibeScheduler()
+
+        scheduler.submit_task(Task(id="normal-1", agent_id="agent-1", payload={}))
+        scheduler.submit_task(Task(id="urgent-1", agent_id="agent-1", payload={}, priority=2))
+        scheduler.submit_task(Task(id="normal-2", agent_id="agent-1", payload={}))
+        scheduler.submit_task(Task(id="medium-1", agent_id="agent-1", payload={}, priority=1))
+        scheduler.submit_task(Task(id="urgent-2", agent_id="agent-1", payload={}, priority=2))
+
+        order = [scheduler.next_task().id for _ in range(5)]
+        assert order == ["urgent-1", "urgent-2", "medium-1", "normal-1", "normal-2"]
+
     def test_payload_can_be_any_type(self):
         """Test that task payload can be any Python type."""
         scheduler = VibeScheduler()
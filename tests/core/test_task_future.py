@@ -0,0 +1,200 @@
+"""
+Unit tests for task futures returned by VibeKernel.submit().
+
+Futures are resolved in memory when the kernel finishes a task; waiting on
+a queued task runs just that task instead of draining the queue.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from vibe_core.agent_protocol import VibeAgent
+from vibe_core.kernel import VibeKernel
+from vibe_core.scheduling import Task, TaskFuture, as_completed, wait_all
+from vibe_core.tools.delegate_tool import DelegateTool
+
+
+class EchoAgent(VibeAgent):
+    """Returns its payload; raises if the payload asks it to."""
+
+    def __init__(self, agent_id: str = "echo"):
+        self._agent_id = agent_id
+        self.processed: list[Any] = []
+
+    @property
+    def agent_id(self) -> str:
+        return self._agent_id
+
+    @property
+    def capabilities(self) -> list[str]:
+        return ["echo"]
+
+    def process(self, task: Task) -> Any:
+        self.processed.append(task.payload)
+        if task.payload == "boom":
+            raise RuntimeError("boom")
+        return {"echo": task.payload}
+
+
+@pytest.fixture
+def agent():
+    return EchoAgent()
+
+
+@pytest.fixture
+def kernel(agent):
+    kernel = VibeKernel(ledger_path=":memory:")
+    kernel.register_agent(agent)
+    kernel.boot()
+    return kernel
+
+
+def test_submit_returns_future_usable_as_task_id(kernel):
+    """The future doubles as the task ID (ledger lookups keep working)."""
+    task = Task(agent_id="echo", payload="hi")
+    future = kernel.submit(task)
+
+    assert isinstance(future, TaskFuture)
+    assert future == task.id
+    assert not future.done()
+
+    kernel.tick()
+    assert future.done()
+    assert future.result() == {"echo": "hi"}
+    assert kernel.get_task_result(future)["status"] == "COMPLETED"
+
+
+def test_result_runs_only_the_awaited_task(kernel, agent):
+    """Waiting on a queued task runs it inline without draining the queue."""
+    first = kernel.submit(Task(agent_id="echo", payload="first"))
+    second = kernel.submit(Task(agent_id="echo", payload="second"))
+
+    assert second.result(timeout=1) == {"echo": "second"}
+    assert agent.processed == ["second"]
+    assert not first.done()
+    assert kernel.get_status()["pending_tasks"] == 1
+
+
+def test_failure_is_delivered_through_future(kernel):
+    """Agent exceptions are raised from result() and exposed by exception()."""
+    future = kernel.submit(Task(agent_id="echo", payload="boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        future.result(timeout=1)
+    assert isinstance(future.exception(), RuntimeError)
+    assert kernel.get_task_result(future)["status"] == "FAILED"
+
+
+def test_done_callback(kernel):
+    """Callbacks fire on completion, or immediately if already done."""
+    seen = []
+    future = kernel.submit(Task(agent_id="echo", payload="cb"))
+    future.add_done_callback(lambda f: seen.append(("before", f.result())))
+
+    kernel.tick()
+    future.add_done_callback(lambda f: seen.append(("after", f.task_id)))
+
+    assert seen == [("before", {"echo": "cb"}), ("after", future.task_id)]
+
+
+def test_result_waits_for_task_running_elsewhere(kernel, agent):
+    """A task already running in another thread is waited for, not re-run."""
+    started, release = threading.Event(), threading.Event()
+    original = agent.process
+
+    def slow_process(task):
+        started.set()
+        release.wait(5)
+        return original(task)
+
+    agent.process = slow_process
+    future = kernel.submit(Task(agent_id="echo", payload="bg"))
+    worker = threading.Thread(target=kernel.tick)
+    worker.start()
+    started.wait(5)
+
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.01)
+
+    release.set()
+    assert future.result(timeout=5) == {"echo": "bg"}
+    worker.join()
+    assert agent.processed == ["bg"]
+
+
+def test_result_times_out_when_kernel_stopped(kernel):
+    """A stopped kernel does not run tasks for waiters."""
+    kernel.shutdown()
+    future = kernel.submit(Task(agent_id="echo", payload="later"))
+
+    with pytest.raises(TimeoutError):
+        future.result(timeout=0.01)
+
+
+def test_expired_timeout_does_not_start_queued_tasks(kernel, agent):
+    """Past the deadline, waiters stop running queued tasks inline."""
+    original = agent.process
+
+    def slow_process(task):
+        time.sleep(0.05)
+        return original(task)
+
+    agent.process = slow_process
+    futures = [kernel.submit(Task(agent_id="echo", payload=i)) for i in range(3)]
+
+    with pytest.raises(TimeoutError):
+        wait_all(futures, timeout=0.01)
+
+    # The first task was started in time and ran to completion; the rest stay queued
+    assert agent.processed == [0]
+    assert futures[0].done()
+    assert not futures[1].done()
+    assert kernel.scheduler.get_queue_status()["pending_tasks"] == 2
+
+    with pytest.raises(TimeoutError):
+        futures[1].result(timeout=0)
+    assert agent.processed == [0]
+
+
+def test_wait_all_and_as_completed(kernel):
+    """Fan-out delegation: results in order, and completion order."""
+    futures = [kernel.submit(Task(agent_id="echo", payload=i)) for i in range(3)]
+    kernel.tick()  # futures[0] finishes first
+
+    assert next(as_completed(futures)).task_id == futures[0].task_id
+    assert wait_all(futures, timeout=1) == [{"echo": 0}, {"echo": 1}, {"echo": 2}]
+
+
+def test_await_future(kernel):
+    """Futures can be awaited from asyncio code."""
+
+    async def delegate():
+        return await kernel.submit(Task(agent_id="echo", payload="async"))
+
+    assert asyncio.run(delegate()) == {"echo": "async"}
+
+
+def test_delegate_wait_fails_fast_when_kernel_not_running(kernel, agent):
+    """delegate_task(wait=true) does not block on a kernel that cannot run the task."""
+    tool = DelegateTool()
+    tool.set_kernel(kernel)
+    kernel.shutdown()
+
+    start = time.monotonic()
+    result = tool.execute(
+        {
+            "agent_id": "echo",
+            "payload": {"mission_id": 1, "phase": "PLANNING"},
+            "wait": True,
+        }
+    )
+
+    assert time.monotonic() - start < 1
+    assert result.success is False
+    assert "kernel is not running (status: STOPPED)" in result.error
+    assert kernel.scheduler.get_queue_status()["pending_tasks"] == 0
+    assert agent.processed == []
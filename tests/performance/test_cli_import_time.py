@@ -0,0 +1,107 @@
+"""
+Import-time budget for the vibe CLI's lightweight subcommands
+
+Test Strategy:
+- Run apps/agency/cli.py under `python -X importtime` in a fresh process
+- `--help`, `metrics`, `trace` and `task list` must not import the kernel,
+  the LLM providers or the pydantic config stack (checked by module name)
+- Their total import time must stay within a cold-start budget
+- Package __init__ files resolve their exports lazily (PEP 562)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+CLI = PROJECT_ROOT / "apps" / "agency" / "cli.py"
+
+# Total import time of a lightweight subcommand (eager imports took ~450ms)
+COLD_START_BUDGET_MS = 250
+
+# Only the boot path (interactive, --mission, --status, --snapshot) may load these
+HEAVY_MODULES = (
+    "apps.agency.prompts",
+    "apps.agency.specialists",
+    "asyncio",
+    "pydantic",
+    "vibe_core.config.phoenix",
+    "vibe_core.kernel",
+    "vibe_core.llm",
+    "vibe_core.runtime.llm_client",
+    "vibe_core.tools.tool_registry",
+)
+
+LIGHT_COMMANDS = (
+    ["--help"],
+    ["metrics"],
+    ["trace", "no-such-task"],
+    ["task", "list"],
+)
+
+
+def _import_profile(tmp_path: Path, *args: str) -> tuple[float, set[str]]:
+    """Run the CLI under -X importtime; return (total import ms, imported modules)."""
+    env = {
+        **os.environ,
+        # Point path resolution at tmp files (the config-derived default needs Phoenix)
+        "VIBE_METRICS_FILE": str(tmp_path / "metrics.prom"),
+        "VIBE_TRACE_DB": str(tmp_path / "traces.db"),
+    }
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", str(CLI), *args],
+        cwd=tmp_path,  # agenda tools keep their store under the working directory
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, _cumulative, name = line.removeprefix("import time:").split("|")
+        total_us += int(self_us)
+        modules.add(name.strip())
+    return total_us / 1000, modules
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize("args", LIGHT_COMMANDS, ids=lambda args: args[0])
+def test_light_subcommands_skip_heavy_imports(tmp_path, args):
+    total_ms, modules = _import_profile(tmp_path, *args)
+
+    assert modules, "no -X importtime output"
+    loaded = sorted(
+        name
+        for name in modules
+        if any(name == heavy or name.startswith(heavy + ".") for heavy in HEAVY_MODULES)
+    )
+    assert loaded == [], f"{' '.join(args)} imported {loaded}"
+    print(f"\n📊 cli.py {' '.join(args)}: {total_ms:.1f}ms of imports")
+    assert total_ms < COLD_START_BUDGET_MS
+
+
+@pytest.mark.performance
+def test_packages_export_lazily():
+    code = (
+        "import sys; import vibe_core.tools, vibe_core.runtime, vibe_core.llm; "
+        "print(sorted(m for m in sys.modules if m.startswith('vibe_core.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True
+    )
+    assert (
+        result.stdout.strip()
+        == "['vibe_core._lazy', 'vibe_core.llm', 'vibe_core.runtime', 'vibe_core.tools']"
+    )
+
+    from vibe_core.tools import ToolRegistry
+    from vibe_core.tools.tool_registry import ToolRegistry as Direct
+
+    assert ToolRegistry is Direct
@@ -0,0 +1,64 @@
+"""
+Performance tests for InvariantChecker (ARCH-029)
+
+Governance runs before every tool call (ToolRegistry, ToolExecutor and the
+orchestrator kernel checks), so checks must stay cheap as soul.yaml grows:
+- Reports checks/sec against a 500-rule soul file (no throughput assert:
+  wall-clock rates vary too much between machines to gate the test run)
+"""
+
+import time
+
+import pytest
+import yaml
+
+from vibe_core.governance import InvariantChecker
+
+RULE_COUNT = 500
+CHECKS = 100_000
+
+
+def _write_large_soul(tmp_path) -> str:
+    rules = [{"id": "sandbox", "condition": "path_outside_root", "action": "block"}]
+    for i in range(RULE_COUNT - 1):
+        if i % 2:
+            rule = {"condition": "path_contains", "pattern": f"protected_{i}/"}
+        else:
+            rule = {"condition": "path_matches", "pattern": f"config/locked_{i}.yaml"}
+        rule.update(id=f"rule_{i}", action="block", message=f"Rule {i}")
+        if i % 7 == 0:
+            rule["tools"] = ["delete_file"]
+        rules.append(rule)
+
+    soul = tmp_path / "soul.yaml"
+    soul.write_text(yaml.safe_dump({"safety_rules": rules}))
+    return str(soul)
+
+
+@pytest.mark.performance
+def test_checks_per_second_with_500_rules(tmp_path, monkeypatch):
+    """Mixed tool-call checks/sec against 500 rules"""
+    monkeypatch.chdir(tmp_path)
+    checker = InvariantChecker(_write_large_soul(tmp_path))
+    assert checker.rule_count == RULE_COUNT
+
+    calls = [("write_file", {"path": f"src/module_{i}.py"}) for i in range(50)]
+    calls += [
+        ("read_file", {"path": "protected_99/data.json"}),
+        ("delete_file", {"path": "config/locked_14.yaml"}),
+        ("write_file", {"path": "../outside.txt"}),
+        ("google_search", {"query": "no path"}),
+    ]
+    for tool_name, params in calls:  # Warm up the path cache
+        checker.check_tool_call(tool_name, params)
+
+    start = time.perf_counter()
+    blocked = 0
+    for i in range(CHECKS):
+        tool_name, params = calls[i % len(calls)]
+        blocked += not checker.check_tool_call(tool_name, params).allowed
+    elapsed = time.perf_counter() - start
+
+    rate = CHECKS / elapsed
+    print(f"\n📊 InvariantChecker: {rate:,.0f} checks/sec ({RULE_COUNT} rules)")
+    assert blocked > 0
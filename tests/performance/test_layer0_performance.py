@@ -9,6 +9,7 @@ Part of: GAD-005-ADDITION Layer 0
 """
 
 import importlib.util
+import json
 import time
 from pathlib import Path
 
@@ -115,6 +116,46 @@ def test_manifest_generation_performance():
         print(f"✅ PASSED: {avg_time:.2f}ms < 500ms target")
 
 
+@pytest.mark.performance
+def test_cached_verification_performance(tmp_path, monkeypatch):
+    """
+    Warm (stat-cached) verification vs a --paranoid full re-hash.
+
+    Uses a synthetic manifest of 200 x 256 KiB files so the difference
+    between hashing and stat-ing is visible.
+    """
+    monkeypatch.setattr(verify_module, "RACY_WINDOW_SECONDS", 0)
+    files = {}
+    for i in range(200):
+        path = tmp_path / f"file_{i}.bin"
+        path.write_bytes(i.to_bytes(2, "big") * (128 * 1024))
+        files[path.name] = {
+            "path": str(path),
+            "sha256": verify_module.calculate_sha256(str(path)),
+            "purpose": "benchmark",
+        }
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text(json.dumps({"trustedBaseline": {"core": files}}))
+    cache = str(tmp_path / "digests.json")
+
+    def timed(**kwargs):
+        start = time.perf_counter()
+        success, report = verify_system_integrity(str(manifest), cache_path=cache, **kwargs)
+        assert success is True
+        return (time.perf_counter() - start) * 1000, report["digests"]
+
+    paranoid_ms, paranoid_stats = timed(paranoid=True)
+    cached_ms, cached_stats = min(timed() for _ in range(5))
+
+    print("\n📊 Cached Integrity Verification (200 x 256 KiB):")
+    print(f"   --paranoid: {paranoid_ms:.2f}ms")
+    print(f"   cached:     {cached_ms:.2f}ms")
+
+    assert paranoid_stats == {"cached": 0, "hashed": 200}
+    assert cached_stats == {"cached": 200, "hashed": 0}
+    assert cached_ms < paranoid_ms
+
+
 def test_performance_summary():
     """
     Summary of Layer 0 performance tests.
@@ -0,0 +1,60 @@
+"""
+Performance tests for ProjectMemoryManager dual-write (ARCH-003)
+
+Ensures the SQLite side of save() only pays for what changed:
+- Appending one session writes one row, whatever the history length
+- Remaining per-save work is an in-memory diff (no failed inserts)
+"""
+
+import time
+
+import pytest
+
+from vibe_core.runtime.project_memory import ProjectMemoryManager
+from vibe_core.store.sqlite_store import SQLiteStore
+
+
+def _measure_append(tmp_path, history: int, appends: int = 20) -> tuple[float, int]:
+    """Save `history` sessions, then time `appends` single-session saves."""
+    store = SQLiteStore(":memory:")
+    mission_id = store.create_mission(f"perf-{history}", "CODING", "in_progress")
+    project_root = tmp_path / str(history)
+    project_root.mkdir()
+    manager = ProjectMemoryManager(project_root, sqlite_store=store)
+
+    memory = manager.load()
+    memory["narrative"] = [
+        {"session": i, "summary": f"Session {i}", "date": "2025-01-01", "phase": "CODING"}
+        for i in range(1, history + 1)
+    ]
+    manager.save(memory, mission_id=mission_id)
+
+    inserts = []
+    store.conn.set_trace_callback(
+        lambda sql: inserts.append(sql) if sql.lstrip().startswith("INSERT") else None
+    )
+
+    start = time.perf_counter()
+    for i in range(history + 1, history + appends + 1):
+        memory["narrative"].append(
+            {"session": i, "summary": f"Session {i}", "date": "2025-01-02", "phase": "CODING"}
+        )
+        manager._sync_to_sqlite(memory, mission_id)
+    elapsed = (time.perf_counter() - start) / appends
+
+    store.close()
+    return elapsed, len(inserts) // appends
+
+
+@pytest.mark.performance
+def test_save_cost_independent_of_history(tmp_path):
+    """SQL work for one new session is the same with 10 or 5000 earlier sessions."""
+    small_time, small_writes = _measure_append(tmp_path, history=10)
+    large_time, large_writes = _measure_append(tmp_path, history=5000)
+
+    print(f"\n📊 Append with 10 sessions:   {small_time * 1000:.3f}ms ({small_writes} insert)")
+    print(f"📊 Append with 5000 sessions: {large_time * 1000:.3f}ms ({large_writes} insert)")
+
+    assert small_writes == large_writes == 1
+    # In-memory diff is linear but tiny; the SQL work is constant
+    assert large_time < small_time * 10 + 0.005
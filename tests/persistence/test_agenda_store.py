@@ -0,0 +1,226 @@
+"""
+Test suite for AgendaStore - indexed agenda with BACKLOG.md view (ARCH-045)
+
+Test Strategy:
+- SQLite table is the source of truth, BACKLOG.md is rendered from it
+- Hand edits to BACKLOG.md are re-imported (stat-detected)
+- Agenda tools and prompt resolvers read through the store
+"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from vibe_core.store.agenda_store import AgendaStore, BacklogFormatError
+
+SAMPLE_BACKLOG = """# VIBE AGENCY BACKLOG
+
+Notes written by a human.
+
+## Outstanding Tasks
+
+- [ ] [LOW] Polish docs
+- [ ] [HIGH] Fix Phoenix Config
+- [ ] Untagged chore
+- [ ] [MEDIUM] Add metrics
+- [ ] [HIGH] Repair ledger
+
+## Completed Tasks
+
+*(Archive of completed work)*
+- [x] [HIGH] Boot kernel
+"""
+
+
+@pytest.fixture
+def store(tmp_path):
+    backlog = tmp_path / "workspace" / "BACKLOG.md"
+    backlog.parent.mkdir()
+    backlog.write_text(SAMPLE_BACKLOG)
+    with AgendaStore(tmp_path, db_path=":memory:") as agenda:
+        yield agenda
+
+
+class TestAgendaQueries:
+    """Test indexed queries over imported BACKLOG.md"""
+
+    def test_import_preserves_file_order(self, store):
+        """Test pending tasks keep their BACKLOG.md order"""
+        assert [t.text for t in store.list_tasks("pending")] == [
+            "[LOW] Polish docs",
+            "[HIGH] Fix Phoenix Config",
+            "Untagged chore",
+            "[MEDIUM] Add metrics",
+            "[HIGH] Repair ledger",
+        ]
+        assert [t.text for t in store.list_tasks("completed")] == ["[HIGH] Boot kernel"]
+
+    def test_top_pending_orders_by_priority(self, store):
+        """Test top-N returns HIGH first, then file order"""
+        top = store.top_pending(3)
+        assert [t.description for t in top] == [
+            "Fix Phoenix Config",
+            "Repair ledger",
+            "Add metrics",
+        ]
+
+    def test_pending_counts(self, store):
+        """Test counts per priority tag (untagged tasks excluded from total)"""
+        assert store.pending_counts() == {"HIGH": 2, "MEDIUM": 1, "LOW": 1, "total": 4}
+
+    def test_invalid_format_raises(self, tmp_path):
+        """Test a backlog without sections is rejected"""
+        backlog = tmp_path / "workspace" / "BACKLOG.md"
+        backlog.parent.mkdir()
+        backlog.write_text("# just a title\n- [ ] something\n")
+        with AgendaStore(tmp_path, db_path=":memory:") as agenda, pytest.raises(BacklogFormatError):
+            agenda.list_tasks()
+
+
+class TestAgendaMutations:
+    """Test writes go to the table and are rendered to BACKLOG.md"""
+
+    def test_add_task_renders_backlog(self, store):
+        """Test added tasks appear in the Outstanding section"""
+        store.add_task("Write tests", "high")
+
+        content = store.backlog_path.read_text()
+        outstanding = content.split("## Completed Tasks")[0]
+        assert outstanding.rstrip().endswith("- [ ] [HIGH] Write tests")
+        assert "Notes written by a human." in content
+        assert "*(Archive of completed work)*" in content
+        assert store.pending_counts()["HIGH"] == 3
+
+    def test_add_task_rejects_unknown_priority(self, store):
+        """Test priority validation"""
+        with pytest.raises(ValueError, match="priority must be one of"):
+            store.add_task("Nope", "URGENT")
+
+    def test_complete_task_moves_to_top_of_completed(self, store):
+        """Test completion matches case-insensitively and archives the task"""
+        task = store.complete_task("phoenix")
+
+        assert task.description == "Fix Phoenix Config"
+        assert [t.text for t in store.list_tasks("completed")] == [
+            "[HIGH] Fix Phoenix Config",
+            "[HIGH] Boot kernel",
+        ]
+        completed = store.backlog_path.read_text().split("## Completed Tasks")[1]
+        assert "- [x] [HIGH] Fix Phoenix Config" in completed
+        assert store.complete_task("does not exist") is None
+
+    def test_rendered_file_is_not_reimported(self, store):
+        """Test our own render does not trigger a re-import"""
+        store.add_task("Write tests")
+        assert store.sync() is False
+
+    def test_hand_edit_is_reimported(self, store):
+        """Test edits to BACKLOG.md are picked up on the next query"""
+        store.list_tasks()
+        edited = SAMPLE_BACKLOG.replace("- [ ] [LOW] Polish docs\n", "- [ ] [HIGH] Hotfix\n")
+        tmp = store.backlog_path.with_suffix(".edit")
+        tmp.write_text(edited)
+        os.replace(tmp, store.backlog_path)
+
+        assert store.top_pending(1)[0].description == "Hotfix"
+        assert store.pending_counts()["LOW"] == 0
+
+    def test_hand_edit_keeps_ids_and_timestamps(self, store):
+        """Test re-imports merge into existing rows instead of replacing them"""
+        added = store.add_task("Write tests", "LOW")
+        done = store.complete_task("ledger")
+        before = {t.description: t for t in store.list_tasks("pending")}
+
+        content = store.backlog_path.read_text()
+        content = content.replace("- [ ] [LOW] Write tests", "- [ ] [HIGH] Write tests")
+        content = content.replace("- [ ] Untagged chore\n", "")
+        store.backlog_path.write_text(content + "- [x] [LOW] Archived by hand\n")
+        os.utime(store.backlog_path, ns=(1, 1))  # Force a stat change
+
+        pending = {t.description: t for t in store.list_tasks("pending")}
+        assert "Untagged chore" not in pending
+        assert pending["Write tests"].id == added.id
+        assert pending["Write tests"].priority == "HIGH"
+        assert pending["Write tests"].created_at == added.created_at
+        assert pending["Polish docs"].id == before["Polish docs"].id
+
+        completed = {t.description: t for t in store.list_tasks("completed")}
+        assert completed["Repair ledger"].id == done.id
+        assert completed["Repair ledger"].completed_at == done.completed_at
+        assert completed["Archived by hand"].completed_at is not None
+
+    def test_deleted_backlog_is_rerendered(self, store):
+        """Test deleting BACKLOG.md does not wipe the table"""
+        store.add_task("Write tests", "HIGH")
+        store.backlog_path.unlink()
+
+        assert store.pending_counts()["HIGH"] == 3
+        assert len(store.list_tasks("pending")) == 6
+        assert "- [ ] [HIGH] Write tests" in store.backlog_path.read_text()
+        assert store.sync() is False
+
+
+class TestAgendaConsumers:
+    """Test agenda tools and prompt resolvers use the store"""
+
+    def test_agenda_tools_round_trip(self, tmp_path, monkeypatch):
+        """Test add/list/complete through the tool interface"""
+        from vibe_core.tools.agenda_tools import AddTaskTool, CompleteTaskTool, ListTasksTool
+
+        monkeypatch.chdir(tmp_path)
+
+        assert ListTasksTool().execute({}).output == "Backlog is empty (no tasks yet)"
+        assert AddTaskTool().execute({"description": "Ship it", "priority": "HIGH"}).success
+        assert AddTaskTool().execute({"description": "Tidy up", "priority": "LOW"}).success
+
+        listing = ListTasksTool().execute({"status": "pending"}).output
+        assert listing == "OUTSTANDING TASKS:\n  - [ ] [HIGH] Ship it\n  - [ ] [LOW] Tidy up"
+
+        result = CompleteTaskTool().execute({"task_description": "ship"})
+        assert result.output == "Task completed: - [ ] [HIGH] Ship it"
+        completed = ListTasksTool().execute({"status": "completed"}).output
+        assert completed == "COMPLETED TASKS:\n  - [x] [HIGH] Ship it"
+
+        # The tools answer from the store, even without the rendered file
+        (tmp_path / "workspace" / "BACKLOG.md").unlink()
+        listing = ListTasksTool().execute({"status": "pending"}).output
+        assert listing == "OUTSTANDING TASKS:\n  - [ ] [LOW] Tidy up"
+        missing = CompleteTaskTool().execute({"task_description": "nothing like it"})
+        assert missing.error == "Task matching 'nothing like it' not found in outstanding tasks"
+
+    def test_shared_store_uses_resolved_root(self, tmp_path, monkeypatch):
+        """Test every spelling of a root gets the same store, rooted at the real path"""
+        from vibe_core.store.agenda_store import get_agenda_store
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "project").mkdir()
+
+        store = get_agenda_store(Path("project/../project"))
+        assert store is get_agenda_store(tmp_path / "project")
+        assert store.root == (tmp_path / "project").resolve()
+        store.close()
+
+    def test_prompt_context_agenda_resolvers(self, tmp_path):
+        """Test agenda_summary/agenda_tasks resolve from the store"""
+        from vibe_core.runtime.prompt_context import PromptContext
+
+        backlog = tmp_path / "workspace" / "BACKLOG.md"
+        backlog.parent.mkdir()
+        backlog.write_text(SAMPLE_BACKLOG)
+
+        context = PromptContext(vibe_root=tmp_path).resolve(["agenda_summary", "agenda_tasks"])
+
+        assert json.loads(context["agenda_summary"]) == {
+            "HIGH": 2,
+            "MEDIUM": 1,
+            "LOW": 1,
+            "total": 4,
+        }
+        assert context["agenda_tasks"].split("\n") == [
+            "- [ ] [HIGH] Fix Phoenix Config",
+            "- [ ] [HIGH] Repair ledger",
+            "- [ ] [MEDIUM] Add metrics",
+            "... and 1 more task(s): 1 LOW priority. Use list_tasks tool to see all.",
+        ]
@@ -0,0 +1,237 @@
+"""
+Test suite for ledger/store retention and cold-storage rollover
+
+Test Strategy:
+- Rows older than hot_days move into <archive>/<table>/<day>.jsonl.gz
+- Live queries only see hot rows; include_archived reaches the partitions
+- A crash between archive write and delete duplicates, never loses rows
+- New databases use auto_vacuum=INCREMENTAL; old ones convert only on opt-in
+- The kernel runs housekeeping from idle ticks (ledger retention only with a policy)
+"""
+
+import gzip
+import json
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+from vibe_core.kernel import VibeKernel
+from vibe_core.ledger import VibeLedger
+from vibe_core.scheduling import Task
+from vibe_core.store.retention import RetentionPolicy
+from vibe_core.store.sqlite_store import SQLiteStore
+
+NOW = datetime(2025, 3, 31, 12, 0, 0)
+
+
+def age_task(ledger: VibeLedger, task_id: str, days: int) -> None:
+    stamp = (NOW - timedelta(days=days)).isoformat()
+    ledger.conn.execute("UPDATE task_history SET timestamp = ? WHERE task_id = ?", (stamp, task_id))
+    ledger.conn.commit()
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    ledger = VibeLedger(str(tmp_path / "vibe.db"), retention=RetentionPolicy(hot_days=7))
+    for i, days in enumerate([1, 10, 40, 40]):
+        task = Task(agent_id="agent-a" if i % 2 else "agent-b", payload={"i": i})
+        task.id = f"task-{i}"
+        ledger.record_completion(task, {"ok": i})
+        age_task(ledger, task.id, days)
+    yield ledger
+    ledger.close()
+
+
+class TestLedgerRetention:
+    def test_old_rows_roll_into_daily_partitions(self, ledger, tmp_path):
+        assert ledger.archiver.roll_over(NOW) == {"task_history": 3}
+
+        assert [r["task_id"] for r in ledger.get_history(limit=10)] == ["task-0"]
+        partitions = [day for day, _ in ledger.archiver.partitions("task_history")]
+        assert partitions == [
+            (NOW - timedelta(days=40)).date().isoformat(),
+            (NOW - timedelta(days=10)).date().isoformat(),
+        ]
+        archive_file = tmp_path / "archive" / "task_history" / f"{partitions[0]}.jsonl.gz"
+        with gzip.open(archive_file, "rt") as f:
+            assert sorted(json.loads(line)["task_id"] for line in f) == ["task-2", "task-3"]
+
+        assert ledger.archiver.roll_over(NOW) == {}
+
+    def test_queries_reach_archived_partitions(self, ledger):
+        ledger.archiver.roll_over(NOW)
+
+        assert ledger.get_task("task-2") is None
+        record = ledger.get_task("task-2", include_archived=True)
+        assert record["input_payload"] == {"i": 2}
+        assert record["output_result"] == {"ok": 2}
+
+        history = ledger.get_history(limit=3, include_archived=True)
+        assert [r["task_id"] for r in history][:2] == ["task-0", "task-1"]
+        assert len(history) == 3
+        agent_a = ledger.get_history(agent_id="agent-a", include_archived=True)
+        assert [r["task_id"] for r in agent_a] == ["task-1", "task-3"]
+
+    def test_batches_are_bounded(self, tmp_path):
+        ledger = VibeLedger(
+            str(tmp_path / "vibe.db"), retention=RetentionPolicy(hot_days=7, batch_size=2)
+        )
+        for i in range(5):
+            task = Task(agent_id="a", payload={})
+            task.id = f"t{i}"
+            ledger.record_start(task)
+            age_task(ledger, task.id, 30)
+
+        assert ledger.archiver.roll_over(NOW) == {"task_history": 2}
+        assert ledger.archiver.roll_over(NOW) == {"task_history": 2}
+        assert ledger.archiver.roll_over(NOW) == {"task_history": 1}
+        assert ledger.get_history(limit=10) == []
+        assert len(ledger.get_history(limit=10, include_archived=True)) == 5
+
+    def test_crash_before_delete_duplicates_but_never_loses(self, ledger, monkeypatch):
+        def crash(*args):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(ledger.conn, "executemany", crash, raising=False)
+        with pytest.raises(sqlite3.OperationalError):
+            ledger.archiver.roll_over(NOW)
+        monkeypatch.undo()
+
+        assert ledger.get_task("task-2") is not None  # Still live
+        assert ledger.archiver.roll_over(NOW) == {"task_history": 3}
+        archived = list(ledger.archiver.iter_archived("task_history"))
+        assert sorted(r["task_id"] for r in archived) == ["task-1", "task-2", "task-3"]
+
+    def test_archived_duplicates_are_dropped_per_partition(self, ledger):
+        ledger.archiver.roll_over(NOW)
+        day = (NOW - timedelta(days=40)).date().isoformat()
+        rows = [
+            r for r in ledger.archiver.iter_archived("task_history") if r["task_id"] == "task-2"
+        ]
+        ledger.archiver._append_partition("task_history", day, rows)  # Crash before delete
+
+        archived = [r["task_id"] for r in ledger.archiver.iter_archived("task_history")]
+        assert sorted(archived) == ["task-1", "task-2", "task-3"]
+
+    def test_without_policy_nothing_moves(self, tmp_path):
+        ledger = VibeLedger(str(tmp_path / "vibe.db"))
+        task = Task(agent_id="a", payload={})
+        ledger.record_start(task)
+        age_task(ledger, task.id, 400)
+        assert ledger.housekeep()["archived"] == {}
+        assert ledger.get_task(task.id) is not None
+
+
+class TestVacuum:
+    def test_new_database_uses_incremental_vacuum(self, ledger):
+        assert ledger.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+    @staticmethod
+    def legacy_ledger(db_path, **policy) -> VibeLedger:
+        conn = sqlite3.connect(db_path)
+        conn.execute(
+            "CREATE TABLE task_history (task_id TEXT PRIMARY KEY, agent_id TEXT NOT NULL, "
+            "input_payload TEXT NOT NULL, output_result TEXT, status TEXT NOT NULL, "
+            "error_message TEXT, timestamp TEXT NOT NULL)"
+        )
+        conn.executemany(
+            "INSERT INTO task_history VALUES (?, 'a', ?, NULL, 'COMPLETED', NULL, ?)",
+            [(f"t{i}", "x" * 2000, "2020-01-01T00:00:00") for i in range(200)],
+        )
+        conn.commit()
+        conn.close()
+        return VibeLedger(str(db_path), retention=RetentionPolicy(hot_days=7, **policy))
+
+    def test_existing_database_is_not_converted_by_default(self, tmp_path):
+        ledger = self.legacy_ledger(tmp_path / "legacy.db")
+
+        summary = ledger.housekeep()
+        assert summary == {"archived": {"task_history": 200}, "vacuumed_pages": 0}
+        assert ledger.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+        ledger.close()
+
+    def test_existing_database_is_converted_and_shrinks(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        ledger = self.legacy_ledger(db_path, batch_size=500, convert_existing=True)
+        assert ledger.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+        size_before = db_path.stat().st_size
+
+        summary = ledger.housekeep()
+        assert summary["archived"] == {"task_history": 200}
+        assert ledger.conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+        assert db_path.stat().st_size < size_before / 4
+        assert len(ledger.get_history(limit=500, include_archived=True)) == 200
+        ledger.close()
+
+
+class TestStoreRetention:
+    def test_store_tables_roll_over_and_stay_queryable(self, tmp_path):
+        store = SQLiteStore(
+            str(tmp_path / "state" / "vibe_agency.db"),
+            retention=RetentionPolicy(hot_days=7, archive_dir=tmp_path / "cold"),
+        )
+        mission_id = store.create_mission("m-1", "CODING", "in_progress", NOW.isoformat())
+        old = (NOW - timedelta(days=30)).isoformat()
+        new = (NOW - timedelta(days=1)).isoformat()
+        store.log_tool_call(mission_id, "Read", {"p": 1}, {"ok": True}, old, 5, True)
+        store.log_tool_call(mission_id, "Edit", {"p": 2}, None, new, 5, False, "boom")
+        store.record_decision(mission_id, "tool_selection", "why", old, "CODING", {"k": 1})
+        store.add_session_narrative(mission_id, 1, "first", old, "PLANNING")
+        store.add_session_narrative(mission_id, 2, "second", new, "CODING")
+
+        assert store.archiver.roll_over(NOW) == {
+            "tool_calls": 1,
+            "decisions": 1,
+            "session_narrative": 1,
+        }
+        assert [c["tool_name"] for c in store.get_tool_calls_for_mission(mission_id)] == ["Edit"]
+        calls = store.get_tool_calls_for_mission(mission_id, include_archived=True)
+        assert [c["tool_name"] for c in calls] == ["Read", "Edit"]
+        assert calls[0]["args"] == {"p": 1}
+
+        assert store.get_decisions_for_mission(mission_id) == []
+        (decision,) = store.get_decisions_for_mission(mission_id, include_archived=True)
+        assert decision["context"] == {"k": 1}
+
+        sessions = store.get_session_narrative(mission_id, include_archived=True)
+        assert [s["session_num"] for s in sessions] == [1, 2]
+        assert store.get_tool_calls_for_mission(mission_id + 1, include_archived=True) == []
+        store.close()
+
+
+class TestKernelHousekeeping:
+    def test_idle_ticks_run_housekeeping_on_interval(self):
+        kernel = VibeKernel(":memory:")
+        runs = []
+        kernel.add_housekeeping(lambda: runs.append(1))
+        kernel.boot()
+
+        assert kernel.tick() is False
+        assert runs == []  # Interval not elapsed yet
+
+        kernel.housekeeping_interval = 0
+        assert kernel.tick() is False
+        assert runs == [1]
+
+    def test_ledger_housekeeping_only_with_retention(self, tmp_path):
+        assert VibeKernel(":memory:")._housekeeping == []
+        kernel = VibeKernel(str(tmp_path / "vibe.db"), retention=RetentionPolicy(hot_days=7))
+        assert kernel._housekeeping == [kernel.ledger.housekeep]
+
+    def test_task_result_falls_back_to_archive(self, tmp_path):
+        kernel = VibeKernel(str(tmp_path / "vibe.db"), retention=RetentionPolicy(hot_days=7))
+        task = Task(agent_id="a", payload={})
+        kernel.ledger.record_completion(task, {"ok": True})
+        age_task(kernel.ledger, task.id, 30)
+        kernel.ledger.archiver.roll_over(NOW)
+
+        assert kernel.ledger.get_task(task.id) is None
+        assert kernel.get_task_result(task.id)["output_result"] == {"ok": True}
+
+    def test_failing_job_does_not_break_tick(self):
+        kernel = VibeKernel(":memory:")
+        kernel.add_housekeeping(lambda: 1 / 0)
+        kernel.boot()
+        kernel.housekeeping_interval = 0
+        assert kernel.tick() is False
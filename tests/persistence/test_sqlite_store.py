@@ -368,6 +368,35 @@ class TestToolCallLogging:
         tool_calls = store.get_tool_calls_for_mission(mission_id)
         assert len(tool_calls) == 2
 
+    def test_iter_tool_calls_streams_in_batches(self):
+        """Test streaming tool calls across missions with a small fetch batch"""
+        store = SQLiteStore(":memory:")
+        m1 = store.create_mission("test-001", "PLANNING", "pending")
+        m2 = store.create_mission("test-002", "CODING", "pending")
+        for i in range(7):
+            store.log_tool_call(
+                m1 if i % 2 else m2, "Bash", {"i": i}, None, f"2025-11-20T00:0{i}:00Z", 1, True
+            )
+
+        stream = store.iter_tool_calls(batch_size=3)
+        assert not isinstance(stream, list)
+        calls = list(stream)
+        assert [c["args"]["i"] for c in calls] == list(range(7))
+        assert len(list(store.iter_tool_calls(m1, batch_size=2))) == 3
+
+    def test_iter_missions_and_tasks_match_list_api(self):
+        """Test streaming readers return the same rows as the list getters"""
+        store = SQLiteStore(":memory:")
+        for i in range(5):
+            store.create_mission(f"test-{i:03d}", "PLANNING", "pending")
+            store.add_task(f"task-{i}", f"Task {i}")
+        store.update_task_status("task-0", "completed", {"ok": True})
+
+        assert list(store.iter_missions(batch_size=2)) == store.get_mission_history()
+        tasks = list(store.iter_all_tasks(batch_size=2))
+        assert tasks == store.get_all_tasks()
+        assert tasks[0]["result"] == {"ok": True}
+
 
 class TestDecisionProvenance:
     """Test agent decision recording"""
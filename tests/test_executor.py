@@ -11,14 +11,14 @@ Ensures the executor correctly:
   5. Handles dry-run mode
 """
 
-from pathlib import Path
+import threading
+import time
 
 import pytest
 
-# Add runtime directory to path
-runtime_dir = Path(__file__).parent.parent / "agency_os" / "core_system" / "playbook"
-
-from executor import (
+from vibe_core.playbook.executor import (
+    AgentInterface,
+    ExecutionResult,
     ExecutionStatus,
     GraphExecutor,
     MockAgent,
@@ -419,5 +419,339 @@ class TestGraphExecutor:
         assert plan.execution_order[-1] == "end"
 
 
+class SleepyAgent(AgentInterface):
+    """Agent that sleeps per action and records peak concurrency"""
+
+    name = "SleepyAgent"
+
+    def __init__(self, delays: dict[str, float], fail: set[str] = frozenset()):
+        self.delays = delays
+        self.fail = fail
+        self.started: list[str] = []
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def can_execute(self, required_skills: list[str]) -> bool:
+        return True
+
+    def execute_action(self, action: str, prompt: str, timeout_seconds: int) -> ExecutionResult:
+        with self._lock:
+            self.started.append(action)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delays.get(action, 0.0))
+        with self._lock:
+            self.active -= 1
+        status = ExecutionStatus.FAILED if action in self.fail else ExecutionStatus.SUCCESS
+        return ExecutionResult(
+            workflow_id="w", node_id=action, status=status, output=prompt, cost_usd=0.01
+        )
+
+
+def _diamond() -> WorkflowGraph:
+    nodes = {name: WorkflowNode(id=name, action=name) for name in ("start", "a", "b", "join")}
+    edges = [
+        WorkflowEdge("start", "a"),
+        WorkflowEdge("start", "b"),
+        WorkflowEdge("a", "join"),
+        WorkflowEdge("b", "join"),
+    ]
+    return WorkflowGraph(
+        id="diamond",
+        name="Diamond",
+        intent="Test",
+        nodes=nodes,
+        edges=edges,
+        entry_point="start",
+        exit_points=["join"],
+    )
+
+
+class TestParallelExecution:
+    """Tests for wave-parallel execution (execute_parallel)"""
+
+    @pytest.fixture(autouse=True)
+    def live_fire(self, monkeypatch):
+        from vibe_core.config import get_config
+
+        monkeypatch.setattr(get_config().safety, "live_fire_enabled", True)
+
+    def test_independent_branches_overlap(self):
+        """Branches a and b run concurrently, join waits for both"""
+        agent = SleepyAgent({"a": 0.2, "b": 0.2})
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+
+        result = executor.execute_parallel(_diamond(), max_workers=4)
+
+        assert result["status"] == "success"
+        assert agent.peak == 2
+        assert result["execution_order"][0] == "start"
+        assert result["execution_order"][-1] == "join"
+        assert result["wall_time_seconds"] < 0.4
+        assert result["total_cost_usd"] == pytest.approx(0.04)
+
+    def test_pool_size_bounds_concurrency(self):
+        """max_workers=1 serializes the branches"""
+        agent = SleepyAgent({"a": 0.05, "b": 0.05})
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+
+        executor.execute_parallel(_diamond(), max_workers=1)
+
+        assert agent.peak == 1
+
+    def test_failure_skips_dependents(self):
+        """A failed node skips nodes behind a success edge"""
+        executor = GraphExecutor()
+        executor.set_agent(SleepyAgent({}, fail={"a"}))
+
+        result = executor.execute_parallel(_diamond())
+        statuses = {r["node_id"]: r["status"] for r in result["results"]}
+
+        assert result["status"] == "failed"
+        assert statuses == {
+            "start": "success",
+            "a": "failed",
+            "b": "success",
+            "join": "skipped",
+        }
+
+    def test_node_timeout(self):
+        """A node exceeding timeout_seconds fails without blocking the run"""
+        agent = SleepyAgent({"a": 2.0})
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+
+        workflow = _diamond()
+        workflow.nodes["a"].timeout_seconds = 0
+
+        started = time.monotonic()
+        result = executor.execute_parallel(workflow)
+        statuses = {r["node_id"]: r["status"] for r in result["results"]}
+
+        assert time.monotonic() - started < 1.5
+        assert statuses == {"start": "success", "a": "failed", "b": "success", "join": "skipped"}
+        assert "Timed out" in next(r["error"] for r in result["results"] if r["node_id"] == "a")
+
+    def test_timeout_counts_from_start_and_keeps_slot(self):
+        """Queued nodes get their full timeout; abandoned workers keep their slot"""
+
+        class RecordingQuota:
+            def __init__(self):
+                self.operations: list[str] = []
+
+            def check_before_request(self, estimated_tokens, operation="unknown"):
+                return True, "OK"
+
+            def record_request(self, tokens_used, cost_usd, operation="unknown"):
+                self.operations.append(operation)
+
+        agent = SleepyAgent({"a": 1.2, "b": 0.05})
+        quota = RecordingQuota()
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+        executor.set_quota_manager(quota)
+
+        workflow = _diamond()
+        workflow.nodes["a"].timeout_seconds = 1
+        workflow.nodes["b"].timeout_seconds = 1
+
+        result = executor.execute_parallel(workflow, max_workers=1)
+        statuses = {r["node_id"]: r["status"] for r in result["results"]}
+
+        assert statuses == {"start": "success", "a": "failed", "b": "success", "join": "skipped"}
+        assert agent.peak == 1
+        # The late result of the abandoned node is neither recorded nor charged
+        assert [r.status for r in executor.execution_history if r.node_id == "a"] == [
+            ExecutionStatus.FAILED
+        ]
+        assert quota.operations == ["start", "b"]
+
+    def test_quota_stop_before_dispatch(self):
+        """Once the quota rejects a node, nothing else is dispatched"""
+
+        class TwoRequestQuota:
+            def __init__(self):
+                self.calls = 0
+
+            def check_before_request(self, estimated_tokens, operation="unknown"):
+                self.calls += 1
+                if self.calls > 2:
+                    raise RuntimeError("Request rate limit exceeded")
+                return True, "OK"
+
+            def record_request(self, tokens_used, cost_usd, operation="unknown"):
+                pass
+
+        agent = SleepyAgent({})
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+        executor.set_quota_manager(TwoRequestQuota())
+
+        result = executor.execute_parallel(_diamond(), max_workers=1)
+        statuses = {r["node_id"]: r["status"] for r in result["results"]}
+
+        assert len(agent.started) == 2
+        assert list(statuses.values()).count("failed") == 1
+        assert statuses["join"] == "skipped"
+
+    def test_dry_run_critical_path(self):
+        """dry_run reports the longest path next to the serial sum"""
+        workflow = _diamond()
+        workflow.nodes["a"].timeout_seconds = 600
+
+        result = GraphExecutor().dry_run(workflow)
+
+        assert result["critical_path"] == {
+            "nodes": ["start", "a", "join"],
+            "wall_time_seconds": 1200,
+            "serial_time_seconds": 1500.0,
+        }
+
+
+class TestRunContext:
+    """Tests for hoisted per-run setup (RunContext)"""
+
+    @pytest.fixture
+    def resolve_calls(self, monkeypatch):
+        from vibe_core.runtime import prompt_context
+
+        calls = []
+
+        class CountingContext:
+            def resolve(self, keys):
+                calls.append(keys)
+                return {"system_time": "now", "current_branch": "main", "git_status": "clean"}
+
+        monkeypatch.setattr(prompt_context, "get_prompt_context", lambda: CountingContext())
+        return calls
+
+    def _prompted_diamond(self) -> WorkflowGraph:
+        workflow = _diamond()
+        for node in workflow.nodes.values():
+            node.prompt_key = "missing.prompt"
+        return workflow
+
+    def test_system_context_resolved_once_per_run(self, resolve_calls):
+        """All nodes of a run share one system context resolution"""
+        result = GraphExecutor().execute_parallel(self._prompted_diamond())
+
+        assert result["status"] == "success"
+        assert len(resolve_calls) == 1
+        assert result["run_setup_seconds"] >= 0
+        assert all("setup_seconds" in r for r in result["results"])
+
+    def test_execute_step_shares_prepared_context(self, resolve_calls):
+        """Manual node loops reuse a prepared run context"""
+        executor = GraphExecutor()
+        workflow = self._prompted_diamond()
+        run = executor.prepare_run()
+
+        for node_id in ("start", "a", "b", "join"):
+            executor.execute_step(workflow, node_id, run_context=run)
+        assert len(resolve_calls) == 1
+
+        run.refresh()
+        executor.execute_step(workflow, "join", run_context=run)
+        assert len(resolve_calls) == 2
+
+    def test_standalone_step_resolves_per_call(self, resolve_calls):
+        """Without a run context each call resolves its own (legacy behavior)"""
+        executor = GraphExecutor()
+        workflow = self._prompted_diamond()
+
+        executor.execute_step(workflow, "start")
+        executor.execute_step(workflow, "a")
+        assert len(resolve_calls) == 2
+
+
+class TestCheckpointResume:
+    """Tests for per-node checkpoints and resume(run_id)"""
+
+    @pytest.fixture(autouse=True)
+    def live_fire(self, monkeypatch):
+        from vibe_core.config import get_config
+
+        monkeypatch.setattr(get_config().safety, "live_fire_enabled", True)
+
+    @pytest.fixture
+    def store(self):
+        from vibe_core.store.sqlite_store import SQLiteStore
+
+        with SQLiteStore(":memory:") as store:
+            yield store
+
+    def _executor(self, store, agent):
+        executor = GraphExecutor()
+        executor.set_agent(agent)
+        executor.set_checkpoint_store(store)
+        return executor
+
+    def test_resume_skips_completed_nodes(self, store):
+        """After a failure, resume only runs the failed node and what depends on it"""
+        workflow = _diamond()
+        first = self._executor(store, SleepyAgent({}, fail={"a"})).execute_parallel(workflow)
+        assert first["status"] == "failed"
+
+        agent = SleepyAgent({})
+        resumed = self._executor(store, agent).resume(workflow, first["run_id"])
+
+        assert resumed["status"] == "success"
+        assert sorted(agent.started) == ["a", "join"]
+        assert sorted(resumed["restored_nodes"]) == ["b", "start"]
+        assert resumed["total_cost_usd"] == pytest.approx(0.02)
+
+    def test_unchanged_rerun_is_free(self, store):
+        """Re-running a completed run executes nothing"""
+        workflow = _diamond()
+        run_id = self._executor(store, SleepyAgent({})).execute_parallel(workflow)["run_id"]
+
+        agent = SleepyAgent({})
+        rerun = self._executor(store, agent).resume(workflow, run_id)
+
+        assert agent.started == []
+        assert rerun["total_cost_usd"] == 0
+        assert len(rerun["restored_nodes"]) == 4
+
+    def test_changed_node_invalidates_downstream(self, store):
+        """Editing a node re-runs it and everything downstream of it"""
+        workflow = _diamond()
+        run_id = self._executor(store, SleepyAgent({})).execute_parallel(workflow)["run_id"]
+
+        workflow.nodes["b"].description = "changed"
+        agent = SleepyAgent({})
+        self._executor(store, agent).resume(workflow, run_id)
+
+        assert sorted(agent.started) == ["b", "join"]
+        checkpoints = store.get_checkpoints(run_id)
+        assert {c["status"] for c in checkpoints.values()} == {"success"}
+
+    def test_mock_checkpoints_are_not_restored_in_live_mode(self, store, monkeypatch):
+        """Mock outputs never stand in for live results, nor one agent's for another's"""
+        from vibe_core.config import get_config
+
+        workflow = _diamond()
+        monkeypatch.setattr(get_config().safety, "live_fire_enabled", False)
+        run_id = self._executor(store, SleepyAgent({})).execute_parallel(workflow)["run_id"]
+
+        monkeypatch.setattr(get_config().safety, "live_fire_enabled", True)
+        agent = SleepyAgent({})
+        resumed = self._executor(store, agent).resume(workflow, run_id)
+        assert sorted(agent.started) == ["a", "b", "join", "start"]
+        assert resumed["restored_nodes"] == []
+
+        other = SleepyAgent({})
+        other.name = "OtherAgent"
+        self._executor(store, other).resume(workflow, run_id)
+        assert len(other.started) == 4
+
+    def test_resume_requires_store(self):
+        """resume() without a checkpoint store is an error"""
+        with pytest.raises(RuntimeError, match="checkpoint store"):
+            GraphExecutor().resume(_diamond(), "run-1")
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -219,3 +219,131 @@ def test_task_status_in_summary():
 
     assert total == 8
     assert all(v >= 0 for v in summary.values())
+
+
+# ============================================================================
+# STREAMING EXPORT
+# ============================================================================
+
+
+def _make_roadmap():
+    from vibe_core.task_management.models import Roadmap, RoadmapPhase, Task, ValidationCheck
+
+    tasks = {
+        "task-1": Task(
+            id="task-1",
+            name="Build System, Phase 2",
+            description="Build the core system",
+            status="DONE",
+            priority=9,
+            validation_checks=[
+                ValidationCheck(id="c1", description="c1", validator="v", status=True),
+                ValidationCheck(id="c2", description="c2", validator="v", status=False),
+            ],
+        ),
+        "task-2": Task(id="task-2", name="Testing", description="", status="TODO", priority=7),
+    }
+    phase = RoadmapPhase(name="PHASE_1", status="IN_PROGRESS", task_ids=["task-1", "task-2"])
+    return Roadmap(project_name="test-project", phases=[phase], tasks=tasks)
+
+
+def test_engine_csv_and_markdown_render_via_writers():
+    """to_csv/to_markdown keep their format when built on the streaming writers."""
+    from vibe_core.task_management.export_engine import ExportEngine
+
+    engine = ExportEngine(_make_roadmap())
+
+    csv_lines = engine.to_csv().splitlines()
+    assert csv_lines[0] == "ID,Name,Status,Priority,Created,Progress"
+    assert csv_lines[1].startswith("task-1,Build System; Phase 2,DONE,9,")
+    assert csv_lines[1].endswith(",50%")
+
+    md = engine.to_markdown()
+    assert md.startswith("# test-project\n")
+    assert "**Progress:** 1/2 tasks complete (50%)" in md
+    assert "  - Validation: 1/2 checks (50%)" in md
+    assert not md.endswith("\n\n")
+
+
+def test_write_jsonl_streams_generator(tmp_path):
+    """JSONL writer consumes a generator lazily and supports gzip."""
+    import gzip
+
+    from vibe_core.task_management.export_engine import export_rows, write_jsonl
+
+    consumed = []
+
+    def rows():
+        for i in range(1000):
+            consumed.append(i)
+            yield {"id": i, "args": {"n": i}}
+
+    class RecordingHandle:
+        """Notes how many rows the generator had produced at each line written."""
+
+        def __init__(self):
+            self.produced_at_write = []
+
+        def write(self, text):
+            if text != "\n":
+                self.produced_at_write.append(len(consumed))
+
+    fh = RecordingHandle()
+    assert write_jsonl(rows(), fh) == 1000
+    # Each row is written before the next one is pulled from the generator
+    assert fh.produced_at_write == list(range(1, 1001))
+
+    consumed.clear()
+    out = tmp_path / "calls.jsonl.gz"
+    assert export_rows(rows(), out, "jsonl") == 1000
+    assert consumed == list(range(1000))
+
+    with gzip.open(out, "rt") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 1000
+    assert json.loads(lines[-1]) == {"id": 999, "args": {"n": 999}}
+
+
+def test_write_csv_quotes_and_flattens(tmp_path):
+    """CSV writer quotes commas and JSON-encodes nested values."""
+    import csv
+
+    from vibe_core.task_management.export_engine import export_rows
+
+    out = tmp_path / "rows.csv"
+    count = export_rows(
+        [{"id": 1, "name": "a, b", "args": {"x": 1}}, {"id": 2, "name": "c", "args": None}],
+        out,
+        "csv",
+    )
+    assert count == 2
+
+    with open(out, newline="") as f:
+        parsed = list(csv.DictReader(f))
+    assert parsed[0]["name"] == "a, b"
+    assert json.loads(parsed[0]["args"]) == {"x": 1}
+    assert parsed[1]["args"] == ""
+
+
+def test_write_markdown_table_escapes_pipes():
+    """Markdown table writer escapes cell separators."""
+    from io import StringIO
+
+    from vibe_core.task_management.export_engine import write_markdown_table
+
+    out = StringIO()
+    assert write_markdown_table([{"tool": "Bash", "args": "a|b"}], out, title="Calls") == 1
+    lines = out.getvalue().splitlines()
+    assert lines[0] == "# Calls"
+    assert lines[2] == "| tool | args |"
+    assert lines[4] == "| Bash | a\\|b |"
+
+
+def test_export_rows_rejects_unknown_format(tmp_path):
+    """Unknown formats fail fast."""
+    import pytest
+
+    from vibe_core.task_management.export_engine import export_rows
+
+    with pytest.raises(ValueError, match="Unknown export format"):
+        export_rows([], tmp_path / "x.xml", "xml")
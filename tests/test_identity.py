@@ -277,6 +277,36 @@ class TestAgentRegistry:
         found = registry.find_by_capability("non-existent-capability")
         assert found == []
 
+    def test_unregister_updates_capability_index(self):
+        """Test unregister removes the agent from capability lookups."""
+        provider = MockLLMProvider()
+        registry = AgentRegistry()
+        for agent_id in ("agent-1", "agent-2"):
+            agent = SimpleLLMAgent(agent_id=agent_id, provider=provider)
+            registry.register(generate_manifest_for_agent(agent))
+
+        removed = registry.unregister("agent-1")
+
+        assert removed.agent_id == "agent-1"
+        assert [m.agent_id for m in registry.find_by_capability("process")] == ["agent-2"]
+        assert registry.unregister("agent-1") is None
+
+        registry.unregister("agent-2")
+        assert registry.find_by_capability("process") == []
+        assert registry.list_capabilities() == {}
+
+    def test_find_by_capabilities(self):
+        """Test multi-capability lookup (all vs any)."""
+        provider = MockLLMProvider()
+        agent = SimpleLLMAgent(agent_id="agent-1", provider=provider)
+        manifest = generate_manifest_for_agent(agent)
+        registry = AgentRegistry()
+        registry.register(manifest)
+
+        assert registry.find_by_capabilities(["process", "missing"]) == []
+        assert registry.find_by_capabilities(["process", "missing"], match_all=False) == [manifest]
+        assert registry.list_capabilities()["process"] == 1
+
     def test_list_all(self):
         """Test listing all registered manifests."""
         provider = MockLLMProvider()
@@ -13,6 +13,8 @@ Test coverage:
 - Edge cases and error handling
 """
 
+import yaml
+
 from vibe_core.governance import InvariantChecker, SoulResult
 
 
@@ -329,6 +331,99 @@ class TestRealWorldScenarios:
             assert result.reason is not None
 
 
+class TestCompiledRules:
+    """Test the compiled matcher agrees with ordered rule evaluation."""
+
+    def _write_soul(self, tmp_path, rules):
+        soul = tmp_path / "soul.yaml"
+        soul.write_text(yaml.safe_dump({"safety_rules": rules}))
+        return soul
+
+    def test_compiled_matches_ordered_evaluation(self, tmp_path, monkeypatch):
+        """Test first blocking rule in soul order wins, as with a linear scan."""
+        monkeypatch.chdir(tmp_path)
+        rules = [
+            {"id": "docs", "condition": "path_contains", "pattern": "docs/", "action": "block"},
+            {"id": "exact", "condition": "path_matches", "pattern": "a/docs/x", "action": "block"},
+            {"id": "sandbox", "condition": "path_outside_root", "action": "block"},
+            {"id": "doc", "condition": "path_contains", "pattern": "doc", "action": "block"},
+            {"id": "warn", "condition": "path_contains", "pattern": "src", "action": "warn"},
+        ]
+        checker = InvariantChecker(str(self._write_soul(tmp_path, rules)))
+
+        paths = ["a/docs/x", "doc.txt", "../doc.txt", "/tmp/src", "src/main.py", "ok.txt"]
+        for path in paths:
+            expected = SoulResult(allowed=True)
+            for rule in checker.rules:
+                if rule.get("action") != "block":
+                    continue
+                result = checker._check_rule(rule, "write_file", {"path": path})
+                if not result.allowed:
+                    expected = result
+                    break
+            assert checker.check_tool_call("write_file", {"path": path}) == expected, path
+
+    def test_rules_scoped_to_tools(self, tmp_path):
+        """Test rules with a tools list only apply to those tools."""
+        rules = [
+            {
+                "id": "no_delete_docs",
+                "condition": "path_contains",
+                "pattern": "docs",
+                "action": "block",
+                "tools": ["delete_file"],
+            },
+        ]
+        checker = InvariantChecker(str(self._write_soul(tmp_path, rules)))
+
+        assert checker.check_tool_call("delete_file", {"path": "docs/a.md"}).allowed is False
+        assert checker.check_tool_call("read_file", {"path": "docs/a.md"}).allowed is True
+
+    def test_reload_recompiles(self, tmp_path):
+        """Test reload() picks up new rules."""
+        soul = self._write_soul(tmp_path, [])
+        checker = InvariantChecker(str(soul))
+        assert checker.check_tool_call("write_file", {"path": "notes.md"}).allowed is True
+
+        rule = {
+            "id": "notes",
+            "condition": "path_matches",
+            "pattern": "notes.md",
+            "action": "block",
+            "message": "No notes.",
+        }
+        self._write_soul(tmp_path, [rule])
+        checker.reload()
+
+        result = checker.check_tool_call("write_file", {"path": "notes.md"})
+        assert result == SoulResult(allowed=False, reason="No notes. (Rule: notes)")
+
+    def test_outside_root_follows_working_directory(self, tmp_path, monkeypatch):
+        """Test memoized path resolution is keyed by the working directory."""
+        checker = InvariantChecker("nonexistent/soul.yaml")
+        inner = tmp_path / "inner"
+        inner.mkdir()
+
+        monkeypatch.chdir(tmp_path)
+        assert checker._is_path_outside_root("inner/file.txt") is False
+        monkeypatch.chdir(inner)
+        assert checker._is_path_outside_root("inner/file.txt") is False
+        assert checker._is_path_outside_root("../file.txt") is True
+
+    def test_outside_root_sees_symlinks_created_after_a_check(self, tmp_path, monkeypatch):
+        """Test a symlink created after a passing check is still resolved."""
+        checker = InvariantChecker("nonexistent/soul.yaml")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        workspace = tmp_path / "workspace"
+        workspace.mkdir()
+
+        monkeypatch.chdir(workspace)
+        assert checker._is_path_outside_root("link/passwd") is False
+        (workspace / "link").symlink_to(outside)
+        assert checker._is_path_outside_root("link/passwd") is True
+
+
 class TestIntegrationWithToolExecutor:
     """Test integration scenarios with ToolExecutor (if available)."""
 
@@ -256,6 +256,54 @@ class TestAttackSimulation:
         assert success is False
 
 
+@pytest.fixture
+def settled_files(monkeypatch):
+    """Treat files as settled right away (ctime can't be backdated in tests)."""
+    monkeypatch.setattr(verify_module, "RACY_WINDOW_SECONDS", 0)
+
+
+class TestDigestCache:
+    """Test the stat-keyed digest cache and --paranoid mode."""
+
+    def test_unchanged_files_are_served_from_cache(self, temp_workspace, settled_files):
+        generate_manifest()
+
+        assert verify_system_integrity()[1]["digests"] == {"cached": 0, "hashed": 3}
+        success, report = verify_system_integrity()
+
+        assert success is True
+        assert report["digests"] == {"cached": 3, "hashed": 0}
+
+    def test_paranoid_rehashes_everything(self, temp_workspace, settled_files):
+        generate_manifest()
+        verify_system_integrity()
+
+        success, report = verify_system_integrity(paranoid=True)
+        assert success is True
+        assert report["digests"] == {"cached": 0, "hashed": 3}
+
+    def test_recently_modified_files_are_not_cached(self, temp_workspace):
+        """Files inside the racy window are re-hashed on every run."""
+        generate_manifest()
+
+        verify_system_integrity()
+        assert verify_system_integrity()[1]["digests"]["hashed"] == 3
+
+    def test_tamper_preserving_size_and_mtime_is_detected(self, temp_workspace, settled_files):
+        """Restoring mtime after a same-size edit still changes ctime."""
+        generate_manifest()
+        verify_system_integrity()
+
+        script = Path("scripts/verify-system-integrity.py")
+        st = script.stat()
+        script.write_text("# verify SCRIPT\n")  # Same size
+        os.utime(script, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        success, report = verify_system_integrity()
+        assert success is False
+        assert report["failed"][0]["file"] == "scripts/verify-system-integrity.py"
+
+
 # Summary test to verify all requirements
 def test_layer0_requirements_met(temp_workspace):
     """
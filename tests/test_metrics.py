@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics registry
+
+Test Strategy:
+- Counters, gauges and histograms render as Prometheus text (0.0.4)
+- Histogram buckets are cumulative and end in +Inf; label values are escaped
+- Metrics are get-or-create by name; a conflicting redeclaration fails
+- Kernel, tools, governance and SQLite record into the process registry
+- The file exporter replaces its snapshot atomically; `metrics` prints it
+- Recording stays cheap enough to leave on in production
+"""
+
+import time
+
+import pytest
+
+from tests.mocks.llm import MockLLMProvider
+from vibe_core.agents.llm_agent import SimpleLLMAgent
+from vibe_core.kernel import VibeKernel
+from vibe_core.metrics import (
+    MetricsFileExporter,
+    MetricsRegistry,
+    connect_metered,
+    get_registry,
+)
+from vibe_core.runtime.tool_safety_guard import ToolSafetyGuard
+from vibe_core.scheduling import Task
+from vibe_core.tools import ReadFileTool, ToolCall, ToolRegistry
+
+
+@pytest.fixture
+def registry():
+    registry = get_registry()
+    registry.clear()
+    yield registry
+    registry.clear()
+
+
+def sample(registry: MetricsRegistry, line_prefix: str) -> float:
+    """Value of the first exposition line starting with line_prefix."""
+    for line in registry.render().splitlines():
+        if line.startswith(line_prefix):
+            return float(line.rsplit(" ", 1)[1])
+    raise AssertionError(f"no sample {line_prefix!r} in:\n{registry.render()}")
+
+
+class TestRegistry:
+    def test_counter_and_gauge_render(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls made", ("tool",))
+        calls.labels("read_file").inc()
+        calls.labels("read_file").inc(2)
+        depth = registry.gauge("queue_depth", "Queue depth")
+        depth.set(3)
+        depth.dec()
+
+        lines = registry.render().splitlines()
+        assert lines == [
+            "# HELP calls_total Calls made",
+            "# TYPE calls_total counter",
+            'calls_total{tool="read_file"} 3',
+            "# HELP queue_depth Queue depth",
+            "# TYPE queue_depth gauge",
+            "queue_depth 2",
+        ]
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 5.0):
+            latency.observe(value)
+
+        text = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in text
+        assert 'latency_seconds_bucket{le="1"} 3' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in text
+        assert "latency_seconds_sum 5.65" in text
+        assert "latency_seconds_count 4" in text
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("error",)).labels('bad "quote"\n\\').inc()
+        assert 'errors_total{error="bad \\"quote\\"\\n\\\\"} 1' in registry.render()
+
+    def test_get_or_create_and_conflicts(self):
+        registry = MetricsRegistry()
+        first = registry.counter("hits_total", "Hits", ("route",))
+        assert registry.counter("hits_total", "Hits", ("route",)) is first
+        with pytest.raises(ValueError):
+            registry.gauge("hits_total", "Hits", ("route",))
+        with pytest.raises(ValueError):
+            registry.counter("hits_total", "Hits", ("path",))
+        with pytest.raises(ValueError):
+            first.labels("a", "b")
+        with pytest.raises(ValueError):
+            first.labels("a").inc(-1)
+
+    def test_clear_keeps_declarations(self):
+        registry = MetricsRegistry()
+        calls = registry.counter("calls_total", "Calls")
+        calls.inc()
+        registry.clear()
+        assert registry.render() == ""
+        calls.inc()
+        assert "calls_total 1" in registry.render()
+
+    def test_recording_overhead_is_small(self):
+        registry = MetricsRegistry()
+        child = registry.histogram("hot_seconds", "Hot path", ("op",)).labels("x")
+        started = time.perf_counter()
+        for _ in range(100_000):
+            child.observe(0.002)
+        per_call = (time.perf_counter() - started) / 100_000
+        assert per_call < 20e-6  # generous bound; typically ~1µs
+
+
+class TestInstrumentation:
+    def test_kernel_records_task_metrics(self, registry):
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(
+            SimpleLLMAgent(agent_id="operator", provider=MockLLMProvider(mock_response="done"))
+        )
+        kernel.boot()
+        kernel.submit(Task(agent_id="operator", payload={"user_message": "hi"}))
+        assert sample(registry, "vibe_kernel_queue_depth") == 1
+
+        assert kernel.tick()
+        assert sample(registry, "vibe_kernel_queue_depth") == 0
+        assert sample(registry, 'vibe_kernel_tasks_total{agent="operator",status="COMPLETED"}') == 1
+        assert sample(registry, 'vibe_kernel_task_seconds_count{agent="operator"}') == 1
+
+    def test_tool_and_governance_metrics(self, registry, tmp_path):
+        target = tmp_path / "notes.txt"
+        target.write_text("hello")
+        tools = ToolRegistry()
+        tools.register(ReadFileTool())
+        tools.execute(ToolCall(tool_name="read_file", parameters={"path": str(target)}))
+        tools.execute(ToolCall(tool_name="missing_tool", parameters={}))
+
+        assert sample(registry, 'vibe_tool_calls_total{tool="read_file",outcome="success"}') == 1
+        assert sample(registry, 'vibe_tool_calls_total{tool="missing_tool",outcome="error"}') == 1
+        assert sample(registry, 'vibe_tool_seconds_count{tool="read_file"}') == 1
+
+        ToolSafetyGuard().check_action("edit_file", {"path": str(target)})
+        blocked = 'vibe_governance_blocks_total{layer="iron_dome",tool="edit_file"'
+        assert sample(registry, blocked) == 1
+
+    def test_sqlite_queries_are_labelled_by_verb(self, registry, tmp_path):
+        conn = connect_metered(str(tmp_path / "m.db"), "test_store")
+        conn.execute("CREATE TABLE t (x INTEGER)")
+        conn.executemany("INSERT INTO t VALUES (?)", [(1,), (2,)])
+        conn.execute("  select count(*) from t").fetchone()
+        conn.execute("ANALYZE")
+        conn.close()
+
+        prefix = "vibe_sqlite_query_seconds_count"
+        assert sample(registry, f'{prefix}{{store="test_store",verb="CREATE"}}') == 1
+        assert sample(registry, f'{prefix}{{store="test_store",verb="INSERT"}}') == 1
+        assert sample(registry, f'{prefix}{{store="test_store",verb="SELECT"}}') == 1
+        assert sample(registry, f'{prefix}{{store="test_store",verb="OTHER"}}') == 1
+
+
+class TestExport:
+    def test_exporter_writes_snapshot_atomically(self, tmp_path):
+        registry = MetricsRegistry()
+        registry.counter("ticks_total", "Ticks").inc()
+        path = tmp_path / "state" / "metrics.prom"
+        exporter = MetricsFileExporter(path, registry=registry, interval=60)
+
+        exporter.start()
+        registry.counter("ticks_total", "Ticks").inc()
+        exporter.stop()
+
+        text = path.read_text()
+        assert text.startswith("# vibe metrics snapshot pid=")
+        assert "ticks_total 2" in text
+        assert [p.name for p in path.parent.iterdir()] == ["metrics.prom"]
+
+    def test_metrics_command_prints_snapshot(self, tmp_path, monkeypatch, capsys):
+        cli = pytest.importorskip("apps.agency.cli")
+        path = tmp_path / "metrics.prom"
+        monkeypatch.setenv("VIBE_METRICS_FILE", str(path))
+
+        assert cli.display_metrics() == 1
+        capsys.readouterr()
+
+        registry = MetricsRegistry()
+        registry.counter("ticks_total", "Ticks").inc()
+        MetricsFileExporter(path, registry=registry).write()
+        assert cli.display_metrics() == 0
+        assert "ticks_total 1" in capsys.readouterr().out
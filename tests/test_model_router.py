@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Test suite for GAD-511.1 (Model Tier Router)
+
+Test Strategy:
+- Declared task class, prompt size and remaining budget pick the tier
+- Undeclared calls, models missing from the tier table, and providers
+  without one (or VIBE_MODEL_ROUTING=0) keep the requested model
+- LLMClient escalates one tier when an answer fails validation
+- Latency, cost and outcome are tracked per tier
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+from vibe_core.runtime.llm_client import LLMClient, LLMResponse, LLMUsage
+from vibe_core.runtime.model_router import PINNED, ModelRouter
+from vibe_core.runtime.providers.anthropic import AnthropicProvider
+
+HAIKU = "claude-3-5-haiku-20241022"
+SONNET = "claude-3-5-sonnet-20241022"
+TIER_MODELS = {"fast": "small", "balanced": "medium", "strong": "large"}
+
+
+class FakeAnthropic:
+    """Provider named "Anthropic" that answers with canned contents"""
+
+    def __init__(self, *contents):
+        self.contents = list(contents)
+        self.models = []
+
+    def get_provider_name(self):
+        return "Anthropic"
+
+    def get_available_models(self):
+        return list(AnthropicProvider.PRICING)
+
+    def calculate_cost(self, input_tokens, output_tokens, model):
+        pricing = AnthropicProvider.PRICING[model]
+        return (input_tokens * pricing["input"] + output_tokens * pricing["output"]) / 1_000_000
+
+    def invoke(self, prompt, model, max_tokens, temperature, max_retries):
+        self.models.append(model)
+        cost = self.calculate_cost(100, 10, model)
+        return LLMResponse(
+            content=self.contents.pop(0),
+            usage=LLMUsage(100, 10, model, cost, "2025-01-01T00:00:00Z"),
+            model=model,
+            finish_reason="end_turn",
+        )
+
+
+class TestRouting:
+    """Tests for tier selection"""
+
+    def test_task_class_picks_tier(self):
+        router = ModelRouter(TIER_MODELS)
+        assert router.route("medium", "classification", 800, 2048).tier == "fast"
+        assert router.route("medium", "code_generation", 800, 2048).model == "large"
+        assert router.route("medium", "default", 8000, 4096).model == "medium"
+
+    def test_undeclared_calls_keep_requested_model(self):
+        router = ModelRouter(TIER_MODELS)
+        short = router.route("large", "default", prompt_tokens=500, max_tokens=256)
+        assert (short.tier, short.model) == ("strong", "large")
+        low = router.route("large", "default", 800, 4096, budget_fraction_left=0.1)
+        assert low.model == "large"
+
+    def test_models_missing_from_tier_table_are_pinned(self):
+        router = ModelRouter.for_provider(FakeAnthropic())
+        for task_class in ("default", "classification", "code_generation"):
+            decision = router.route("claude-3-opus-20240229", task_class, 500, 256)
+            assert (decision.tier, decision.model) == (PINNED, "claude-3-opus-20240229")
+
+    def test_long_prompt_skips_fast_tier(self):
+        router = ModelRouter(TIER_MODELS)
+        assert router.route("medium", "classification", 50_000, 256).tier == "balanced"
+
+    def test_remaining_budget_steps_down(self):
+        router = ModelRouter(TIER_MODELS)
+        low = router.route("large", "code_generation", 800, 4096, budget_fraction_left=0.1)
+        assert low.tier == "balanced"
+
+        costs = {"small": 0.01, "medium": 0.5, "large": 2.0}
+        tight = router.route(
+            "large", "code_generation", 800, 4096, budget_left_usd=0.2, cost_of=costs.get
+        )
+        assert tight.model == "small"
+        assert "over remaining budget" in tight.reason
+
+    def test_unknown_provider_passes_through(self, monkeypatch):
+        provider = Mock()
+        provider.get_provider_name.return_value = "Local"
+        decision = ModelRouter.for_provider(provider).route("llama", "classification", 10, 10)
+        assert (decision.tier, decision.model) == (PINNED, "llama")
+
+        monkeypatch.setenv("VIBE_MODEL_ROUTING", "0")
+        router = ModelRouter.for_provider(FakeAnthropic())
+        assert router.route(SONNET, "classification", 10, 10).model == SONNET
+
+
+class TestLLMClientRouting:
+    """Tests for routing, escalation and stats inside LLMClient"""
+
+    def test_declared_cheap_calls_use_fast_tier(self):
+        provider = FakeAnthropic('{"label": "bug"}', "A crash on start.")
+        client = LLMClient(provider=provider)
+
+        response = client.invoke(
+            prompt="Classify: crash on start", model=SONNET, task_class="classification"
+        )
+        client.invoke(prompt="Describe: crash on start", model=SONNET, max_tokens=100)
+
+        assert provider.models == [HAIKU, SONNET]
+        assert response.model == HAIKU
+        tiers = client.get_cost_summary()["tiers"]
+        assert tiers["fast"]["requests"] == 1
+        assert tiers["fast"]["total_cost_usd"] == round(response.usage.cost_usd, 4)
+        assert tiers["balanced"]["requests"] == 1
+
+    def test_failed_validation_escalates_one_tier(self):
+        provider = FakeAnthropic("not json", '{"label": "bug"}')
+        client = LLMClient(provider=provider)
+
+        response = client.invoke(
+            prompt="Classify: crash on start",
+            model=SONNET,
+            task_class="classification",
+            validate=lambda content: content.startswith("{"),
+        )
+
+        assert provider.models == [HAIKU, SONNET]
+        assert response.content == '{"label": "bug"}'
+        tiers = client.router.get_stats()
+        assert tiers["fast"]["rejected"] == 1
+        assert tiers["fast"]["escalations"] == 1
+        assert tiers["balanced"]["requests"] == 1
+        assert client.cost_tracker.get_summary()["total_invocations"] == 2
+
+    def test_last_answer_returned_when_no_tier_left(self):
+        provider = FakeAnthropic("bad")
+        client = LLMClient(provider=provider)
+
+        response = client.invoke(
+            prompt="Write the module",
+            model=SONNET,
+            task_class="code_generation",
+            validate=lambda content: False,
+        )
+
+        assert response.content == "bad"
+        assert provider.models == [SONNET]
+        assert client.router.get_stats()["strong"]["rejected"] == 1
+
+    def test_provider_errors_are_recorded_per_tier(self):
+        provider = FakeAnthropic()  # No contents left: invoke raises IndexError
+        client = LLMClient(provider=provider)
+
+        with pytest.raises(Exception, match="invocation failed"):
+            client.invoke(prompt="Label this", model=SONNET, task_class="routing")
+
+        assert client.router.get_stats()["fast"]["errors"] == 1
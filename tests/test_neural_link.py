@@ -28,8 +28,8 @@ class DummyAgent:
 # from researcher import ResearcherAgent
 
 router_dir = Path(__file__).parent.parent / "agency_os" / "core_system" / "playbook"
-from executor import GraphExecutor, WorkflowGraph, WorkflowNode
-from router import AgentRouter
+from vibe_core.playbook.executor import GraphExecutor, WorkflowGraph, WorkflowNode
+from vibe_core.playbook.router import AgentRouter
 
 
 class TestAgentRouter:
@@ -60,6 +60,65 @@ class TestAgentRouter:
         )
         assert router.find_best_agent(action) is None
 
+    def test_router_prefers_max_overlap_then_first_registered(self):
+        generalist = DummyAgent(name="generalist", capabilities=["coding"])
+        specialist = DummyAgent(name="specialist", capabilities=["coding", "debugging"])
+        twin = DummyAgent(name="twin", capabilities=["coding", "debugging"])
+        router = AgentRouter([generalist, specialist, twin])
+
+        assert router.find_best_agent_for_skills(["coding", "debugging"]) is specialist
+        assert router.find_best_agent_for_skills(["coding"]) is generalist
+
+    def test_router_weighted_scoring(self):
+        coder = DummyAgent(name="coder", capabilities=["coding", "python"])
+        researcher = DummyAgent(name="researcher", capabilities=["research"])
+        router = AgentRouter([coder, researcher])
+        skills = ["coding", "python", "research"]
+
+        assert router.find_best_agent_for_skills(skills) is coder
+        assert router.find_best_agent_for_skills(skills, weights={"research": 3.0}) is researcher
+
+    def test_router_counts_duplicate_skills(self):
+        documenter = DummyAgent(name="documenter", capabilities=["sql", "docs"])
+        pythonista = DummyAgent(name="pythonista", capabilities=["python"])
+        router = AgentRouter([documenter, pythonista])
+
+        assert router.find_best_agent_for_skills(["python", "python", "sql"]) is pythonista
+        assert router.find_best_agent_for_skills(["python", "sql"]) is documenter
+
+    def test_router_breaks_ties_by_live_load(self):
+        busy = DummyAgent(name="busy", capabilities=["coding"])
+        idle = DummyAgent(name="idle", capabilities=["coding"])
+        load = {"busy": 2, "idle": 0}
+        router = AgentRouter([busy, idle], load_provider=lambda agent: load[agent.name])
+
+        assert router.find_best_agent_for_skills(["coding"]) is idle
+        load.update(busy=0, idle=5)  # Cached decision still honours live load
+        assert router.find_best_agent_for_skills(["coding"]) is busy
+
+    def test_router_index_follows_register_and_unregister(self):
+        coder = DummyAgent(name="coder", capabilities=["coding"])
+        reviewer = DummyAgent(name="reviewer", capabilities=["review", "coding"])
+        router = AgentRouter([coder])
+
+        assert router.find_best_agent_for_skills(["review"]) is None
+        router.register(reviewer)
+        assert router.find_best_agent_for_skills(["review"]) is reviewer
+        assert router.agents_with_skill("coding") == [coder, reviewer]
+
+        assert router.unregister(coder)
+        assert router.find_best_agent_for_skills(["coding"]) is reviewer
+        assert router.agents_with_skill("coding") == [reviewer]
+        assert not router.unregister(coder)
+
+    def test_kernel_load_provider(self):
+        from vibe_core.kernel import VibeKernel
+        from vibe_core.playbook.router import kernel_load_provider
+
+        kernel = VibeKernel(ledger_path=":memory:")
+        load = kernel_load_provider(kernel)
+        assert load(DummyAgent(name="unknown", capabilities=[])) == (0, 0.0)
+
 
 class TestExecutorNeuralLink:
     def test_executor_uses_router_for_step(self):
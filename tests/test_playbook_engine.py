@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Tests for PlaybookEngine Tier 1 routing through the compiled IntentIndex.
+
+Verifies exact (Aho-Corasick) and fuzzy (character n-gram TF-IDF) matches,
+ranking, and recompilation when _registry.yaml changes.
+"""
+
+import os
+
+import pytest
+import yaml
+
+from vibe_core.runtime.intent_index import AhoCorasick, IntentIndex
+from vibe_core.runtime.playbook_engine import PlaybookEngine
+
+ROUTES = [
+    {
+        "name": "bootstrap",
+        "description": "First-time system initialization",
+        "intent_patterns": ["start", "hi claude"],
+        "threshold": 0.70,
+        "priority": "HIGH",
+    },
+    {
+        "name": "session_resume",
+        "description": "Continue existing work",
+        "intent_patterns": ["continue", "keep going"],
+        "threshold": 0.75,
+        "priority": "HIGH",
+    },
+    {
+        "name": "ecommerce_app",
+        "description": "E-commerce workflow",
+        "intent_patterns": ["online store", "shopping cart", "start an online store"],
+        "threshold": 0.80,
+        "priority": "MEDIUM",
+    },
+]
+
+
+def write_registry(path, routes):
+    path.write_text(yaml.safe_dump({"routes": routes, "config": {"default_threshold": 0.75}}))
+
+
+@pytest.fixture
+def engine(tmp_path):
+    registry = tmp_path / "_registry.yaml"
+    write_registry(registry, ROUTES)
+    return PlaybookEngine(registry_path=registry)
+
+
+class TestAhoCorasick:
+    def test_finds_overlapping_patterns(self):
+        automaton = AhoCorasick(["he", "she", "his", "hers"])
+        hits = sorted(automaton.find_all("ushers"))
+        assert hits == [(0, 2), (1, 1), (3, 2)]
+
+
+class TestIntentIndex:
+    def test_exact_match_on_word_boundaries(self):
+        index = IntentIndex(ROUTES)
+        assert [m.route["name"] for m in index.rank("please continue")] == ["session_resume"]
+        assert index.rank("restart everything") == []  # "start" inside "restart"
+
+    def test_ranks_most_specific_route_first(self):
+        index = IntentIndex(ROUTES)
+        ranked = index.rank("start an online store")
+
+        assert [m.route["name"] for m in ranked] == ["ecommerce_app", "bootstrap"]
+        assert ranked[0].kind == "exact"
+        assert ranked[0].score == 1.0
+        assert ranked[0].pattern == "start an online store"
+
+    def test_fuzzy_match_respects_route_threshold(self):
+        index = IntentIndex(ROUTES)
+        (match,) = index.rank("shoping cart")
+
+        assert match.route["name"] == "ecommerce_app"
+        assert match.kind == "fuzzy"
+        assert 0.80 <= match.score < 1.0
+        assert index.rank("quantum chromodynamics") == []
+
+    def test_blank_input(self):
+        assert IntentIndex(ROUTES).rank("   ") == []
+
+
+class TestPlaybookEngineRouting:
+    def test_route_returns_best_match_with_score(self, engine):
+        route = engine.route("Hi Claude, keep going", {})
+
+        assert route.confidence == "explicit"
+        assert route.source == "matched: 'keep going'"
+        assert route.score == pytest.approx(len("keep going") / len("hi claude, keep going"))
+
+    def test_falls_through_to_context_tier(self, engine):
+        route = engine.route("something unrelated", {"tests": {"failing_count": 2}})
+        assert route.task == "debug"
+        assert route.confidence == "context"
+
+    def test_registry_change_recompiles_index(self, engine):
+        assert engine.rank_routes("ship it") == []
+
+        routes = [*ROUTES, {"name": "deploy", "intent_patterns": ["ship it"]}]
+        write_registry(engine.registry_path, routes)
+        st = os.stat(engine.registry_path)
+        os.utime(engine.registry_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+        assert [m.route["name"] for m in engine.rank_routes("ship it")] == ["deploy"]
+        assert "deploy" in [r["name"] for r in engine.list_available_routes()]
+
+    def test_default_registry_loads(self):
+        engine = PlaybookEngine()
+        assert engine.rank_routes("show me progress")[0].route["name"] == "status_check"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
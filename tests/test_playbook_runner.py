@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Tests for GAD-913: Playbook Runner checkpoints
+
+Test Strategy:
+- Every executed phase is checkpointed under the run ID
+- resume(run_id) restores completed phases and re-runs the rest
+- Changing a phase or the project context invalidates its checkpoint and
+  everything after it
+"""
+
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from vibe_core.playbook.runner import (
+    PlaybookAgent,
+    PlaybookDefinition,
+    PlaybookError,
+    PlaybookPhase,
+    PlaybookRunner,
+)
+from vibe_core.store.sqlite_store import SQLiteStore
+
+
+class RecordingRunner(PlaybookRunner):
+    """Runner that records executed phases and fails the ones listed"""
+
+    def __init__(self, store, fail: set[str] = frozenset()):
+        super().__init__(orchestrator=object(), checkpoint_store=store)
+        self.fail = fail
+        self.executed: list[str] = []
+
+    def _execute_phase(self, phase, playbook):
+        self.executed.append(phase.name)
+        if phase.name in self.fail:
+            return {"phase_name": phase.name, "status": "failed", "error": "boom"}
+        return super()._execute_phase(phase, playbook)
+
+
+def _playbook() -> PlaybookDefinition:
+    return PlaybookDefinition(
+        id="sdlc",
+        name="SDLC",
+        description="Test",
+        version="1.0",
+        phases=[
+            PlaybookPhase(name=name, description=name, agents=["coder"])
+            for name in ("plan", "code", "test")
+        ],
+        agents={"coder": PlaybookAgent(name="coder", role="Coder")},
+        tools={},
+    )
+
+
+@pytest.fixture
+def store():
+    with SQLiteStore(":memory:") as store:
+        yield store
+
+
+def test_resume_skips_completed_phases(store):
+    playbook = _playbook()
+    first = RecordingRunner(store, fail={"code"}).execute_playbook(playbook)
+    assert first["status"] == "failed"
+    assert set(store.get_checkpoints(first["run_id"])) == {"plan", "code"}
+
+    runner = RecordingRunner(store)
+    resumed = runner.resume(playbook, first["run_id"])
+
+    assert resumed["status"] == "success"
+    assert runner.executed == ["code", "test"]
+    assert resumed["restored_phases"] == ["plan"]
+    assert [p["phase_name"] for p in resumed["phases_executed"]] == ["plan", "code", "test"]
+
+
+def test_unchanged_rerun_executes_nothing(store):
+    playbook = _playbook()
+    run_id = RecordingRunner(store).execute_playbook(playbook)["run_id"]
+
+    runner = RecordingRunner(store)
+    rerun = runner.resume(playbook, run_id)
+
+    assert runner.executed == []
+    assert rerun["restored_phases"] == ["plan", "code", "test"]
+
+
+def test_changed_phase_invalidates_later_phases(store):
+    playbook = _playbook()
+    run_id = RecordingRunner(store).execute_playbook(playbook)["run_id"]
+
+    playbook.phases[1].tools = ["pytest"]
+    runner = RecordingRunner(store)
+    runner.resume(playbook, run_id)
+    assert runner.executed == ["code", "test"]
+
+    runner = RecordingRunner(store)
+    runner.resume(playbook, run_id, project_context={"name": "other"})
+    assert runner.executed == ["plan", "code", "test"]
+
+
+def test_project_context_with_non_json_values(store):
+    context = {"name": "demo", "root": Path("/tmp/demo"), "started": datetime(2025, 1, 1)}
+    run_id = RecordingRunner(store).execute_playbook(_playbook(), context)["run_id"]
+
+    checkpoint = store.get_checkpoints(run_id)["plan"]
+    assert checkpoint["input"]["project_context"]["root"] == "/tmp/demo"
+
+    runner = RecordingRunner(store)
+    runner.resume(_playbook(), run_id, project_context=context)
+    assert runner.executed == []
+
+
+def test_resume_requires_store():
+    with pytest.raises(PlaybookError, match="checkpoint store"):
+        PlaybookRunner(orchestrator=object()).resume(_playbook(), "run-1")
@@ -209,3 +209,98 @@ class TestProjectMemoryManager:
         new_manager = ProjectMemoryManager(temp_project)
         memory = new_manager.load()
         assert memory["project_id"] == "test-project-123"
+
+
+class TestSQLiteDeltaSync:
+    """Test change-tracked dual-write to SQLite (ARCH-003)"""
+
+    @pytest.fixture
+    def store(self):
+        from vibe_core.store.sqlite_store import SQLiteStore
+
+        with SQLiteStore(":memory:") as store:
+            yield store
+
+    @pytest.fixture
+    def manager(self, tmp_path, store):
+        return ProjectMemoryManager(tmp_path, sqlite_store=store)
+
+    @staticmethod
+    def _writes(store) -> list[str]:
+        statements = []
+        store.conn.set_trace_callback(
+            lambda sql: statements.append(sql) if sql.lstrip().startswith("INSERT") else None
+        )
+        return statements
+
+    def _memory(self, manager, sessions: int) -> dict:
+        memory = manager.load()
+        memory["narrative"] = [
+            {"session": i, "summary": f"Session {i}", "date": "2025-01-01", "phase": "CODING"}
+            for i in range(1, sessions + 1)
+        ]
+        memory["domain"]["concepts"] = ["payment"]
+        return memory
+
+    def test_only_new_entries_are_written(self, manager, store):
+        """A second save sends just the appended session"""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        memory = self._memory(manager, 5)
+        manager.save(memory, mission_id=mission_id)
+
+        writes = self._writes(store)
+        memory["narrative"].append(
+            {"session": 6, "summary": "Session 6", "date": "2025-01-02", "phase": "CODING"}
+        )
+        manager.save(memory, mission_id=mission_id)
+
+        assert len(writes) == 1
+        assert "session_narrative" in writes[0]
+        assert len(store.get_session_narrative(mission_id)) == 6
+
+    def test_unchanged_save_skips_sqlite(self, manager, store):
+        """Saving identical memory does not touch SQLite"""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        memory = self._memory(manager, 3)
+        manager.save(memory, mission_id=mission_id)
+
+        writes = self._writes(store)
+        manager.save(memory, mission_id=mission_id)
+        assert writes == []
+
+    def test_modified_entry_is_updated(self, manager, store):
+        """Edited sessions and trajectory are upserted in place"""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        memory = self._memory(manager, 2)
+        manager.save(memory, mission_id=mission_id)
+
+        memory["narrative"][0]["summary"] = "Rewritten"
+        memory["trajectory"]["phase"] = "TESTING"
+        manager.save(memory, mission_id=mission_id)
+
+        narrative = store.get_session_narrative(mission_id)
+        assert [row["summary"] for row in narrative] == ["Rewritten", "Session 2"]
+        assert store.get_trajectory(mission_id)["current_phase"] == "TESTING"
+
+    def test_new_manager_seeds_from_sqlite(self, tmp_path, store):
+        """A fresh manager does not re-send rows SQLite already has"""
+        mission_id = store.create_mission("m-1", "CODING", "in_progress")
+        first = ProjectMemoryManager(tmp_path, sqlite_store=store)
+        memory = self._memory(first, 4)
+        first.save(memory, mission_id=mission_id)
+
+        second = ProjectMemoryManager(tmp_path, sqlite_store=store)
+        writes = self._writes(store)
+        second.save(memory, mission_id=mission_id)
+        assert writes == []
+
+    def test_json_is_compact_and_atomic(self, manager, tmp_path):
+        """JSON is written without indentation and leaves no temp files"""
+        manager.save(self._memory(manager, 2))
+
+        content = manager.memory_file.read_text()
+        assert "\n" not in content
+        assert json.loads(content)["narrative"][1]["summary"] == "Session 2"
+        assert sorted(p.name for p in manager.memory_file.parent.iterdir()) == [
+            "project_memory.json"
+        ]
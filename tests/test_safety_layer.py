@@ -7,6 +7,8 @@ Tests the safety layer that protects against:
 - Unexpected cost spikes (Quota Manager)
 - Rate limit violations (Quota Manager)
 - Token consumption spikes (Quota Manager)
+- Misjudged request sizes (Cost Forecaster: tokenizer approximation,
+  per-model prices, per-task correction factors)
 """
 
 import time
@@ -20,6 +22,11 @@ from vibe_core.runtime.circuit_breaker import (
     CircuitBreakerOpenError,
     CircuitBreakerState,
 )
+from vibe_core.runtime.cost_forecast import (
+    CostForecaster,
+    PriceTable,
+    estimate_tokens,
+)
 from vibe_core.runtime.quota_manager import (
     OperationalQuota,
     QuotaExceededError,
@@ -341,6 +348,93 @@ class TestQuotaManager:
         assert 0.08 < estimated < 0.10
 
 
+# =============================================================================
+# COST FORECAST TESTS
+# =============================================================================
+
+
+class PricedProvider:
+    """Minimal provider exposing the calculate_cost/get_available_models API"""
+
+    PRICING = {"cheap-model": (0.1, 0.4), "big-model": (3.0, 15.0)}
+
+    def get_available_models(self):
+        return list(self.PRICING)
+
+    def calculate_cost(self, input_tokens, output_tokens, model):
+        price_in, price_out = self.PRICING.get(model, (1.0, 1.0))
+        return (input_tokens * price_in + output_tokens * price_out) / 1_000_000
+
+
+class TestCostForecast:
+    """Tests for token estimation, price table and correction factors"""
+
+    def test_estimate_tokens_tracks_prompt_length(self):
+        """Token estimate is close to BPE counts and scales with the prompt"""
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("The quick brown fox jumps over the lazy dog.") == 10
+        long_prompt = "def handler(event):\n    return {'status': 200}\n" * 4000
+        assert 40_000 < estimate_tokens(long_prompt) < 80_000
+
+    def test_price_table_probes_provider_costs(self):
+        """Prices come from the provider's calculate_cost, per model"""
+        prices = PriceTable([PricedProvider()])
+        assert prices.price("cheap-model") == (0.1, 0.4)
+        assert prices.price("big-model") == (3.0, 15.0)
+        assert prices.price("unlisted") == (1.0, 1.0)  # Provider's own fallback
+        assert PriceTable().price("anything") == (3.0, 15.0)
+        assert prices.cost("big-model", 1_000_000, 0) == pytest.approx(3.0)
+
+    def test_forecast_uses_prompt_and_model_price(self):
+        """Forecast counts the prompt and prices it for the chosen model"""
+        forecaster = CostForecaster(PriceTable([PricedProvider()]))
+        prompt = "word " * 50_000
+
+        cheap = forecaster.forecast(prompt, "cheap-model", max_tokens=4096)
+        big = forecaster.forecast(prompt, "big-model", max_tokens=4096)
+        assert cheap.input_tokens == 50_000
+        assert cheap.output_tokens == 4096  # No history yet: worst case
+        assert big.cost_usd > cheap.cost_usd * 20
+
+    def test_reconcile_learns_per_task_correction(self):
+        """Actual usage pulls the task's forecast toward reality"""
+        forecaster = CostForecaster(PriceTable([PricedProvider()]))
+        prompt = "classify this ticket " * 100
+
+        for _ in range(15):
+            forecast = forecaster.forecast(prompt, "big-model", 4096, task="classification")
+            forecaster.reconcile(forecast, input_tokens=forecast.prompt_tokens * 2, output_tokens=8)
+
+        learned = forecaster.forecast(prompt, "big-model", 4096, task="classification")
+        assert learned.output_tokens < 100
+        assert learned.input_tokens == pytest.approx(2 * learned.prompt_tokens, rel=0.05)
+        # Other task classes keep their own (default) factors
+        assert forecaster.forecast(prompt, "big-model", 4096).output_tokens == 4096
+        assert forecaster.get_factors()["classification"]["samples"] == 15
+
+    def test_quota_admits_cheap_requests_after_learning(self):
+        """A learned forecast lets the quota admit what the budget allows"""
+        quota = OperationalQuota(
+            limits=QuotaLimits(tokens_per_minute=100_000, cost_per_request_usd=0.01),
+            forecaster=CostForecaster(PriceTable([PricedProvider()])),
+        )
+        prompt = "summarize " * 200
+
+        first = quota.forecast(prompt, "big-model", max_tokens=2048, task="summary")
+        with pytest.raises(QuotaExceededError):
+            quota.check_before_request(
+                first.total_tokens, "summary", estimated_cost_usd=first.cost_usd * 2
+            )
+        for _ in range(10):
+            quota.reconcile(first, input_tokens=first.prompt_tokens, output_tokens=100)
+
+        learned = quota.forecast(prompt, "big-model", max_tokens=2048, task="summary")
+        assert learned.cost_usd < first.cost_usd / 5
+        assert quota.check_before_request(
+            learned.total_tokens, "summary", estimated_cost_usd=learned.cost_usd
+        ) == (True, "OK")
+
+
 # =============================================================================
 # INTEGRATION TESTS
 # =============================================================================
@@ -433,6 +527,32 @@ class TestSafetyLayerIntegration:
         assert status["totals"]["total_requests"] == 1
         assert status["totals"]["total_tokens"] == 150
 
+    def test_llm_client_forecasts_with_provider_prices(self):
+        """LLMClient forecasts from the prompt and reconciles actual usage"""
+        from vibe_core.runtime.llm_client import LLMClient, LLMResponse, LLMUsage
+
+        provider = PricedProvider()
+        provider.get_provider_name = lambda: "Priced"
+        provider.invoke = Mock(
+            return_value=LLMResponse(
+                content="ok",
+                usage=LLMUsage(400, 20, "cheap-model", 0.0001, "2025-01-01T00:00:00Z"),
+                model="cheap-model",
+                finish_reason="stop",
+            )
+        )
+        client = LLMClient(provider=provider)
+        check = Mock(wraps=client.quota_manager.check_before_request)
+        client.quota_manager.check_before_request = check
+
+        client.invoke(prompt="route this " * 200, model="cheap-model", task_class="routing")
+
+        kwargs = check.call_args.kwargs
+        assert kwargs["estimated_tokens"] == estimate_tokens("route this " * 200) + 4096
+        assert kwargs["estimated_cost_usd"] < 0.002  # cheap-model rates, not Sonnet
+        factors = client.quota_manager.get_status()["forecast_factors"]
+        assert factors["routing"]["samples"] == 1
+
     def test_circuit_breaker_and_quota_manager_together(self):
         """Circuit breaker and quota manager work together"""
         breaker = CircuitBreaker(config=CircuitBreakerConfig(failure_threshold=2))
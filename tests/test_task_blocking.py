@@ -267,3 +267,142 @@ def test_no_circular_blocking():
     assert "task-001" in roadmap["tasks"]["task-002"]["blocking_tasks"]
     assert "task-002" in roadmap["tasks"]["task-001"]["blocked_by"]
     assert "task-001" in roadmap["tasks"]["task-002"]["blocked_by"]
+
+
+# ============================================================================
+# DEPENDENCY GRAPH INDEX
+# ============================================================================
+
+
+@pytest.fixture
+def blocking_manager():
+    """TaskManager over the linear blocking chain roadmap."""
+    from vibe_core.task_management import TaskManager
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        vibe_dir = root / ".vibe"
+        vibe_dir.mkdir()
+        create_test_roadmap_with_blocking(vibe_dir)
+        yield TaskManager(root)
+
+
+def test_graph_frontier_follows_status_changes():
+    """Ready frontier is maintained incrementally as blockers complete."""
+    from vibe_core.task_management import TaskGraph, TaskStatus
+
+    graph = TaskGraph()
+    for task_id in ("a", "b", "c"):
+        graph.add_task(task_id, TaskStatus.TODO, weight=10)
+    graph.add_edge("a", "b")
+    graph.add_edge("a", "c")
+    graph.add_edge("b", "c")
+
+    assert graph.ready() == {"a"}
+    assert graph.is_blocked("c")
+
+    graph.set_status("a", TaskStatus.DONE)
+    assert graph.ready() == {"b"}
+
+    graph.set_status("b", TaskStatus.DONE)
+    assert graph.ready() == {"c"}
+
+    graph.set_status("b", TaskStatus.IN_PROGRESS)  # Reopened blocker
+    assert graph.is_blocked("c")
+    assert graph.ready() == frozenset()
+
+
+def test_graph_rejects_cycles():
+    """Inserting an edge that closes a cycle raises and leaves the graph unchanged."""
+    from vibe_core.task_management import DependencyCycleError, TaskGraph, TaskStatus
+
+    graph = TaskGraph()
+    for task_id in ("a", "b", "c"):
+        graph.add_task(task_id, TaskStatus.TODO)
+    graph.add_edge("a", "b")
+    graph.add_edge("b", "c")
+
+    with pytest.raises(DependencyCycleError) as exc_info:
+        graph.add_edge("c", "a")
+    assert exc_info.value.cycle == ["c", "a", "b", "c"]
+    assert "c" not in graph.blockers("a")
+
+    with pytest.raises(DependencyCycleError):
+        graph.add_edge("a", "a")
+
+
+def test_graph_critical_path_uses_remaining_budget():
+    """Critical path is the heaviest chain of unfinished tasks."""
+    from vibe_core.task_management import TaskGraph, TaskStatus
+
+    graph = TaskGraph()
+    graph.add_task("design", TaskStatus.TODO, weight=60)
+    graph.add_task("backend", TaskStatus.TODO, weight=240)
+    graph.add_task("frontend", TaskStatus.TODO, weight=90)
+    graph.add_task("release", TaskStatus.TODO, weight=30)
+    graph.add_edge("design", "backend")
+    graph.add_edge("design", "frontend")
+    graph.add_edge("backend", "release")
+    graph.add_edge("frontend", "release")
+
+    assert graph.critical_path() == {
+        "tasks": ["design", "backend", "release"],
+        "total_mins": 330,
+    }
+
+    graph.set_status("design", TaskStatus.DONE)
+    assert graph.critical_path()["tasks"] == ["backend", "release"]
+
+
+def test_task_manager_blocking_uses_index(blocking_manager):
+    """TaskManager answers blocking queries from the cached graph."""
+    assert blocking_manager.is_task_blocked("task-002")
+    assert not blocking_manager.is_task_blocked("task-001")
+    assert [t.id for t in blocking_manager.get_blocked_by_tasks("task-003")] == ["task-002"]
+    assert [t.id for t in blocking_manager.get_ready_tasks()] == ["task-001"]
+    assert blocking_manager.get_critical_path()["tasks"] == ["task-001", "task-002", "task-003"]
+
+    # Index is reused while roadmap.yaml is unchanged
+    assert blocking_manager.get_task_graph() is blocking_manager.get_task_graph()
+
+
+def test_task_manager_block_task_persists_and_checks_cycles(blocking_manager):
+    """block_task writes roadmap.yaml and refuses cyclic dependencies."""
+    from vibe_core.task_management import DependencyCycleError, TaskManager
+
+    with pytest.raises(DependencyCycleError):
+        blocking_manager.block_task("task-003", "task-001")
+
+    blocking_manager.unblock_task("task-002", "task-003")
+    blocking_manager.block_task("task-001", "task-003")
+
+    fresh = TaskManager(blocking_manager.vibe_root)
+    roadmap = fresh.get_roadmap()
+    assert roadmap.tasks["task-003"].blocked_by == ["task-001"]
+    assert "task-003" not in roadmap.tasks["task-002"].blocking_tasks
+    assert fresh.is_task_blocked("task-003")
+
+
+def test_batch_block_tasks_reports_cycles_per_pair(blocking_manager):
+    """BatchOperations records invalid pairs without aborting the batch."""
+    from vibe_core.task_management.batch_operations import BatchOperations
+
+    results = BatchOperations(blocking_manager).batch_block_tasks(
+        [("task-001", "task-003"), ("task-003", "task-001"), ("task-001", "missing")]
+    )
+
+    assert results["successful"] == [{"blocker": "task-001", "blocked": "task-003"}]
+    assert [f["blocked"] for f in results["failed"]] == ["task-001", "missing"]
+    assert "cycle" in results["failed"][0]["error"]
+
+
+def test_next_task_generator_picks_from_frontier(blocking_manager):
+    """Tasks whose blockers are DONE become eligible for selection."""
+    from vibe_core.task_management import ActiveMission, TaskStatus
+    from vibe_core.task_management.next_task_generator import generate_next_task
+
+    roadmap = blocking_manager.get_roadmap()
+    assert generate_next_task(roadmap, ActiveMission())["id"] == "task-001"
+
+    roadmap.tasks["task-001"].status = TaskStatus.DONE
+    assert generate_next_task(roadmap, ActiveMission())["id"] == "task-002"
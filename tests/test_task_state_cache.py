@@ -0,0 +1,175 @@
+"""Tests for cached mission/roadmap state in TaskManager (GAD-701)"""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+
+from vibe_core.task_management import TaskManager, TaskStatus, ValidationCheck
+from vibe_core.task_management import task_manager as task_manager_module
+
+
+def _write_roadmap(root: Path):
+    tasks = {
+        f"task-{i:03d}": {
+            "id": f"task-{i:03d}",
+            "name": f"Task {i}",
+            "description": "",
+            "status": "TODO",
+            "priority": 5,
+        }
+        for i in range(1, 3)
+    }
+    roadmap = {
+        "project_name": "cache-test",
+        "phases": [{"name": "PHASE_1", "status": "TODO", "task_ids": list(tasks)}],
+        "tasks": tasks,
+    }
+    roadmap_file = root / ".vibe" / "config" / "roadmap.yaml"
+    roadmap_file.parent.mkdir(parents=True, exist_ok=True)
+    roadmap_file.write_text(yaml.safe_dump(roadmap))
+
+
+@pytest.fixture
+def manager(tmp_path):
+    task_manager_module.clear_state_cache()
+    _write_roadmap(tmp_path)
+    yield TaskManager(tmp_path)
+    task_manager_module.clear_state_cache()
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    """Count how often active_mission.json is actually read from disk."""
+    calls = []
+    original = task_manager_module.atomic_read_json
+
+    def counting_read(path):
+        calls.append(path)
+        return original(path)
+
+    monkeypatch.setattr(task_manager_module, "atomic_read_json", counting_read)
+    return calls
+
+
+def test_repeated_reads_hit_cache(manager, count_parses):
+    """Unchanged state file is parsed once and then served from cache."""
+    manager.start_task("task-001")  # Write-through populates the cache
+
+    for _ in range(5):
+        assert manager.get_active_mission().current_task.id == "task-001"
+
+    assert count_parses == []
+
+
+def test_cached_reads_are_isolated_copies(manager):
+    """Mutating a returned mission does not leak into the cache."""
+    manager.start_task("task-001")
+
+    mission = manager.get_active_mission()
+    mission.current_task.time_used_mins = 999
+
+    assert manager.get_active_mission().current_task.time_used_mins == 0
+
+
+def test_external_write_invalidates_cache(manager, count_parses):
+    """A file replaced by another process is re-read (inode/size/mtime change)."""
+    manager.start_task("task-001")
+
+    data = json.loads(manager.state_file.read_text())
+    data["total_tasks_completed"] = 7
+    tmp = manager.state_file.with_suffix(".ext")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, manager.state_file)
+
+    assert manager.get_active_mission().total_tasks_completed == 7
+    assert len(count_parses) == 1
+
+
+def test_cache_is_shared_between_instances(manager, count_parses):
+    """Cache is process-level, so a second TaskManager reuses it."""
+    manager.start_task("task-002")
+
+    other = TaskManager(manager.vibe_root)
+    assert other.get_active_mission().current_task.id == "task-002"
+    assert count_parses == []
+
+
+def test_transaction_writes_once(manager, monkeypatch):
+    """Several mutations inside one transaction produce a single write."""
+    writes = []
+    original = task_manager_module.atomic_write_json
+
+    def counting_write(path, data):
+        writes.append(path)
+        original(path, data)
+
+    monkeypatch.setattr(task_manager_module, "atomic_write_json", counting_write)
+
+    with manager.transaction():
+        manager.start_task("task-001")
+        manager.update_task_progress(time_spent_mins=10)
+        manager.update_task_progress(time_spent_mins=5)
+        assert writes == []
+
+    assert len(writes) == 1
+    task = TaskManager(manager.vibe_root).get_active_mission().current_task
+    assert task.time_used_mins == 15
+    assert task.status == TaskStatus.IN_PROGRESS
+
+
+def test_transaction_discards_changes_on_error(manager):
+    """An exception inside the transaction leaves the state file untouched."""
+    manager.start_task("task-001")
+
+    with pytest.raises(RuntimeError, match="boom"), manager.transaction():
+        manager.update_task_progress(time_spent_mins=30)
+        raise RuntimeError("boom")
+
+    assert manager.get_active_mission().current_task.time_used_mins == 0
+
+
+def test_failed_completion_persists_check_results(manager):
+    """A completion that fails validation still records the failed checks."""
+    manager.start_task("task-001")
+    with manager.transaction():
+        mission = manager.get_active_mission()
+        mission.current_task.validation_checks = [
+            ValidationCheck(
+                id="report",
+                description="Report written",
+                validator="file_exists",
+                params={"path": "report.md"},
+            )
+        ]
+        manager._save_mission(mission)
+
+    with pytest.raises(RuntimeError, match="Report written"):
+        manager.complete_current_task()
+
+    task_manager_module.clear_state_cache()
+    task = TaskManager(manager.vibe_root).get_active_mission().current_task
+    assert task.id == "task-001"
+    assert task.status == TaskStatus.IN_PROGRESS
+    check = task.validation_checks[0]
+    assert check.status is False
+    assert check.error == "Check failed"
+    assert check.last_check is not None
+
+
+def test_roadmap_reads_are_cached(manager, monkeypatch):
+    """roadmap.yaml is parsed once while unchanged."""
+    parses = []
+    original = TaskManager._parse_roadmap
+
+    def counting_parse(self):
+        parses.append(1)
+        return original(self)
+
+    monkeypatch.setattr(TaskManager, "_parse_roadmap", counting_parse)
+
+    for _ in range(3):
+        assert "task-001" in manager.get_roadmap().tasks
+    assert len(parses) == 1
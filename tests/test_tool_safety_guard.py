@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for ToolSafetyGuard ("Iron Dome", GAD-509 Extension)
+
+Test Strategy:
+- Read-before-write is checked against the version actually read
+  (content hash + mtime), keyed by inode so aliases count as the same file
+- Session memory is bounded (LRU eviction, short violation window)
+- Violations spill to the ledger
+"""
+
+import os
+
+import pytest
+
+from vibe_core.ledger import VibeLedger
+from vibe_core.runtime.tool_safety_guard import RECENT_VIOLATIONS, ToolSafetyGuard
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "module.py"
+    path.write_text("print('v1')\n")
+    return path
+
+
+def bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+
+class TestReadBeforeWrite:
+    """Test ANTI_BLINDNESS and STALE_READ"""
+
+    def test_edit_requires_read(self, source):
+        guard = ToolSafetyGuard()
+
+        allowed, violation = guard.check_action("edit_file", {"path": str(source)})
+        assert allowed is False
+        assert violation.rule == "ANTI_BLINDNESS"
+
+        guard.record_file_read(str(source))
+        assert guard.check_action("edit_file", {"path": str(source)}) == (True, None)
+
+    def test_edit_after_external_change_is_stale(self, source):
+        guard = ToolSafetyGuard()
+        guard.record_file_read(str(source))
+
+        source.write_text("print('v2, written by someone else')\n")
+        bump_mtime(source)
+
+        allowed, violation = guard.check_action("write_file", {"path": str(source)})
+        assert allowed is False
+        assert violation.rule == "STALE_READ"
+
+        guard.record_file_read(str(source))
+        assert guard.check_action("write_file", {"path": str(source)})[0] is True
+
+    def test_touch_without_content_change_is_fresh(self, source):
+        guard = ToolSafetyGuard()
+        guard.record_file_read(str(source))
+        bump_mtime(source)
+
+        assert guard.check_action("edit_file", {"path": str(source)})[0] is True
+
+    def test_atomic_replace_is_detected(self, source):
+        """Test a file replaced via rename (new inode) is still matched by path"""
+        guard = ToolSafetyGuard()
+        guard.record_file_read(str(source))
+
+        replacement = source.with_suffix(".tmp")
+        replacement.write_text("print('replaced')\n")
+        os.replace(replacement, source)
+
+        assert guard.check_action("edit_file", {"path": str(source)})[1].rule == "STALE_READ"
+
+    def test_aliases_share_one_entry(self, source):
+        """Test a read through a symlink counts for the real path (inode key)"""
+        link = source.parent / "alias.py"
+        link.symlink_to(source)
+        guard = ToolSafetyGuard()
+
+        guard.record_file_read(str(link))
+
+        assert guard.check_action("edit_file", {"path": str(source)})[0] is True
+        assert guard.get_status()["files_read"] == 1
+
+    def test_own_write_becomes_known_version(self, source):
+        guard = ToolSafetyGuard()
+        guard.record_file_read(str(source))
+
+        source.write_text("print('my edit')\n")
+        bump_mtime(source)
+        guard.record_file_write(str(source))
+
+        assert guard.check_action("edit_file", {"path": str(source)})[0] is True
+        assert guard.get_status()["files_written"] == 1
+        assert guard.get_status()["files_read"] == 1
+
+    def test_write_only_file_is_not_counted_as_read(self, tmp_path):
+        guard = ToolSafetyGuard()
+        guard.record_file_write(str(tmp_path / "new.py"))
+
+        status = guard.get_status()
+        assert status["files_read"] == 0
+        assert status["files_written"] == 1
+
+
+class TestBoundedSession:
+    """Test session memory stays bounded"""
+
+    def test_lru_evicts_least_recently_used(self, tmp_path):
+        guard = ToolSafetyGuard(max_tracked_files=2)
+        paths = []
+        for name in ("a.py", "b.py", "c.py"):
+            path = tmp_path / name
+            path.write_text(name)
+            paths.append(str(path))
+
+        guard.record_file_read(paths[0])
+        guard.record_file_read(paths[1])
+        guard.check_action("edit_file", {"path": paths[0]})  # a is now most recent
+        guard.record_file_read(paths[2])  # evicts b
+
+        assert guard.check_action("edit_file", {"path": paths[0]})[0] is True
+        assert guard.check_action("edit_file", {"path": paths[1]})[1].rule == "ANTI_BLINDNESS"
+        status = guard.get_status()
+        assert status["files_read"] == 2
+        assert status["files_evicted"] == 1
+
+    def test_violation_window_is_bounded(self):
+        guard = ToolSafetyGuard(enable_strict_mode=False)
+
+        for i in range(RECENT_VIOLATIONS + 10):
+            guard.check_action("delete_directory", {"path": f"/tmp/dir{i}"})
+
+        status = guard.get_status()
+        assert status["violations"]["total"] == RECENT_VIOLATIONS + 10
+        assert status["violations"]["blocking"] == RECENT_VIOLATIONS + 10
+        assert len(guard.context.violations) == RECENT_VIOLATIONS
+        assert len(status["recent_violations"]) == 5
+
+
+class TestLedgerSpill:
+    """Test violations are written to the ledger"""
+
+    def test_violations_recorded_in_ledger(self, source):
+        ledger = VibeLedger(":memory:")
+        guard = ToolSafetyGuard(ledger=ledger)
+
+        guard.check_action("write_file", {"path": str(source), "content": "x" * 10_000})
+
+        (record,) = ledger.get_safety_violations(session_start=guard.context.session_start)
+        assert record["rule"] == "ANTI_BLINDNESS"
+        assert record["severity"] == "blocking"
+        assert record["tool_name"] == "write_file"
+        assert record["args"]["path"] == str(source)
+        assert record["args"]["content"].endswith("(10000 chars)")
+        ledger.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Tests for structured tracing spans
+
+Test Strategy:
+- Nested spans share a trace and link to their parent (ContextVar propagation)
+- Errors are recorded on the span and re-raised
+- Kernel, agent and tool spans form one trace keyed by the task ID
+- SQLite and JSONL sinks persist spans; nested tasks are found by task ID
+- `trace <task_id>` renders a flame-style breakdown from the span database
+"""
+
+from typing import Any
+
+import pytest
+
+from tests.mocks.llm import MockLLMProvider
+from vibe_core.agent_protocol import VibeAgent
+from vibe_core.agents.llm_agent import SimpleLLMAgent
+from vibe_core.kernel import VibeKernel
+from vibe_core.scheduling import Task
+from vibe_core.tools import ReadFileTool, ToolRegistry
+from vibe_core.tracing import (
+    JsonlSpanSink,
+    SQLiteSpanSink,
+    Tracer,
+    format_trace,
+    get_tracer,
+    read_jsonl_trace,
+    span,
+)
+
+
+class DelegatingAgent(VibeAgent):
+    """Runs a child task inline (like DelegateTool + future.result())."""
+
+    def __init__(self, kernel: VibeKernel):
+        self.kernel = kernel
+        self.child_id = None
+
+    @property
+    def agent_id(self) -> str:
+        return "parent"
+
+    @property
+    def capabilities(self) -> list[str]:
+        return []
+
+    def process(self, task: Task) -> Any:
+        child = Task(agent_id="child", payload={})
+        self.child_id = child.id
+        return self.kernel.submit(child).result(timeout=5)
+
+
+class ChildAgent(VibeAgent):
+    @property
+    def agent_id(self) -> str:
+        return "child"
+
+    @property
+    def capabilities(self) -> list[str]:
+        return []
+
+    def process(self, task: Task) -> Any:
+        with span("child.work"):
+            return {"ok": True}
+
+
+@pytest.fixture
+def tracer():
+    tracer = get_tracer()
+    tracer.clear()
+    yield tracer
+    for sink in tracer.sinks:
+        tracer.remove_sink(sink)
+        sink.close()
+    tracer.clear()
+
+
+class TestSpans:
+    def test_nested_spans_share_trace_and_link_parent(self):
+        tracer = Tracer()
+        with tracer.span("outer", trace_id="t-1") as outer:
+            with tracer.span("inner", trace_id="ignored") as inner:
+                assert tracer.current_span() is inner
+            assert tracer.current_span() is outer
+        assert tracer.current_span() is None
+
+        assert inner.trace_id == "t-1"
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert [sp.name for sp in tracer.recent_spans()] == ["inner", "outer"]
+        assert outer.duration_ms >= inner.duration_ms
+
+    def test_exception_marks_span_and_propagates(self):
+        tracer = Tracer()
+        with pytest.raises(ValueError), tracer.span("boom"):
+            raise ValueError("bad input")
+
+        (sp,) = tracer.recent_spans()
+        assert sp.status == "ERROR"
+        assert sp.error == "ValueError: bad input"
+
+    def test_ring_buffer_is_bounded(self):
+        tracer = Tracer(buffer_size=3)
+        for i in range(5):
+            with tracer.span(f"s{i}"):
+                pass
+        assert [sp.name for sp in tracer.recent_spans()] == ["s2", "s3", "s4"]
+
+    def test_disabled_tracer_records_nothing(self):
+        tracer = Tracer()
+        tracer.enabled = False
+        with tracer.span("quiet"):
+            pass
+        assert tracer.recent_spans() == []
+
+    def test_failing_sink_does_not_break_caller(self):
+        class BrokenSink:
+            def write(self, span):
+                raise OSError("disk full")
+
+            def close(self):
+                pass
+
+        tracer = Tracer()
+        tracer.add_sink(BrokenSink())
+        with tracer.span("still-works"):
+            pass
+        assert len(tracer.recent_spans()) == 1
+
+
+class TestInstrumentation:
+    def test_kernel_tick_traces_agent_and_tool(self, tracer, tmp_path):
+        target = tmp_path / "notes.txt"
+        target.write_text("hello")
+        registry = ToolRegistry()
+        registry.register(ReadFileTool())
+        response = f'{{"tool": "read_file", "parameters": {{"path": "{target}"}}}}'
+        agent = SimpleLLMAgent(
+            agent_id="operator",
+            provider=MockLLMProvider(mock_response=response),
+            tool_registry=registry,
+        )
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(agent)
+        kernel.boot()
+
+        task = Task(agent_id="operator", payload={"user_message": "read it"})
+        kernel.submit(task)
+        assert kernel.tick()
+
+        spans = tracer.get_trace(task.id)
+        names = {sp.name for sp in spans}
+        assert {
+            "kernel.submit",
+            "kernel.tick",
+            "kernel.execute_task",
+            "agent.process",
+            "prompt.compose",
+            "tool.execute",
+        } <= names
+
+        by_name = {sp.name: sp for sp in spans}
+        assert by_name["kernel.execute_task"].parent_id == by_name["kernel.tick"].span_id
+        assert by_name["agent.process"].parent_id == by_name["kernel.execute_task"].span_id
+        assert by_name["tool.execute"].parent_id == by_name["agent.process"].span_id
+        assert by_name["tool.execute"].attributes == {"tool": "read_file", "success": True}
+
+    def test_failed_task_span_records_error(self, tracer):
+        class FailingAgent(ChildAgent):
+            def process(self, task):
+                raise RuntimeError("agent crashed")
+
+        kernel = VibeKernel(":memory:")
+        kernel.register_agent(FailingAgent())
+        kernel.boot()
+        task = Task(agent_id="child", payload={})
+        kernel.submit(task)
+        with pytest.raises(RuntimeError):
+            kernel.tick()
+
+        execute = next(sp for sp in tracer.get_trace(task.id) if sp.name == "kernel.execute_task")
+        assert execute.status == "ERROR"
+        assert "agent crashed" in execute.error
+
+
+class TestSinks:
+    def test_sqlite_sink_finds_nested_task_by_task_id(self, tracer, tmp_path):
+        sink = SQLiteSpanSink(tmp_path / "traces.db")
+        tracer.add_sink(sink)
+
+        kernel = VibeKernel(":memory:")
+        parent_agent = DelegatingAgent(kernel)
+        kernel.register_agent(parent_agent)
+        kernel.register_agent(ChildAgent())
+        kernel.boot()
+
+        parent = Task(agent_id="parent", payload={})
+        kernel.submit(parent)
+        kernel.tick()
+
+        parent_spans = sink.read_trace(parent.id)
+        assert "child.work" in {sp.name for sp in parent_spans}
+
+        # The child ran inside the parent's trace, but is found by its own ID
+        child_spans = sink.read_trace(parent_agent.child_id)
+        names = [sp.name for sp in child_spans]
+        assert "child.work" in names
+        assert "kernel.tick" not in names
+        assert all(sp.trace_id == parent.id for sp in child_spans)
+
+        assert sink.read_trace("unknown-task") == []
+
+    def test_jsonl_sink_round_trip(self, tmp_path):
+        path = tmp_path / "spans" / "trace.jsonl"
+        tracer = Tracer()
+        sink = JsonlSpanSink(path)
+        tracer.add_sink(sink)
+        with (
+            tracer.span("outer", trace_id="t-9", task_id="t-9"),
+            tracer.span("inner", detail={"k": 1}),
+        ):
+            pass
+        sink.close()
+
+        spans = read_jsonl_trace(path, "t-9")
+        assert [sp.name for sp in spans] == ["outer", "inner"]
+        assert spans[1].attributes == {"detail": {"k": 1}}
+
+    def test_format_trace_shows_tree_and_self_time(self):
+        tracer = Tracer()
+        with tracer.span("root", trace_id="t-2"), tracer.span("child"):
+            pass
+        text = format_trace(tracer.get_trace("t-2"))
+
+        lines = text.splitlines()
+        assert lines[0].startswith("Trace t-2: 2 span(s)")
+        assert lines[1].startswith("root ")
+        assert lines[2].startswith("  child ")
+        assert "100.0% |" in lines[1]
+        assert format_trace([]) == "(no spans)"
+
+
+class TestTraceCommand:
+    def test_trace_command_renders_breakdown(self, tracer, tmp_path, monkeypatch, capsys):
+        cli = pytest.importorskip("apps.agency.cli")
+        trace_db = tmp_path / "traces.db"
+        monkeypatch.setenv("VIBE_TRACE_DB", str(trace_db))
+
+        sink = SQLiteSpanSink(trace_db)
+        tracer.add_sink(sink)
+        with (
+            span("kernel.execute_task", trace_id="task-42", task_id="task-42"),
+            span("provider.invoke", provider="google"),
+        ):
+            pass
+
+        assert cli.display_trace("task-42") == 0
+        out = capsys.readouterr().out
+        assert "kernel.execute_task" in out
+        assert "  provider.invoke" in out
+
+        assert cli.display_trace("missing") == 1
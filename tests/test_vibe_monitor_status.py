@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for the vibe-monitor status service (apps/vibe-monitor/status_service.py)
+
+Test Strategy:
+- /api/status is served from a cached snapshot, recomputed only on change
+- New ledger rows (tasks, safety violations) are pushed as events
+- SSE encoding and the per-client stream
+"""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+from vibe_core.ledger import VibeLedger
+from vibe_core.scheduling import Task
+
+MODULE_PATH = Path(__file__).parent.parent / "apps" / "vibe-monitor" / "status_service.py"
+_spec = importlib.util.spec_from_file_location("vibe_monitor_status_service", MODULE_PATH)
+status_service = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(status_service)
+
+EventBroker = status_service.EventBroker
+StatusService = status_service.StatusService
+format_sse = status_service.format_sse
+
+
+class CountingSource:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"status": "healthy", "timestamp": f"t{self.calls}", "health": {}}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (tmp_path / "playbooks" / "presets").mkdir(parents=True)
+    return tmp_path
+
+
+def drain(q):
+    events = []
+    while not q.empty():
+        _, event_type, data = q.get_nowait()
+        events.append((event_type, data))
+    return events
+
+
+class TestSnapshot:
+    def test_snapshot_is_cached(self, repo):
+        source = CountingSource()
+        service = StatusService(repo, status_source=source)
+
+        first = service.snapshot()
+        assert service.snapshot() is first
+        assert service.poll_once() is False
+        assert source.calls == 1
+        assert first["ledger"] == {"available": False}
+
+    def test_refresh_on_fingerprint_change(self, repo):
+        source = CountingSource()
+        service = StatusService(repo, status_source=source)
+        service.snapshot()
+        q = service.broker.subscribe()
+
+        (repo / ".venv").mkdir()
+
+        assert service.poll_once() is True
+        assert source.calls == 2
+        assert drain(q) == []  # Only the timestamp differs: no status event
+
+    def test_max_age_forces_refresh(self, repo):
+        source = CountingSource()
+        service = StatusService(repo, status_source=source, max_age=0)
+        service.snapshot()
+
+        assert service.poll_once() is True
+        assert source.calls == 2
+
+    def test_source_failure_yields_degraded_snapshot(self, repo):
+        def broken():
+            raise RuntimeError("boom")
+
+        snapshot = StatusService(repo, status_source=broken).snapshot()
+        assert snapshot["status"] == "degraded"
+        assert "boom" in snapshot["errors"][0]
+
+
+class TestLedgerEvents:
+    def test_new_tasks_and_violations_are_published(self, repo):
+        ledger_path = repo / "data" / "vibe.db"
+        ledger_path.parent.mkdir()
+        ledger = VibeLedger(str(ledger_path))
+        ledger.record_start(Task(agent_id="agent-a", payload={}))
+
+        service = StatusService(repo, ledger_path=ledger_path, status_source=CountingSource())
+        assert service.snapshot()["ledger"]["total_tasks"] == 1
+        q = service.broker.subscribe()
+
+        task = Task(agent_id="agent-b", payload={})
+        ledger.record_start(task)
+        service.poll_once()
+        ledger.record_completion(task, {"ok": True})
+        ledger.record_safety_violation(
+            rule="ANTI_BLINDNESS",
+            severity="blocking",
+            tool_name="write_file",
+            message="Blind write",
+        )
+        service.poll_once()
+
+        events = drain(q)
+        kinds = [(t, d.get("status") or d.get("rule")) for t, d in events if t != "status"]
+        assert kinds == [
+            ("task", "STARTED"),
+            ("task", "COMPLETED"),
+            ("violation", "ANTI_BLINDNESS"),
+        ]
+        assert events[0][1]["task_id"] == task.id
+        # Ledger file changed, so the snapshot (with its summary) was refreshed too
+        assert events[-1][0] == "status"
+        assert events[-1][1]["ledger"]["by_status"] == {"STARTED": 1, "COMPLETED": 1}
+
+        service.stop()
+        ledger.close()
+
+
+class TestEventStream:
+    def test_format_sse(self):
+        assert format_sse("task", {"a": 1}, 7) == 'id: 7\nevent: task\ndata: {"a": 1}\n\n'
+
+    def test_broker_drops_oldest_for_slow_subscriber(self):
+        broker = EventBroker(max_queued=2)
+        q = broker.subscribe()
+        for i in range(3):
+            broker.publish("task", i)
+
+        assert [data for _, _, data in (q.get_nowait(), q.get_nowait())] == [1, 2]
+
+    def test_stream_starts_with_snapshot_then_events(self, repo):
+        service = StatusService(repo, status_source=CountingSource())
+        stream = service.stream(keepalive=0.01, max_events=2)
+
+        first = next(stream)
+        assert first.startswith("event: status\n")
+        assert json.loads(first.split("data: ", 1)[1])["status"] == "healthy"
+        assert next(stream) == ": keepalive\n\n"
+
+        service.broker.publish("task", {"task_id": "t-1"})
+        chunks = list(stream)
+        assert chunks[-1].startswith("id: 1\nevent: task\n")
+        assert service.broker.subscriber_count == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -89,3 +89,97 @@ class TestSearchFileTool:
         result = tool.execute({"pattern": "*", "path": "../"})
         assert result.success is False
         assert "Access denied" in result.error
+
+
+class TestWorkspaceFileIndex:
+    @pytest.fixture
+    def workspace(self, tmp_path, monkeypatch):
+        (tmp_path / "pkg" / "sub").mkdir(parents=True)
+        (tmp_path / "node_modules" / "lib").mkdir(parents=True)
+        (tmp_path / ".git").mkdir()
+        (tmp_path / "config.py").write_text("")
+        (tmp_path / "pkg" / "config.py").write_text("")
+        (tmp_path / "pkg" / "app.py").write_text("")
+        (tmp_path / "pkg" / "sub" / "config.py.bak").write_text("")
+        (tmp_path / "node_modules" / "lib" / "config.py").write_text("")
+        (tmp_path / ".git" / "config.py").write_text("")
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
+
+    def test_ranking_and_pruning(self, workspace):
+        """Exact name matches first, shallower first; ignored/hidden dirs pruned."""
+        result = SearchFileTool().execute({"pattern": "config.py*"})
+        assert result.output.split("\n") == [
+            "config.py",
+            "pkg/config.py",
+            "pkg/sub/config.py.bak",
+        ]
+
+    def test_pagination(self, workspace):
+        """limit/offset page through ranked results."""
+        tool = SearchFileTool()
+        first = tool.execute({"pattern": "*.py", "limit": 2})
+        assert first.metadata["total"] == 3
+        assert first.metadata["truncated"] is True
+        assert "use offset=2 for more" in first.output
+
+        rest = tool.execute({"pattern": "*.py", "limit": 2, "offset": 2})
+        assert rest.output == "pkg/config.py"
+        assert rest.metadata["truncated"] is False
+
+    def test_multi_dot_extension(self, workspace):
+        """Multi-dot suffixes match the full suffix, not just the last extension."""
+        (workspace / "pkg" / "app.test.py").write_text("")
+        (workspace / "dist.tar.gz").write_text("")
+        tool = SearchFileTool()
+        assert tool.execute({"pattern": "*.test.py"}).output == "pkg/app.test.py"
+        assert tool.execute({"pattern": "*.tar.gz"}).output == "dist.tar.gz"
+        assert tool.execute({"pattern": "*.py.bak"}).output == "pkg/sub/config.py.bak"
+
+    def test_search_ignored_directory_directly(self, workspace):
+        """Searching inside an ignored dir falls back to a direct walk."""
+        result = SearchFileTool().execute({"pattern": "*.py", "path": "node_modules"})
+        assert result.output == "node_modules/lib/config.py"
+
+    def test_incremental_refresh(self, workspace):
+        """Created, deleted and renamed entries show up on the next query."""
+        tool = SearchFileTool()
+        assert tool.execute({"pattern": "new.py"}).output == "No matches found."
+
+        (workspace / "pkg" / "sub" / "new.py").write_text("")
+        assert tool.execute({"pattern": "new.py"}).output == "pkg/sub/new.py"
+
+        (workspace / "pkg" / "sub").rename(workspace / "pkg" / "moved")
+        assert tool.execute({"pattern": "new.py"}).output == "pkg/moved/new.py"
+
+        (workspace / "pkg" / "moved" / "new.py").unlink()
+        assert tool.execute({"pattern": "new.py"}).output == "No matches found."
+
+    def test_search_refreshes_once_per_query(self, workspace, monkeypatch):
+        """A search validates the index once, not once per index call."""
+        from vibe_core.tools.file_index import WorkspaceFileIndex
+
+        refreshes = []
+        original = WorkspaceFileIndex.refresh
+
+        def counting_refresh(self, force=False):
+            refreshes.append(force)
+            return original(self, force)
+
+        monkeypatch.setattr(WorkspaceFileIndex, "refresh", counting_refresh)
+        assert SearchFileTool().execute({"pattern": "app.py"}).output == "pkg/app.py"
+        assert len(refreshes) == 1
+
+    def test_list_directory_uses_index(self, workspace):
+        """Ignored dirs are listed but hidden ones are not."""
+        result = ListDirectoryTool().execute({})
+        assert result.output.split("\n") == [
+            "[DIR] node_modules",
+            "[DIR] pkg",
+            "[FILE] config.py",
+        ]
+
+        (workspace / "pkg" / "extra.txt").write_text("")
+        listing = ListDirectoryTool().execute({"path": "pkg"}).output
+        assert "[FILE] extra.txt" in listing
+        assert "[DIR] sub" in listing
@@ -10,26 +10,45 @@ import importlib.machinery
 import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+from typing import Any
 
-# Load vibe-cli as a module
 vibe_cli_path = Path(__file__).parent / "vibe-cli"
 
-if not vibe_cli_path.exists():
-    raise FileNotFoundError(f"vibe-cli not found at {vibe_cli_path}")
+# Functions exported for testing; vibe-cli is loaded when one is first used
+_EXPORTS = ("display_motd", "get_critical_alerts", "load_system_status")
 
-spec = importlib.util.spec_from_loader(
-    "vibe_cli",
-    importlib.machinery.SourceFileLoader("vibe_cli", str(vibe_cli_path)),
-)
 
-if spec is None or spec.loader is None:
-    raise ImportError(f"Could not create module spec for {vibe_cli_path}")
+def _load_vibe_cli() -> ModuleType:
+    """Load vibe-cli as a module (once)."""
+    if "vibe_cli" in sys.modules:
+        return sys.modules["vibe_cli"]
 
-vibe_cli_module = importlib.util.module_from_spec(spec)
-sys.modules["vibe_cli"] = vibe_cli_module
-spec.loader.exec_module(vibe_cli_module)
+    if not vibe_cli_path.exists():
+        raise FileNotFoundError(f"vibe-cli not found at {vibe_cli_path}")
 
-# Export specific functions for testing
-get_critical_alerts = vibe_cli_module.get_critical_alerts
-display_motd = vibe_cli_module.display_motd
-load_system_status = vibe_cli_module.load_system_status
+    spec = importlib.util.spec_from_loader(
+        "vibe_cli",
+        importlib.machinery.SourceFileLoader("vibe_cli", str(vibe_cli_path)),
+    )
+
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Could not create module spec for {vibe_cli_path}")
+
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["vibe_cli"] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules["vibe_cli"]
+        raise
+    return module
+
+
+def __getattr__(name: str) -> Any:
+    """PEP 562: importing this helper no longer executes vibe-cli."""
+    if name == "vibe_cli_module":
+        return _load_vibe_cli()
+    if name in _EXPORTS:
+        return getattr(_load_vibe_cli(), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -13,6 +13,8 @@ Components:
 - tools: Generic tool implementations
 """
 
+from vibe_core._lazy import lazy_exports
+
 __version__ = "2.0.0"
 __all__ = [
     "config",
@@ -21,3 +23,6 @@ __all__ = [
     "specialists",
     "task_management",
 ]
+
+# PEP 562: `vibe_core.runtime` & co. are imported on first access
+__getattr__, __dir__ = lazy_exports(__name__, submodules=tuple(__all__))
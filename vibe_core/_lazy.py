@@ -0,0 +1,55 @@
+"""
+Lazy package exports (PEP 562).
+
+Package __init__ files re-export names from their submodules. Importing
+them eagerly makes `import vibe_core.tools.agenda_tools` pay for every
+sibling module (the tool registry, governance, the LLM client...). With
+lazy_exports() a package maps each public name to the submodule that
+defines it and imports that submodule on first attribute access:
+
+    # vibe_core/tools/__init__.py
+    __getattr__, __dir__ = lazy_exports(__name__, {"ToolRegistry": ".tool_registry"})
+
+`from vibe_core.tools import ToolRegistry` keeps working; the submodule is
+imported then, once, and the value is cached in the package namespace.
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str,
+    exports: dict[str, str] | None = None,
+    submodules: tuple[str, ...] = (),
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build module-level __getattr__ and __dir__ for a package.
+
+    Args:
+        package: The package's __name__
+        exports: Public name -> submodule defining it (relative or absolute)
+        submodules: Subpackages exposed as attributes (e.g. vibe_core.runtime)
+
+    Returns:
+        (__getattr__, __dir__) to assign at module level
+    """
+    exports = dict(exports or {})
+    submodules = tuple(submodules)
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            value = getattr(importlib.import_module(exports[name], package), name)
+        elif name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)  # Later lookups skip __getattr__
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted({*vars(sys.modules[package]), *exports, *submodules})
+
+    return __getattr__, __dir__
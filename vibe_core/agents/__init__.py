@@ -5,8 +5,23 @@ This module provides concrete agent implementations that integrate
 with the kernel via the VibeAgent protocol.
 """
 
-from vibe_core.agents.llm_agent import SimpleLLMAgent
-from vibe_core.agents.specialist_agent import SpecialistAgent
-from vibe_core.agents.specialist_factory import SpecialistFactoryAgent
+from typing import TYPE_CHECKING
+
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vibe_core.agents.llm_agent import SimpleLLMAgent
+    from vibe_core.agents.specialist_agent import SpecialistAgent
+    from vibe_core.agents.specialist_factory import SpecialistFactoryAgent
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "SimpleLLMAgent": "vibe_core.agents.llm_agent",
+        "SpecialistAgent": "vibe_core.agents.specialist_agent",
+        "SpecialistFactoryAgent": "vibe_core.agents.specialist_factory",
+    },
+)
 
 __all__ = ["SimpleLLMAgent", "SpecialistAgent", "SpecialistFactoryAgent"]
@@ -14,6 +14,7 @@ from typing import Any, Optional
 from vibe_core.agent_protocol import AgentResponse, VibeAgent
 from vibe_core.llm import LLMProvider
 from vibe_core.scheduling import Task
+from vibe_core.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -175,62 +176,68 @@ class SimpleLLMAgent(VibeAgent):
                 f"Got payload keys: {list(payload.keys())}"
             )
 
-        # Determine model to use
-        model_to_use = payload.get("model") or self.model
+        with span("agent.process", agent_id=self.agent_id, task_id=task.id) as sp:
+            # Determine model to use
+            model_to_use = payload.get("model") or self.model
+            sp.set_attribute("model", model_to_use or "default")
 
-        # Build message history
-        messages = self._build_messages(user_message, payload.get("context"))
+            # Build message history
+            with span("prompt.compose", source="SimpleLLMAgent"):
+                messages = self._build_messages(user_message, payload.get("context"))
 
-        # Log the interaction
-        logger.info(
-            f"AGENT: {self.agent_id} processing task {task.id} "
-            f"(user_message length={len(user_message)}, model={model_to_use})"
-        )
-        logger.debug(f"AGENT: Messages to LLM: {messages}")
-
-        try:
-            # Call LLM provider
-            response = self.provider.chat(messages, model=model_to_use)
-
-            logger.info(f"AGENT: {self.agent_id} received LLM response (length={len(response)})")
-            logger.debug(f"AGENT: LLM response: {response}")
-
-            # Check if response contains tool call
-            tool_result = None
-            if self.tool_registry:
-                tool_call_data = self._extract_tool_call(response)
-                if tool_call_data:
-                    logger.info(f"AGENT: {self.agent_id} detected tool call in response")
-                    tool_result = self._execute_tool_call(tool_call_data)
-
-            return AgentResponse(
-                agent_id=self.agent_id,
-                task_id=task.id,
-                success=True,
-                output={
-                    "response": response,
-                    "model_used": model_to_use or "default",
-                    "provider": self.provider.__class__.__name__,
-                    "tool_call": tool_result,  # None if no tool call
-                },
-            )
-
-        except Exception as e:
-            logger.error(f"AGENT: {self.agent_id} LLM call failed for task {task.id}: {e}")
-
-            # Return AgentResponse with failure status instead of raising
-            error_msg = f"LLM call failed: {e!s}"
-            return AgentResponse(
-                agent_id=self.agent_id,
-                task_id=task.id,
-                success=False,
-                output=None,
-                error=error_msg,
-                metadata={
-                    "provider": self.provider.__class__.__name__,
-                    "original_error_type": type(e).__name__,
-                },
+            # Log the interaction
+            logger.info(
+                f"AGENT: {self.agent_id} processing task {task.id} "
+                f"(user_message length={len(user_message)}, model={model_to_use})"
             )
+            logger.debug(f"AGENT: Messages to LLM: {messages}")
+
+            try:
+                # Call LLM provider
+                response = self.provider.chat(messages, model=model_to_use)
+
+                logger.info(
+                    f"AGENT: {self.agent_id} received LLM response (length={len(response)})"
+                )
+                logger.debug(f"AGENT: LLM response: {response}")
+
+                # Check if response contains tool call
+                tool_result = None
+                if self.tool_registry:
+                    tool_call_data = self._extract_tool_call(response)
+                    if tool_call_data:
+                        logger.info(f"AGENT: {self.agent_id} detected tool call in response")
+                        tool_result = self._execute_tool_call(tool_call_data)
+
+                return AgentResponse(
+                    agent_id=self.agent_id,
+                    task_id=task.id,
+                    success=True,
+                    output={
+                        "response": response,
+                        "model_used": model_to_use or "default",
+                        "provider": self.provider.__class__.__name__,
+                        "tool_call": tool_result,  # None if no tool call
+                    },
+                )
+
+            except Exception as e:
+                logger.error(f"AGENT: {self.agent_id} LLM call failed for task {task.id}: {e}")
+                sp.set_error(e)
+
+                # Return AgentResponse with failure status instead of raising
+                error_msg = f"LLM call failed: {e!s}"
+                return AgentResponse(
+                    agent_id=self.agent_id,
+                    task_id=task.id,
+                    success=False,
+                    output=None,
+                    error=error_msg,
+                    metadata={
+                        "provider": self.provider.__class__.__name__,
+                        "original_error_type": type(e).__name__,
+                    },
+                )
 
     def _build_messages(
         self, user_message: str, context: dict | None = None
@@ -21,15 +21,64 @@ The Archivist is the proof that Vibe OS is not just a kernel—it's an
 experience system that ships with useful apps.
 """
 
+import hashlib
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
+from vibe_core.cartridges.archivist.index_store import DocumentIndexStore
 from vibe_core.cartridges.base import CartridgeBase
 
 logger = logging.getLogger(__name__)
 
+# Below this many changed documents, extraction runs in-process
+# (spawning a process pool costs more than it saves)
+PARALLEL_EXTRACT_THRESHOLD = 8
+
+
+def _read_document(file_path: str) -> tuple[str | None, str | None]:
+    """
+    Read a document and fingerprint its raw bytes.
+
+    Module-level so it can run in a worker process.
+
+    Returns:
+        (text, sha256 hex digest); text is None if the format is not
+        extractable, both are None if the file could not be read
+    """
+    with open(file_path, "rb") as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    suffix = os.path.splitext(file_path)[1].lower()
+    if suffix in (".txt", ".md"):
+        return raw.decode("utf-8"), digest
+
+    if suffix == ".pdf":
+        try:
+            import io
+
+            import PyPDF2
+        except ImportError:
+            return None, digest
+        pdf_reader = PyPDF2.PdfReader(io.BytesIO(raw))
+        return "\n".join(page.extract_text() for page in pdf_reader.pages), digest
+
+    return None, digest
+
+
+def _extract_worker(file_path: str) -> tuple[str, str | None, str | None, str | None]:
+    """Process-pool entry point: (path, text, digest, error)."""
+    try:
+        text, digest = _read_document(file_path)
+        return file_path, text, digest, None
+    except Exception as e:
+        return file_path, None, None, str(e)
+
 
 class ArchivistCartridge(CartridgeBase):
     """
@@ -40,6 +89,8 @@ class ArchivistCartridge(CartridgeBase):
     2. extract_text(file_path) → Get document content
     3. summarize(text, max_length=500) → Generate summary (offline LLM)
     4. build_index(folder_path) → Build complete knowledge base
+       (incremental: only new or changed documents are reprocessed)
+    5. search(query) / query(...) → Look up indexed documents
     """
 
     name = "archivist"
@@ -47,13 +98,30 @@ class ArchivistCartridge(CartridgeBase):
     description = "Knowledge base builder - reads documents and generates searchable index"
     author = "Vibe Agency"
 
-    def __init__(self, vibe_root: Path | None = None):
-        """Initialize the Archivist cartridge."""
+    def __init__(
+        self,
+        vibe_root: Path | None = None,
+        index_db: Path | str | None = None,
+        max_workers: int | None = None,
+    ):
+        """
+        Initialize the Archivist cartridge.
+
+        Args:
+            vibe_root: Path to vibe-agency root (auto-detected if None)
+            index_db: SQLite document index (default: <vibe_root>/.vibe/state/archivist.db).
+                      Use ":memory:" for ephemeral testing.
+            max_workers: Text extraction processes (default: CPU count)
+        """
         super().__init__(vibe_root=vibe_root)
 
         # Archivist-specific configuration
         self.supported_formats = [".md", ".txt", ".pdf"]
         self.max_document_size = 10 * 1024 * 1024  # 10MB
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self._index_db = index_db or self.vibe_root / ".vibe" / "state" / "archivist.db"
+        self._index_store: DocumentIndexStore | None = None
 
         logger.info("🗂️ The Archivist initialized - Ready to catalog knowledge")
 
@@ -79,28 +147,33 @@ class ArchivistCartridge(CartridgeBase):
 
         documents = []
 
-        for file_path in folder.rglob("*"):
-            if not file_path.is_file():
-                continue
-
-            # Check supported format
-            if file_path.suffix.lower() not in self.supported_formats:
-                continue
-
-            # Check file size
-            file_size = file_path.stat().st_size
-            if file_size > self.max_document_size:
-                logger.warning(f"⚠️ Skipping oversized file: {file_path} ({file_size} bytes)")
-                continue
-
-            documents.append(
-                {
-                    "path": str(file_path),
-                    "name": file_path.name,
-                    "format": file_path.suffix.lower(),
-                    "size_bytes": file_size,
-                }
-            )
+        for dirpath, _dirnames, filenames in os.walk(folder):
+            for filename in filenames:
+                # Check supported format
+                suffix = os.path.splitext(filename)[1].lower()
+                if suffix not in self.supported_formats:
+                    continue
+
+                file_path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(file_path)
+                except OSError:
+                    continue
+
+                # Check file size
+                if st.st_size > self.max_document_size:
+                    logger.warning(f"⚠️ Skipping oversized file: {file_path} ({st.st_size} bytes)")
+                    continue
+
+                documents.append(
+                    {
+                        "path": file_path,
+                        "name": filename,
+                        "format": suffix,
+                        "size_bytes": st.st_size,
+                        "mtime_ns": st.st_mtime_ns,
+                    }
+                )
 
         logger.info(f"📊 Found {len(documents)} documents in {folder_path}")
         return sorted(documents, key=lambda x: x["path"])
@@ -109,8 +182,7 @@ class ArchivistCartridge(CartridgeBase):
         """
         Extract text from a document.
 
-        Currently supports: TXT, MD
-        PDF support can be added with pypdf library.
+        Supports: TXT, MD, and PDF (requires PyPDF2).
 
         Args:
             file_path: Path to document
@@ -125,32 +197,14 @@ class ArchivistCartridge(CartridgeBase):
             return None
 
         try:
-            # TXT and MD files
-            if file.suffix.lower() in [".txt", ".md"]:
-                with open(file, encoding="utf-8") as f:
-                    return f.read()
-
-            # PDF support (requires pypdf)
-            if file.suffix.lower() == ".pdf":
-                try:
-                    import PyPDF2
-
-                    text = []
-                    with open(file, "rb") as f:
-                        pdf_reader = PyPDF2.PdfReader(f)
-                        for page_num in range(len(pdf_reader.pages)):
-                            page = pdf_reader.pages[page_num]
-                            text.append(page.extract_text())
-                    return "\n".join(text)
-                except ImportError:
-                    logger.warning("⚠️ PyPDF2 not installed. PDF extraction unavailable.")
-                    return None
-
+            text, _digest = _read_document(str(file))
         except Exception as e:
             logger.error(f"❌ Failed to extract text from {file_path}: {e}")
             return None
 
-        return None
+        if text is None and file.suffix.lower() == ".pdf":
+            logger.warning("⚠️ PyPDF2 not installed. PDF extraction unavailable.")
+        return text
 
     def summarize(self, text: str, max_length: int = 500) -> str:
         """
@@ -180,57 +234,100 @@ class ArchivistCartridge(CartridgeBase):
             logger.warning(f"⚠️ Summarization failed: {e}. Using text truncation.")
             return text[:max_length]
 
+    @property
+    def index_store(self) -> DocumentIndexStore:
+        """Persistent document index (opened on first use)."""
+        if self._index_store is None:
+            self._index_store = DocumentIndexStore(self._index_db)
+        return self._index_store
+
+    def close(self):
+        """Close the document index."""
+        if self._index_store is not None:
+            self._index_store.close()
+            self._index_store = None
+
     def build_index(self, folder_path: str, output_path: str | None = None) -> dict[str, Any]:
         """
         Build a complete knowledge index from all documents in a folder.
 
+        Incremental: documents whose (size, mtime) are unchanged since the
+        last run are served from the index store. Changed documents are
+        re-read (in a process pool for large batches); if their content hash
+        still matches, the stored summary is reused. Only new content is
+        summarized. Documents deleted from the folder are dropped from the
+        index.
+
         Args:
             folder_path: Path to documents
-            output_path: Where to save the index (optional)
+            output_path: Where to save the index as JSON (optional)
 
         Returns:
-            Index structure with all documents and summaries
+            Index structure with all documents and summaries, plus
+            "stats" (unchanged, reindexed, removed, failed counts)
         """
-        # Scan directory
-        documents = self.scan_directory(folder_path)
+        folder = os.path.abspath(folder_path)
+        documents = self.scan_directory(folder)
 
         if not documents:
             logger.warning(f"⚠️ No documents found in {folder_path}")
+            if os.path.isdir(folder):
+                self.index_store.prune(folder, keep=set())
+                self.index_store.commit()
             return {"status": "empty", "documents": [], "folder": folder_path}
 
-        # Extract and summarize each document
-        index = {
-            "folder": str(folder_path),
-            "total_documents": len(documents),
-            "documents": [],
-        }
-
-        logger.info(f"📖 Building knowledge index from {len(documents)} documents...")
-
-        for doc in documents:
-            logger.info(f"📄 Processing: {doc['name']}")
+        store = self.index_store
+        known = store.fingerprints([doc["path"] for doc in documents])
+        changed = [
+            doc
+            for doc in documents
+            if (row := known.get(doc["path"])) is None
+            or (row["size_bytes"], row["mtime_ns"]) != (doc["size_bytes"], doc["mtime_ns"])
+        ]
+
+        logger.info(
+            f"📖 Building knowledge index from {len(documents)} documents "
+            f"({len(changed)} new or changed)..."
+        )
 
-            # Extract text
-            text = self.extract_text(doc["path"])
+        to_summarize: list[tuple[dict[str, Any], str, str]] = []
+        failed = set()
+        for doc, text, digest in self._extract_all(changed):
+            row = known.get(doc["path"])
             if not text:
                 logger.warning(f"⚠️ Could not extract text from {doc['name']}")
-                continue
-
-            # Generate summary
-            summary = self.summarize(text)
-
-            # Create document entry
-            doc_entry = {
+                failed.add(doc["path"])
+            elif row is not None and row["content_hash"] == digest:
+                store.touch(doc["path"], doc["size_bytes"], doc["mtime_ns"])  # Only touched
+            else:
+                to_summarize.append((doc, text, digest))
+
+        for doc, text, digest in to_summarize:
+            entry = {
                 "name": doc["name"],
                 "path": doc["path"],
                 "format": doc["format"],
                 "size_bytes": doc["size_bytes"],
                 "text_length": len(text),
-                "summary": summary,
+                "summary": self.summarize(text),
                 "preview": text[:200],  # First 200 chars
             }
+            store.upsert(entry, doc["mtime_ns"], digest, text)
 
-            index["documents"].append(doc_entry)
+        removed = store.prune(folder, keep={doc["path"] for doc in documents} - failed)
+        store.commit()
+
+        index = {
+            "folder": str(folder_path),
+            "total_documents": len(documents),
+            "documents": store.query(folder=folder),
+            "stats": {
+                "unchanged": len(documents) - len(changed),
+                "reindexed": len(to_summarize),
+                "removed": removed,
+                "failed": len(failed),
+            },
+        }
 
         # Save index if requested
         if output_path:
@@ -247,6 +344,76 @@ class ArchivistCartridge(CartridgeBase):
 
         return index
 
+    def _extract_all(self, documents: list[dict[str, Any]]):
+        """
+        Yield (doc, text, digest) for each document.
+
+        Large batches are extracted in a process pool (PDF parsing is
+        CPU-bound); small batches, or environments where worker processes
+        cannot be started, are extracted in-process.
+        """
+        if len(documents) >= PARALLEL_EXTRACT_THRESHOLD and self.max_workers > 1:
+            by_path = {doc["path"]: doc for doc in documents}
+            try:
+                with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+                    results = list(pool.map(_extract_worker, by_path, chunksize=4))
+            except (BrokenProcessPool, OSError) as e:
+                logger.warning(f"⚠️ Process pool unavailable ({e}); extracting in-process")
+            else:
+                for path, text, digest, error in results:
+                    if error:
+                        logger.error(f"❌ Failed to extract text from {path}: {error}")
+                    yield by_path[path], text, digest
+                return
+
+        for doc in documents:
+            _, text, digest, error = _extract_worker(doc["path"])
+            if error:
+                logger.error(f"❌ Failed to extract text from {doc['path']}: {error}")
+            yield doc, text, digest
+
+    def search(
+        self, query: str, limit: int = 10, folder: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Full-text search over indexed documents (names, summaries, text).
+
+        Args:
+            query: Search terms (all must match)
+            limit: Maximum number of results
+            folder: Restrict to documents under this folder
+
+        Returns:
+            Ranked document entries, each with a "snippet" of matching text
+        """
+        folder = os.path.abspath(folder) if folder else None
+        return self.index_store.search(query, limit=limit, folder=folder)
+
+    def query(
+        self,
+        folder: str | None = None,
+        format: str | None = None,
+        name: str | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Structured lookup of indexed documents (see DocumentIndexStore.query).
+
+        Returns:
+            Document entries ordered by path
+        """
+        folder = os.path.abspath(folder) if folder else None
+        return self.index_store.query(
+            folder=folder,
+            format=format,
+            name=name,
+            min_size=min_size,
+            max_size=max_size,
+            limit=limit,
+        )
+
     def report_status(self) -> dict[str, Any]:
         """Report Archivist status."""
         status = super().report_status()
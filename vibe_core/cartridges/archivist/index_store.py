@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+Archivist document index store - ARCH-050
+
+SQLite table `archivist_documents` holds one row per indexed document,
+unique by absolute path and fingerprinted by (size_bytes, mtime_ns,
+content_hash). The Archivist uses the fingerprint to reprocess only
+documents that changed since the last build_index() run.
+
+Document text is kept in an FTS5 table (`archivist_fts`) so the index is
+searchable instead of being one JSON dump. FTS rows share the rowid of
+their document (archivist_documents.id), so replacing or pruning a document
+is a rowid lookup rather than a scan of the FTS table. If the SQLite build has no FTS5,
+search falls back to LIKE matching on name, summary and preview.
+
+Usage:
+    store = DocumentIndexStore(Path(".vibe/state/archivist.db"))
+    store.search("kernel scheduler", limit=5)
+    store.query(format=".md", folder="/docs")
+"""
+
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+# Columns returned for every document (order matches build_index entries)
+DOCUMENT_FIELDS = ("name", "path", "format", "size_bytes", "text_length", "summary", "preview")
+
+
+class DocumentIndexStore:
+    """SQLite-backed, searchable document index with change fingerprints."""
+
+    def __init__(self, db_path: Path | str):
+        """
+        Args:
+            db_path: SQLite file. Use ":memory:" for ephemeral testing.
+        """
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.fts_enabled = False
+        self._ensure_schema()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ========================================================================
+    # SCHEMA
+    # ========================================================================
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS archivist_documents (
+                    id INTEGER PRIMARY KEY,
+                    path TEXT NOT NULL UNIQUE,
+                    name TEXT NOT NULL,
+                    format TEXT NOT NULL,
+                    size_bytes INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    text_length INTEGER NOT NULL,
+                    summary TEXT,
+                    preview TEXT,
+                    indexed_at TEXT
+                );
+                CREATE INDEX IF NOT EXISTS idx_archivist_format
+                    ON archivist_documents(format);
+            """)
+            try:
+                self.conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS archivist_fts "
+                    "USING fts5(name, summary, body)"
+                )
+                self.fts_enabled = True
+            except sqlite3.OperationalError:
+                self.fts_enabled = False  # SQLite built without FTS5
+            self.conn.commit()
+
+    # ========================================================================
+    # FINGERPRINTS / MUTATIONS
+    # ========================================================================
+
+    def fingerprints(self, paths: list[str]) -> dict[str, sqlite3.Row]:
+        """Stored (size_bytes, mtime_ns, content_hash) per path, for known paths."""
+        with self._lock:
+            found = {}
+            for start in range(0, len(paths), 500):
+                chunk = paths[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                rows = self.conn.execute(
+                    "SELECT path, size_bytes, mtime_ns, content_hash "  # noqa: S608
+                    f"FROM archivist_documents WHERE path IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                found.update((row["path"], row) for row in rows)
+            return found
+
+    def touch(self, path: str, size_bytes: int, mtime_ns: int):
+        """Record a new stat for a document whose content did not change."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE archivist_documents SET size_bytes = ?, mtime_ns = ? WHERE path = ?",
+                (size_bytes, mtime_ns, path),
+            )
+
+    def upsert(self, entry: dict[str, Any], mtime_ns: int, content_hash: str, text: str):
+        """Insert or replace a document and its searchable text."""
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO archivist_documents
+                    (path, name, format, size_bytes, mtime_ns, content_hash,
+                     text_length, summary, preview, indexed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    name = excluded.name,
+                    format = excluded.format,
+                    size_bytes = excluded.size_bytes,
+                    mtime_ns = excluded.mtime_ns,
+                    content_hash = excluded.content_hash,
+                    text_length = excluded.text_length,
+                    summary = excluded.summary,
+                    preview = excluded.preview,
+                    indexed_at = excluded.indexed_at
+                """,
+                (
+                    entry["path"],
+                    entry["name"],
+                    entry["format"],
+                    entry["size_bytes"],
+                    mtime_ns,
+                    content_hash,
+                    entry["text_length"],
+                    entry["summary"],
+                    entry["preview"],
+                    datetime.utcnow().isoformat() + "Z",
+                ),
+            )
+            if self.fts_enabled:
+                doc_id = self.conn.execute(
+                    "SELECT id FROM archivist_documents WHERE path = ?", (entry["path"],)
+                ).fetchone()[0]
+                self.conn.execute("DELETE FROM archivist_fts WHERE rowid = ?", (doc_id,))
+                self.conn.execute(
+                    "INSERT INTO archivist_fts (rowid, name, summary, body) VALUES (?, ?, ?, ?)",
+                    (doc_id, entry["name"], entry["summary"], text),
+                )
+
+    def prune(self, folder: str, keep: set[str]) -> int:
+        """
+        Remove documents under folder that are not in keep (deleted files).
+
+        Returns:
+            Number of documents removed
+        """
+        with self._lock:
+            gone = [doc_id for path, doc_id in self._paths_under(folder) if path not in keep]
+            for doc_id in gone:
+                self.conn.execute("DELETE FROM archivist_documents WHERE id = ?", (doc_id,))
+                if self.fts_enabled:
+                    self.conn.execute("DELETE FROM archivist_fts WHERE rowid = ?", (doc_id,))
+            return len(gone)
+
+    def commit(self):
+        with self._lock:
+            self.conn.commit()
+
+    def _paths_under(self, folder: str) -> list[tuple[str, int]]:
+        """(path, id) of every document under folder."""
+        prefix = folder.rstrip("/") + "/"
+        rows = self.conn.execute(
+            "SELECT path, id FROM archivist_documents WHERE substr(path, 1, ?) = ?",
+            (len(prefix), prefix),
+        ).fetchall()
+        return [(row["path"], row["id"]) for row in rows]
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def query(
+        self,
+        folder: str | None = None,
+        format: str | None = None,
+        name: str | None = None,
+        min_size: int | None = None,
+        max_size: int | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Indexed documents matching all given filters, ordered by path.
+
+        Args:
+            folder: Only documents under this absolute folder
+            format: File extension, e.g. ".md"
+            name: Glob on the file name, e.g. "design-*"
+            min_size: Minimum size in bytes
+            max_size: Maximum size in bytes
+            limit: Maximum number of documents
+        """
+        clauses, params = [], []
+        if folder:
+            prefix = folder.rstrip("/") + "/"
+            clauses.append("substr(path, 1, ?) = ?")
+            params += [len(prefix), prefix]
+        if format:
+            clauses.append("format = ?")
+            params.append(format.lower())
+        if name:
+            clauses.append("name GLOB ?")
+            params.append(name)
+        if min_size is not None:
+            clauses.append("size_bytes >= ?")
+            params.append(min_size)
+        if max_size is not None:
+            clauses.append("size_bytes <= ?")
+            params.append(max_size)
+
+        sql = f"SELECT {', '.join(DOCUMENT_FIELDS)} FROM archivist_documents"  # noqa: S608
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY path"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+    def search(
+        self, query: str, limit: int = 10, folder: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Full-text search over document names, summaries and text.
+
+        Every whitespace-separated term must match. Results are ranked by
+        relevance (bm25) when FTS5 is available.
+
+        Returns:
+            Document dicts with an extra "snippet" field
+        """
+        terms = query.split()
+        if not terms:
+            return []
+
+        columns = ", ".join(f"d.{f}" for f in DOCUMENT_FIELDS)
+        params: list[Any] = []
+        if self.fts_enabled:
+            match = " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+            sql = (
+                f"SELECT {columns}, "  # noqa: S608
+                "snippet(archivist_fts, 2, '[', ']', '...', 12) AS snippet "
+                "FROM archivist_fts JOIN archivist_documents d ON d.id = archivist_fts.rowid "
+                "WHERE archivist_fts MATCH ?"
+            )
+            params.append(match)
+        else:
+            sql = f"SELECT {columns}, d.preview AS snippet FROM archivist_documents d WHERE 1"  # noqa: S608
+            for term in terms:
+                sql += " AND (d.name LIKE ? OR d.summary LIKE ? OR d.preview LIKE ?)"
+                params += [f"%{term}%"] * 3
+
+        if folder:
+            prefix = folder.rstrip("/") + "/"
+            sql += " AND substr(d.path, 1, ?) = ?"
+            params += [len(prefix), prefix]
+        sql += " ORDER BY bm25(archivist_fts)" if self.fts_enabled else " ORDER BY d.path"
+        sql += " LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            return [dict(row) for row in self.conn.execute(sql, params).fetchall()]
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM archivist_documents").fetchone()[0]
+
+
+__all__ = ["DOCUMENT_FIELDS", "DocumentIndexStore"]
@@ -63,8 +63,8 @@ class CartridgeSpec:
     module_path: str
     dependencies: list[str]
     tools: list[str]
-    offline_capable: bool
-    requires_api: bool
+    offline_capable: bool | None  # None: unknown (listed from the manifest)
+    requires_api: bool | None
     registered_at: str
 
 
@@ -10,20 +10,52 @@ This registry:
 3. Supports cartridge dependency resolution
 4. Provides introspection into available cartridges
 
+Discovery is lazy: cartridge definitions are parsed (not imported) into a
+manifest of name, version, description, entry point and file hash, cached
+in .vibe/state/cartridge_manifest.json. Listing cartridges reads only the
+manifest; a cartridge module is imported the first time get_cartridge()
+asks for it. Entries whose file hash changed are re-parsed.
+
 Usage:
     registry = CartridgeRegistry()
     archivist = registry.get_cartridge("archivist")
     all_cartridges = registry.list_cartridges()
 """
 
+import ast
+import hashlib
+import importlib
 import importlib.util
+import json
 import logging
+from dataclasses import asdict, dataclass
+from datetime import datetime
 from pathlib import Path
 
 from .base import CartridgeBase, CartridgeSpec
 
 logger = logging.getLogger(__name__)
 
+# Bump when the manifest layout changes (older caches are rebuilt)
+MANIFEST_VERSION = 2
+
+
+@dataclass(frozen=True)
+class CartridgeManifestEntry:
+    """What discovery knows about a cartridge without importing it."""
+
+    name: str  # Registered under its directory name
+    spec_name: str  # The class's own name attribute (as reported by get_spec())
+    version: str
+    description: str
+    author: str
+    class_name: str
+    entry_point: str  # Definition file, relative to vibe_root
+    file_hash: str  # sha256 of the definition file
+    indexed_at: str
+    offline_capable: bool | None = None  # None: not declared on the class
+    requires_api: bool | None = None
+
 
 class CartridgeRegistry:
     """
@@ -36,21 +68,27 @@ class CartridgeRegistry:
     - Cartridge introspection and listing
     """
 
-    def __init__(self, vibe_root: Path | None = None):
+    def __init__(self, vibe_root: Path | None = None, manifest_path: Path | None = None):
         """
         Initialize the cartridge registry.
 
         Args:
             vibe_root: Path to vibe-agency root
+            manifest_path: Manifest cache file
+                (default: <vibe_root>/.vibe/state/cartridge_manifest.json)
         """
         if vibe_root is None:
             vibe_root = self._detect_vibe_root()
 
         self.vibe_root = Path(vibe_root)
+        self.manifest_path = Path(
+            manifest_path or self.vibe_root / ".vibe" / "state" / "cartridge_manifest.json"
+        )
+        self._manifest: dict[str, CartridgeManifestEntry] = {}
         self._registry: dict[str, type[CartridgeBase]] = {}
         self._instances: dict[str, CartridgeBase] = {}
 
-        # Auto-discover cartridges in vibe_core/cartridges/
+        # Auto-discover cartridges in vibe_core/cartridges/ (no imports)
         self._auto_discover()
 
     def _detect_vibe_root(self) -> Path:
@@ -69,22 +107,30 @@ class CartridgeRegistry:
         )
 
     def _auto_discover(self) -> None:
-        """Auto-discover cartridges in vibe_core/cartridges/ directory."""
+        """Build the manifest of vibe_core/cartridges/, reusing cached entries."""
         cartridges_dir = self.vibe_root / "vibe_core" / "cartridges"
 
         if not cartridges_dir.exists():
             logger.warning(f"⚠️ Cartridges directory not found: {cartridges_dir}")
             return
 
+        cached = self._read_manifest()
         # Look for cartridge directories (skip __pycache__, base.py, registry.py, etc.)
-        for item in cartridges_dir.iterdir():
+        for item in sorted(cartridges_dir.iterdir()):
             if item.is_dir() and not item.name.startswith("_"):
                 # Look for cartridge_main.py or __init__.py with CartridgeBase subclass
-                self._load_cartridge_from_dir(item)
+                entry = self._index_cartridge_dir(item, cached.get(item.name))
+                if entry is not None:
+                    self._manifest[entry.name] = entry
 
-    def _load_cartridge_from_dir(self, cartridge_dir: Path) -> None:
+        if self._manifest != cached:
+            self._write_manifest()
+
+    def _index_cartridge_dir(
+        self, cartridge_dir: Path, cached: CartridgeManifestEntry | None
+    ) -> CartridgeManifestEntry | None:
         """
-        Load a cartridge from a directory.
+        Describe the cartridge in a directory.
 
         Looks for:
         1. cartridge_main.py (primary cartridge definition)
@@ -92,53 +138,176 @@ class CartridgeRegistry:
         """
         cartridge_name = cartridge_dir.name
 
-        # Try cartridge_main.py first
-        cartridge_main = cartridge_dir / "cartridge_main.py"
-        if cartridge_main.exists():
-            self._load_cartridge_from_file(cartridge_main, cartridge_name)
-            return
-
-        # Try __init__.py
-        init_file = cartridge_dir / "__init__.py"
-        if init_file.exists():
-            self._load_cartridge_from_file(init_file, cartridge_name)
-            return
+        for file_name in ("cartridge_main.py", "__init__.py"):
+            file_path = cartridge_dir / file_name
+            if not file_path.exists():
+                continue
+            source = file_path.read_bytes()
+            file_hash = hashlib.sha256(source).hexdigest()
+            entry_point = file_path.relative_to(self.vibe_root).as_posix()
+            if cached and cached.file_hash == file_hash and cached.entry_point == entry_point:
+                return cached
+            entry = self._parse_cartridge(source, file_path, cartridge_name, file_hash)
+            if entry is not None:
+                logger.debug(f"Indexed cartridge: {cartridge_name} ({entry.class_name})")
+                return entry
 
         logger.debug(f"⚠️ No cartridge definition found in {cartridge_dir}")
+        return None
 
-    def _load_cartridge_from_file(self, file_path: Path, cartridge_name: str) -> None:
+    def _parse_cartridge(
+        self, source: bytes, file_path: Path, cartridge_name: str, file_hash: str
+    ) -> CartridgeManifestEntry | None:
         """
-        Dynamically load a cartridge class from a Python file.
+        Read the CartridgeBase subclass of a file from its syntax tree.
 
-        Args:
-            file_path: Path to the Python file
-            cartridge_name: Name of the cartridge
+        A class counts as a cartridge if one of its bases is CartridgeBase (or
+        a cartridge defined earlier in the same file). Metadata comes from its
+        string class attributes, falling back to the CartridgeBase defaults;
+        offline_capable/requires_api are read from boolean class attributes
+        and stay unknown (None) when the class does not declare them.
         """
         try:
-            spec = importlib.util.spec_from_file_location(f"cartridge_{cartridge_name}", file_path)
+            tree = ast.parse(source, filename=str(file_path))
+        except SyntaxError as e:
+            logger.warning(f"⚠️ Failed to parse cartridge {cartridge_name}: {e}")
+            return None
+
+        cartridge_classes = {"CartridgeBase"}
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            base_names = {
+                base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+                for base in node.bases
+            }
+            if not base_names & cartridge_classes:
+                continue
+            cartridge_classes.add(node.name)
+
+            metadata = {
+                "name": cartridge_name,
+                "version": CartridgeBase.version,
+                "description": CartridgeBase.description,
+                "author": CartridgeBase.author,
+            }
+            flags: dict[str, bool | None] = {"offline_capable": None, "requires_api": None}
+            for stmt in node.body:
+                target, value = None, None
+                if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                    target, value = stmt.targets[0], stmt.value
+                elif isinstance(stmt, ast.AnnAssign):
+                    target, value = stmt.target, stmt.value
+                if not (isinstance(target, ast.Name) and isinstance(value, ast.Constant)):
+                    continue
+                if target.id in metadata and isinstance(value.value, str):
+                    metadata[target.id] = value.value
+                elif target.id in flags and isinstance(value.value, bool):
+                    flags[target.id] = value.value
+
+            return CartridgeManifestEntry(
+                name=cartridge_name,
+                spec_name=metadata["name"],
+                version=metadata["version"],
+                description=metadata["description"],
+                author=metadata["author"],
+                class_name=node.name,
+                entry_point=file_path.relative_to(self.vibe_root).as_posix(),
+                file_hash=file_hash,
+                indexed_at=datetime.utcnow().isoformat() + "Z",
+                offline_capable=flags["offline_capable"],
+                requires_api=flags["requires_api"],
+            )
+
+        logger.warning(f"⚠️ No CartridgeBase subclass found in {file_path} for {cartridge_name}")
+        return None
+
+    def _read_manifest(self) -> dict[str, CartridgeManifestEntry]:
+        """Load the cached manifest (empty if missing, stale or corrupt)."""
+        try:
+            data = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+            if data.get("version") != MANIFEST_VERSION:
+                return {}
+            return {
+                name: CartridgeManifestEntry(**entry) for name, entry in data["cartridges"].items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, TypeError, KeyError, AttributeError) as e:
+            logger.debug(f"Ignoring unreadable cartridge manifest {self.manifest_path}: {e}")
+            return {}
+
+    def _write_manifest(self) -> None:
+        """Persist the manifest (best effort: a read-only tree just re-parses)."""
+        data = {
+            "version": MANIFEST_VERSION,
+            "cartridges": {name: asdict(entry) for name, entry in self._manifest.items()},
+        }
+        try:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+            tmp_path.replace(self.manifest_path)
+        except OSError as e:
+            logger.debug(f"Could not write cartridge manifest {self.manifest_path}: {e}")
+
+    def _load_cartridge_class(self, entry: CartridgeManifestEntry) -> type[CartridgeBase]:
+        """
+        Import a cartridge's definition file and register its class.
+
+        Args:
+            entry: Manifest entry of the cartridge
+
+        Returns:
+            The cartridge class
 
-            if spec and spec.loader:
+        Raises:
+            ValueError: If the module fails to import or lacks the class
+        """
+        file_path = self.vibe_root / entry.entry_point
+        try:
+            module = self._import_package_module(entry, file_path)
+            if module is None:
+                spec = importlib.util.spec_from_file_location(f"cartridge_{entry.name}", file_path)
+                if spec is None or spec.loader is None:
+                    raise ImportError(f"no loader for {file_path}")
                 module = importlib.util.module_from_spec(spec)
                 spec.loader.exec_module(module)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load cartridge {entry.name}: {e}")
+            raise ValueError(f"Cartridge '{entry.name}' failed to load: {e}") from e
 
-                # Find CartridgeBase subclass in the module
-                for attr_name in dir(module):
-                    attr = getattr(module, attr_name)
-                    if (
-                        isinstance(attr, type)
-                        and issubclass(attr, CartridgeBase)
-                        and attr is not CartridgeBase
-                    ):
-                        self._registry[cartridge_name] = attr
-                        logger.info(f"✅ Registered cartridge: {cartridge_name} ({attr.__name__})")
-                        return
-
-                logger.warning(
-                    f"⚠️ No CartridgeBase subclass found in {file_path} for {cartridge_name}"
-                )
+        cartridge_class = getattr(module, entry.class_name, None)
+        if not (isinstance(cartridge_class, type) and issubclass(cartridge_class, CartridgeBase)):
+            raise ValueError(
+                f"Cartridge '{entry.name}': {entry.class_name} in {file_path} "
+                f"is not a CartridgeBase subclass"
+            )
 
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to load cartridge {cartridge_name}: {e}")
+        self._registry[entry.name] = cartridge_class
+        logger.info(f"✅ Registered cartridge: {entry.name} ({cartridge_class.__name__})")
+        return cartridge_class
+
+    def _import_package_module(self, entry: CartridgeManifestEntry, file_path: Path):
+        """
+        Import a cartridge under its package name if that resolves to its file.
+
+        Keeps one module object per cartridge, so classes loaded here are the
+        same as those imported directly (e.g. vibe_core.cartridges.archivist).
+        Returns None for cartridges outside the importable package tree.
+        """
+        module_name = _module_name(entry)
+        try:
+            spec = importlib.util.find_spec(module_name)
+        except (ImportError, ValueError):
+            return None
+        if (
+            spec is None
+            or spec.origin is None
+            or Path(spec.origin).resolve() != file_path.resolve()
+        ):
+            return None
+        return importlib.import_module(module_name)
 
     def register_cartridge(
         self, name: str, cartridge_class: type[CartridgeBase], override: bool = False
@@ -160,18 +329,18 @@ class CartridgeRegistry:
                 f"Cartridge class must inherit from CartridgeBase, got: {cartridge_class.__name__}"
             )
 
-        if name in self._registry and not override:
+        if (name in self._registry or name in self._manifest) and not override:
             raise ValueError(
                 f"Cartridge '{name}' already registered. Use override=True to replace."
             )
 
         old_class = self._registry.get(name)
+        old_entry = self._manifest.get(name)
         self._registry[name] = cartridge_class
 
-        if old_class:
-            logger.info(
-                f"🔄 Cartridge override: {name} ({old_class.__name__} → {cartridge_class.__name__})"
-            )
+        if old_class or old_entry:
+            old_name = old_class.__name__ if old_class else old_entry.class_name
+            logger.info(f"🔄 Cartridge override: {name} ({old_name} → {cartridge_class.__name__})")
         else:
             logger.info(f"➕ Cartridge registered: {name} → {cartridge_class.__name__}")
 
@@ -187,19 +356,23 @@ class CartridgeRegistry:
             Instantiated CartridgeBase subclass
 
         Raises:
-            ValueError: If cartridge not found
+            ValueError: If cartridge not found or its module fails to load
         """
-        if name not in self._registry:
+        if name not in self._registry and name not in self._manifest:
             raise ValueError(
-                f"Cartridge '{name}' not found. Available: {list(self._registry.keys())}"
+                f"Cartridge '{name}' not found. Available: {self.get_cartridge_names()}"
             )
 
         # Return cached instance if requested
         if cached and name in self._instances:
             return self._instances[name]
 
+        # Import on first use
+        cartridge_class = self._registry.get(name) or self._load_cartridge_class(
+            self._manifest[name]
+        )
+
         # Instantiate new cartridge
-        cartridge_class = self._registry[name]
         cartridge = cartridge_class(vibe_root=self.vibe_root)
 
         # Cache instance
@@ -212,28 +385,63 @@ class CartridgeRegistry:
         """
         List all registered cartridges with their metadata.
 
+        Cartridges whose class is loaded report their own spec. Those that
+        were not imported yet are described from the manifest (no import;
+        tools unknown until first use, flags the class does not declare
+        are None).
+
         Returns:
             Dictionary mapping cartridge names to CartridgeSpec
         """
         result = {}
-        for name, cartridge_class in self._registry.items():
-            # Instantiate temporarily to get spec
-            try:
-                instance = cartridge_class(vibe_root=self.vibe_root)
-                result[name] = instance.get_spec()
-            except Exception as e:
-                logger.warning(f"⚠️ Failed to get spec for cartridge {name}: {e}")
+        for name in self.get_cartridge_names():
+            if name in self._instances:
+                result[name] = self._instances[name].get_spec()
+            elif name in self._registry:
+                # Already imported: instantiate temporarily to get spec
+                try:
+                    instance = self._registry[name](vibe_root=self.vibe_root)
+                    result[name] = instance.get_spec()
+                except Exception as e:
+                    logger.warning(f"⚠️ Failed to get spec for cartridge {name}: {e}")
+            else:
+                entry = self._manifest[name]
+                result[name] = CartridgeSpec(
+                    name=entry.spec_name,
+                    version=entry.version,
+                    description=entry.description,
+                    author=entry.author,
+                    class_name=entry.class_name,
+                    module_path=_module_name(entry),
+                    dependencies=[],
+                    tools=[],
+                    offline_capable=entry.offline_capable,
+                    requires_api=entry.requires_api,
+                    registered_at=entry.indexed_at,
+                )
 
         return result
 
+    def get_manifest(self) -> dict[str, CartridgeManifestEntry]:
+        """Manifest entries of all discovered cartridges."""
+        return dict(self._manifest)
+
     def get_cartridge_names(self) -> list[str]:
         """Get list of all registered cartridge names."""
-        return list(self._registry.keys())
+        return list(dict.fromkeys([*self._manifest, *self._registry]))
 
     def __repr__(self) -> str:
         """String representation for debugging."""
-        cartridges = ", ".join(f"{name}({cls.__name__})" for name, cls in self._registry.items())
-        return f"CartridgeRegistry({len(self._registry)} cartridges: {cartridges})"
+        classes = {name: entry.class_name for name, entry in self._manifest.items()}
+        classes.update({name: cls.__name__ for name, cls in self._registry.items()})
+        cartridges = ", ".join(f"{name}({class_name})" for name, class_name in classes.items())
+        return f"CartridgeRegistry({len(classes)} cartridges: {cartridges})"
+
+
+def _module_name(entry: CartridgeManifestEntry) -> str:
+    """Dotted package name of a cartridge's entry point."""
+    parts = Path(entry.entry_point).with_suffix("").parts
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
 
 
 # ============================================================================
@@ -263,4 +471,4 @@ def get_default_cartridge_registry(vibe_root: Path | None = None) -> CartridgeRe
     return _default_registry
 
 
-__all__ = ["CartridgeRegistry", "get_default_cartridge_registry"]
+__all__ = ["CartridgeManifestEntry", "CartridgeRegistry", "get_default_cartridge_registry"]
@@ -30,12 +30,16 @@ import subprocess
 from pathlib import Path
 from typing import Any
 
+from vibe_core.agent_protocol import AgentResponse
 from vibe_core.cartridges.base import CartridgeBase
-from vibe_core.kernel import VibeKernel
+from vibe_core.kernel import KernelStatus, VibeKernel
 from vibe_core.scheduling import Task
 
 logger = logging.getLogger(__name__)
 
+# Upper bound for a single specialist delegation
+DELEGATION_TIMEOUT_SECONDS = 600
+
 
 class StudioCartridge(CartridgeBase):
     """
@@ -303,6 +307,13 @@ class StudioCartridge(CartridgeBase):
             if not self.kernel:
                 return {"success": False, "error": "No kernel available"}
 
+            # Queued tasks only run on a RUNNING kernel; don't wait on one that never will
+            if self.kernel.status != KernelStatus.RUNNING:
+                return {
+                    "success": False,
+                    "error": f"Kernel is not running (status: {self.kernel.status.value})",
+                }
+
             # Create delegation task
             task = Task(
                 agent_id=agent_id,
@@ -312,28 +323,14 @@ class StudioCartridge(CartridgeBase):
                 },
             )
 
-            # Submit to kernel
-            task_id = self.kernel.submit(task)
-
-            # Wait for completion (simplified - real impl would use async)
-            max_ticks = 1000
-            ticks = 0
-            while (
-                self.kernel.scheduler.get_queue_status()["pending_tasks"] > 0 and ticks < max_ticks
-            ):
-                self.kernel.tick()
-                ticks += 1
-
-            # Query result from ledger
+            # Submit to kernel and wait for this task only (runs inline if still queued)
+            future = self.kernel.submit(task)
             try:
-                result_row = self.kernel.ledger.get_task_result(task_id)
-                if result_row:
-                    return json.loads(result_row)
-                else:
-                    return {"success": False, "error": f"No result for task {task_id}"}
-            except Exception as e:
-                logger.warning(f"Could not retrieve result from ledger: {e}")
-                return {"success": False, "error": str(e)}
+                result = future.result(timeout=DELEGATION_TIMEOUT_SECONDS)
+            except TimeoutError:
+                return {"success": False, "error": f"No result for task {future.task_id}"}
+
+            return result.to_dict() if isinstance(result, AgentResponse) else result
 
         except Exception as e:
             logger.error(f"Delegation failed: {e}")
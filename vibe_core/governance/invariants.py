@@ -10,16 +10,28 @@ Key concepts:
 - Invariant: A rule that must always hold true
 - SoulResult: The result of checking a tool call against the soul
 
+Rules are compiled at load/reload() into a per-tool matcher: one combined
+regex for all path_contains patterns, a dict for path_matches, and a
+memoized absolute path for path_outside_root. A call that passes (the
+common case) costs one regex search, one dict lookup and at most one path
+resolution, whatever the number of rules.
+
 Architecture note:
 This is ARCH-029 from Phase 3 (Governance & Soul).
 """
 
-from dataclasses import dataclass
+import os
+import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Distinct (path, cwd) pairs whose absolute path is remembered by path_outside_root
+PATH_CACHE_SIZE = 4096
+
 
 @dataclass
 class SoulResult:
@@ -35,6 +47,42 @@ class SoulResult:
     reason: str | None = None
 
 
+_ALLOWED = SoulResult(allowed=True)
+
+
+@dataclass
+class _CompiledRules:
+    """Block rules applicable to one tool, compiled for single-pass matching."""
+
+    results: list[SoulResult] = field(default_factory=list)  # Per rule, in soul order
+    contains: list[tuple[int, str]] = field(default_factory=list)  # (order, pattern)
+    contains_regex: re.Pattern | None = None
+    matches: dict[str, int] = field(default_factory=dict)  # pattern -> first order
+    outside_root: int | None = None  # Order of the first path_outside_root rule
+
+    def first_block(self, path_str: str, is_outside_root) -> int | None:
+        """Order of the first rule (in soul order) blocking path_str, or None."""
+        first = self.matches.get(path_str)
+
+        if self.contains_regex is not None and self.contains_regex.search(path_str):
+            # Rare path: find which patterns hit to honour rule order
+            for order, pattern in self.contains:
+                if first is not None and order > first:
+                    break
+                if pattern in path_str:
+                    first = order
+                    break
+
+        if (
+            self.outside_root is not None
+            and (first is None or self.outside_root < first)
+            and is_outside_root(path_str)
+        ):
+            first = self.outside_root
+
+        return first
+
+
 class InvariantChecker:
     """
     Validates tool calls against soul.yaml safety rules.
@@ -55,6 +103,7 @@ class InvariantChecker:
             pattern: ".git"
             action: "block"
             message: "Touching .git is forbidden."
+            tools: ["write_file"]  # Optional: only these tools (default: all)
     """
 
     def __init__(self, soul_path: str = "config/soul.yaml"):
@@ -66,6 +115,7 @@ class InvariantChecker:
         """
         self.soul_path = Path(soul_path)
         self.rules = self._load_rules()
+        self._compile()
 
     def _load_rules(self) -> list[dict]:
         """
@@ -103,23 +153,71 @@ class InvariantChecker:
             >>> print(result.allowed)  # False
             >>> print(result.reason)   # "Touching .git is forbidden..."
         """
-        # Check each rule in order
-        for rule in self.rules:
-            # Only apply rules that have "block" action
-            if rule.get("action") != "block":
-                continue
-
-            # Check if this rule applies to this tool call
-            result = self._check_rule(rule, tool_name, params)
-            if not result.allowed:
-                return result
-
-        # All rules passed
-        return SoulResult(allowed=True)
+        if "path" not in params:
+            return _ALLOWED
+
+        compiled = self._compiled_by_tool.get(tool_name, self._compiled_default)
+        order = compiled.first_block(str(params["path"]), self._is_path_outside_root)
+        if order is None:
+            # All rules passed
+            return _ALLOWED
+        return compiled.results[order]
+
+    # ========================================================================
+    # RULE COMPILATION
+    # ========================================================================
+
+    def _compile(self) -> None:
+        """Compile block rules into per-tool matchers (called on load/reload)."""
+        block_rules = [r for r in self.rules if r.get("action") == "block"]
+        scoped_tools = {tool for r in block_rules for tool in r.get("tools") or []}
+
+        self._compiled_default = self._compile_rules([r for r in block_rules if not r.get("tools")])
+        self._compiled_by_tool = {
+            tool: self._compile_rules(
+                [r for r in block_rules if not r.get("tools") or tool in r["tools"]]
+            )
+            for tool in scoped_tools
+        }
+
+    def _compile_rules(self, rules: list[dict]) -> _CompiledRules:
+        compiled = _CompiledRules()
+        for order, rule in enumerate(rules):
+            compiled.results.append(self._block_result(rule))
+            condition = rule.get("condition")
+            pattern = rule.get("pattern", "")
+
+            if condition == "path_contains" and pattern:
+                compiled.contains.append((order, pattern))
+            elif condition == "path_matches" and pattern:
+                compiled.matches.setdefault(pattern, order)
+            elif condition == "path_outside_root" and compiled.outside_root is None:
+                compiled.outside_root = order
+
+        if compiled.contains:
+            # Longest first so the alternation doesn't stop at a shared prefix
+            patterns = sorted({p for _, p in compiled.contains}, key=len, reverse=True)
+            compiled.contains_regex = re.compile("|".join(map(re.escape, patterns)))
+        return compiled
+
+    @staticmethod
+    def _block_result(rule: dict) -> SoulResult:
+        default = (
+            "Path outside root blocked"
+            if rule.get("condition") == "path_outside_root"
+            else "Path blocked by soul rule"
+        )
+        return SoulResult(
+            allowed=False,
+            reason=f"{rule.get('message', default)} (Rule: {rule.get('id', 'unknown')})",
+        )
 
     def _check_rule(self, rule: dict, tool_name: str, params: dict[str, Any]) -> SoulResult:
         """
-        Check a single rule against a tool call.
+        Check a single rule against a tool call (uncompiled reference evaluation).
+
+        check_tool_call() uses the compiled matcher; this evaluates one rule
+        directly and must agree with it.
 
         Args:
             rule: The rule dictionary from soul.yaml
@@ -131,6 +229,10 @@ class InvariantChecker:
         """
         condition = rule.get("condition")
 
+        # Tool-scoped rules only apply to their tools
+        if rule.get("tools") and tool_name not in rule["tools"]:
+            return SoulResult(allowed=True)
+
         # File path based rules (most common)
         if "path" in params:
             path_str = str(params["path"])
@@ -176,26 +278,13 @@ class InvariantChecker:
 
         Returns:
             True if path is outside project root
+
+        Note:
+            Only the lexical (path, cwd) join is memoized. Symlinks are
+            resolved on every call, so a link created after an earlier check
+            cannot inherit its verdict.
         """
-        try:
-            # Get absolute path of the target
-            target_path = Path(path_str).resolve()
-
-            # Get project root (assuming we're running from project root)
-            # In production, this should be configurable
-            root_path = Path.cwd().resolve()
-
-            # Check if target is under root
-            # This handles .. and symlinks correctly
-            try:
-                target_path.relative_to(root_path)
-                return False  # Inside root
-            except ValueError:
-                return True  # Outside root
-
-        except (OSError, RuntimeError):
-            # If we can't resolve the path, block it (fail-safe)
-            return True
+        return _resolves_outside(path_str, os.getcwd())
 
     def reload(self) -> None:
         """
@@ -205,6 +294,7 @@ class InvariantChecker:
         restarting the system.
         """
         self.rules = self._load_rules()
+        self._compile()
 
     @property
     def rule_count(self) -> int:
@@ -214,3 +304,28 @@ class InvariantChecker:
     def get_rule_ids(self) -> list[str]:
         """Return list of all rule IDs."""
         return [rule.get("id", "unknown") for rule in self.rules]
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _absolute(path_str: str, cwd: str) -> str:
+    """path_str made absolute against cwd (lexical only, so safe to memoize)."""
+    return os.path.join(cwd, path_str)
+
+
+def _resolves_outside(path_str: str, cwd: str) -> bool:
+    """True if path_str (relative to cwd) resolves outside cwd."""
+    try:
+        # Get real path of the target (never cached: symlinks may change)
+        target_path = os.path.realpath(_absolute(path_str, cwd))
+
+        # Project root = working directory (resolved, so symlinked roots compare equal)
+        root_path = os.path.realpath(cwd)
+
+    except (OSError, RuntimeError, ValueError):
+        # If we can't resolve the path, block it (fail-safe)
+        return True
+
+    # Check if target is under root (.. and symlinks are already resolved)
+    return target_path != root_path and not target_path.startswith(
+        root_path.rstrip(os.sep) + os.sep
+    )
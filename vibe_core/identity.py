@@ -496,6 +496,8 @@ class AgentRegistry:
 
     Design:
     - Simple dict-based storage (Level 1)
+    - Inverted capability index (capability → agent_ids), maintained on
+      register/unregister, so capability lookups don't scan every manifest
     - Can be persisted to disk (data/registry/)
     - Can be queried by agent_id or capability
     - Thread-safe for reads (single-threaded kernel OK for now)
@@ -516,6 +518,8 @@ class AgentRegistry:
             >>> registry = AgentRegistry()
         """
         self.manifests: dict[str, AgentManifest] = {}
+        # capability → agent_ids (dict as an insertion-ordered set: registration order)
+        self._by_capability: dict[str, dict[str, None]] = {}
         logger.debug("Initialized AgentRegistry")
 
     def register(self, manifest: AgentManifest) -> None:
@@ -539,8 +543,33 @@ class AgentRegistry:
             raise ValueError(f"Agent '{agent_id}' is already registered")
 
         self.manifests[agent_id] = manifest
+        for capability in manifest.capabilities:
+            self._by_capability.setdefault(capability, {})[agent_id] = None
         logger.info(f"Registered manifest for {agent_id}")
 
+    def unregister(self, agent_id: str) -> AgentManifest | None:
+        """
+        Remove an agent manifest.
+
+        Args:
+            agent_id: The agent's unique identifier
+
+        Returns:
+            The removed AgentManifest, or None if it was not registered
+        """
+        manifest = self.manifests.pop(agent_id, None)
+        if manifest is None:
+            return None
+
+        for capability in manifest.capabilities:
+            agent_ids = self._by_capability.get(capability)
+            if agent_ids is not None:
+                agent_ids.pop(agent_id, None)
+                if not agent_ids:
+                    del self._by_capability[capability]
+        logger.info(f"Unregistered manifest for {agent_id}")
+        return manifest
+
     def lookup(self, agent_id: str) -> AgentManifest | None:
         """
         Look up a manifest by agent ID.
@@ -572,9 +601,40 @@ class AgentRegistry:
             >>> agents = registry.find_by_capability("read_file")
             >>> print(f"Found {len(agents)} agents with read_file capability")
         """
-        return [
-            manifest for manifest in self.manifests.values() if capability in manifest.capabilities
-        ]
+        agent_ids = self._by_capability.get(capability, {})
+        return [self.manifests[agent_id] for agent_id in agent_ids]
+
+    def find_by_capabilities(
+        self, capabilities: list[str], match_all: bool = True
+    ) -> list[AgentManifest]:
+        """
+        Find agents by several capabilities at once.
+
+        Args:
+            capabilities: Capability names
+            match_all: True = agents having every capability,
+                       False = agents having any of them
+
+        Returns:
+            list[AgentManifest]: Matching manifests in registration order
+        """
+        id_sets = [self._by_capability.get(c, {}).keys() for c in capabilities]
+        if not id_sets:
+            return []
+        if match_all:
+            matched = set(min(id_sets, key=len)).intersection(*id_sets)
+        else:
+            matched = set().union(*id_sets)
+        return [m for agent_id, m in self.manifests.items() if agent_id in matched]
+
+    def list_capabilities(self) -> dict[str, int]:
+        """
+        Return every known capability with its agent count.
+
+        Returns:
+            dict: capability → number of registered agents providing it
+        """
+        return {capability: len(ids) for capability, ids in self._by_capability.items()}
 
     def list_all(self) -> list[AgentManifest]:
         """
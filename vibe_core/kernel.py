@@ -8,19 +8,45 @@ The Kernel is the central "System Object" - before this, vibe was
 just a collection of scripts. Now, VibeKernel IS the application.
 """
 
+from __future__ import annotations
+
 import logging
 import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from vibe_core.agent_protocol import AgentNotFoundError, VibeAgent
 from vibe_core.identity import AgentRegistry, generate_manifest_for_agent
 from vibe_core.ledger import VibeLedger
-from vibe_core.scheduling import Task, VibeScheduler
+from vibe_core.metrics import get_registry
+from vibe_core.playbook.router import AgentRouter, kernel_load_provider
+from vibe_core.scheduling import Task, TaskFuture, VibeScheduler
+from vibe_core.store.agenda_store import agenda_exists, get_agenda_store
+from vibe_core.tracing import span
+
+if TYPE_CHECKING:
+    from vibe_core.runtime.inbox_watcher import InboxWatcher
+    from vibe_core.store.retention import RetentionPolicy
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_registry()
+QUEUE_DEPTH = _metrics.gauge("vibe_kernel_queue_depth", "Tasks waiting in the scheduler queue")
+TASKS_TOTAL = _metrics.counter(
+    "vibe_kernel_tasks_total", "Tasks executed by the kernel", ("agent", "status")
+)
+TASK_SECONDS = _metrics.histogram(
+    "vibe_kernel_task_seconds", "Task execution time per agent", ("agent",)
+)
+
+# Seconds between housekeeping passes (retention, incremental vacuum) on idle ticks
+HOUSEKEEPING_INTERVAL = 300.0
+
 
 class KernelStatus(str, Enum):
     """Kernel operational states."""
@@ -31,6 +57,41 @@ class KernelStatus(str, Enum):
     HALTED = "HALTED"
 
 
+@dataclass
+class AgentLoad:
+    """Live load and latency of one agent, for routing tie-breaks."""
+
+    in_flight: int = 0
+    completed: int = 0
+    failed: int = 0
+    avg_latency_seconds: float = 0.0  # Exponential moving average
+
+    # Weight of the newest sample in avg_latency_seconds
+    LATENCY_ALPHA = 0.2
+
+    def record(self, seconds: float, success: bool) -> None:
+        if self.completed + self.failed == 0:
+            self.avg_latency_seconds = seconds
+        else:
+            self.avg_latency_seconds += self.LATENCY_ALPHA * (seconds - self.avg_latency_seconds)
+        if success:
+            self.completed += 1
+        else:
+            self.failed += 1
+
+    def routing_key(self) -> tuple[int, float]:
+        """Sort key: fewer in-flight tasks first, then lower latency."""
+        return (self.in_flight, self.avg_latency_seconds)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "avg_latency_seconds": self.avg_latency_seconds,
+        }
+
+
 class VibeKernel:
     """
     The central Kernel that orchestrates task execution.
@@ -56,13 +117,16 @@ class VibeKernel:
     - Persistent observability via ledger
     """
 
-    def __init__(self, ledger_path: str = "vibe_ledger.db"):
+    def __init__(
+        self, ledger_path: str = "vibe_ledger.db", retention: RetentionPolicy | None = None
+    ):
         """
         Initialize the kernel with scheduler, agent registry, and ledger.
 
         Args:
             ledger_path: Path to SQLite ledger database. Use ":memory:"
                          for in-memory database (useful for testing).
+            retention: Ledger retention policy (None = keep all history live)
 
         Example:
             >>> kernel = VibeKernel()  # Uses "vibe_ledger.db"
@@ -71,9 +135,21 @@ class VibeKernel:
         self.scheduler = VibeScheduler()
         self.agent_registry: dict[str, VibeAgent] = {}
         self.manifest_registry = AgentRegistry()  # STEWARD manifest registry (ARCH-026)
-        self.ledger = VibeLedger(ledger_path)
+        # Capability routing over registered agents, ties broken by live load (GAD-904)
+        self.agent_router = AgentRouter(load_provider=kernel_load_provider(self))
+        self.ledger = VibeLedger(ledger_path, retention=retention)
+        self.housekeeping_interval = HOUSEKEEPING_INTERVAL
+        # Ledger retention only runs when a policy asks for it
+        self._housekeeping: list[Callable[[], Any]] = (
+            [self.ledger.housekeep] if retention is not None else []
+        )
+        self._last_housekeeping = time.monotonic()
+        self._futures: dict[str, TaskFuture] = {}  # Unfinished submitted tasks
+        self._agent_load: dict[str, AgentLoad] = {}  # Live load/latency per agent (routing)
+        self._load_lock = threading.Lock()
         self.status = KernelStatus.STOPPED
         self.inbox_messages: list[dict[str, str]] = []  # GAD-006: Asynchronous Intent
+        self.inbox_watcher: InboxWatcher | None = None  # GAD-006: live inbox -> tasks
         self.agenda_tasks: list[str] = []  # ARCH-045: Agenda system (pending tasks)
         self.git_status: str | None = None  # ARCH-044: Git-Ops sync status
         logger.debug("KERNEL: Initialized (status=STOPPED)")
@@ -158,40 +234,21 @@ class VibeKernel:
         Empty backlog = no pending agenda items.
 
         The backlog is a file-based task queue that survives crashes
-        (Linux philosophy: files are the universal interface).
+        (Linux philosophy: files are the universal interface). Reads go through
+        the indexed AgendaStore, which re-imports the file only when it changed.
 
         Example:
             >>> kernel._scan_backlog()
             >>> if kernel.agenda_tasks:
             ...     print(f"Found {len(kernel.agenda_tasks)} pending tasks")
         """
-        backlog_path = Path("workspace/BACKLOG.md")
-
-        if not backlog_path.exists():
-            logger.debug("KERNEL: BACKLOG.md not found (no agenda)")
+        if not agenda_exists(Path(".")):
+            logger.debug("KERNEL: No BACKLOG.md or agenda store found (no agenda)")
             return
 
         try:
-            content = backlog_path.read_text(encoding="utf-8")
-
-            # Extract Outstanding Tasks section
-            outstanding_idx = content.find("## Outstanding Tasks")
-            completed_idx = content.find("## Completed Tasks")
-
-            if outstanding_idx == -1 or completed_idx == -1:
-                logger.warning("KERNEL: Invalid BACKLOG.md format")
-                return
-
-            section_content = content[outstanding_idx + len("## Outstanding Tasks") : completed_idx]
-
-            # Parse task lines (markdown checkboxes)
-            tasks = []
-            for line in section_content.split("\n"):
-                line = line.strip()
-                if line.startswith("- [ ]"):
-                    # Extract the task description
-                    task_desc = line.replace("- [ ]", "").strip()
-                    tasks.append(task_desc)
+            # Indexed agenda store (re-imports BACKLOG.md only if it changed)
+            tasks = [task.text for task in get_agenda_store(Path(".")).list_tasks("pending")]
 
             if tasks:
                 self.agenda_tasks = tasks
@@ -279,9 +336,73 @@ class VibeKernel:
             >>> kernel.shutdown()
             >>> print(kernel.status)  # KernelStatus.STOPPED
         """
+        if self.inbox_watcher is not None:
+            self.inbox_watcher.close()
+            self.inbox_watcher = None
         self.status = KernelStatus.STOPPED
         logger.info("KERNEL: SHUTDOWN")
 
+    def add_housekeeping(self, job: Callable[[], Any]) -> None:
+        """
+        Run a maintenance job on idle ticks (e.g. SQLiteStore.housekeep).
+
+        Jobs should do a bounded amount of work per call; they run at most
+        every housekeeping_interval seconds, only when the queue is empty.
+        """
+        self._housekeeping.append(job)
+
+    def housekeep(self) -> None:
+        """Run every housekeeping job now (failures are logged, not raised)."""
+        self._last_housekeeping = time.monotonic()
+        for job in self._housekeeping:
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"KERNEL: Housekeeping job {job!r} failed: {e}")
+
+    def start_inbox_watcher(
+        self,
+        agent_id: str,
+        inbox_dir: Path | str = "workspace/inbox",
+        db_path: Path | str | None = None,
+        poll_interval: float | None = None,
+    ) -> InboxWatcher:
+        """
+        Watch the inbox and submit new messages as tasks (GAD-006).
+
+        Unlike the boot-time scan (which only loads messages as operator
+        context), the watcher keeps running: every message dropped into the
+        inbox becomes a prioritized Task, and is moved to processed/ once that
+        task finished. Handling is journaled in SQLite, so each message is
+        handled exactly once across restarts.
+
+        Args:
+            agent_id: Agent for messages without an "agent:" header
+            inbox_dir: Directory producers write messages into
+            db_path: Journal SQLite file (default: <inbox_dir>/.inbox.db)
+            poll_interval: Seconds between rescans (default: inbox_watcher.POLL_INTERVAL)
+
+        Returns:
+            The running InboxWatcher (stopped by shutdown())
+
+        Example:
+            >>> kernel.boot()
+            >>> kernel.start_inbox_watcher("vibe-operator")
+            >>> # Messages now arrive in the scheduler; tick() processes them
+        """
+        if self.inbox_watcher is not None:
+            return self.inbox_watcher
+
+        # Imported on demand: vibe_core.runtime pulls in the prompt stack
+        from vibe_core.runtime.inbox_watcher import InboxWatcher
+
+        kwargs = {} if poll_interval is None else {"poll_interval": poll_interval}
+        self.inbox_watcher = InboxWatcher(
+            submit=self.submit, inbox_dir=inbox_dir, agent_id=agent_id, db_path=db_path, **kwargs
+        )
+        self.inbox_watcher.start()
+        return self.inbox_watcher
+
     def register_agent(self, agent: VibeAgent) -> None:
         """
         Register an agent with the kernel for task dispatch.
@@ -314,8 +435,32 @@ class VibeKernel:
             )
 
         self.agent_registry[agent_id] = agent
+        self.agent_router.register(agent)
         logger.info(f"KERNEL: Registered agent '{agent_id}'")
 
+    def unregister_agent(self, agent_id: str) -> VibeAgent | None:
+        """
+        Remove an agent and its STEWARD manifest.
+
+        Queued tasks for the agent stay in the scheduler and fail with
+        AgentNotFoundError when dispatched.
+
+        Args:
+            agent_id: The agent to remove
+
+        Returns:
+            The removed agent, or None if it was not registered
+        """
+        agent = self.agent_registry.pop(agent_id, None)
+        if agent is None:
+            return None
+        self.manifest_registry.unregister(agent_id)
+        self.agent_router.unregister(agent)
+        with self._load_lock:
+            self._agent_load.pop(agent_id, None)
+        logger.info(f"KERNEL: Unregistered agent '{agent_id}'")
+        return agent
+
     def _validate_delegation(self, agent_id: str) -> None:
         """
         Validate a delegation request using STEWARD manifest (ARCH-026 Phase 4).
@@ -364,13 +509,17 @@ class VibeKernel:
 
         logger.debug(f"KERNEL: Delegation validation passed for {agent_id}")
 
-    def submit(self, task: Task) -> str:
+    def submit(self, task: Task) -> TaskFuture:
         """
         Submit a task to the kernel's scheduler (ARCH-026 Phase 4).
 
         This is a convenience proxy to scheduler.submit_task().
         Before queueing, it validates the agent using STEWARD manifest.
 
+        The returned TaskFuture is resolved in memory as soon as the task
+        finishes. It is also the task ID (str subclass), so it can be passed
+        to get_task_result() and friends as before.
+
         Validation checks (Phase 4):
         1. Agent is registered
         2. Agent has an active manifest
@@ -380,7 +529,7 @@ class VibeKernel:
             task: The Task to be queued
 
         Returns:
-            str: The task ID for tracking
+            TaskFuture: Handle on the task (its string value is the task ID)
 
         Raises:
             ValueError: If agent is not registered or manifest invalid
@@ -388,14 +537,41 @@ class VibeKernel:
         Example:
             >>> kernel = VibeKernel()
             >>> task = Task(agent_id="agent-1", payload={"action": "compile"})
-            >>> task_id = kernel.submit(task)
+            >>> future = kernel.submit(task)
+            >>> response = future.result(timeout=30)
         """
-        # ARCH-026 Phase 4: Validate delegation using manifest
-        self._validate_delegation(task.agent_id)
+        with span("kernel.submit", trace_id=task.id, task_id=task.id, agent_id=task.agent_id):
+            # ARCH-026 Phase 4: Validate delegation using manifest
+            self._validate_delegation(task.agent_id)
+
+            future = TaskFuture(task.id, runner=self._run_pending)
+            self._futures[task.id] = future
+            self.scheduler.submit_task(task)
+            self._update_queue_depth()
+        logger.debug(f"KERNEL: Task {task.id} submitted to {task.agent_id}")
+        return future
 
-        task_id = self.scheduler.submit_task(task)
-        logger.debug(f"KERNEL: Task {task_id} submitted to {task.agent_id}")
-        return task_id
+    def _run_pending(self, task_id: str) -> bool:
+        """
+        Execute one queued task out of order, for a caller waiting on it.
+
+        Returns:
+            bool: True if the task was still queued and has now run. Its outcome
+                  (result or exception) is delivered through its TaskFuture.
+        """
+        if self.status != KernelStatus.RUNNING:
+            return False
+
+        task = self.scheduler.take_task(task_id)
+        if task is None:
+            return False
+        self._update_queue_depth()
+
+        try:
+            self._execute_task(task)
+        except Exception:
+            pass  # Already recorded to the ledger and set on the future
+        return True
 
     def tick(self) -> bool:
         """
@@ -421,6 +597,7 @@ class VibeKernel:
             - This method should be called repeatedly in a loop
             - Non-blocking: returns immediately if no work available
             - Thread-safe with respect to scheduler operations
+            - Idle ticks run housekeeping at most every housekeeping_interval seconds
         """
         if self.status != KernelStatus.RUNNING:
             logger.warning(f"KERNEL: tick() called but status is {self.status}")
@@ -429,11 +606,15 @@ class VibeKernel:
         task = self.scheduler.next_task()
 
         if task is None:
-            # Idle state - no work to do
+            # Idle state - no work to do, so do maintenance now and then
+            if time.monotonic() - self._last_housekeeping >= self.housekeeping_interval:
+                self.housekeep()
             return False
+        self._update_queue_depth()
 
-        # Execute the task
-        self._execute_task(task)
+        # Execute the task (the task ID is the trace ID)
+        with span("kernel.tick", trace_id=task.id, task_id=task.id):
+            self._execute_task(task)
         return True
 
     def _execute_task(self, task: Task) -> Any:
@@ -459,6 +640,24 @@ class VibeKernel:
             - All executions (success/failure) are recorded to the ledger
             - Ledger recording failures are logged but don't stop execution
         """
+        started = time.perf_counter()
+        status = "FAILED"
+        try:
+            with span(
+                "kernel.execute_task", trace_id=task.id, task_id=task.id, agent_id=task.agent_id
+            ):
+                result = self._dispatch(task)
+            status = "COMPLETED"
+            return result
+        finally:
+            TASK_SECONDS.labels(task.agent_id).observe(time.perf_counter() - started)
+            TASKS_TOTAL.labels(task.agent_id, status).inc()
+
+    def _update_queue_depth(self) -> None:
+        QUEUE_DEPTH.set(self.scheduler.get_queue_status()["pending_tasks"])
+
+    def _dispatch(self, task: Task) -> Any:
+        """Run the task on its agent and record the outcome (see _execute_task)."""
         agent_id = task.agent_id
 
         # Look up the agent in the registry
@@ -469,7 +668,9 @@ class VibeKernel:
             logger.error(f"KERNEL: {error_msg} (task={task.id})")
             # Record the failure before raising
             self.ledger.record_failure(task, error_msg)
-            raise AgentNotFoundError(agent_id=agent_id, task_id=task.id)
+            error = AgentNotFoundError(agent_id=agent_id, task_id=task.id)
+            self._resolve(task.id, error=error)
+            raise error
 
         agent = self.agent_registry[agent_id]
 
@@ -482,9 +683,16 @@ class VibeKernel:
             f"(payload={task.payload})"
         )
 
+        with self._load_lock:
+            load = self._agent_load.setdefault(agent_id, AgentLoad())
+            load.in_flight += 1
+        started = time.monotonic()
+        success = False
+
         try:
             # Execute the task
             result = agent.process(task)
+            success = True
 
             # Convert AgentResponse to dict for ledger storage if needed
             from vibe_core.agent_protocol import AgentResponse
@@ -496,6 +704,7 @@ class VibeKernel:
 
             logger.debug(f"KERNEL: Task {task.id} completed (result={result})")
 
+            self._resolve(task.id, result=result)
             return result
 
         except Exception as e:
@@ -504,10 +713,28 @@ class VibeKernel:
             self.ledger.record_failure(task, error_msg)
 
             logger.error(f"KERNEL: Task {task.id} failed: {error_msg}")
+            self._resolve(task.id, error=e)
 
             # Re-raise the exception so caller can handle it
             raise
 
+        finally:
+            with self._load_lock:
+                load.in_flight -= 1
+                load.record(time.monotonic() - started, success)
+
+    def _resolve(
+        self, task_id: str, result: Any = None, error: BaseException | None = None
+    ) -> None:
+        """Complete the task's future (no-op for tasks queued without submit())."""
+        future = self._futures.pop(task_id, None)
+        if future is None:
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
     def get_status(self) -> dict:
         """
         Get the current kernel status and metrics.
@@ -580,13 +807,29 @@ class VibeKernel:
             >>> print(f"Found {len(planning_agents)} planning agents")
 
         Notes:
-            - Searches manifest capabilities
+            - Indexed lookup (inverted capability index, no manifest scan)
             - Returns empty list if no matches found
             - Useful for intelligent task routing
         """
         manifests = self.manifest_registry.find_by_capability(capability)
         return [manifest.to_dict() for manifest in manifests]
 
+    def get_agent_load(self, agent_id: str) -> AgentLoad:
+        """
+        Live load of an agent: in-flight tasks and average latency.
+
+        Used by AgentRouter to break ties between equally capable agents.
+
+        Args:
+            agent_id: The agent to query
+
+        Returns:
+            AgentLoad snapshot (all zeros for agents that never ran a task)
+        """
+        with self._load_lock:
+            load = self._agent_load.get(agent_id)
+            return AgentLoad(**load.to_dict()) if load else AgentLoad()
+
     def get_task_result(self, task_id: str) -> dict | None:
         """
         Retrieve the result of a completed task from the ledger (ARCH-026 Phase 4).
@@ -617,9 +860,10 @@ class VibeKernel:
         Notes:
             - Works with in-memory or on-disk ledger
             - Returns deserialized JSON (input_payload and output_result)
+            - Falls back to archived history (see RetentionPolicy)
             - Returns None if task_id not found
         """
-        record = self.ledger.get_task(task_id)
+        record = self.ledger.get_task(task_id, include_archived=True)
         if record is None:
             logger.warning(f"KERNEL: Task {task_id} not found in ledger")
             return None
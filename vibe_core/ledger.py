@@ -14,7 +14,14 @@ import sqlite3
 from datetime import datetime
 from typing import Any
 
+from vibe_core.metrics import connect_metered
 from vibe_core.scheduling import Task
+from vibe_core.store.retention import (
+    LEDGER_TABLES,
+    Archiver,
+    RetentionPolicy,
+    enable_incremental_vacuum,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +42,7 @@ class VibeLedger:
     - Structured data (JSON serialization for complex payloads)
     - Failure-safe (recording errors never crashes kernel)
     - Queryable (SQL interface for analysis)
+    - Bounded (with a RetentionPolicy, old rows roll into a JSONL.gz archive)
 
     Schema:
         task_history table:
@@ -47,13 +55,15 @@ class VibeLedger:
         - timestamp: Execution timestamp (TEXT, ISO format)
     """
 
-    def __init__(self, db_path: str = "vibe_ledger.db"):
+    def __init__(self, db_path: str = "vibe_ledger.db", retention: RetentionPolicy | None = None):
         """
         Initialize the ledger with SQLite database.
 
         Args:
             db_path: Path to SQLite database file. Use ":memory:"
                      for in-memory database (testing).
+            retention: Keep this many days hot and archive the rest
+                       (None = keep everything in the live table)
 
         Example:
             >>> ledger = VibeLedger("vibe_ledger.db")
@@ -62,7 +72,7 @@ class VibeLedger:
         """
         self.db_path = db_path
         try:
-            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+            self.conn = connect_metered(db_path, "ledger", check_same_thread=False)
             # Test connection integrity
             self.conn.execute("SELECT 1")
             logger.info(f"LEDGER: Initialized (db_path={db_path})")
@@ -72,11 +82,13 @@ class VibeLedger:
                 f"Falling back to IN-MEMORY (transient) ledger to ensure system survival."
             )
             self.db_path = ":memory:"
-            self.conn = sqlite3.connect(":memory:", check_same_thread=False)
+            self.conn = connect_metered(":memory:", "ledger", check_same_thread=False)
             logger.info("LEDGER: Initialized (db_path=:memory: [FALLBACK])")
 
         self.conn.row_factory = sqlite3.Row  # Enable dict-like access
+        enable_incremental_vacuum(self.conn)  # Before the schema (new databases)
         self._initialize_schema()
+        self.archiver = Archiver(self.conn, self.db_path, LEDGER_TABLES, retention)
 
     def _initialize_schema(self) -> None:
         """Create task_history table if it doesn't exist."""
@@ -94,6 +106,10 @@ class VibeLedger:
             )
         """
         )
+        # History queries and retention rollover both scan by time
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS idx_task_history_timestamp ON task_history(timestamp)"
+        )
         self.conn.commit()
         logger.debug("LEDGER: Schema initialized")
 
@@ -217,7 +233,11 @@ class VibeLedger:
             logger.error(f"LEDGER: Failed to record failure for task {task.id}: {e}")
 
     def get_history(
-        self, limit: int = 10, status: str | None = None, agent_id: str | None = None
+        self,
+        limit: int = 10,
+        status: str | None = None,
+        agent_id: str | None = None,
+        include_archived: bool = False,
     ) -> list[dict[str, Any]]:
         """
         Retrieve recent task execution history.
@@ -226,6 +246,7 @@ class VibeLedger:
             limit: Maximum number of records to return (default: 10)
             status: Filter by status (COMPLETED, FAILED, STARTED), or None for all
             agent_id: Filter by agent_id, or None for all agents
+            include_archived: Fill up to limit from archived partitions
 
         Returns:
             List of task history records as dictionaries
@@ -262,23 +283,24 @@ class VibeLedger:
             rows = cursor.fetchall()
 
             # Convert to list of dicts
-            history = []
-            for row in rows:
-                record = dict(row)
-                # Deserialize JSON fields
-                if record["input_payload"]:
-                    try:
-                        record["input_payload"] = json.loads(record["input_payload"])
-                    except json.JSONDecodeError:
-                        pass  # Keep as string if invalid JSON
-
-                if record["output_result"]:
-                    try:
-                        record["output_result"] = json.loads(record["output_result"])
-                    except json.JSONDecodeError:
-                        pass  # Keep as string if invalid JSON
-
-                history.append(record)
+            history = [self._decode_record(dict(row)) for row in rows]
+
+            # Archived rows are older than every live row, so they come last
+            if include_archived and len(history) < limit:
+                archived = self.archiver.iter_archived(
+                    "task_history",
+                    where=lambda r: (
+                        (not status or r["status"] == status)
+                        and (not agent_id or r["agent_id"] == agent_id)
+                    ),
+                    newest_first=True,
+                )
+                live_ids = {record["task_id"] for record in history}
+                for record in archived:
+                    if record["task_id"] not in live_ids:
+                        history.append(self._decode_record(record))
+                        if len(history) >= limit:
+                            break
 
             return history
 
@@ -286,12 +308,13 @@ class VibeLedger:
             logger.error(f"LEDGER: Failed to retrieve history: {e}")
             return []
 
-    def get_task(self, task_id: str) -> dict[str, Any] | None:
+    def get_task(self, task_id: str, include_archived: bool = False) -> dict[str, Any] | None:
         """
         Retrieve a specific task record by ID.
 
         Args:
             task_id: The task ID to look up
+            include_archived: Also search archived partitions (scans them)
 
         Returns:
             Task record as dictionary, or None if not found
@@ -307,21 +330,13 @@ class VibeLedger:
             row = cursor.fetchone()
 
             if row:
-                record = dict(row)
-                # Deserialize JSON fields
-                if record["input_payload"]:
-                    try:
-                        record["input_payload"] = json.loads(record["input_payload"])
-                    except json.JSONDecodeError:
-                        pass
-
-                if record["output_result"]:
-                    try:
-                        record["output_result"] = json.loads(record["output_result"])
-                    except json.JSONDecodeError:
-                        pass
+                return self._decode_record(dict(row))
 
-                return record
+            if include_archived:
+                for record in self.archiver.iter_archived(
+                    "task_history", where=lambda r: r["task_id"] == task_id
+                ):
+                    return self._decode_record(record)
 
             return None
 
@@ -329,6 +344,39 @@ class VibeLedger:
             logger.error(f"LEDGER: Failed to retrieve task {task_id}: {e}")
             return None
 
+    @staticmethod
+    def _decode_record(record: dict[str, Any]) -> dict[str, Any]:
+        """Deserialize the JSON fields of a task_history row (live or archived)."""
+        for field in ("input_payload", "output_result"):
+            if record[field]:
+                try:
+                    record[field] = json.loads(record[field])
+                except json.JSONDecodeError:
+                    pass  # Keep as string if invalid JSON
+        return record
+
+    def housekeep(self) -> dict[str, Any]:
+        """
+        Run one bounded retention pass (kernel idle ticks call this).
+
+        Rolls task_history rows older than the retention window into the
+        archive, then releases free pages with incremental vacuum.
+
+        Returns:
+            Summary from Archiver.housekeep() (empty if the pass failed)
+
+        Notes:
+            - Failures are logged but don't raise exceptions
+        """
+        try:
+            summary = self.archiver.housekeep()
+            if summary["archived"]:
+                logger.info(f"LEDGER: Archived {summary['archived']}")
+            return summary
+        except Exception as e:
+            logger.error(f"LEDGER: Housekeeping failed: {e}")
+            return {}
+
     def get_statistics(self) -> dict[str, Any]:
         """
         Get aggregate statistics about task execution.
@@ -378,6 +426,113 @@ class VibeLedger:
                 "agents": [],
             }
 
+    def _ensure_safety_violations_table(self) -> None:
+        """Create safety_violations table on first use (ToolSafetyGuard spill log)."""
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS safety_violations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                session_start TEXT,
+                rule TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                tool_name TEXT NOT NULL,
+                message TEXT NOT NULL,
+                args TEXT,
+                timestamp TEXT NOT NULL
+            )
+        """
+        )
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_safety_violations_session "
+            "ON safety_violations(session_start, id)"
+        )
+
+    def record_safety_violation(
+        self,
+        rule: str,
+        severity: str,
+        tool_name: str,
+        message: str,
+        args: dict[str, Any] | None = None,
+        timestamp: str | None = None,
+        session_start: str | None = None,
+    ) -> None:
+        """
+        Record a ToolSafetyGuard violation.
+
+        Args:
+            rule: Safety rule (e.g., "ANTI_BLINDNESS")
+            severity: blocking, warning or info
+            tool_name: Tool whose call violated the rule
+            message: Human-readable explanation
+            args: Tool arguments (serialized as JSON, non-JSON values as str)
+            timestamp: When it happened (default: now)
+            session_start: Guard session the violation belongs to
+
+        Notes:
+            - Recording failures are logged but don't raise exceptions
+        """
+        try:
+            self._ensure_safety_violations_table()
+            self.conn.execute(
+                """
+                INSERT INTO safety_violations
+                (session_start, rule, severity, tool_name, message, args, timestamp)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    session_start,
+                    rule,
+                    severity,
+                    tool_name,
+                    message,
+                    json.dumps(args, default=str) if args is not None else None,
+                    timestamp or datetime.utcnow().isoformat() + "Z",
+                ),
+            )
+            self.conn.commit()
+            logger.debug(f"LEDGER: Recorded safety violation {rule} ({tool_name})")
+        except Exception as e:
+            logger.error(f"LEDGER: Failed to record safety violation {rule}: {e}")
+
+    def get_safety_violations(
+        self, limit: int = 10, session_start: str | None = None
+    ) -> list[dict[str, Any]]:
+        """
+        Retrieve recent safety violations, newest first.
+
+        Args:
+            limit: Maximum number of records to return
+            session_start: Only violations of this guard session
+
+        Returns:
+            List of violation records (args deserialized)
+        """
+        try:
+            self._ensure_safety_violations_table()
+            query = "SELECT * FROM safety_violations"
+            params: list[Any] = []
+            if session_start:
+                query += " WHERE session_start = ?"
+                params.append(session_start)
+            query += " ORDER BY id DESC LIMIT ?"
+            params.append(limit)
+
+            records = []
+            for row in self.conn.execute(query, params).fetchall():
+                record = dict(row)
+                if record["args"]:
+                    try:
+                        record["args"] = json.loads(record["args"])
+                    except json.JSONDecodeError:
+                        pass  # Keep as string if invalid JSON
+                records.append(record)
+            return records
+
+        except Exception as e:
+            logger.error(f"LEDGER: Failed to retrieve safety violations: {e}")
+            return []
+
     def record_decision(self, **kwargs) -> None:
         """
         Record a specialist decision (COMPATIBILITY STUB for legacy Specialists).
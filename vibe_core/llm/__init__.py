@@ -5,11 +5,29 @@ This module provides the LLM abstraction layer that enables agents
 to perform cognitive work via language models.
 """
 
-from vibe_core.llm.chain import ChainProvider
-from vibe_core.llm.human_provider import HumanProvider
-from vibe_core.llm.provider import LLMError, LLMProvider
-from vibe_core.llm.smart_local_provider import SmartLocalProvider
-from vibe_core.llm.steward_provider import StewardProvider
+from typing import TYPE_CHECKING
+
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vibe_core.llm.chain import ChainProvider
+    from vibe_core.llm.human_provider import HumanProvider
+    from vibe_core.llm.provider import LLMError, LLMProvider
+    from vibe_core.llm.smart_local_provider import SmartLocalProvider
+    from vibe_core.llm.steward_provider import StewardProvider
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ChainProvider": "vibe_core.llm.chain",
+        "HumanProvider": "vibe_core.llm.human_provider",
+        "LLMError": "vibe_core.llm.provider",
+        "LLMProvider": "vibe_core.llm.provider",
+        "SmartLocalProvider": "vibe_core.llm.smart_local_provider",
+        "StewardProvider": "vibe_core.llm.steward_provider",
+    },
+)
 
 __all__ = [
     "ChainProvider",
@@ -0,0 +1,415 @@
+"""
+Metrics registry for vibe-agency OS.
+
+Counters, gauges and fixed-bucket histograms with Prometheus text
+exposition. Metrics are declared once at module level (get-or-create by
+name) and recorded through label children, so a hot path costs a dict
+lookup and a short uncontended lock - cheap enough to stay on in
+production. Kernel (queue depth, task latency per agent), providers
+(latency, tokens, cost, errors), tools, governance blocks and SQLite
+(query latency) record into the process-wide registry.
+
+The kernel runs in the CLI process, so MetricsFileExporter writes the
+exposition to metrics.prom next to the ledger; `vibe metrics` and the
+monitor's /metrics route serve that snapshot.
+
+Example:
+    >>> from vibe_core.metrics import get_registry
+    >>> TOOL_CALLS = get_registry().counter(
+    ...     "vibe_tool_calls_total", "Tool calls", ("tool", "outcome")
+    ... )
+    >>> TOOL_CALLS.labels("read_file", "success").inc()
+    >>> print(get_registry().render())
+"""
+
+import logging
+import math
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds (sub-millisecond SQLite up to slow LLM calls)
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.005,
+    0.01,
+    0.05,
+    0.1,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Seconds between snapshots written by MetricsFileExporter
+EXPORT_INTERVAL = 15.0
+
+# Content type of the Prometheus text format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class _CounterValue:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        with self._lock:
+            self.value += amount
+
+
+class _GaugeValue:
+    __slots__ = ("_lock", "value")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = float(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.inc(-amount)
+
+
+class _HistogramValue:
+    __slots__ = ("_bounds", "_lock", "count", "counts", "sum")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self._lock = threading.Lock()
+        self.counts = [0] * (len(bounds) + 1)  # Per bucket, last one is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+            self.count += 1
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the with-block in seconds."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+
+class _Metric(ABC):
+    """A named metric family; one value per combination of label values."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: object):
+        """The value for one label combination (keep it for hot paths)."""
+        key = tuple(str(v) for v in values)
+        child = self._values.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {len(key)} value(s)"
+                )
+            with self._lock:
+                child = self._values.setdefault(key, self._new_value())
+        return child
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    @abstractmethod
+    def _new_value(self):
+        """A fresh value for a new label combination."""
+
+    @abstractmethod
+    def _samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        """(sample name, labels, value) for the exposition format."""
+
+    def _items(self) -> list[tuple[dict[str, str], object]]:
+        with self._lock:
+            items = list(self._values.items())
+        return [(dict(zip(self.labelnames, key, strict=True)), value) for key, value in items]
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def _new_value(self) -> _CounterValue:
+        return _CounterValue()
+
+    def _samples(self):
+        for labels, value in self._items():
+            yield self.name, labels, value.value
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.labels().dec(amount)
+
+    def _new_value(self) -> _GaugeValue:
+        return _GaugeValue()
+
+    def _samples(self):
+        for labels, value in self._items():
+            yield self.name, labels, value.value
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def observe(self, value: float) -> None:
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+    def _new_value(self) -> _HistogramValue:
+        return _HistogramValue(self.buckets)
+
+    def _samples(self):
+        for labels, value in self._items():
+            with value._lock:
+                counts, total, count = list(value.counts), value.sum, value.count
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += bucket_count
+                yield f"{self.name}_bucket", {**labels, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, count
+
+
+class MetricsRegistry:
+    """Process-wide set of metrics, rendered as Prometheus text."""
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def get(self, name: str) -> _Metric | None:
+        return self._metrics.get(name)
+
+    def clear(self) -> None:
+        """Reset every recorded value (metric declarations are kept)."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        """Prometheus text exposition (format 0.0.4) of every metric with values."""
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            samples = list(metric._samples())
+            if not samples:
+                continue
+            lines.append(f"# HELP {metric.name} {_escape(metric.documentation, quote=False)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _get_or_create(self, cls, name, documentation, labelnames, **kwargs):
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif type(metric) is not cls or metric.labelnames != tuple(labelnames):
+                raise ValueError(f"Metric {name} already registered as a different type or labels")
+            return metric
+
+
+class MeteredConnection(sqlite3.Connection):
+    """
+    sqlite3 connection that records statement latency per store and verb.
+
+    Open it with connect_metered(), which sets `store` (e.g. "ledger").
+    """
+
+    store = "sqlite"
+
+    def execute(self, sql: str, parameters=(), /):
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            _observe_query(self.store, sql, time.perf_counter() - started)
+
+    def executemany(self, sql: str, parameters, /):
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, parameters)
+        finally:
+            _observe_query(self.store, sql, time.perf_counter() - started)
+
+
+def connect_metered(database: str, store: str, **kwargs) -> MeteredConnection:
+    """sqlite3.connect() returning a MeteredConnection labelled with store."""
+    conn = sqlite3.connect(database, factory=MeteredConnection, **kwargs)
+    conn.store = store
+    return conn
+
+
+class MetricsFileExporter:
+    """
+    Writes the registry's exposition to a file, periodically and on stop().
+
+    The file is replaced atomically, so readers never see a partial
+    snapshot.
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        registry: MetricsRegistry | None = None,
+        interval: float = EXPORT_INTERVAL,
+    ):
+        self.path = Path(path)
+        self.registry = registry or get_registry()
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def write(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+        header = f"# vibe metrics snapshot pid={os.getpid()} at {datetime.utcnow().isoformat()}Z\n"
+        tmp_path.write_text(header + self.registry.render(), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="metrics-export", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background writer and write a final snapshot."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval)
+            self._thread = None
+        self._write_logged()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._write_logged()
+
+    def _write_logged(self) -> None:
+        try:
+            self.write()
+        except OSError as e:
+            logger.warning(f"METRICS: Failed to write {self.path}: {e}")
+
+
+def _observe_query(store: str, sql: str, seconds: float) -> None:
+    verb = sql.lstrip()[:8].split(None, 1)[0].upper() if sql.strip() else "OTHER"
+    if verb not in _SQL_VERBS:
+        verb = "OTHER"
+    SQLITE_QUERY_SECONDS.labels(store, verb).observe(seconds)
+
+
+def _escape(text: str, quote: bool = True) -> str:
+    text = text.replace("\\", "\\\\").replace("\n", "\\n")
+    return text.replace('"', '\\"') if quote else text
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+_registry = MetricsRegistry()
+
+# Statement verbs used as the "verb" label (anything else is OTHER)
+_SQL_VERBS = {"SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "CREATE", "PRAGMA"}
+
+SQLITE_QUERY_SECONDS = _registry.histogram(
+    "vibe_sqlite_query_seconds", "SQLite statement execution time", ("store", "verb")
+)
+
+
+def get_registry() -> MetricsRegistry:
+    """The process-wide metrics registry."""
+    return _registry
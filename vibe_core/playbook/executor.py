@@ -18,11 +18,23 @@ Architecture:
   4. Generate execution plan
   5. Execute plan or dry-run it
 
+execute_parallel() runs the graph wave by wave: every node is dispatched to a
+bounded worker pool as soon as its predecessors finished, so independent
+branches overlap. With a checkpoint store attached, every node outcome is
+persisted and resume(run_id) skips nodes whose checkpoint is still valid.
+
 Version: 0.1 (Logic Foundation)
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -33,6 +45,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default worker pool size for execute_parallel()
+DEFAULT_MAX_WORKERS = 4
+
 
 class ExecutionStatus(Enum):
     """Status of workflow execution"""
@@ -102,7 +117,9 @@ class ExecutionResult:
     output: Any = None
     error: str | None = None
     cost_usd: float = 0.0
-    duration_seconds: float = 0.0
+    duration_seconds: float = 0.0  # Agent time
+    setup_seconds: float = 0.0  # Prompt/context preparation before dispatch
+    from_checkpoint: bool = False  # Reused from a previous run, not executed
 
 
 class AgentInterface:
@@ -147,6 +164,111 @@ class MockAgent(AgentInterface):
         )
 
 
+SYSTEM_CONTEXT_KEYS = ["system_time", "current_branch", "git_status"]
+
+
+class RunContext:
+    """
+    Per-run execution context, shared by all nodes of a run.
+
+    Resolves the expensive, run-invariant inputs of execute_step once instead
+    of per node: the live-fire setting, the system prompt context (git
+    subprocesses) and the knowledge retriever (module load + index).
+
+    Refresh points are explicit: call refresh() (e.g. after a node changed
+    the working tree), or set max_age_seconds to re-resolve the system
+    context once it gets older than that.
+    """
+
+    def __init__(self, max_age_seconds: float | None = None):
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+        started = time.monotonic()
+        self.live_fire_enabled = _resolve_live_fire()
+        self.setup_seconds = time.monotonic() - started  # Cumulative one-time setup cost
+        self._system_context: dict[str, Any] | None = None
+        self._system_resolved_at = 0.0
+        self._retriever: Any = None
+        self._retriever_loaded = False
+
+    def system_context(self) -> dict[str, Any]:
+        """System context for prompt interpolation (resolved once per run)."""
+        with self._lock:
+            stale = (
+                self.max_age_seconds is not None
+                and time.monotonic() - self._system_resolved_at > self.max_age_seconds
+            )
+            if self._system_context is None or stale:
+                started = time.monotonic()
+                try:
+                    from vibe_core.runtime.prompt_context import get_prompt_context
+
+                    self._system_context = get_prompt_context().resolve(SYSTEM_CONTEXT_KEYS)
+                    logger.debug(
+                        f"🔌 CONTEXT: Resolved {len(self._system_context)} system contexts"
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️  Failed to resolve system context: {e}")
+                    self._system_context = {}
+                self._system_resolved_at = time.monotonic()
+                self.setup_seconds += self._system_resolved_at - started
+            return self._system_context
+
+    def retriever(self) -> Any:
+        """KnowledgeRetriever for GAD-908 nodes (loaded once; None if unavailable)."""
+        with self._lock:
+            if not self._retriever_loaded:
+                started = time.monotonic()
+                try:
+                    self._retriever = _load_knowledge_retriever()
+                except Exception as e:
+                    logger.warning(
+                        f"⚠️  Knowledge retrieval failed: {e}. Continuing without knowledge context."
+                    )
+                    self._retriever = None
+                self._retriever_loaded = True
+                self.setup_seconds += time.monotonic() - started
+            return self._retriever
+
+    def refresh(self, config: bool = True, system: bool = True, retriever: bool = False) -> None:
+        """Explicit refresh point: drop cached inputs so they are resolved again."""
+        with self._lock:
+            if config:
+                self.live_fire_enabled = _resolve_live_fire()
+            if system:
+                self._system_context = None
+            if retriever:
+                self._retriever, self._retriever_loaded = None, False
+
+
+def _resolve_live_fire() -> bool:
+    """Live-fire flag from Phoenix config (VIBE_LIVE_FIRE env var as fallback)."""
+    try:
+        # Lazy import to avoid circular dependencies
+        from vibe_core.config import get_config
+
+        return get_config().safety.live_fire_enabled
+    except ImportError:
+        import os
+
+        return os.getenv("VIBE_LIVE_FIRE", "false").lower() == "true"
+
+
+def _load_knowledge_retriever() -> Any:
+    """Load KnowledgeRetriever from the knowledge base (GAD-908)."""
+    import importlib.util
+
+    retriever_path = Path(__file__).parent.parent.parent / "02_knowledge" / "retriever.py"
+
+    spec = importlib.util.spec_from_file_location("retriever", retriever_path)
+    retriever_module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(retriever_module)
+
+    # Initialize retriever with repo root
+    vibe_root = Path(__file__).parent.parent.parent.parent
+    return retriever_module.KnowledgeRetriever(vibe_root)
+
+
 class GraphExecutor:
     """
     Orchestrates workflow execution using graph-based dependencies.
@@ -161,7 +283,9 @@ class GraphExecutor:
         self.router = None  # AgentRouter (GAD-904) when connected
         self.quota = None  # OperationalQuota instance when safety layer active
         self.lens_prompt = None  # GAD-906/907: Semantic lens injection
+        self.checkpoint_store = None  # SQLiteStore for per-node checkpoints (resume)
         self.execution_history: list[ExecutionResult] = []
+        self._lock = threading.Lock()  # Guards history/quota bookkeeping across workers
 
     def set_agent(self, agent: AgentInterface) -> None:
         """Set the agent to use for execution"""
@@ -176,6 +300,10 @@ class GraphExecutor:
         """Attach OperationalQuota for pre-flight cost checks"""
         self.quota = quota_manager
 
+    def set_checkpoint_store(self, store) -> None:  # type: ignore
+        """Attach SQLiteStore for per-node checkpoints (enables resume)"""
+        self.checkpoint_store = store
+
     def set_lens(self, lens_prompt: str) -> None:
         """
         Set semantic lens for mindset injection (GAD-906/907).
@@ -215,12 +343,12 @@ class GraphExecutor:
             adjacency[edge.from_node].add(edge.to_node)
             in_degree[edge.to_node] += 1
 
-        # Kahn's algorithm for topological sort
-        queue = [node_id for node_id, degree in in_degree.items() if degree == 0]
+        # Kahn's algorithm for topological sort (deque: O(1) pops)
+        queue = deque(node_id for node_id, degree in in_degree.items() if degree == 0)
         execution_order = []
 
         while queue:
-            node = queue.pop(0)
+            node = queue.popleft()
             execution_order.append(node)
 
             for neighbor in adjacency[node]:
@@ -339,10 +467,61 @@ class GraphExecutor:
                 "dependencies": plan.dependencies.get(node_id, []),
             }
 
+        if plan.is_valid:
+            result["critical_path"] = self.critical_path(graph, plan)
+
         return result
 
+    def critical_path(
+        self, graph: WorkflowGraph, plan: ExecutionPlan | None = None
+    ) -> dict[str, Any]:
+        """
+        Longest dependency chain, weighted by node timeout_seconds.
+
+        With wave-parallel execution the wall time is bounded by this path,
+        not by the sum over all nodes.
+
+        Returns:
+            dict with 'nodes' (ordered), 'wall_time_seconds' (critical path)
+            and 'serial_time_seconds' (sum over all nodes)
+        """
+        plan = plan or self._topological_sort(graph)
+        best: dict[str, float] = {}
+        prev: dict[str, str | None] = {}
+
+        for node_id in plan.execution_order:
+            base, via = 0.0, None
+            for dep in plan.dependencies.get(node_id, []):
+                if best[dep] > base:
+                    base, via = best[dep], dep
+            best[node_id] = base + graph.nodes[node_id].timeout_seconds
+            prev[node_id] = via
+
+        if not best:
+            return {"nodes": [], "wall_time_seconds": 0.0, "serial_time_seconds": 0.0}
+
+        end = max(best, key=best.get)
+        path = []
+        node: str | None = end
+        while node is not None:
+            path.append(node)
+            node = prev[node]
+        path.reverse()
+
+        return {
+            "nodes": path,
+            "wall_time_seconds": best[end],
+            "serial_time_seconds": float(sum(n.timeout_seconds for n in graph.nodes.values())),
+        }
+
     def execute_step(
-        self, graph: WorkflowGraph, node_id: str, context: str | None = None
+        self,
+        graph: WorkflowGraph,
+        node_id: str,
+        context: str | None = None,
+        check_quota: bool = True,
+        run_context: RunContext | None = None,
+        record: bool = True,
     ) -> ExecutionResult:
         """Execute a single workflow node using routed agent.
 
@@ -356,20 +535,17 @@ class GraphExecutor:
             graph: The workflow graph
             node_id: The node to execute
             context: Optional context/prompt to pass to the agent
+            check_quota: Run the quota pre-flight check (execute_parallel checks
+                         before dispatch and passes False)
+            run_context: Shared per-run context (see prepare_run()). Without one,
+                         config and system context are resolved for this call only.
+            record: Append the result to execution_history and charge the quota
+                    (execute_parallel records on the scheduler thread and passes
+                    False, so results of abandoned nodes are dropped)
         """
-        # Lazy import to avoid circular dependencies
-        live_fire_enabled = False  # Default: safe mode
-
-        try:
-            from vibe_core.config import get_config
-
-            config = get_config()
-            live_fire_enabled = config.safety.live_fire_enabled
-        except ImportError:
-            # Fallback: Use environment variable if Phoenix config unavailable
-            import os
-
-            live_fire_enabled = os.getenv("VIBE_LIVE_FIRE", "false").lower() == "true"
+        setup_started = time.monotonic()
+        run_context = run_context or RunContext()
+        live_fire_enabled = run_context.live_fire_enabled
 
         node = graph.nodes[node_id]
 
@@ -378,7 +554,6 @@ class GraphExecutor:
         if node.prompt_key:
             try:
                 # Import runtime modules with proper package paths
-                from vibe_core.runtime.prompt_context import get_prompt_context
                 from vibe_core.runtime.prompt_registry import PromptRegistry
 
                 # Build context dict for prompt interpolation
@@ -387,17 +562,8 @@ class GraphExecutor:
                     prompt_context["context"] = context
 
                 # GAD-909: Resolve dynamic context (The Flesh / OPERATION CONTEXT)
-                # Load standard system context for prompt placeholders
-                try:
-                    context_engine = get_prompt_context()
-                    system_context = context_engine.resolve(
-                        ["system_time", "current_branch", "git_status"]
-                    )
-                    # Merge system context into prompt context
-                    prompt_context.update(system_context)
-                    logger.debug(f"🔌 CONTEXT: Resolved {len(system_context)} system contexts")
-                except Exception as e:
-                    logger.warning(f"⚠️  Failed to resolve system context: {e}")
+                # Standard system context for prompt placeholders (resolved once per run)
+                prompt_context.update(run_context.system_context())
 
                 # Get prompt from registry (with context interpolation)
                 base_prompt = PromptRegistry.get(node.prompt_key, prompt_context)
@@ -416,25 +582,9 @@ class GraphExecutor:
 
         # GAD-908: Knowledge Context Injection (OPERATION INSIGHT)
         # Check if this node needs knowledge context
-        if node.knowledge_context:
+        retriever = run_context.retriever() if node.knowledge_context else None
+        if retriever is not None:
             try:
-                # Import with proper path handling
-                import importlib.util
-
-                retriever_path = (
-                    Path(__file__).parent.parent.parent / "02_knowledge" / "retriever.py"
-                )
-
-                spec = importlib.util.spec_from_file_location("retriever", retriever_path)
-                retriever_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(retriever_module)
-
-                KnowledgeRetriever = retriever_module.KnowledgeRetriever
-
-                # Initialize retriever with repo root
-                vibe_root = Path(__file__).parent.parent.parent.parent
-                retriever = KnowledgeRetriever(vibe_root)
-
                 # Extract query from context (use first 100 chars as search query)
                 query = context[:100] if context else node.action
                 logger.info(f"👁️ INSIGHT: Retrieving knowledge for query: '{query[:50]}...'")
@@ -495,24 +645,17 @@ class GraphExecutor:
             prompt = base_prompt
 
         # Quota pre-flight check
-        if self.quota:
-            try:
-                self.quota.check_before_request(estimated_tokens=50, operation=node.action)
-            except Exception as e:  # QuotaExceededError
-                return ExecutionResult(
-                    workflow_id=graph.id,
-                    node_id=node_id,
-                    status=ExecutionStatus.FAILED,
-                    output=None,
-                    error=str(e),
-                )
+        if check_quota:
+            rejected = self._check_quota(graph, node)
+            if rejected is not None:
+                return rejected
 
         # Select agent
-        selected_agent = None
-        if self.router:
-            selected_agent = self.router.find_best_agent_for_skills(node.required_skills)
-        if selected_agent is None and hasattr(self, "agent"):
-            selected_agent = self.agent  # Fallback
+        selected_agent = self._select_agent(node)
+
+        # Setup overhead (prompt/context preparation) is reported apart from agent time
+        agent_started = time.monotonic()
+        setup_seconds = agent_started - setup_started
 
         # EXECUTION MODE: Real vs Mock
         if live_fire_enabled:
@@ -572,14 +715,55 @@ class GraphExecutor:
             )
             cost_usd = 0.0
 
-        self.execution_history.append(result)
+        result.setup_seconds = setup_seconds
+        if not result.duration_seconds:
+            result.duration_seconds = time.monotonic() - agent_started
 
-        # Record quota usage
-        if self.quota:
-            self.quota.record_request(tokens_used=50, cost_usd=cost_usd, operation=node.action)
+        if record:
+            self._record(node, result, cost_usd)
 
         return result
 
+    def _record(self, node: WorkflowNode, result: ExecutionResult, cost_usd: float) -> None:
+        """Append an executed node to the history and charge its usage to the quota."""
+        with self._lock:
+            self.execution_history.append(result)
+
+            # Record quota usage
+            if self.quota:
+                self.quota.record_request(tokens_used=50, cost_usd=cost_usd, operation=node.action)
+
+    def prepare_run(self, max_age_seconds: float | None = None) -> RunContext:
+        """
+        Create the shared context for one workflow run.
+
+        Pass it to every execute_step() call of the run so config, system
+        context and the knowledge retriever are resolved once.
+
+        Example:
+            >>> run = executor.prepare_run()
+            >>> for node_id in plan.execution_order:
+            ...     executor.execute_step(graph, node_id, run_context=run)
+        """
+        return RunContext(max_age_seconds=max_age_seconds)
+
+    def _check_quota(self, graph: WorkflowGraph, node: WorkflowNode) -> ExecutionResult | None:
+        """Quota pre-flight check. Returns a FAILED result if the node must not run."""
+        if not self.quota:
+            return None
+        try:
+            with self._lock:
+                self.quota.check_before_request(estimated_tokens=50, operation=node.action)
+        except Exception as e:  # QuotaExceededError
+            return ExecutionResult(
+                workflow_id=graph.id,
+                node_id=node.id,
+                status=ExecutionStatus.FAILED,
+                output=None,
+                error=str(e),
+            )
+        return None
+
     def execute(self, graph: WorkflowGraph) -> dict[str, Any]:
         """
         Execute the workflow (uses agent interface).
@@ -627,6 +811,287 @@ class GraphExecutor:
             ],
         }
 
+    def execute_parallel(
+        self,
+        graph: WorkflowGraph,
+        context: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        run_id: str | None = None,
+        run_context: RunContext | None = None,
+    ) -> dict[str, Any]:
+        """
+        Execute the workflow with wave-parallel scheduling.
+
+        Each node is dispatched (via execute_step) as soon as all of its
+        predecessors finished, on a pool of at most max_workers threads.
+
+        - Edge conditions: a "success" edge from a node that did not succeed
+          skips the dependent node; "always" edges only wait for completion
+        - Timeouts: a node running longer than its timeout_seconds (counted from
+          the moment a worker picks it up) is marked FAILED and its dependents
+          are released. The abandoned worker keeps its pool slot until it
+          returns, and its late result is neither recorded nor charged to quota
+        - Quota: checked before every dispatch; once exceeded, nothing else is
+          dispatched and the remaining nodes are SKIPPED
+        - Checkpoints: with a checkpoint store attached, each executed node is
+          checkpointed under run_id. Re-running an existing run_id reuses
+          successful checkpoints whose key (node definition + context +
+          upstream outputs) is unchanged
+
+        Args:
+            graph: The workflow graph
+            context: Optional context passed to every node
+            max_workers: Worker pool size
+            run_id: Run to checkpoint into / resume (new ID if omitted)
+            run_context: Shared per-run setup (one is prepared if omitted)
+
+        Returns:
+            dict with run_id, status, completion order, per-node results,
+            wall time, cost and setup overhead
+        """
+        is_valid, validation_msg = self.validate_workflow(graph)
+        if not is_valid:
+            return {
+                "workflow_id": graph.id,
+                "status": "failed",
+                "error": validation_msg,
+            }
+
+        plan = self._topological_sort(graph)
+        incoming: dict[str, list[WorkflowEdge]] = {node_id: [] for node_id in graph.nodes}
+        successors: dict[str, list[str]] = {node_id: [] for node_id in graph.nodes}
+        for edge in graph.edges:
+            incoming[edge.to_node].append(edge)
+            successors[edge.from_node].append(edge.to_node)
+
+        waiting = {node_id: len(edges) for node_id, edges in incoming.items()}
+        ready = deque(node_id for node_id in plan.execution_order if waiting[node_id] == 0)
+        running: dict[Future, str] = {}  # future -> node_id
+        started_at: dict[str, float] = {}  # node_id -> monotonic time a worker picked it up
+        abandoned: set[Future] = set()  # timed-out workers still holding a pool slot
+        results: dict[str, ExecutionResult] = {}
+        quota_stop: str | None = None
+
+        run_id = run_id or uuid.uuid4().hex
+        run_context = run_context or self.prepare_run()
+        checkpoints = self.checkpoint_store.get_checkpoints(run_id) if self.checkpoint_store else {}
+        keys: dict[str, str] = {}  # node_id -> checkpoint key
+        output_digests: dict[str, str] = {}  # node_id -> hash of its JSON output
+
+        def finish(node_id: str, result: ExecutionResult) -> None:
+            results[node_id] = result
+            output_json = _encode_output(result.output)
+            output_digests[node_id] = hashlib.sha256(output_json.encode()).hexdigest()
+            if self.checkpoint_store and node_id in keys and not result.from_checkpoint:
+                self.checkpoint_store.save_checkpoint(
+                    run_id=run_id,
+                    workflow_id=graph.id,
+                    node_id=node_id,
+                    checkpoint_key=keys[node_id],
+                    status=result.status.value,
+                    input_data={"context": context, "upstream": upstream_of(node_id)},
+                    output_json=output_json,
+                    error=result.error,
+                    cost_usd=result.cost_usd,
+                    duration_seconds=result.duration_seconds,
+                )
+            for successor in successors[node_id]:
+                waiting[successor] -= 1
+                if waiting[successor] == 0:
+                    ready.append(successor)
+
+        def upstream_of(node_id: str) -> dict[str, str]:
+            return {edge.from_node: output_digests[edge.from_node] for edge in incoming[node_id]}
+
+        def not_run(node_id: str, status: ExecutionStatus, error: str) -> None:
+            result = ExecutionResult(
+                workflow_id=graph.id, node_id=node_id, status=status, error=error
+            )
+            with self._lock:
+                self.execution_history.append(result)
+            finish(node_id, result)
+
+        def run_node(node_id: str) -> ExecutionResult:
+            started_at[node_id] = time.monotonic()
+            return self.execute_step(graph, node_id, context, False, run_context, record=False)
+
+        started = time.monotonic()
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="graph-exec")
+        try:
+            while ready or running:
+                # Dispatch everything that is ready, up to the free pool slots
+                while ready and len(running) + len(abandoned) < max_workers:
+                    node_id = ready.popleft()
+                    node = graph.nodes[node_id]
+
+                    blocked_by = [
+                        edge.from_node
+                        for edge in incoming[node_id]
+                        if edge.condition != "always"
+                        and results[edge.from_node].status != ExecutionStatus.SUCCESS
+                    ]
+                    if blocked_by:
+                        not_run(node_id, ExecutionStatus.SKIPPED, f"Upstream failed: {blocked_by}")
+                        continue
+                    if quota_stop:
+                        not_run(node_id, ExecutionStatus.SKIPPED, quota_stop)
+                        continue
+
+                    keys[node_id] = self._checkpoint_key(
+                        node, context, upstream_of(node_id), run_context.live_fire_enabled
+                    )
+                    checkpoint = checkpoints.get(node_id)
+                    if (
+                        checkpoint
+                        and checkpoint["checkpoint_key"] == keys[node_id]
+                        and checkpoint["status"] == ExecutionStatus.SUCCESS.value
+                    ):
+                        logger.info(f"♻️ Node {node_id} restored from checkpoint (run {run_id})")
+                        finish(node_id, self._restore(graph, checkpoint))
+                        continue
+
+                    rejected = self._check_quota(graph, node)
+                    if rejected is not None:
+                        quota_stop = f"Quota exceeded: {rejected.error}"
+                        logger.warning(f"⛔ {quota_stop} (no further nodes dispatched)")
+                        with self._lock:
+                            self.execution_history.append(rejected)
+                        finish(node_id, rejected)
+                        continue
+
+                    running[pool.submit(run_node, node_id)] = node_id
+
+                if not running and not (ready and abandoned):
+                    continue
+
+                # A node's deadline runs from when a worker picked it up; one that
+                # has not started yet cannot expire before now + its timeout
+                now = time.monotonic()
+                deadlines = [
+                    started_at.get(node_id, now) + graph.nodes[node_id].timeout_seconds
+                    for node_id in running.values()
+                ]
+                done, _ = wait(
+                    [*running, *abandoned],
+                    timeout=max(min(deadlines) - now, 0.0) if deadlines else None,
+                    return_when=FIRST_COMPLETED,
+                )
+                abandoned -= done
+                for future in done & running.keys():
+                    node_id = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        not_run(node_id, ExecutionStatus.FAILED, f"{type(e).__name__}: {e}")
+                        continue
+                    self._record(graph.nodes[node_id], result, result.cost_usd)
+                    finish(node_id, result)
+
+                now = time.monotonic()
+                for future, node_id in list(running.items()):
+                    timeout = graph.nodes[node_id].timeout_seconds
+                    if node_id in started_at and started_at[node_id] + timeout <= now:
+                        del running[future]
+                        abandoned.add(future)
+                        logger.warning(f"⏱️ Node {node_id} timed out after {timeout}s")
+                        not_run(node_id, ExecutionStatus.FAILED, f"Timed out after {timeout}s")
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        wall_time = time.monotonic() - started
+        all_succeeded = all(r.status == ExecutionStatus.SUCCESS for r in results.values())
+
+        return {
+            "workflow_id": graph.id,
+            "run_id": run_id,
+            "status": "success" if all_succeeded else "failed",
+            "execution_order": list(results),
+            "wall_time_seconds": wall_time,
+            "total_cost_usd": sum(r.cost_usd for r in results.values()),
+            "run_setup_seconds": run_context.setup_seconds,
+            "node_setup_seconds": sum(r.setup_seconds for r in results.values()),
+            "restored_nodes": [n for n, r in results.items() if r.from_checkpoint],
+            "results": [
+                {
+                    "node_id": r.node_id,
+                    "status": r.status.value,
+                    "output": r.output,
+                    "error": r.error,
+                    "duration_seconds": r.duration_seconds,
+                    "setup_seconds": r.setup_seconds,
+                    "from_checkpoint": r.from_checkpoint,
+                }
+                for r in results.values()
+            ],
+        }
+
+    def resume(
+        self,
+        graph: WorkflowGraph,
+        run_id: str,
+        context: str | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> dict[str, Any]:
+        """
+        Resume a checkpointed run (e.g. after a crash or quota stop).
+
+        Nodes whose checkpoint is still valid are restored without executing
+        (or paying for) them again; everything else runs as usual.
+
+        Raises:
+            RuntimeError: If no checkpoint store is attached
+        """
+        if self.checkpoint_store is None:
+            raise RuntimeError("resume() requires a checkpoint store (set_checkpoint_store)")
+        return self.execute_parallel(graph, context, max_workers=max_workers, run_id=run_id)
+
+    def _select_agent(self, node: WorkflowNode) -> AgentInterface | None:
+        """Agent that executes a node: the router's pick, else the default agent."""
+        selected_agent = None
+        if self.router:
+            selected_agent = self.router.find_best_agent_for_skills(node.required_skills)
+        if selected_agent is None and hasattr(self, "agent"):
+            selected_agent = self.agent  # Fallback
+        return selected_agent
+
+    def _checkpoint_key(
+        self,
+        node: WorkflowNode,
+        context: str | None,
+        upstream: dict[str, str],
+        live_fire_enabled: bool,
+    ) -> str:
+        """Content hash of everything that determines a node's output."""
+        agent = self._select_agent(node)
+        material = json.dumps(
+            {
+                "node": asdict(node),
+                "context": context,
+                "lens": self.lens_prompt,
+                "upstream": upstream,
+                # Mock outputs must never be restored as results of a live run
+                "live_fire": live_fire_enabled,
+                "agent": getattr(agent, "name", type(agent).__name__),
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(material.encode()).hexdigest()
+
+    def _restore(self, graph: WorkflowGraph, checkpoint: dict[str, Any]) -> ExecutionResult:
+        result = ExecutionResult(
+            workflow_id=graph.id,
+            node_id=checkpoint["node_id"],
+            status=ExecutionStatus.SUCCESS,
+            output=json.loads(checkpoint["output"]) if checkpoint["output"] else None,
+            cost_usd=0.0,
+            duration_seconds=0.0,
+            from_checkpoint=True,
+        )
+        with self._lock:
+            self.execution_history.append(result)
+        return result
+
     def get_execution_history(self) -> list[ExecutionResult]:
         """Get execution history"""
         return self.execution_history
@@ -636,6 +1101,11 @@ class GraphExecutor:
         return graph.estimated_cost_usd
 
 
+def _encode_output(output: Any) -> str:
+    """Canonical JSON for node outputs (checkpoint storage and hashing)."""
+    return json.dumps(output, sort_keys=True, default=str)
+
+
 if __name__ == "__main__":
     # Example usage (no import needed - just test the executor)
 
@@ -11,19 +11,29 @@ Status: INITIAL IMPLEMENTATION (mocked dispatch, $0 cost)
 
 Responsibilities:
 1. Maintain registry of active agent instances
-2. Match required skills -> best agent (max overlap, ties resolved by first registered)
+2. Match required skills -> best agent (max weighted overlap; ties resolved by
+   live load when a load provider is attached, then by first registered)
 3. Provide simple APIs:
-   - register(agent)
+   - register(agent) / unregister(agent)
    - find_best_agent(action: SemanticAction)
-   - find_best_agent_for_skills(skills: list[str])
+   - find_best_agent_for_skills(skills: list[str], weights=None)
 4. Safe fallback: return None if no agent can fully satisfy required skills
 
+Performance:
+- Inverted capability index: skill -> bitset of agent slots, maintained on
+  register/unregister. Scoring only touches agents that have at least one
+  of the required skills.
+- Routing decisions are cached per (skill-set, weights). The cache holds the
+  tied top candidates; the live-load tie-break is applied on every call, so
+  cached decisions never go stale on load. Register/unregister clears it.
+
 NOTE: No real LLM calls yet. Execution is mocked per instructions.
 """
 
 from __future__ import annotations
 
-from typing import Protocol
+from collections.abc import Callable, Mapping
+from typing import Any, Protocol
 
 
 class HasRequiredSkills(Protocol):
@@ -31,45 +41,116 @@ class HasRequiredSkills(Protocol):
     # name and intent are optional for scoring
 
 
+# Maps an agent to a sortable load key (lower = less loaded), e.g.
+# kernel_load_provider(kernel) - VibeKernel.agent_router has it attached
+LoadProvider = Callable[[object], Any]
+
+
 class AgentRouter:
     """Agent capability matching and selection."""
 
-    def __init__(self, agents: list[object] | None = None):
-        self._agents: list[object] = agents or []
+    def __init__(
+        self, agents: list[object] | None = None, load_provider: LoadProvider | None = None
+    ):
+        self._agents: list[object] = []
+        self._index: dict[str, int] = {}  # skill -> bitset of agent slots
+        self._cache: dict[tuple, tuple[int, ...]] = {}  # routing key -> tied top slots
+        self.load_provider = load_provider
+        for agent in agents or []:
+            self.register(agent)
 
     # Registry operations -------------------------------------------------
     def register(self, agent: object) -> None:
+        if agent in self._agents:
+            return
+        slot = len(self._agents)
+        self._agents.append(agent)
+        for skill in set(getattr(agent, "capabilities", []) or []):
+            self._index[skill] = self._index.get(skill, 0) | (1 << slot)
+        self._cache.clear()
+
+    def unregister(self, agent: object) -> bool:
+        """Remove an agent. Returns False if it was not registered."""
         if agent not in self._agents:
-            self._agents.append(agent)
+            return False
+        self._agents.remove(agent)
+        self.reindex()
+        return True
+
+    def reindex(self) -> None:
+        """Rebuild the capability index (call after agents change their capabilities)."""
+        agents, self._agents = self._agents, []
+        self._index.clear()
+        self._cache.clear()
+        for agent in agents:
+            self.register(agent)
+
+    def set_load_provider(self, load_provider: LoadProvider | None) -> None:
+        """Attach a live load source for tie-breaking (e.g. kernel_load_provider)."""
+        self.load_provider = load_provider
 
     def list_agents(self) -> list[object]:
         return list(self._agents)
 
-    # Matching logic ------------------------------------------------------
-    def _score(self, agent: object, required: list[str]) -> int:
-        capabilities = getattr(agent, "capabilities", []) or []
-        return sum(1 for skill in required if skill in capabilities)
+    def agents_with_skill(self, skill: str) -> list[object]:
+        """Agents declaring a skill, in registration order."""
+        return [self._agents[slot] for slot in _slots(self._index.get(skill, 0))]
 
-    def find_best_agent_for_skills(self, required_skills: list[str]) -> object | None:
-        if not self._agents:
-            return None
-        best = None
-        best_score = -1
-        for agent in self._agents:
-            score = self._score(agent, required_skills)
-            if score > best_score:
-                best = agent
-                best_score = score
+    # Matching logic ------------------------------------------------------
+    def _top_candidates(
+        self, required_skills: list[str], weights: Mapping[str, float] | None
+    ) -> tuple[int, ...]:
+        """Slots of the agents sharing the best (positive) weighted score."""
+        key = (
+            tuple(sorted(required_skills)),  # Duplicates kept: each one scores
+            frozenset(weights.items()) if weights else None,
+        )
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        scores: dict[int, float] = {}
+        for skill in key[0]:
+            weight = weights.get(skill, 1.0) if weights else 1.0
+            for slot in _slots(self._index.get(skill, 0)):
+                scores[slot] = scores.get(slot, 0.0) + weight
+
+        best_score = max(scores.values(), default=0.0)
         if best_score <= 0:  # No overlap at all
+            candidates: tuple[int, ...] = ()
+        else:
+            candidates = tuple(sorted(s for s, score in scores.items() if score == best_score))
+        self._cache[key] = candidates
+        return candidates
+
+    def find_best_agent_for_skills(
+        self, required_skills: list[str], weights: Mapping[str, float] | None = None
+    ) -> object | None:
+        """
+        Best agent for a set of skills.
+
+        Args:
+            required_skills: Skills the work needs
+            weights: Optional per-skill weights (default 1.0 each)
+
+        Returns:
+            Agent with the highest weighted overlap (ties: least loaded, then
+            first registered), or None if no agent has any of the skills
+        """
+        candidates = self._top_candidates(required_skills, weights)
+        if not candidates:
             return None
-        return best
+        if len(candidates) == 1 or self.load_provider is None:
+            return self._agents[candidates[0]]
+        slot = min(candidates, key=lambda s: (self.load_provider(self._agents[s]), s))
+        return self._agents[slot]
 
     def find_best_agent(self, action: HasRequiredSkills) -> object | None:
         return self.find_best_agent_for_skills(action.required_skills)
 
     # Convenience ---------------------------------------------------------
     def can_any_execute(self, required_skills: list[str]) -> bool:
-        return self.find_best_agent_for_skills(required_skills) is not None
+        return bool(self._top_candidates(required_skills, None))
 
     def get_capability_matrix(self) -> dict:
         matrix = {}
@@ -78,4 +159,27 @@ class AgentRouter:
         return matrix
 
 
-__all__ = ["AgentRouter"]
+def kernel_load_provider(kernel) -> LoadProvider:
+    """
+    Load provider backed by VibeKernel's live per-agent stats.
+
+    Agents are matched to kernel agents by agent_id (falling back to name);
+    agents unknown to the kernel count as idle.
+    """
+
+    def load(agent: object) -> Any:
+        agent_id = getattr(agent, "agent_id", None) or getattr(agent, "name", None)
+        return kernel.get_agent_load(agent_id).routing_key()
+
+    return load
+
+
+def _slots(bits: int):
+    """Yield the set bit positions of a bitset, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+__all__ = ["AgentRouter", "kernel_load_provider"]
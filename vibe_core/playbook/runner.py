@@ -20,11 +20,19 @@ Responsibilities:
 4. Execute through CoreOrchestrator
 5. Track execution and results
 
+With a checkpoint store attached (the same SQLiteStore workflow_checkpoints
+table GraphExecutor uses), every phase outcome is checkpointed under the
+run_id and resume(run_id) skips phases whose checkpoint is still valid.
+
 Version: 0.1 (Foundation)
 """
 
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
@@ -318,18 +326,24 @@ class PlaybookRunner:
     This is the main entry point for "cartridge slot" functionality.
     """
 
-    def __init__(self, orchestrator=None):
+    def __init__(self, orchestrator=None, checkpoint_store=None):
         """
         Initialize runner.
 
         Args:
             orchestrator: CoreOrchestrator instance (optional for lazy loading)
+            checkpoint_store: SQLiteStore for per-phase checkpoints (optional)
         """
         self.orchestrator = orchestrator
+        self.checkpoint_store = checkpoint_store
         self.registry = PlaybookRegistry()
         self.loader = PlaybookLoader()
         self.execution_history: list[dict[str, Any]] = []
 
+    def set_checkpoint_store(self, store) -> None:  # type: ignore
+        """Attach a store (SQLiteStore) for per-phase checkpoints and resume"""
+        self.checkpoint_store = store
+
     def load_registry(self) -> None:
         """Load all playbooks from registry"""
         self.registry.load_all()
@@ -377,14 +391,23 @@ class PlaybookRunner:
         return self.execute_playbook(playbook, project_context)
 
     def execute_playbook(
-        self, playbook: PlaybookDefinition, project_context: dict[str, Any] = None
+        self,
+        playbook: PlaybookDefinition,
+        project_context: dict[str, Any] = None,
+        run_id: str | None = None,
     ) -> dict[str, Any]:
         """
         Execute a playbook definition.
 
+        With a checkpoint store attached, each executed phase is checkpointed
+        under run_id. Re-running an existing run_id restores phases whose
+        checkpoint key (phase definition + project context + previous phase
+        output) is unchanged instead of executing them again.
+
         Args:
             playbook: PlaybookDefinition to execute
             project_context: Project context
+            run_id: Run to checkpoint into / resume (new ID if omitted)
 
         Returns:
             Execution results
@@ -403,11 +426,14 @@ class PlaybookRunner:
             except TypeError as e:
                 raise PlaybookExecutionError(f"Cannot initialize CoreOrchestrator: {e}")
 
+        run_id = run_id or uuid.uuid4().hex
         result = {
             "playbook_id": playbook.id,
             "playbook_name": playbook.name,
+            "run_id": run_id,
             "status": "running",
             "phases_executed": [],
+            "restored_phases": [],
             "errors": [],
         }
 
@@ -422,10 +448,40 @@ class PlaybookRunner:
                     "description": playbook.description,
                 }
 
+            checkpoints = (
+                self.checkpoint_store.get_checkpoints(run_id) if self.checkpoint_store else {}
+            )
+            upstream: str | None = None  # hash of the previous phase's output
+
             # Execute each phase
             for phase in playbook.phases:
-                phase_result = self._execute_phase(phase, playbook)
+                key = _phase_key(playbook, phase, project_context, upstream)
+                checkpoint = checkpoints.get(phase.name)
+                if (
+                    checkpoint
+                    and checkpoint["checkpoint_key"] == key
+                    and checkpoint["status"] == "success"
+                ):
+                    logger.info(f"♻️ Phase {phase.name} restored from checkpoint (run {run_id})")
+                    phase_result = json.loads(checkpoint["output"])
+                    result["restored_phases"].append(phase.name)
+                else:
+                    phase_started = time.monotonic()
+                    phase_result = self._execute_phase(phase, playbook)
+                    if self.checkpoint_store:
+                        self.checkpoint_store.save_checkpoint(
+                            run_id=run_id,
+                            workflow_id=playbook.id,
+                            node_id=phase.name,
+                            checkpoint_key=key,
+                            status=phase_result["status"],
+                            input_data={"project_context": project_context, "upstream": upstream},
+                            output_json=_encode(phase_result),
+                            error=phase_result.get("error"),
+                            duration_seconds=time.monotonic() - phase_started,
+                        )
                 result["phases_executed"].append(phase_result)
+                upstream = hashlib.sha256(_encode(phase_result).encode()).hexdigest()
 
                 if phase_result.get("status") == "failed":
                     result["status"] = "failed"
@@ -443,6 +499,22 @@ class PlaybookRunner:
         self.execution_history.append(result)
         return result
 
+    def resume(
+        self,
+        playbook: PlaybookDefinition,
+        run_id: str,
+        project_context: dict[str, Any] = None,
+    ) -> dict[str, Any]:
+        """
+        Resume a checkpointed playbook run (e.g. after a crash or failed phase).
+
+        Raises:
+            PlaybookError: If no checkpoint store is attached
+        """
+        if self.checkpoint_store is None:
+            raise PlaybookError("resume() requires a checkpoint store (set_checkpoint_store)")
+        return self.execute_playbook(playbook, project_context, run_id=run_id)
+
     def _execute_phase(self, phase: PlaybookPhase, playbook: PlaybookDefinition) -> dict[str, Any]:
         """
         Execute a single phase.
@@ -486,6 +558,31 @@ class PlaybookRunner:
         return self.execution_history
 
 
+def _phase_key(
+    playbook: PlaybookDefinition,
+    phase: PlaybookPhase,
+    project_context: dict[str, Any],
+    upstream: str | None,
+) -> str:
+    """Content hash of everything that determines a phase's outcome."""
+    material = {
+        "playbook": playbook.id,
+        "version": playbook.version,
+        "phase": asdict(phase),
+        "agents": [
+            asdict(playbook.agents[name]) for name in phase.agents if name in playbook.agents
+        ],
+        "project_context": project_context,
+        "upstream": upstream,
+    }
+    return hashlib.sha256(_encode(material).encode()).hexdigest()
+
+
+def _encode(data: Any) -> str:
+    """Canonical JSON (checkpoint storage and hashing)."""
+    return json.dumps(data, sort_keys=True, default=str)
+
+
 def run_playbook_cli(
     playbook_id_or_path: str, project_context: dict[str, Any] = None
 ) -> dict[str, Any]:
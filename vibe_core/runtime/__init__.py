@@ -11,9 +11,27 @@ Contains runtime components for the orchestrator:
 - prompt_context.py: Dynamic context engine for prompt injection (GAD-909)
 """
 
-from .llm_client import CostTracker, LLMClient, NoOpClient
-from .prompt_context import PromptContext, get_prompt_context
-from .prompt_registry import PromptRegistry
+from typing import TYPE_CHECKING
+
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .llm_client import CostTracker, LLMClient, NoOpClient
+    from .prompt_context import PromptContext, get_prompt_context
+    from .prompt_registry import PromptRegistry
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "CostTracker": ".llm_client",
+        "LLMClient": ".llm_client",
+        "NoOpClient": ".llm_client",
+        "PromptContext": ".prompt_context",
+        "get_prompt_context": ".prompt_context",
+        "PromptRegistry": ".prompt_registry",
+    },
+)
 
 __all__ = [
     "CostTracker",
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Pre-flight Token and Cost Forecasting (GAD-510.2)
+==================================================
+
+Forecasts what an LLM request will consume before it is sent, so the
+Operational Quota Manager checks real numbers instead of `max_tokens`
+priced at one fixed rate:
+
+  - Input tokens: local tokenizer approximation of the prompt
+  - Output tokens: max_tokens scaled by the ratio learned for the task
+  - Cost: per-model price table probed from the providers' calculate_cost
+
+After the call, reconcile() compares the forecast with actual usage and
+updates per-task correction factors (exponentially weighted), so repeated
+task types converge on what they really cost.
+
+Usage:
+    forecaster = CostForecaster(PriceTable([provider]))
+    forecast = forecaster.forecast(prompt, model="gemini-2.5-flash", max_tokens=4096)
+    ...
+    forecaster.reconcile(forecast, input_tokens=812, output_tokens=240)
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Fallback price (USD per million input/output tokens) when no provider is known:
+# Claude 3.5 Sonnet, the rate the quota manager used before forecasting
+DEFAULT_PRICE = (3.0, 15.0)
+
+# Weight of the newest observation in the per-task correction factors
+DEFAULT_SMOOTHING = 0.3
+
+# Bounds for the learned factors (one outlier must not zero out a forecast)
+INPUT_FACTOR_BOUNDS = (0.25, 4.0)
+OUTPUT_RATIO_BOUNDS = (0.01, 1.0)
+
+# Word pieces of the tokenizer approximation: ASCII letters, digits,
+# whitespace runs, anything else (punctuation, non-ASCII) one char at a time
+_PIECES = re.compile(r"[A-Za-z]+|[0-9]+|\s+|.", re.DOTALL)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Approximate the BPE token count of text without a tokenizer model.
+
+    Common words are one token, long words one more per 8 letters, digits
+    group by three, single spaces merge into the next word, and other
+    characters (punctuation, non-ASCII) count one each. Close to BPE
+    tokenizers on English prose and code; per-task input factors learned by
+    CostForecaster.reconcile() absorb the remaining model-specific skew.
+
+    Args:
+        text: Prompt text
+
+    Returns:
+        int: Estimated number of tokens
+    """
+    tokens = 0
+    for piece in _PIECES.findall(text):
+        first = piece[0]
+        if first.isascii() and first.isalpha():
+            tokens += 1 + len(piece) // 8
+        elif first.isdigit() and first.isascii():
+            tokens += (len(piece) + 2) // 3
+        elif first.isspace():
+            tokens += 0 if piece == " " else 1
+        else:
+            tokens += 1
+    return tokens
+
+
+class PriceTable:
+    """
+    Per-model prices in USD per million tokens, probed from providers.
+
+    Each provider's calculate_cost() is asked for the price of one million
+    input and one million output tokens for every model it lists. Unknown
+    models are priced by the first provider (which applies its own
+    fallback) and cached.
+    """
+
+    def __init__(self, providers: list[Any] | None = None, default: tuple = DEFAULT_PRICE):
+        self.default = default
+        self._prices: dict[str, tuple[float, float]] = {}
+        self._providers: list[Any] = []
+        for provider in providers or []:
+            self.add_provider(provider)
+
+    def add_provider(self, provider: Any) -> None:
+        """Add every model a provider lists (earlier providers win on conflicts)."""
+        self._providers.append(provider)
+        try:
+            models = list(provider.get_available_models())
+        except Exception as e:
+            logger.debug(f"PriceTable: {provider!r} does not list models: {e}")
+            return
+        for model in models:
+            if isinstance(model, str) and model not in self._prices:
+                self._prices[model] = self._probe(provider, model)
+
+    def price(self, model: str) -> tuple[float, float]:
+        """(input, output) USD per million tokens for a model."""
+        price = self._prices.get(model)
+        if price is None:
+            price = self._probe(self._providers[0], model) if self._providers else self.default
+            self._prices[model] = price
+        return price
+
+    def cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        input_price, output_price = self.price(model)
+        return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+    def _probe(self, provider: Any, model: str) -> tuple[float, float]:
+        try:
+            return (
+                float(provider.calculate_cost(1_000_000, 0, model)),
+                float(provider.calculate_cost(0, 1_000_000, model)),
+            )
+        except Exception as e:
+            logger.debug(f"PriceTable: Cannot price {model} via {provider!r}: {e}")
+            return self.default
+
+
+@dataclass(frozen=True)
+class CostForecast:
+    """Expected usage of one request, before it is sent."""
+
+    model: str
+    task: str
+    prompt_tokens: int  # Tokenizer approximation, before correction
+    input_tokens: int
+    output_tokens: int
+    max_tokens: int
+    cost_usd: float
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass
+class _TaskFactors:
+    input_factor: float = 1.0  # Actual input tokens / approximation
+    output_ratio: float = 1.0  # Actual output tokens / max_tokens (starts at worst case)
+    samples: int = 0
+
+
+class CostForecaster:
+    """
+    Forecasts tokens and cost per request and learns per-task corrections.
+
+    A task without history is forecast at max_tokens of output (as
+    conservative as the old estimate); reconcile() then moves its output
+    ratio and input factor toward what the task actually uses.
+    """
+
+    def __init__(self, prices: PriceTable | None = None, smoothing: float = DEFAULT_SMOOTHING):
+        self.prices = prices or PriceTable()
+        self.smoothing = smoothing
+        self._factors: dict[str, _TaskFactors] = {}
+        self._lock = threading.Lock()
+
+    def forecast(
+        self, prompt: str, model: str, max_tokens: int, task: str = "default"
+    ) -> CostForecast:
+        """
+        Forecast tokens and cost of one request.
+
+        Args:
+            prompt: Full prompt text
+            model: Model the request goes to (selects the price)
+            max_tokens: Output token limit of the request
+            task: Task class whose correction factors apply
+
+        Returns:
+            CostForecast
+        """
+        with self._lock:
+            factors = self._factors.get(task) or _TaskFactors()
+        prompt_tokens = estimate_tokens(prompt)
+        input_tokens = round(prompt_tokens * factors.input_factor)
+        output_tokens = min(max_tokens, round(max_tokens * factors.output_ratio))
+        return CostForecast(
+            model=model,
+            task=task,
+            prompt_tokens=prompt_tokens,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            max_tokens=max_tokens,
+            cost_usd=self.prices.cost(model, input_tokens, output_tokens),
+        )
+
+    def reconcile(self, forecast: CostForecast, input_tokens: int, output_tokens: int) -> None:
+        """
+        Learn from actual usage of a forecast request.
+
+        Args:
+            forecast: The forecast made before the request
+            input_tokens: Input tokens the provider reported
+            output_tokens: Output tokens the provider reported
+        """
+        alpha = self.smoothing
+        with self._lock:
+            factors = self._factors.setdefault(forecast.task, _TaskFactors())
+            if forecast.prompt_tokens > 0 and input_tokens > 0:
+                observed = _clamp(input_tokens / forecast.prompt_tokens, INPUT_FACTOR_BOUNDS)
+                factors.input_factor += alpha * (observed - factors.input_factor)
+            if forecast.max_tokens > 0:
+                observed = _clamp(output_tokens / forecast.max_tokens, OUTPUT_RATIO_BOUNDS)
+                factors.output_ratio += alpha * (observed - factors.output_ratio)
+            factors.samples += 1
+
+    def get_factors(self) -> dict[str, dict[str, float]]:
+        """Learned correction factors per task (for status output)."""
+        with self._lock:
+            return {
+                task: {
+                    "input_factor": round(f.input_factor, 3),
+                    "output_ratio": round(f.output_ratio, 3),
+                    "samples": f.samples,
+                }
+                for task, f in self._factors.items()
+            }
+
+
+def _clamp(value: float, bounds: tuple[float, float]) -> float:
+    return min(max(value, bounds[0]), bounds[1])
@@ -0,0 +1,451 @@
+"""
+Inbox Watcher - durable file inbox feeding the kernel scheduler (GAD-006)
+
+External producers drop Markdown messages into workspace/inbox/. While the
+kernel runs, the watcher turns each new message into a prioritized Task on
+the scheduler and acknowledges it once the task finished:
+
+- Watching: inotify (Linux, via libc) wakes the watcher when a file is
+  closed after writing or moved into the inbox; elsewhere the directory is
+  polled. Either way a periodic rescan backs up missed events.
+- Journal: every message gets a row (its offset, `seq`) in the SQLite
+  table `inbox_messages`, unique per (filename, content hash). A message
+  is queued at most once per process and handled once across restarts.
+- Acknowledgement: after the task completes, the row is marked done and
+  the file is moved to processed/ (failed tasks: failed/) with os.replace,
+  so it is atomic on the same filesystem. If the process dies between the
+  two steps, recovery finishes the move without re-running the task.
+
+Message format (front matter optional):
+
+    ---
+    priority: HIGH        # HIGH | MEDIUM | LOW or an integer
+    agent: vibe-operator  # target agent (default: the watcher's agent_id)
+    ---
+    Please summarize the open PRs.
+
+Producers should write to a dotfile (e.g. ".msg.md.tmp") and rename it
+into place; dotfiles and non-.md files are ignored.
+
+Usage:
+    watcher = kernel.start_inbox_watcher("vibe-operator")
+    ...
+    kernel.shutdown()  # stops the watcher
+"""
+
+import ctypes
+import ctypes.util
+import hashlib
+import logging
+import os
+import select
+import sqlite3
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from vibe_core.scheduling import Task, TaskFuture
+
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL = 1.0  # Seconds between rescans (fallback and safety net)
+
+PRIORITIES = {"HIGH": 2, "MEDIUM": 1, "LOW": 0}
+DEFAULT_PRIORITY = "HIGH"  # Inbox messages are high priority context (GAD-006)
+
+PROCESSED_DIR = "processed"
+FAILED_DIR = "failed"
+
+
+@dataclass
+class InboxMessage:
+    """One parsed inbox file."""
+
+    filename: str
+    body: str
+    content_hash: str
+    priority: int
+    agent_id: str | None = None
+
+
+def parse_message(path: Path) -> InboxMessage:
+    """
+    Read an inbox file and its optional front matter.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    raw = path.read_bytes()
+    text = raw.decode("utf-8", errors="replace")
+    headers: dict[str, str] = {}
+    body = text
+
+    lines = text.splitlines(keepends=True)
+    if lines and lines[0].strip() == "---":
+        for i, line in enumerate(lines[1:], 1):
+            if line.strip() == "---":
+                body = "".join(lines[i + 1 :])
+                break
+            key, sep, value = line.partition(":")
+            if sep:
+                headers[key.strip().lower()] = value.split("#", 1)[0].strip()
+        else:
+            headers = {}  # Unterminated front matter: treat everything as body
+
+    return InboxMessage(
+        filename=path.name,
+        body=body.strip(),
+        content_hash=hashlib.sha256(raw).hexdigest(),
+        priority=_parse_priority(headers.get("priority", DEFAULT_PRIORITY)),
+        agent_id=headers.get("agent") or None,
+    )
+
+
+def _parse_priority(value: str) -> int:
+    value = value.strip().upper()
+    if value in PRIORITIES:
+        return PRIORITIES[value]
+    try:
+        return int(value)
+    except ValueError:
+        return PRIORITIES[DEFAULT_PRIORITY]
+
+
+# ============================================================================
+# JOURNAL
+# ============================================================================
+
+
+class InboxJournal:
+    """SQLite record of every inbox message and its handling state."""
+
+    def __init__(self, db_path: Path | str):
+        """
+        Args:
+            db_path: SQLite file. Use ":memory:" for ephemeral testing.
+        """
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS inbox_messages (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    filename TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    agent_id TEXT NOT NULL,
+                    priority INTEGER NOT NULL,
+                    task_id TEXT,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    error_message TEXT,
+                    received_at TEXT NOT NULL,
+                    finished_at TEXT,
+                    UNIQUE (filename, content_hash),
+                    CHECK (status IN ('queued', 'done', 'failed'))
+                );
+                CREATE INDEX IF NOT EXISTS idx_inbox_status ON inbox_messages(status, seq);
+            """)
+            self.conn.commit()
+
+    def lookup(self, filename: str, content_hash: str) -> sqlite3.Row | None:
+        with self._lock:
+            return self.conn.execute(
+                "SELECT * FROM inbox_messages WHERE filename = ? AND content_hash = ?",
+                (filename, content_hash),
+            ).fetchone()
+
+    def enqueue(self, message: InboxMessage, agent_id: str, task_id: str) -> int:
+        """Record a message as queued (re-queues a row left over from a crash)."""
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO inbox_messages
+                    (filename, content_hash, agent_id, priority, task_id, status, received_at)
+                VALUES (?, ?, ?, ?, ?, 'queued', ?)
+                ON CONFLICT(filename, content_hash) DO UPDATE SET
+                    agent_id = excluded.agent_id,
+                    priority = excluded.priority,
+                    task_id = excluded.task_id
+                """,
+                (
+                    message.filename,
+                    message.content_hash,
+                    agent_id,
+                    message.priority,
+                    task_id,
+                    _now(),
+                ),
+            )
+            self.conn.commit()
+            return self.lookup(message.filename, message.content_hash)["seq"]
+
+    def finish(self, seq: int, status: str, error_message: str | None = None) -> None:
+        with self._lock:
+            self.conn.execute(
+                "UPDATE inbox_messages SET status = ?, error_message = ?, finished_at = ? "
+                "WHERE seq = ?",
+                (status, error_message, _now(), seq),
+            )
+            self.conn.commit()
+
+    def last_offset(self) -> int:
+        """Highest seq whose handling finished (done or failed)."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT MAX(seq) FROM inbox_messages WHERE status != 'queued'"
+            ).fetchone()
+            return row[0] or 0
+
+    def counts(self) -> dict[str, int]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT status, COUNT(*) AS count FROM inbox_messages GROUP BY status"
+            ).fetchall()
+            return {row["status"]: row["count"] for row in rows}
+
+
+# ============================================================================
+# CHANGE NOTIFICATION
+# ============================================================================
+
+
+class _Inotify:
+    """Minimal inotify wrapper: wakes up when files land in one directory."""
+
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+
+    def __init__(self, path: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        wd = libc.inotify_add_watch(fd, os.fsencode(path), self.IN_CLOSE_WRITE | self.IN_MOVED_TO)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, f"inotify_add_watch failed for {path}")
+        self.fd = fd
+
+    def wait(self, timeout: float) -> bool:
+        """Block until an event arrives or timeout passes. True on events."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return False
+        try:
+            while os.read(self.fd, 65536):  # Drain; any event means "rescan"
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+# ============================================================================
+# WATCHER
+# ============================================================================
+
+
+class InboxWatcher:
+    """Turns inbox files into scheduler tasks, exactly once."""
+
+    def __init__(
+        self,
+        submit: Callable[[Task], TaskFuture],
+        inbox_dir: Path | str,
+        agent_id: str,
+        db_path: Path | str | None = None,
+        poll_interval: float = POLL_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        """
+        Args:
+            submit: Queues a task and returns its future (e.g. kernel.submit)
+            inbox_dir: Directory producers write messages into
+            agent_id: Agent for messages without an "agent:" header
+            db_path: Journal SQLite file (default: <inbox_dir>/.inbox.db)
+            poll_interval: Seconds between rescans
+            use_inotify: Use inotify where available (False: always poll)
+        """
+        self.submit = submit
+        self.inbox_dir = Path(inbox_dir)
+        self.agent_id = agent_id
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+
+        self.inbox_dir.mkdir(parents=True, exist_ok=True)
+        self.journal = InboxJournal(db_path or self.inbox_dir / ".inbox.db")
+
+        # Serializes queueing and acknowledgement, so a scan never sees a
+        # message between "journal says done" and "file moved"
+        self._lock = threading.RLock()
+        self._in_flight: dict[int, str] = {}  # seq -> task_id (queued by this process)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.mode = "stopped"
+
+    # Lifecycle -----------------------------------------------------------
+    def start(self) -> None:
+        """Scan once, then watch the inbox from a daemon thread (idempotent)."""
+        if self._thread and self._thread.is_alive():
+            return
+        self.scan()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vibe-inbox", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_interval + 1)
+            self._thread = None
+        self.mode = "stopped"
+
+    def close(self) -> None:
+        self.stop()
+        self.journal.close()
+
+    def _run(self) -> None:
+        notifier = None
+        if self.use_inotify:
+            try:
+                notifier = _Inotify(self.inbox_dir)
+            except (OSError, AttributeError) as e:  # Not Linux, or no inotify
+                logger.debug(f"INBOX: inotify unavailable ({e}), polling")
+        self.mode = "inotify" if notifier else "polling"
+        logger.info(f"📨 INBOX: Watching {self.inbox_dir} ({self.mode})")
+
+        try:
+            while not self._stop.is_set():
+                if notifier:
+                    notifier.wait(self.poll_interval)
+                else:
+                    self._stop.wait(self.poll_interval)
+                if self._stop.is_set():
+                    break
+                try:
+                    self.scan()
+                except Exception as e:
+                    logger.error(f"INBOX: Scan failed: {e}", exc_info=True)
+        finally:
+            if notifier:
+                notifier.close()
+
+    # Scanning ------------------------------------------------------------
+    def scan(self) -> int:
+        """
+        Queue every message not handled yet.
+
+        Returns:
+            Number of tasks submitted
+        """
+        submitted = 0
+        for path in sorted(self.inbox_dir.glob("*.md")):
+            if path.name.startswith(".") or not path.is_file():
+                continue
+            try:
+                with self._lock:
+                    queued = self._handle(path)
+                if queued:
+                    submitted += 1
+            except FileNotFoundError:
+                continue  # Moved away while scanning
+            except Exception as e:
+                logger.error(f"INBOX: Failed to queue {path.name}: {e}", exc_info=True)
+        return submitted
+
+    def _handle(self, path: Path) -> bool:
+        message = parse_message(path)
+        row = self.journal.lookup(message.filename, message.content_hash)
+
+        if row is not None:
+            if row["status"] != "queued":
+                # Handled before a crash, file not moved yet: finish the move only
+                self._archive(path, row["seq"], row["status"])
+                return False
+            if row["seq"] in self._in_flight:
+                return False
+            # Queued by a previous process whose scheduler is gone: queue again
+
+        agent_id = message.agent_id or self.agent_id
+        task = Task(
+            agent_id=agent_id,
+            priority=message.priority,
+            payload={
+                "user_message": message.body,
+                "source": "inbox",
+                "inbox_file": message.filename,
+            },
+        )
+        seq = self.journal.enqueue(message, agent_id, task.id)
+        task.payload["inbox_offset"] = seq
+
+        self._in_flight[seq] = task.id
+        try:
+            future = self.submit(task)
+        except Exception as e:
+            self._in_flight.pop(seq, None)
+            self.journal.finish(seq, "failed", f"{type(e).__name__}: {e}")
+            self._archive(path, seq, "failed")
+            logger.error(f"INBOX: Rejected {message.filename}: {e}")
+            return False
+
+        future.add_done_callback(lambda f: self._acknowledge(f, seq, path))
+        logger.info(f"📨 INBOX: Queued {message.filename} -> task {task.id} (offset {seq})")
+        return True
+
+    def _acknowledge(self, future: TaskFuture, seq: int, path: Path) -> None:
+        error = future.exception(timeout=0)
+        status = "failed" if error is not None else "done"
+        message = f"{type(error).__name__}: {error}" if error is not None else None
+        with self._lock:
+            self.journal.finish(seq, status, message)  # Commit first, then move
+            self._archive(path, seq, status)
+            self._in_flight.pop(seq, None)
+
+    def _archive(self, path: Path, seq: int, status: str) -> None:
+        """Atomically move a handled message out of the inbox."""
+        target_dir = self.inbox_dir / (PROCESSED_DIR if status == "done" else FAILED_DIR)
+        target_dir.mkdir(exist_ok=True)
+        target = target_dir / path.name
+        if target.exists():
+            target = target_dir / f"{path.stem}.{seq}{path.suffix}"
+        try:
+            os.replace(path, target)
+        except FileNotFoundError:
+            pass  # Already moved
+
+    # Introspection -------------------------------------------------------
+    def get_status(self) -> dict[str, Any]:
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return {
+            "inbox_dir": str(self.inbox_dir),
+            "mode": self.mode,
+            "in_flight": in_flight,
+            "last_offset": self.journal.last_offset(),
+            "messages": self.journal.counts(),
+        }
+
+
+def _now() -> str:
+    return datetime.utcnow().isoformat() + "Z"
+
+
+__all__ = ["InboxJournal", "InboxMessage", "InboxWatcher", "parse_message"]
@@ -0,0 +1,233 @@
+"""Intent Index - compiled matcher for PlaybookEngine (Tier 1 routing)
+
+Compiles every route's intent_patterns from _registry.yaml once:
+
+- Exact hits: an Aho-Corasick automaton over all patterns finds every
+  pattern occurring in the input (on word boundaries) in one pass.
+- Fuzzy hits: a TF-IDF index over character n-grams scores near misses
+  ("shoping cart", "keep goin") by cosine similarity, via n-gram posting lists.
+  A route matches fuzzily if its best pattern clears the route's
+  `threshold` (or config.default_threshold).
+
+Both are local and dependency-free (no embeddings, $0 cost).
+
+Usage:
+    index = IntentIndex(registry["routes"], default_threshold=0.75)
+    for match in index.rank("can you show me progress"):
+        print(match.route["name"], match.kind, match.score)
+"""
+
+import math
+import re
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+NGRAM_SIZE = 3
+
+_PRIORITY_RANK = {"HIGH": 0, "MEDIUM": 1, "LOW": 2}
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    """Lowercase and collapse whitespace."""
+    return _WHITESPACE.sub(" ", text.lower()).strip()
+
+
+@dataclass
+class IntentMatch:
+    """One ranked route for an input."""
+
+    route: dict[str, Any]
+    score: float  # 0..1
+    kind: str  # 'exact' | 'fuzzy'
+    pattern: str  # Best matching intent pattern
+
+
+class AhoCorasick:
+    """Multi-pattern substring automaton (goto/fail/output over a char trie)."""
+
+    def __init__(self, patterns: list[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[int]] = [[]]
+        self._lengths = [len(p) for p in patterns]
+
+        for pattern_id, pattern in enumerate(patterns):
+            if not pattern:
+                continue
+            state = 0
+            for char in pattern:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][char] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(pattern_id)
+
+        # Breadth-first failure links; outputs inherit their fail state's outputs
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0  # Root's children fail to root
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find_all(self, text: str) -> list[tuple[int, int]]:
+        """All (pattern_id, start) occurrences in text, overlapping included."""
+        hits = []
+        state = 0
+        for i, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for pattern_id in self._out[state]:
+                hits.append((pattern_id, i - self._lengths[pattern_id] + 1))
+        return hits
+
+
+class IntentIndex:
+    """Ranked route matching over compiled intent patterns."""
+
+    def __init__(self, routes: list[dict[str, Any]], default_threshold: float = 0.75):
+        """
+        Args:
+            routes: Registry routes (name, intent_patterns, threshold, priority, ...)
+            default_threshold: Fuzzy similarity threshold for routes without one
+        """
+        self.routes = routes
+        self.default_threshold = default_threshold
+
+        # Flattened (route_idx, normalized pattern, original pattern)
+        self._patterns: list[tuple[int, str, str]] = [
+            (route_idx, normalize(pattern), pattern)
+            for route_idx, route in enumerate(routes)
+            for pattern in route.get("intent_patterns", []) or []
+            if normalize(pattern)
+        ]
+        self._automaton = AhoCorasick([p for _, p, _ in self._patterns])
+        self._build_vectors()
+
+    # ========================================================================
+    # TF-IDF CHARACTER N-GRAMS
+    # ========================================================================
+
+    def _build_vectors(self):
+        docs = [_ngrams(p) for _, p, _ in self._patterns]
+        df: dict[str, int] = {}
+        for grams in docs:
+            for gram in grams:
+                df[gram] = df.get(gram, 0) + 1
+
+        n = len(docs)
+        self._idf = {gram: math.log((1 + n) / (1 + count)) + 1 for gram, count in df.items()}
+        self._unseen_idf = math.log(1 + n) + 1  # n-grams no pattern has
+
+        self._postings: dict[str, list[tuple[int, float]]] = {}
+        for pattern_id, grams in enumerate(docs):
+            vector = {g: tf * self._idf[g] for g, tf in grams.items()}
+            norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+            for gram, weight in vector.items():
+                self._postings.setdefault(gram, []).append((pattern_id, weight / norm))
+
+    def _similarities(self, text: str) -> dict[int, float]:
+        """Cosine similarity of text against every pattern sharing an n-gram."""
+        grams = _ngrams(text)
+        vector = {g: tf * self._idf.get(g, self._unseen_idf) for g, tf in grams.items()}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+
+        scores: dict[int, float] = {}
+        for gram, weight in vector.items():
+            for pattern_id, pattern_weight in self._postings.get(gram, ()):
+                scores[pattern_id] = scores.get(pattern_id, 0.0) + weight / norm * pattern_weight
+        return scores
+
+    # ========================================================================
+    # RANKING
+    # ========================================================================
+
+    def rank(self, user_input: str, limit: int | None = None) -> list[IntentMatch]:
+        """
+        Rank routes for user input, best first.
+
+        Exact (word-bounded substring) hits rank above fuzzy ones. Exact
+        score is the share of the input covered by the route's matched
+        patterns, so the most specific route wins; fuzzy score is cosine
+        similarity.
+        Ties go to higher route priority, then registry order.
+
+        Args:
+            user_input: Raw user input
+            limit: Maximum number of routes
+
+        Returns:
+            Ranked IntentMatch list (empty for blank input or no match)
+        """
+        text = normalize(user_input)
+        if not text:
+            return []
+
+        best: dict[int, IntentMatch] = {}
+
+        hits: dict[int, set[int]] = {}  # route_idx -> distinct matched pattern ids
+        for pattern_id, start in self._automaton.find_all(text):
+            route_idx, pattern, _ = self._patterns[pattern_id]
+            if _on_word_boundaries(text, start, start + len(pattern)):
+                hits.setdefault(route_idx, set()).add(pattern_id)
+        for route_idx, pattern_ids in hits.items():
+            covered = sum(len(self._patterns[p][1]) for p in pattern_ids)
+            longest = max(pattern_ids, key=lambda p: (len(self._patterns[p][1]), -p))
+            best[route_idx] = IntentMatch(
+                self.routes[route_idx],
+                min(covered / len(text), 1.0),
+                "exact",
+                self._patterns[longest][2],
+            )
+
+        for pattern_id, score in self._similarities(text).items():
+            route_idx, _, original = self._patterns[pattern_id]
+            route = self.routes[route_idx]
+            if score < route.get("threshold", self.default_threshold):
+                continue
+            current = best.get(route_idx)
+            if current is None or (current.kind == "fuzzy" and score > current.score):
+                best[route_idx] = IntentMatch(route, min(score, 1.0), "fuzzy", original)
+
+        ranked = sorted(
+            best.items(),
+            key=lambda item: (
+                item[1].kind != "exact",
+                -item[1].score,
+                _PRIORITY_RANK.get(str(item[1].route.get("priority", "")).upper(), 3),
+                item[0],
+            ),
+        )
+        matches = [match for _, match in ranked]
+        return matches[:limit] if limit is not None else matches
+
+
+def _ngrams(text: str) -> dict[str, int]:
+    """Character n-gram counts of a normalized string (word-padded)."""
+    padded = f" {text} "
+    counts: dict[str, int] = {}
+    for i in range(max(len(padded) - NGRAM_SIZE + 1, 1)):
+        gram = padded[i : i + NGRAM_SIZE]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+
+def _on_word_boundaries(text: str, start: int, end: int) -> bool:
+    before = text[start - 1] if start > 0 else " "
+    after = text[end] if end < len(text) else " "
+    return not before.isalnum() and not after.isalnum()
+
+
+__all__ = ["AhoCorasick", "IntentIndex", "IntentMatch", "normalize"]
@@ -11,7 +11,8 @@ Features:
 - Retry logic with exponential backoff
 - Cost tracking (input/output tokens)
 - Circuit breaker (GAD-509)
-- Operational quotas (GAD-510)
+- Operational quotas (GAD-510), checked against per-model cost forecasts
+- Model tier routing (GAD-511.1) with escalation on failed validation
 
 **BACKWARD COMPATIBLE**: Maintains same API as previous version
 
@@ -19,11 +20,15 @@ Version: 2.0 (GAD-511)
 """
 
 import logging
-from dataclasses import dataclass
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from datetime import datetime
 from typing import Any
 
 from .circuit_breaker import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerOpenError
+from .cost_forecast import CostForecast
+from .model_router import ModelRouter, RouteDecision
 from .providers import LLMProvider, LLMProviderError, NoOpProvider, get_default_provider
 from .quota_manager import OperationalQuota, QuotaExceededError, QuotaLimits
 
@@ -189,6 +194,7 @@ class LLMClient:
     - Cost tracking via CostTracker
     - Circuit breaker (GAD-509)
     - Operational quotas (GAD-510)
+    - Model tier routing (GAD-511.1)
     - Budget enforcement (optional)
 
     Usage:
@@ -202,13 +208,19 @@ class LLMClient:
         print(f"Cost: ${response.usage.cost_usd:.4f}")
     """
 
-    def __init__(self, budget_limit: float | None = None, provider: LLMProvider | None = None):
+    def __init__(
+        self,
+        budget_limit: float | None = None,
+        provider: LLMProvider | None = None,
+        router: ModelRouter | None = None,
+    ):
         """
         Initialize LLM client.
 
         Args:
             budget_limit: Optional budget limit in USD (default: None = no limit)
             provider: Optional explicit provider (default: auto-detect via factory)
+            router: Optional model tier router (default: the provider's tier table)
         """
         self.cost_tracker = CostTracker()
         self.budget_limit = budget_limit
@@ -237,6 +249,12 @@ class LLMClient:
         else:
             self.provider = get_default_provider()
 
+        # Price quota forecasts with the provider's own rates (GAD-510.2)
+        self.quota_manager.forecaster.prices.add_provider(self.provider)
+
+        # Pick a model tier per request (GAD-511.1)
+        self.router = router or ModelRouter.for_provider(self.provider)
+
         # Set mode for backward compatibility
         if isinstance(self.provider, NoOpProvider):
             self.mode = "noop"
@@ -254,18 +272,29 @@ class LLMClient:
         max_tokens: int = 4096,
         temperature: float = 1.0,
         max_retries: int = 3,
+        task_class: str = "default",
+        validate: Callable[[str], bool] | None = None,
     ) -> LLMResponse:
         """
         Invoke LLM with safety layer, retry logic, and cost tracking.
 
         **GAD-511**: Delegates to provider while maintaining safety guardrails
 
+        **GAD-511.1**: The router may send the request to a cheaper or
+        stronger model than `model` (see ModelRouter); response.model names
+        the model that answered.
+
         Args:
             prompt: Input prompt
-            model: Model to use
+            model: Model to use (the router's starting point)
             max_tokens: Maximum output tokens
             temperature: Sampling temperature
             max_retries: Maximum retry attempts (default: 3)
+            task_class: Kind of request (e.g. "classification"); selects the
+                        model tier and the forecast correction factor
+            validate: Optional check of the response content; a rejected
+                      answer is retried one tier up (the last answer is
+                      returned if no stronger tier is left)
 
         Returns:
             LLMResponse with content and usage info
@@ -276,6 +305,79 @@ class LLMClient:
             CircuitBreakerOpenError: If circuit breaker is OPEN
             LLMInvocationError: If all retries fail
         """
+        forecast = self.quota_manager.forecast(prompt, model, max_tokens, task=task_class)
+        decision = self._route(model, task_class, forecast)
+
+        while True:
+            started = time.perf_counter()
+            try:
+                response = self._invoke_model(
+                    prompt, decision.model, max_tokens, temperature, max_retries, forecast
+                )
+            except (BudgetExceededError, QuotaExceededError):
+                raise  # Nothing was sent
+            except Exception:
+                self.router.record(decision, time.perf_counter() - started, 0.0, "error")
+                raise
+
+            accepted = validate is None or validate(response.content)
+            self.router.record(
+                decision,
+                time.perf_counter() - started,
+                response.usage.cost_usd,
+                "success" if accepted else "rejected",
+            )
+            if accepted:
+                return response
+
+            escalated = self.router.escalate(decision, model)
+            if escalated is None:
+                logger.warning(f"LLM answer from {decision.model} failed validation (no tier left)")
+                return response
+            logger.info(f"LLM answer from {decision.model} failed validation, escalating")
+            decision = escalated
+
+    def _route(self, model: str, task_class: str, forecast: CostForecast) -> RouteDecision:
+        """Choose the tier for a request from its task class, size and budget."""
+        budget_left, fraction_left = self._budget_left()
+        prices = self.quota_manager.forecaster.prices
+        decision = self.router.route(
+            model,
+            task_class,
+            prompt_tokens=forecast.input_tokens,
+            max_tokens=forecast.max_tokens,
+            budget_left_usd=budget_left,
+            budget_fraction_left=fraction_left,
+            cost_of=lambda m: prices.cost(m, forecast.input_tokens, forecast.output_tokens),
+        )
+        if decision.model != model:
+            logger.debug(f"Routed {task_class} request to {decision.model}: {decision.reason}")
+        return decision
+
+    def _budget_left(self) -> tuple[float | None, float | None]:
+        """(USD left, share left) of the tighter of the client budget and daily quota."""
+        remaining = []
+        limits, metrics = self.quota_manager.limits, self.quota_manager.metrics
+        if limits.cost_per_day_usd > 0:
+            remaining.append(
+                (limits.cost_per_day_usd - metrics.cost_this_day_usd, limits.cost_per_day_usd)
+            )
+        if self.budget_limit:
+            remaining.append((self.budget_limit - self.cost_tracker.total_cost, self.budget_limit))
+        if not remaining:
+            return None, None
+        return min(left for left, _ in remaining), min(left / limit for left, limit in remaining)
+
+    def _invoke_model(
+        self,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        max_retries: int,
+        forecast: CostForecast,
+    ) -> LLMResponse:
+        """One guarded provider call: budget, quota, circuit breaker, cost tracking."""
         # Check budget before invocation
         if self.budget_limit and self.cost_tracker.total_cost >= self.budget_limit:
             raise BudgetExceededError(
@@ -283,11 +385,20 @@ class LLMClient:
                 f"(current: ${self.cost_tracker.total_cost:.4f})"
             )
 
-        # Check operational quotas (GAD-510 pre-flight check)
-        estimated_tokens = max_tokens
+        # Check operational quotas (GAD-510 pre-flight check on a GAD-510.2 forecast)
+        if forecast.model != model:
+            forecast = replace(
+                forecast,
+                model=model,
+                cost_usd=self.quota_manager.forecaster.prices.cost(
+                    model, forecast.input_tokens, forecast.output_tokens
+                ),
+            )
         try:
             self.quota_manager.check_before_request(
-                estimated_tokens=estimated_tokens, operation=f"invoke({model})"
+                estimated_tokens=forecast.total_tokens,
+                operation=f"invoke({model})",
+                estimated_cost_usd=forecast.cost_usd,
             )
         except QuotaExceededError as e:
             logger.error(f"Quota check failed: {e}")
@@ -323,6 +434,7 @@ class LLMClient:
             self.quota_manager.record_request(
                 tokens_used=total_tokens, cost_usd=usage.cost_usd, operation=f"invoke({model})"
             )
+            self.quota_manager.reconcile(forecast, usage.input_tokens, usage.output_tokens)
 
             # Log success
             provider_name = getattr(provider_response, "provider", "unknown")
@@ -365,6 +477,7 @@ class LLMClient:
             summary["budget_used_percent"] = round(
                 (self.cost_tracker.total_cost / self.budget_limit) * 100, 2
             )
+        summary["tiers"] = self.router.get_stats()
         return summary
 
 
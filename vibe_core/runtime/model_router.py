@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Model Tier Router (GAD-511.1)
+==============================
+
+Picks a model tier for LLMClient requests that declare a task class,
+instead of sending every call to the model the caller named:
+
+  - Declared task class: classification-style work (routing, audits,
+    summaries) goes to the fast tier, code generation to the strong tier
+  - Prompt size: long prompts never go to the fast tier
+  - Remaining budget: low budget steps down a tier, and a tier whose
+    forecast cost exceeds what is left is skipped
+
+Calls without a declared task class keep the model they asked for (its
+tier is only used for stats and escalation), so routing never downgrades
+them.
+
+With a validator, an answer that fails validation is retried one tier up
+(escalation). Latency, cost and outcome are recorded per tier, both in
+get_stats() and in the metrics registry.
+
+Providers without a tier table (or VIBE_MODEL_ROUTING=0), and models the
+tier table does not list, pass the requested model through unchanged, as
+tier "pinned".
+
+Usage:
+    router = ModelRouter.for_provider(provider)
+    decision = router.route("claude-3-5-sonnet-20241022", "classification",
+                            prompt_tokens=800, max_tokens=256)
+    decision.model  # "claude-3-5-haiku-20241022"
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from vibe_core.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+# Tiers from cheapest to strongest
+TIERS = ("fast", "balanced", "strong")
+
+# Tier of requests that are never rerouted (no tier table, routing disabled,
+# or a model the tier table does not list)
+PINNED = "pinned"
+
+# Tier models per provider (get_provider_name()); missing tiers use the requested model
+DEFAULT_TIER_MODELS = {
+    "Anthropic": {
+        "fast": "claude-3-5-haiku-20241022",
+        "balanced": "claude-3-5-sonnet-20241022",
+        "strong": "claude-3-5-sonnet-20241022",
+    },
+    "Google": {
+        "fast": "gemini-2.5-flash",
+        "balanced": "gemini-2.5-flash",
+        "strong": "gemini-1.5-pro",
+    },
+}
+
+# Tier per declared task class (other calls keep the requested model)
+DEFAULT_TASK_TIERS = {
+    "classification": "fast",
+    "routing": "fast",
+    "audit": "fast",
+    "summarization": "fast",
+    "extraction": "fast",
+    "code_generation": "strong",
+    "planning": "strong",
+}
+
+# Prompts above this never go to the fast tier
+LONG_PROMPT_TOKENS = 32_000
+# Below this share of the budget left, step down one tier
+LOW_BUDGET_FRACTION = 0.2
+
+_metrics = get_registry()
+TIER_REQUESTS = _metrics.counter(
+    "vibe_llm_tier_requests_total", "LLMClient requests per tier", ("tier", "model", "outcome")
+)
+TIER_SECONDS = _metrics.histogram("vibe_llm_tier_seconds", "LLMClient latency per tier", ("tier",))
+TIER_COST = _metrics.counter("vibe_llm_tier_cost_usd_total", "LLMClient cost per tier", ("tier",))
+TIER_ESCALATIONS = _metrics.counter(
+    "vibe_llm_tier_escalations_total", "Validation-failure escalations", ("from_tier", "to_tier")
+)
+
+
+@dataclass(frozen=True)
+class RouteDecision:
+    """The model chosen for one request, and why."""
+
+    tier: str
+    model: str
+    reason: str
+
+
+@dataclass
+class TierStats:
+    requests: int = 0
+    errors: int = 0
+    rejected: int = 0  # Answers that failed validation
+    escalations: int = 0  # Escalations away from this tier
+    total_seconds: float = 0.0
+    total_cost_usd: float = 0.0
+
+
+class ModelRouter:
+    """
+    Chooses a tier (and so a model) per request and keeps per-tier stats.
+
+    An empty tier table routes nothing: every request keeps its requested
+    model under tier "pinned" (stats are still recorded). The same goes for
+    requested models the table does not list.
+    """
+
+    def __init__(
+        self,
+        tier_models: dict[str, str] | None = None,
+        task_tiers: dict[str, str] | None = None,
+    ):
+        self.tier_models = dict(tier_models or {})
+        self.task_tiers = dict(DEFAULT_TASK_TIERS if task_tiers is None else task_tiers)
+        self._stats: dict[str, TierStats] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_provider(cls, provider) -> "ModelRouter":
+        """Router with the provider's default tier table (pass-through if none)."""
+        if os.getenv("VIBE_MODEL_ROUTING", "1") == "0":
+            return cls()
+        try:
+            name = provider.get_provider_name()
+        except Exception:
+            name = None
+        tier_models = DEFAULT_TIER_MODELS.get(name) if isinstance(name, str) else None
+        return cls(tier_models)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.tier_models)
+
+    def route(
+        self,
+        requested_model: str,
+        task_class: str = "default",
+        prompt_tokens: int = 0,
+        max_tokens: int = 0,
+        budget_left_usd: float | None = None,
+        budget_fraction_left: float | None = None,
+        cost_of: Callable[[str], float] | None = None,
+    ) -> RouteDecision:
+        """
+        Pick the tier and model for a request.
+
+        Args:
+            requested_model: Model the caller asked for
+            task_class: Declared kind of work (see DEFAULT_TASK_TIERS); other
+                        values keep the requested model
+            prompt_tokens: Forecast prompt size
+            max_tokens: Output token limit
+            budget_left_usd: Money left before a budget or quota stops calls
+            budget_fraction_left: Share of that budget still left (0.0-1.0)
+            cost_of: Forecast cost of this request on a given model
+
+        Returns:
+            RouteDecision
+        """
+        if not self.enabled:
+            return RouteDecision(PINNED, requested_model, "no tier table")
+
+        requested_tier = self.tier_of(requested_model)
+        if requested_tier is None:
+            return RouteDecision(PINNED, requested_model, "model not in tier table")
+        if task_class not in self.task_tiers:
+            return RouteDecision(requested_tier, requested_model, "requested model")
+
+        reason = f"task class {task_class}"
+        index = TIERS.index(self.task_tiers[task_class])
+
+        if index == 0 and prompt_tokens > LONG_PROMPT_TOKENS:
+            index, reason = 1, f"{reason}; long prompt"
+        if index > 0 and budget_fraction_left is not None:
+            if budget_fraction_left < LOW_BUDGET_FRACTION:
+                index, reason = index - 1, f"{reason}; low budget"
+        if cost_of is not None and budget_left_usd is not None:
+            while index > 0 and cost_of(self.model_for(TIERS[index], requested_model)) > (
+                budget_left_usd
+            ):
+                index, reason = index - 1, f"{reason}; over remaining budget"
+
+        tier = TIERS[index]
+        return RouteDecision(tier, self.model_for(tier, requested_model), reason)
+
+    def escalate(self, decision: RouteDecision, requested_model: str) -> RouteDecision | None:
+        """The next stronger tier with a different model, or None at the top."""
+        if decision.tier == PINNED:
+            return None
+        for tier in TIERS[TIERS.index(decision.tier) + 1 :]:
+            model = self.model_for(tier, requested_model)
+            if model != decision.model:
+                with self._lock:
+                    self._stats.setdefault(decision.tier, TierStats()).escalations += 1
+                TIER_ESCALATIONS.labels(decision.tier, tier).inc()
+                return RouteDecision(tier, model, f"escalated from {decision.tier}")
+        return None
+
+    def tier_of(self, model: str) -> str | None:
+        """Lowest tier served by a model (None if the table lacks it)."""
+        for tier in TIERS:
+            if self.tier_models.get(tier) == model:
+                return tier
+        return None
+
+    def model_for(self, tier: str, requested_model: str) -> str:
+        return self.tier_models.get(tier) or requested_model
+
+    def record(
+        self, decision: RouteDecision, seconds: float, cost_usd: float, outcome: str
+    ) -> None:
+        """
+        Record one attempt on a tier.
+
+        Args:
+            decision: Route the attempt used
+            seconds: Wall-clock latency
+            cost_usd: Actual cost (0 for errors)
+            outcome: "success", "error" or "rejected" (failed validation)
+        """
+        with self._lock:
+            stats = self._stats.setdefault(decision.tier, TierStats())
+            stats.requests += 1
+            stats.total_seconds += seconds
+            stats.total_cost_usd += cost_usd
+            if outcome == "error":
+                stats.errors += 1
+            elif outcome == "rejected":
+                stats.rejected += 1
+        TIER_REQUESTS.labels(decision.tier, decision.model, outcome).inc()
+        TIER_SECONDS.labels(decision.tier).observe(seconds)
+        if cost_usd:
+            TIER_COST.labels(decision.tier).inc(cost_usd)
+
+    def get_stats(self) -> dict[str, dict[str, float]]:
+        """Requests, errors, rejections, escalations, latency and cost per tier."""
+        with self._lock:
+            return {
+                tier: {
+                    "requests": s.requests,
+                    "errors": s.errors,
+                    "rejected": s.rejected,
+                    "escalations": s.escalations,
+                    "avg_latency_ms": round(s.total_seconds / s.requests * 1000, 1)
+                    if s.requests
+                    else 0.0,
+                    "total_cost_usd": round(s.total_cost_usd, 4),
+                }
+                for tier, s in self._stats.items()
+            }
@@ -81,26 +81,17 @@ class KernelOracle:
 
         try:
             cartridge_registry = get_default_cartridge_registry(self.vibe_root)
-            cartridge_names = cartridge_registry.get_cartridge_names()
-
-            for cartridge_name in cartridge_names:
-                try:
-                    cartridge = cartridge_registry.get_cartridge(cartridge_name)
-                    spec = cartridge.get_spec()
-                    cartridges.append(
-                        {
-                            "name": cartridge_name,
-                            "description": spec.description,
-                        }
-                    )
-                except Exception as e:
-                    logger.debug(f"Error loading cartridge {cartridge_name}: {e}")
-                    cartridges.append(
-                        {
-                            "name": cartridge_name,
-                            "description": "(Unable to load)",
-                        }
-                    )
+            # Described from the manifest: listing imports no cartridge modules
+            specs = cartridge_registry.list_cartridges()
+
+            for cartridge_name in cartridge_registry.get_cartridge_names():
+                spec = specs.get(cartridge_name)
+                cartridges.append(
+                    {
+                        "name": cartridge_name,
+                        "description": spec.description if spec else "(Unable to load)",
+                    }
+                )
 
         except Exception as e:
             logger.debug(f"Error loading cartridge registry: {e}")
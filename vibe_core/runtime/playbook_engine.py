@@ -2,14 +2,21 @@
 
 Routes user intent + context → task playbook
 Uses LEAN logic (simple if/else, no ML for MVP)
+
+Tier 1 keyword matching goes through a compiled IntentIndex (Aho-Corasick
+exact hits + character n-gram TF-IDF fuzzy hits), built once from
+_registry.yaml and rebuilt when the file changes.
 """
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from vibe_core.runtime.intent_index import IntentIndex, IntentMatch
+
 
 @dataclass
 class PlaybookRoute:
@@ -19,6 +26,7 @@ class PlaybookRoute:
     description: str
     confidence: str  # 'explicit', 'context', 'suggested'
     source: str  # What triggered this route
+    score: float = 0.0  # Match score for Tier 1 routes (0..1)
 
 
 class PlaybookEngine:
@@ -28,13 +36,36 @@ class PlaybookEngine:
         self.registry_path = (
             registry_path or Path(__file__).parent.parent / "playbook" / "_registry.yaml"
         )
+        self._registry_stat: tuple[int, int] | None = None
         self.registry = self._load_registry()
+        self._index = self._build_index()
+
+    def _stat_registry(self) -> tuple[int, int] | None:
+        try:
+            st = os.stat(self.registry_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _build_index(self) -> IntentIndex:
+        config = self.registry.get("config") or {}
+        return IntentIndex(
+            self.registry.get("routes", []) or [],
+            default_threshold=config.get("default_threshold", 0.75),
+        )
+
+    def _refresh(self) -> None:
+        """Reload the registry and recompile the matcher if _registry.yaml changed."""
+        if self._stat_registry() != self._registry_stat:
+            self.registry = self._load_registry()
+            self._index = self._build_index()
 
     def _load_registry(self) -> dict[str, Any]:
         """Load playbook registry"""
+        self._registry_stat = self._stat_registry()
         try:
             with open(self.registry_path) as f:
-                return yaml.safe_load(f)
+                return yaml.safe_load(f) or {}
         except Exception:
             # Fallback minimal registry
             return {"routes": [], "config": {"fallback_strategy": "suggest_options"}}
@@ -53,29 +84,37 @@ class PlaybookEngine:
         # TIER 3: Suggest options (inspiration mode)
         return self._suggest_options(context)
 
+    def rank_routes(self, user_input: str, limit: int | None = None) -> list[IntentMatch]:
+        """
+        Rank registry routes for user input, best first.
+
+        Args:
+            user_input: Raw user input
+            limit: Maximum number of routes
+
+        Returns:
+            IntentMatch list (route dict, score, kind 'exact'/'fuzzy', pattern)
+        """
+        self._refresh()
+        return self._index.rank(user_input, limit=limit)
+
     def _match_keywords(self, user_input: str) -> PlaybookRoute | None:
         """Match against registry intent patterns (Tier 1)"""
-        user_lower = user_input.lower().strip()
-
-        # Don't match if input is empty
-        if not user_lower:
+        matches = self.rank_routes(user_input, limit=1)
+        if not matches:
             return None
 
-        for route in self.registry.get("routes", []):
-            patterns = route.get("intent_patterns", [])
-            for pattern in patterns:
-                # Simple substring match (no embeddings for MVP)
-                if pattern.lower() in user_lower or user_lower in pattern.lower():
-                    # Map route names to task names
-                    task = self._route_to_task(route["name"])
-                    return PlaybookRoute(
-                        task=task,
-                        description=route.get("description", ""),
-                        confidence="explicit",
-                        source=f"matched: '{pattern}'",
-                    )
-
-        return None
+        best = matches[0]
+        # Map route names to task names
+        task = self._route_to_task(best.route["name"])
+        verb = "matched" if best.kind == "exact" else "similar to"
+        return PlaybookRoute(
+            task=task,
+            description=best.route.get("description", ""),
+            confidence="explicit",
+            source=f"{verb}: '{best.pattern}'",
+            score=best.score,
+        )
 
     def _infer_from_context(self, context: dict) -> PlaybookRoute | None:
         """Infer task from context signals (Tier 2 - LEAN rules!)"""
@@ -168,6 +207,7 @@ class PlaybookEngine:
 
     def list_available_routes(self) -> list[dict[str, str]]:
         """List all available routes from registry"""
+        self._refresh()
         routes = []
         for route in self.registry.get("routes", []):
             routes.append(
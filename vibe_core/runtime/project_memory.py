@@ -6,6 +6,9 @@ across sessions. This is the "brain" that makes STEWARD understand the full pict
 
 import json
 import logging
+import os
+import tempfile
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -13,6 +16,29 @@ from typing import Any
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class _SyncedState:
+    """What SQLite already holds for one mission (ARCH-003 delta sync)."""
+
+    narrative: dict[int, tuple] = field(default_factory=dict)  # session -> (summary, date, phase)
+    concepts: set[str] = field(default_factory=set)
+    concerns: set[str] = field(default_factory=set)
+    trajectory: tuple | None = None
+
+
+def _narrative_key(entry: dict[str, Any]) -> tuple:
+    return (entry.get("summary", ""), entry.get("date"), entry.get("phase", "UNKNOWN"))
+
+
+def _trajectory_key(trajectory: dict[str, Any]) -> tuple:
+    return (
+        trajectory.get("phase", "UNKNOWN"),
+        trajectory.get("current_focus"),
+        tuple(trajectory.get("completed", [])),
+        tuple(trajectory.get("blockers", [])),
+    )
+
+
 class ProjectMemoryManager:
     """Manages semantic project memory across sessions"""
 
@@ -27,6 +53,7 @@ class ProjectMemoryManager:
         self.project_root = project_root
         self.memory_file = project_root / ".vibe" / "project_memory.json"
         self.sqlite_store = sqlite_store
+        self._synced: dict[int, _SyncedState] = {}  # mission_id -> rows already in SQLite
         self._ensure_vibe_dir()
 
     def _ensure_vibe_dir(self):
@@ -57,21 +84,91 @@ class ProjectMemoryManager:
         self._ensure_vibe_dir()
 
         # Write to JSON (source of truth in Shadow Mode Phase 1)
-        with open(self.memory_file, "w") as f:
-            json.dump(memory, f, indent=2)
+        self._write_json(memory)
 
         # ARCH-003: Dual Write Mode - also write to SQLite if mission_id provided
         if self.sqlite_store and mission_id:
             try:
-                from datetime import datetime
-
-                timestamp = datetime.utcnow().isoformat() + "Z"
-                self.sqlite_store._map_project_memory_to_sql(memory, mission_id, timestamp)
-                logger.debug(f"✅ Dual-write project memory to SQLite: mission_id={mission_id}")
+                self._sync_to_sqlite(memory, mission_id)
             except Exception as e:
                 # Non-fatal - JSON is source of truth in Shadow Mode Phase 1
+                self._synced.pop(mission_id, None)  # Re-read SQLite state next time
                 logger.warning(f"⚠️ SQLite dual-write for project memory failed (non-fatal): {e}")
 
+    def _write_json(self, memory: dict[str, Any]):
+        """Compact, atomic write (temp file in the same directory + rename)."""
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.memory_file.parent, prefix=".project_memory.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(memory, f, separators=(",", ":"))
+            os.replace(tmp_path, self.memory_file)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _sync_to_sqlite(self, memory: dict[str, Any], mission_id: int):
+        """Send only new or modified entries to SQLite (one transaction)."""
+        state = self._synced.get(mission_id) or self._load_synced_state(mission_id)
+
+        narrative = [
+            entry
+            for entry in memory.get("narrative", [])
+            if state.narrative.get(entry.get("session", 0)) != _narrative_key(entry)
+        ]
+        domain = memory.get("domain", {})
+        concepts = [c for c in dict.fromkeys(domain.get("concepts", [])) if c not in state.concepts]
+        concerns = [c for c in dict.fromkeys(domain.get("concerns", [])) if c not in state.concerns]
+        trajectory = memory.get("trajectory") or None
+        if trajectory and _trajectory_key(trajectory) == state.trajectory:
+            trajectory = None
+
+        if narrative or concepts or concerns or trajectory:
+            timestamp = datetime.utcnow().isoformat() + "Z"
+            self.sqlite_store.sync_project_memory(
+                mission_id,
+                timestamp,
+                narrative=narrative,
+                concepts=concepts,
+                concerns=concerns,
+                trajectory=trajectory,
+            )
+            logger.debug(
+                f"✅ Dual-write project memory to SQLite: mission_id={mission_id} "
+                f"({len(narrative)} sessions, {len(concepts)} concepts, {len(concerns)} concerns)"
+            )
+
+        for entry in narrative:
+            state.narrative[entry.get("session", 0)] = _narrative_key(entry)
+        state.concepts.update(concepts)
+        state.concerns.update(concerns)
+        if trajectory:
+            state.trajectory = _trajectory_key(trajectory)
+        self._synced[mission_id] = state
+
+    def _load_synced_state(self, mission_id: int) -> _SyncedState:
+        """Seed change tracking from what SQLite already holds (once per mission)."""
+        state = _SyncedState(
+            narrative={
+                row["session_num"]: (row["summary"], row["date"], row["phase"])
+                for row in self.sqlite_store.get_session_narrative(mission_id)
+            },
+            concepts=set(self.sqlite_store.get_domain_concepts(mission_id)),
+            concerns=set(self.sqlite_store.get_domain_concerns(mission_id)),
+        )
+        trajectory = self.sqlite_store.get_trajectory(mission_id)
+        if trajectory:
+            state.trajectory = _trajectory_key(
+                {
+                    "phase": trajectory["current_phase"],
+                    "current_focus": trajectory["current_focus"],
+                    "completed": trajectory.get("completed_phases") or [],
+                    "blockers": trajectory.get("blockers") or [],
+                }
+            )
+        return state
+
     def update_after_session(
         self,
         session_summary: str,
@@ -6,6 +6,8 @@ Composes task playbook + context → enriched prompt for STEWARD
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tracing import span
+
 
 class PromptComposer:
     """Composes task playbook + context → enriched prompt"""
@@ -16,16 +18,18 @@ class PromptComposer:
     def compose(self, task: str, context: dict[str, Any]) -> str:
         """Compose final enriched prompt"""
 
-        # Load base task playbook
-        task_md = self._load_task(task)
+        with span("prompt.compose", source="PromptComposer", task=task) as sp:
+            # Load base task playbook
+            task_md = self._load_task(task)
 
-        # Inject context
-        enriched = self._inject_context(task_md, context)
+            # Inject context
+            enriched = self._inject_context(task_md, context)
 
-        # Add boot prompt
-        final = self._add_boot_prompt(enriched, context)
+            # Add boot prompt
+            final = self._add_boot_prompt(enriched, context)
 
-        return final
+            sp.set_attribute("chars", len(final))
+            return final
 
     def _load_task(self, task: str) -> str:
         """Load task playbook markdown"""
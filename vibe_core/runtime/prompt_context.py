@@ -338,41 +338,13 @@ class PromptContext:
         try:
             import json
 
-            backlog_path = self.vibe_root / "workspace" / "BACKLOG.md"
+            from vibe_core.store.agenda_store import agenda_exists, get_agenda_store
 
-            if not backlog_path.exists():
+            if not agenda_exists(self.vibe_root):
                 return '{"HIGH": 0, "MEDIUM": 0, "LOW": 0, "total": 0}'
 
-            content = backlog_path.read_text()
-
-            # Extract Outstanding Tasks section only
-            outstanding_idx = content.find("## Outstanding Tasks")
-            completed_idx = content.find("## Completed Tasks")
-
-            if outstanding_idx == -1 or completed_idx == -1:
-                return '{"HIGH": 0, "MEDIUM": 0, "LOW": 0, "total": 0}'
-
-            outstanding_section = content[
-                outstanding_idx + len("## Outstanding Tasks") : completed_idx
-            ]
-
-            # Count tasks by priority
-            counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-
-            for line in outstanding_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- [ ]"):
-                    # Extract priority from [PRIORITY] tag
-                    if "[HIGH]" in line:
-                        counts["HIGH"] += 1
-                    elif "[MEDIUM]" in line:
-                        counts["MEDIUM"] += 1
-                    elif "[LOW]" in line:
-                        counts["LOW"] += 1
-
-            counts["total"] = counts["HIGH"] + counts["MEDIUM"] + counts["LOW"]
-
-            return json.dumps(counts)
+            # Indexed count per priority (outstanding tasks only)
+            return json.dumps(get_agenda_store(self.vibe_root).pending_counts())
 
         except Exception as e:
             logger.warning(f"Failed to resolve agenda_summary: {e}")
@@ -389,65 +361,25 @@ class PromptContext:
             Formatted string with top 5 tasks and summary of remaining
         """
         try:
-            backlog_path = self.vibe_root / "workspace" / "BACKLOG.md"
+            from vibe_core.store.agenda_store import agenda_exists, get_agenda_store
 
-            if not backlog_path.exists():
+            if not agenda_exists(self.vibe_root):
                 return "[No agenda tasks. Backlog is clear.]"
 
-            content = backlog_path.read_text()
-
-            # Extract Outstanding Tasks section only
-            outstanding_idx = content.find("## Outstanding Tasks")
-            completed_idx = content.find("## Completed Tasks")
-
-            if outstanding_idx == -1 or completed_idx == -1:
-                return "[No agenda tasks. Backlog is clear.]"
-
-            outstanding_section = content[
-                outstanding_idx + len("## Outstanding Tasks") : completed_idx
-            ]
-
-            # Parse tasks by priority
-            high_tasks = []
-            medium_tasks = []
-            low_tasks = []
-
-            for line in outstanding_section.split("\n"):
-                line = line.strip()
-                if line.startswith("- [ ]"):
-                    # Extract priority and task description
-                    if "[HIGH]" in line:
-                        high_tasks.append(line)
-                    elif "[MEDIUM]" in line:
-                        medium_tasks.append(line)
-                    elif "[LOW]" in line:
-                        low_tasks.append(line)
-
-            # Build focus filter output: top 5 HIGH tasks, then summary
-            output_lines = []
-            total_count = len(high_tasks) + len(medium_tasks) + len(low_tasks)
-
-            # Show top 5 HIGH priority tasks
-            display_count = 0
+            store = get_agenda_store(self.vibe_root)
             max_display = 5
 
-            for task in high_tasks[:max_display]:
-                output_lines.append(task)
-                display_count += 1
-
-            # If we have room, add MEDIUM tasks
-            remaining_high = len(high_tasks) - min(max_display, len(high_tasks))
-            if display_count < max_display and medium_tasks:
-                for task in medium_tasks[:max_display - display_count]:
-                    output_lines.append(task)
-                    display_count += 1
-                remaining_medium = len(medium_tasks) - min(
-                    max_display - len(high_tasks), len(medium_tasks)
-                )
-            else:
-                remaining_medium = len(medium_tasks)
+            # Index lookups: top HIGH (then MEDIUM) tasks + per-priority counts
+            shown = store.top_pending(max_display, priorities=("HIGH", "MEDIUM"))
+            counts = store.pending_counts()
+
+            output_lines = [task.to_markdown() for task in shown]
+            display_count = len(shown)
+            shown_high = sum(1 for task in shown if task.priority == "HIGH")
 
-            remaining_low = len(low_tasks)
+            remaining_high = counts["HIGH"] - shown_high
+            remaining_medium = counts["MEDIUM"] - (display_count - shown_high)
+            remaining_low = counts["LOW"]
 
             # Build summary of remaining
             summary_parts = []
@@ -460,7 +392,7 @@ class PromptContext:
 
             # Add summary line
             if summary_parts:
-                remaining_total = total_count - display_count
+                remaining_total = counts["total"] - display_count
                 output_lines.append(
                     f"... and {remaining_total} more task(s): {', '.join(summary_parts)}. "
                     f"Use list_tasks tool to see all."
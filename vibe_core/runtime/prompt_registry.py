@@ -39,6 +39,7 @@ import yaml
 
 # Import PromptRuntime using proper package path
 from vibe_core.runtime.prompt_runtime import PromptRuntime
+from vibe_core.tracing import span
 
 # Import workspace utilities without sys.path manipulation
 _REPO_ROOT = (
@@ -134,6 +135,25 @@ class PromptRegistry:
             GovernanceLoadError: If Guardian Directives can't be loaded
             ContextEnrichmentError: If workspace context enrichment fails
         """
+        with span("prompt.compose", source="PromptRegistry", agent=agent, task=task) as sp:
+            final_prompt = cls._compose(
+                agent, task, workspace, inject_governance, inject_tools, inject_sops, context
+            )
+            sp.set_attribute("chars", len(final_prompt))
+        return final_prompt
+
+    @classmethod
+    def _compose(
+        cls,
+        agent: str,
+        task: str | None,
+        workspace: str | None,
+        inject_governance: bool,
+        inject_tools: list[str] | None,
+        inject_sops: list[str] | None,
+        context: dict[str, Any] | None,
+    ) -> str:
+        """Build the base prompt and its injection layers (see compose)."""
         logger.info(f"Composing prompt: agent={agent}, task={task}, workspace={workspace}")
 
         # Initialize context if not provided
@@ -22,12 +22,16 @@ import time
 from datetime import datetime
 from typing import Any
 
+from vibe_core.tracing import Span, span
+
 from .base import (
+    PROVIDER_ERRORS,
     LLMProvider,
     LLMResponse,
     LLMUsage,
     ProviderInvocationError,
     ProviderNotAvailableError,
+    record_invocation,
 )
 
 logger = logging.getLogger(__name__)
@@ -46,6 +50,7 @@ class AnthropicProvider(LLMProvider):
         "claude-3-5-sonnet-20241022": {"input": 3.0, "output": 15.0},
         "claude-3-5-sonnet-20250129": {"input": 3.0, "output": 15.0},
         "claude-3-5-sonnet-latest": {"input": 3.0, "output": 15.0},
+        "claude-3-5-haiku-20241022": {"input": 0.8, "output": 4.0},
     }
 
     def __init__(self, api_key: str | None = None, **kwargs: Any):
@@ -104,6 +109,21 @@ class AnthropicProvider(LLMProvider):
         Raises:
             ProviderInvocationError: If all retries fail
         """
+        with span("provider.invoke", provider="anthropic", model=model) as sp:
+            return self._invoke(sp, prompt, model, max_tokens, temperature, max_retries, **kwargs)
+
+    def _invoke(
+        self,
+        sp: Span,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        max_retries: int,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Call the API with retries, recording usage on the span (see invoke)."""
+        started = time.perf_counter()
         last_error = None
 
         for attempt in range(max_retries):
@@ -139,6 +159,12 @@ class AnthropicProvider(LLMProvider):
                     f"cost: ${usage.cost_usd:.4f})"
                 )
 
+                sp.set_attribute("attempts", attempt + 1)
+                sp.set_attribute("input_tokens", usage.input_tokens)
+                sp.set_attribute("output_tokens", usage.output_tokens)
+                sp.set_attribute("cost_usd", usage.cost_usd)
+                record_invocation("anthropic", usage, time.perf_counter() - started)
+
                 # Return standardized response
                 return LLMResponse(
                     content=response.content[0].text,
@@ -151,6 +177,7 @@ class AnthropicProvider(LLMProvider):
             except Exception as e:
                 last_error = e
                 error_name = type(e).__name__
+                PROVIDER_ERRORS.labels("anthropic", model, error_name).inc()
 
                 # Check if retryable error
                 retryable_errors = ["RateLimitError", "APIConnectionError", "APITimeoutError"]
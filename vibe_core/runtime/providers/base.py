@@ -25,6 +25,24 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
+from vibe_core.metrics import get_registry
+
+_metrics = get_registry()
+PROVIDER_SECONDS = _metrics.histogram(
+    "vibe_provider_request_seconds",
+    "LLM provider call time, retries included",
+    ("provider", "model"),
+)
+PROVIDER_TOKENS = _metrics.counter(
+    "vibe_provider_tokens_total", "LLM tokens used", ("provider", "model", "direction")
+)
+PROVIDER_COST = _metrics.counter(
+    "vibe_provider_cost_usd_total", "LLM spend in USD", ("provider", "model")
+)
+PROVIDER_ERRORS = _metrics.counter(
+    "vibe_provider_errors_total", "Failed LLM provider attempts", ("provider", "model", "error")
+)
+
 
 @dataclass
 class LLMUsage:
@@ -215,3 +233,11 @@ class ProviderInvocationError(LLMProviderError):
     """Raised when provider invocation fails"""
 
     pass
+
+
+def record_invocation(provider: str, usage: LLMUsage, seconds: float) -> None:
+    """Record a successful provider call in the metrics registry."""
+    PROVIDER_SECONDS.labels(provider, usage.model).observe(seconds)
+    PROVIDER_TOKENS.labels(provider, usage.model, "input").inc(usage.input_tokens)
+    PROVIDER_TOKENS.labels(provider, usage.model, "output").inc(usage.output_tokens)
+    PROVIDER_COST.labels(provider, usage.model).inc(usage.cost_usd)
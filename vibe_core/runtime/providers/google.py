@@ -27,12 +27,16 @@ import time
 from datetime import datetime
 from typing import Any
 
+from vibe_core.tracing import Span, span
+
 from .base import (
+    PROVIDER_ERRORS,
     LLMProvider,
     LLMResponse,
     LLMUsage,
     ProviderInvocationError,
     ProviderNotAvailableError,
+    record_invocation,
 )
 
 logger = logging.getLogger(__name__)
@@ -120,6 +124,21 @@ class GoogleProvider(LLMProvider):
         Raises:
             ProviderInvocationError: If all retries fail
         """
+        with span("provider.invoke", provider="google", model=model) as sp:
+            return self._invoke(sp, prompt, model, max_tokens, temperature, max_retries, **kwargs)
+
+    def _invoke(
+        self,
+        sp: Span,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+        temperature: float,
+        max_retries: int,
+        **kwargs: Any,
+    ) -> LLMResponse:
+        """Call the API with retries, recording usage on the span (see invoke)."""
+        started = time.perf_counter()
         last_error = None
 
         for attempt in range(max_retries):
@@ -182,6 +201,12 @@ class GoogleProvider(LLMProvider):
                     f"cost: ${usage.cost_usd:.4f})"
                 )
 
+                sp.set_attribute("attempts", attempt + 1)
+                sp.set_attribute("input_tokens", usage.input_tokens)
+                sp.set_attribute("output_tokens", usage.output_tokens)
+                sp.set_attribute("cost_usd", usage.cost_usd)
+                record_invocation("google", usage, time.perf_counter() - started)
+
                 # Return standardized response
                 return LLMResponse(
                     content=content,
@@ -194,6 +219,7 @@ class GoogleProvider(LLMProvider):
             except Exception as e:
                 last_error = e
                 error_name = type(e).__name__
+                PROVIDER_ERRORS.labels("google", model, error_name).inc()
 
                 # Check if retryable error
                 retryable_errors = ["ResourceExhausted", "ServiceUnavailable", "DeadlineExceeded"]
@@ -19,7 +19,11 @@ GAD-510.1: Dynamic Quota Configuration
 - Falls back to safe defaults if undefined
 - Configurable limits prevent surprises and enable custom budgets
 
-Version: 1.1 (GAD-510 + GAD-510.1)
+GAD-510.2: Pre-flight Forecasting
+- forecast() estimates prompt/output tokens and prices them per model
+- reconcile() learns per-task correction factors from actual usage
+
+Version: 1.2 (GAD-510 + GAD-510.1 + GAD-510.2)
 """
 
 import logging
@@ -27,6 +31,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
+from .cost_forecast import CostForecast, CostForecaster
+
 logger = logging.getLogger(__name__)
 
 # Try to import Phoenix config, fall back to environment variables
@@ -145,26 +151,35 @@ class OperationalQuota:
     Usage:
         quota = OperationalQuota()
 
-        # Pre-flight check
+        # Pre-flight check (forecast from the prompt, priced for the model)
+        forecast = quota.forecast(prompt, model="gemini-2.5-flash", max_tokens=4096)
         try:
-            quota.check_before_request(estimated_tokens=5000, operation="feature_implementation")
+            quota.check_before_request(
+                estimated_tokens=forecast.total_tokens,
+                operation="feature_implementation",
+                estimated_cost_usd=forecast.cost_usd,
+            )
         except QuotaExceededError as e:
             logger.error(f"Cannot execute request: {e}")
             return
 
-        # Record actual usage
+        # Record actual usage and learn from the forecast error
         quota.record_request(tokens_used=4800, cost_usd=0.24, operation="feature_implementation")
+        quota.reconcile(forecast, input_tokens=4000, output_tokens=800)
     """
 
-    def __init__(self, limits: QuotaLimits | None = None):
+    def __init__(self, limits: QuotaLimits | None = None, forecaster: CostForecaster | None = None):
         """
         Initialize quota manager.
 
         Args:
             limits: QuotaLimits configuration (loads from env vars if None)
+            forecaster: Token/cost forecaster (default: one priced at DEFAULT_PRICE
+                        until providers are added to its price table)
         """
         self.limits = limits or QuotaLimits.from_environment()
         self.metrics = QuotaMetrics()
+        self.forecaster = forecaster or CostForecaster()
 
         logger.info(
             f"Quota Manager initialized: "
@@ -174,10 +189,32 @@ class OperationalQuota:
             f"cost/day=${self.limits.cost_per_day_usd}"
         )
 
+    def forecast(
+        self, prompt: str, model: str, max_tokens: int, task: str = "default"
+    ) -> CostForecast:
+        """
+        Forecast tokens and cost of a request (see CostForecaster.forecast).
+
+        Args:
+            prompt: Full prompt text
+            model: Model the request goes to
+            max_tokens: Output token limit of the request
+            task: Task class whose learned correction factors apply
+
+        Returns:
+            CostForecast to pass to check_before_request() and reconcile()
+        """
+        return self.forecaster.forecast(prompt, model, max_tokens, task)
+
+    def reconcile(self, forecast: CostForecast, input_tokens: int, output_tokens: int) -> None:
+        """Learn from the actual usage of a forecast request."""
+        self.forecaster.reconcile(forecast, input_tokens, output_tokens)
+
     def check_before_request(
         self,
         estimated_tokens: int,
         operation: str = "unknown",
+        estimated_cost_usd: float | None = None,
     ) -> tuple[bool, str]:
         """
         Pre-flight check before sending a request to LLM.
@@ -185,6 +222,7 @@ class OperationalQuota:
         Args:
             estimated_tokens: Estimated tokens this request will use
             operation: Human-readable description of the operation
+            estimated_cost_usd: Forecast cost (default: _estimate_cost(estimated_tokens))
 
         Returns:
             (can_execute: bool, reason: str)
@@ -212,7 +250,10 @@ class OperationalQuota:
             )
 
         # Check 3: Estimate cost and check against limits
-        estimated_cost = self._estimate_cost(estimated_tokens)
+        if estimated_cost_usd is not None:
+            estimated_cost = estimated_cost_usd
+        else:
+            estimated_cost = self._estimate_cost(estimated_tokens)
 
         if estimated_cost > self.limits.cost_per_request_usd:
             logger.warning(
@@ -334,6 +375,7 @@ class OperationalQuota:
         """
         Estimate cost for a given number of tokens.
 
+        Fallback for callers without a forecast (see forecast()).
         Based on Claude 3.5 Sonnet pricing:
         - Input: $3 per million tokens
         - Output: $15 per million tokens
@@ -391,6 +433,7 @@ class OperationalQuota:
                 "total_tokens": self.metrics.total_tokens,
                 "quota_violations": len(self.metrics.quota_violations),
             },
+            "forecast_factors": self.forecaster.get_factors(),
         }
 
     def reset(self):
@@ -10,21 +10,48 @@ It physically prevents operations that are known to cause "AI Slop" and regressi
 
 Rules (Non-negotiable):
   1. ANTI-BLINDNESS: No file edits without prior read in session
+     (STALE_READ: the file changed since the version that was read)
   2. BLAST RADIUS: No directory deletions without explicit override
   3. TEST DISCIPLINE: No commits when tests are failing
 
-Version: 1.0 (GAD-509 Extension - Operation Iron Dome)
+Session memory is bounded: read files are tracked in an LRU keyed by
+(device, inode), each with the content hash, mtime and size of the version
+read. Violations keep only a short recent window in memory and spill to the
+ledger when one is attached.
+
+Version: 1.1 (GAD-509 Extension - Operation Iron Dome)
 """
 
+import hashlib
 import logging
+import os
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from vibe_core.metrics import get_registry
+from vibe_core.tracing import span
+
+if TYPE_CHECKING:
+    from vibe_core.ledger import VibeLedger
 
 logger = logging.getLogger(__name__)
 
+GOVERNANCE_BLOCKS = get_registry().counter(
+    "vibe_governance_blocks_total", "Tool calls blocked by governance", ("layer", "tool", "rule")
+)
+
+# Files tracked per session before least recently used entries are evicted
+DEFAULT_MAX_TRACKED_FILES = 2048
+
+# Violations kept in memory (the rest live in the ledger)
+RECENT_VIOLATIONS = 20
+
+# String arguments longer than this are truncated in violation records
+MAX_ARG_CHARS = 200
+
 
 class ViolationSeverity(Enum):
     """Severity levels for safety violations"""
@@ -47,14 +74,42 @@ class SafetyViolation:
 
 
 @dataclass
-class SessionContext:
-    """Tracks session state for safety checks"""
+class FileVersion:
+    """The version of a file the agent last read (or wrote) in this session"""
+
+    path: str  # Absolute path it was accessed by
+    content_hash: str | None  # sha256 of the bytes (None if the file did not exist)
+    mtime_ns: int | None
+    size: int | None
+    read: bool = False
+    written: bool = False
+
+
+# LRU key: (st_dev, st_ino) for existing files, ("path", abspath) otherwise
+FileKey = tuple
+
 
-    files_read: set[str] = field(default_factory=set)
-    files_written: set[str] = field(default_factory=set)
-    violations: list[SafetyViolation] = field(default_factory=list)
+@dataclass
+class SessionContext:
+    """Tracks session state for safety checks (bounded)"""
+
+    files: OrderedDict[FileKey, FileVersion] = field(default_factory=OrderedDict)
+    paths: dict[str, FileKey] = field(default_factory=dict)  # abspath → key
+    violations: deque[SafetyViolation] = field(
+        default_factory=lambda: deque(maxlen=RECENT_VIOLATIONS)
+    )
+    violation_counts: dict[str, int] = field(default_factory=dict)  # severity → count
+    evicted_files: int = 0
     session_start: str = field(default_factory=lambda: datetime.utcnow().isoformat() + "Z")
 
+    @property
+    def files_read(self) -> int:
+        return sum(1 for version in self.files.values() if version.read)
+
+    @property
+    def files_written(self) -> int:
+        return sum(1 for version in self.files.values() if version.written)
+
 
 class ToolSafetyGuardError(Exception):
     """Raised when a tool operation is blocked by safety rules"""
@@ -75,7 +130,7 @@ class ToolSafetyGuard:
         3. Test Discipline: Block commits with failing tests
 
     Usage:
-        guard = ToolSafetyGuard()
+        guard = ToolSafetyGuard(ledger=kernel.ledger)
 
         # Before executing a tool
         allowed, violation = guard.check_action("edit_file", {"path": "foo.py", ...})
@@ -86,15 +141,25 @@ class ToolSafetyGuard:
         guard.record_file_read("foo.py")
     """
 
-    def __init__(self, enable_strict_mode: bool = True):
+    def __init__(
+        self,
+        enable_strict_mode: bool = True,
+        ledger: "VibeLedger | None" = None,
+        max_tracked_files: int = DEFAULT_MAX_TRACKED_FILES,
+    ):
         """
         Initialize the safety guard.
 
         Args:
             enable_strict_mode: If True, enforce all blocking rules.
                                If False, log warnings but allow operations.
+            ledger: Ledger receiving every violation (memory keeps only the
+                    last RECENT_VIOLATIONS)
+            max_tracked_files: Read/written files remembered per session (LRU)
         """
         self.strict_mode = enable_strict_mode
+        self.ledger = ledger
+        self.max_tracked_files = max_tracked_files
         self.context = SessionContext()
 
         logger.info(
@@ -117,21 +182,44 @@ class ToolSafetyGuard:
             - If allowed is True, operation can proceed
             - If allowed is False, operation is blocked and violation contains details
         """
-        # Rule 1: Anti-Blindness
+        with span("governance.safety_check", tool=tool_name) as sp:
+            allowed, violation = self._check_action(tool_name, args)
+            sp.set_attribute("allowed", allowed)
+            if violation is not None:
+                sp.set_attribute("rule", violation.rule)
+        if not allowed and violation is not None:
+            GOVERNANCE_BLOCKS.labels("iron_dome", tool_name, violation.rule).inc()
+        return allowed, violation
+
+    def _check_action(
+        self, tool_name: str, args: dict[str, Any]
+    ) -> tuple[bool, SafetyViolation | None]:
+        """Apply the safety rules to one action (see check_action)."""
+        # Rule 1: Anti-Blindness (and stale reads)
         if tool_name in ["edit_file", "write_file", "modify_file"]:
             file_path = self._extract_file_path(args)
-            if file_path and not self._was_file_read(file_path):
-                violation = SafetyViolation(
-                    rule="ANTI_BLINDNESS",
-                    severity=ViolationSeverity.BLOCKING,
-                    message=(
+            freshness = self._read_freshness(file_path) if file_path else "fresh"
+            if freshness != "fresh":
+                if freshness == "unread":
+                    rule = "ANTI_BLINDNESS"
+                    message = (
                         f"BLOCKED: Cannot edit '{file_path}' without reading it first. "
                         f"This prevents hallucinated edits. Read the file before editing."
-                    ),
+                    )
+                else:
+                    rule = "STALE_READ"
+                    message = (
+                        f"BLOCKED: '{file_path}' changed since it was read. "
+                        f"The edit would be based on an outdated version. Read it again."
+                    )
+                violation = SafetyViolation(
+                    rule=rule,
+                    severity=ViolationSeverity.BLOCKING,
+                    message=message,
                     tool_name=tool_name,
-                    args=args,
+                    args=_compact_args(args),
                 )
-                self.context.violations.append(violation)
+                self._record_violation(violation)
 
                 if self.strict_mode:
                     logger.error(f"🛡️ IRON DOME BLOCKED: {violation.message}")
@@ -150,9 +238,9 @@ class ToolSafetyGuard:
                     f"Use delete_file for individual files instead."
                 ),
                 tool_name=tool_name,
-                args=args,
+                args=_compact_args(args),
             )
-            self.context.violations.append(violation)
+            self._record_violation(violation)
 
             if self.strict_mode:
                 logger.error(f"🛡️ IRON DOME BLOCKED: {violation.message}")
@@ -166,31 +254,39 @@ class ToolSafetyGuard:
 
         return True, None
 
-    def record_file_read(self, file_path: str):
+    def record_file_read(self, file_path: str, content: bytes | None = None):
         """
         Record that a file has been read in this session.
 
+        Remembers the version read (content hash, mtime, size), so a later
+        edit can be checked against it.
+
         Args:
             file_path: Path to the file that was read
+            content: Raw bytes that were read (hashed from disk if omitted)
         """
-        normalized = self._normalize_path(file_path)
-        self.context.files_read.add(normalized)
-        logger.debug(f"📖 Recorded file read: {normalized}")
+        version = self._track(file_path, content)
+        version.read = True
+        logger.debug(f"📖 Recorded file read: {version.path}")
 
-    def record_file_write(self, file_path: str):
+    def record_file_write(self, file_path: str, content: bytes | None = None):
         """
         Record that a file has been written in this session.
 
+        The written version becomes the known version: follow-up edits don't
+        need another read.
+
         Args:
             file_path: Path to the file that was written
+            content: Raw bytes that were written (hashed from disk if omitted)
         """
-        normalized = self._normalize_path(file_path)
-        self.context.files_written.add(normalized)
-        logger.debug(f"✍️ Recorded file write: {normalized}")
+        version = self._track(file_path, content)
+        version.written = True
+        logger.debug(f"✍️ Recorded file write: {version.path}")
 
     def _was_file_read(self, file_path: str) -> bool:
         """
-        Check if a file was read in the current session.
+        Check if a file was read in the current session (any version).
 
         Args:
             file_path: Path to check
@@ -198,15 +294,19 @@ class ToolSafetyGuard:
         Returns:
             True if file was read, False otherwise
         """
-        normalized = self._normalize_path(file_path)
-        was_read = normalized in self.context.files_read
-
-        logger.debug(f"🔍 Check file read: {normalized} → {was_read}")
+        was_read = self._read_freshness(file_path) != "unread"
+        logger.debug(f"🔍 Check file read: {file_path} → {was_read}")
         return was_read
 
+    # ========================================================================
+    # SESSION FILE STORE (bounded LRU)
+    # ========================================================================
+
     def _normalize_path(self, path: str) -> str:
         """
-        Normalize a file path for comparison.
+        Normalize a file path for comparison (lexical, no filesystem access).
+
+        Aliases (symlinks, hard links) are unified by the (device, inode) key.
 
         Args:
             path: File path to normalize
@@ -215,11 +315,114 @@ class ToolSafetyGuard:
             Normalized absolute path
         """
         try:
-            return str(Path(path).resolve())
+            return os.path.abspath(path)
         except Exception:
-            # If path resolution fails, return as-is
+            # If path normalization fails, return as-is
             return path
 
+    def _stat(self, path: str) -> os.stat_result | None:
+        try:
+            return os.stat(path)
+        except (OSError, ValueError):
+            return None
+
+    def _lookup(self, path: str, st: os.stat_result | None) -> tuple[FileKey, FileVersion] | None:
+        """Find the tracked version by inode, or by path (file replaced since)."""
+        files = self.context.files
+        if st is not None:
+            key = (st.st_dev, st.st_ino)
+            if key in files:
+                files.move_to_end(key)
+                return key, files[key]
+        key = self.context.paths.get(path)
+        if key is not None and key in files:
+            files.move_to_end(key)
+            return key, files[key]
+        return None
+
+    def _track(self, file_path: str, content: bytes | None) -> FileVersion:
+        path = self._normalize_path(file_path)
+        st = self._stat(path)
+        if content is not None:
+            content_hash = hashlib.sha256(content).hexdigest()
+        else:
+            content_hash = _hash_file(path) if st is not None else None
+
+        found = self._lookup(path, st)
+        read = found[1].read if found else False
+        written = found[1].written if found else False
+        if found:
+            self._forget(found[0])
+
+        key: FileKey = (st.st_dev, st.st_ino) if st is not None else ("path", path)
+        version = FileVersion(
+            path=path,
+            content_hash=content_hash,
+            mtime_ns=st.st_mtime_ns if st else None,
+            size=st.st_size if st else None,
+            read=read,
+            written=written,
+        )
+        self._forget(key)
+        self.context.files[key] = version
+        self.context.paths[path] = key
+
+        while len(self.context.files) > self.max_tracked_files:
+            old_key, _ = self.context.files.popitem(last=False)
+            self._forget(old_key)
+            self.context.evicted_files += 1
+        return version
+
+    def _forget(self, key: FileKey):
+        version = self.context.files.pop(key, None)
+        if version is not None and self.context.paths.get(version.path) == key:
+            del self.context.paths[version.path]
+
+    def _read_freshness(self, file_path: str) -> str:
+        """
+        Compare a file on disk with the version read in this session.
+
+        Returns:
+            "fresh" (unchanged since read), "stale" (changed since read)
+            or "unread" (never read, or evicted from the session store)
+        """
+        path = self._normalize_path(file_path)
+        st = self._stat(path)
+        found = self._lookup(path, st)
+        if found is None:
+            return "unread"
+
+        key, version = found
+        if st is None:
+            # Existed when read, gone now → stale; never existed → still fine
+            return "stale" if version.mtime_ns is not None else "fresh"
+        if key == (st.st_dev, st.st_ino) and (version.mtime_ns, version.size) == (
+            st.st_mtime_ns,
+            st.st_size,
+        ):
+            return "fresh"  # Cheap path: same inode, same stat
+
+        # Stat changed (touch, rewrite, atomic replace): compare content
+        if version.content_hash is not None and _hash_file(path) == version.content_hash:
+            self._track(path, None)  # Same bytes: remember the new stat
+            return "fresh"
+        return "stale"
+
+    def _record_violation(self, violation: SafetyViolation):
+        severity = violation.severity.value
+        self.context.violations.append(violation)
+        self.context.violation_counts[severity] = self.context.violation_counts.get(severity, 0) + 1
+        if self.ledger is not None:
+            self.ledger.record_safety_violation(
+                rule=violation.rule,
+                severity=severity,
+                tool_name=violation.tool_name,
+                message=violation.message,
+                args=violation.args,
+                timestamp=violation.timestamp,
+                session_start=self.context.session_start,
+            )
+
     def _extract_file_path(self, args: dict[str, Any]) -> str | None:
         """
         Extract file path from tool arguments.
@@ -243,19 +446,17 @@ class ToolSafetyGuard:
         Returns:
             Dictionary with session context and violation stats
         """
+        counts = self.context.violation_counts
         return {
             "strict_mode": self.strict_mode,
             "session_start": self.context.session_start,
-            "files_read": len(self.context.files_read),
-            "files_written": len(self.context.files_written),
+            "files_read": self.context.files_read,
+            "files_written": self.context.files_written,
+            "files_evicted": self.context.evicted_files,
             "violations": {
-                "total": len(self.context.violations),
-                "blocking": sum(
-                    1 for v in self.context.violations if v.severity == ViolationSeverity.BLOCKING
-                ),
-                "warning": sum(
-                    1 for v in self.context.violations if v.severity == ViolationSeverity.WARNING
-                ),
+                "total": sum(counts.values()),
+                "blocking": counts.get(ViolationSeverity.BLOCKING.value, 0),
+                "warning": counts.get(ViolationSeverity.WARNING.value, 0),
             },
             "recent_violations": [
                 {
@@ -264,7 +465,7 @@ class ToolSafetyGuard:
                     "message": v.message,
                     "timestamp": v.timestamp,
                 }
-                for v in self.context.violations[-5:]  # Last 5 violations
+                for v in list(self.context.violations)[-5:]  # Last 5 violations
             ],
         }
 
@@ -274,3 +475,27 @@ class ToolSafetyGuard:
         """
         logger.info("🔄 Resetting Tool Safety Guard session context")
         self.context = SessionContext()
+
+
+def _hash_file(path: str) -> str | None:
+    """sha256 of a file's bytes (None if it cannot be read)."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _compact_args(args: dict[str, Any]) -> dict[str, Any]:
+    """Tool args with long strings (file contents, diffs) truncated."""
+    return {
+        key: (
+            f"{value[:MAX_ARG_CHARS]}... ({len(value)} chars)"
+            if isinstance(value, str) and len(value) > MAX_ARG_CHARS
+            else value
+        )
+        for key, value in args.items()
+    }
@@ -2,9 +2,10 @@
 Scheduling module for vibe-agency.
 
 This module provides the core scheduling primitives for the vibe OS,
-including the FIFO task queue and scheduler.
+including the FIFO task queue, the scheduler and task futures.
 """
 
+from vibe_core.scheduling.future import TaskFuture, as_completed, wait_all
 from vibe_core.scheduling.scheduler import Task, VibeScheduler
 
-__all__ = ["Task", "VibeScheduler"]
+__all__ = ["Task", "TaskFuture", "VibeScheduler", "as_completed", "wait_all"]
@@ -0,0 +1,193 @@
+"""
+Task futures for vibe-agency OS.
+
+kernel.submit() returns a TaskFuture: a handle on the submitted task that
+is resolved in memory the moment the kernel finishes executing it. Waiters
+block on an event (no polling, no ledger round-trip).
+
+TaskFuture is a str subclass whose value is the task ID, so existing code
+that treats the return value of submit() as an ID (ledger lookups,
+get_task_result(), logging) keeps working unchanged.
+
+The kernel is single-threaded and tick-driven. If a waiter asks for the
+result of a task that is still queued, the future asks the kernel to run
+that one task inline ("help while waiting"), instead of ticking through
+unrelated tasks queued ahead of it.
+
+Timeouts bound waiting, not execution. A task is only started inline while
+the deadline has not passed yet. Once started, it runs to completion on the
+waiting thread (agents cannot be interrupted), so a slow task can finish
+after the deadline; its result is then returned rather than discarded.
+
+Example:
+    >>> futures = [kernel.submit(Task(agent_id=a, payload=p)) for a, p in jobs]
+    >>> results = wait_all(futures, timeout=30)
+    >>> for future in as_completed(futures):
+    ...     print(future, future.result())
+"""
+
+import asyncio
+import concurrent.futures
+import time
+from collections.abc import Callable, Iterable, Iterator
+from typing import Any
+
+
+class TaskFuture(str):
+    """
+    Handle on a submitted task (the string value is the task ID).
+
+    Mirrors the concurrent.futures.Future API: done(), result(timeout),
+    exception(timeout), add_done_callback(fn). Awaitable from asyncio code.
+    """
+
+    def __new__(cls, task_id: str, runner: Callable[[str], bool] | None = None):
+        """
+        Args:
+            task_id: ID of the submitted task
+            runner: Callback that executes the task inline if it is still
+                    queued (returns False if it was not)
+        """
+        future = super().__new__(cls, task_id)
+        future._future = concurrent.futures.Future()
+        future._runner = runner
+        return future
+
+    @property
+    def task_id(self) -> str:
+        return str(self)
+
+    # ========================================================================
+    # STATE
+    # ========================================================================
+
+    def done(self) -> bool:
+        """True once the task finished (successfully or not)."""
+        return self._future.done()
+
+    def result(self, timeout: float | None = None) -> Any:
+        """
+        Return the task's result, waiting up to timeout seconds.
+
+        A queued task is run inline only if the timeout has not expired yet
+        (see module docstring).
+
+        Raises:
+            TimeoutError: If the task did not finish in time
+            Exception: Whatever the agent raised while processing the task
+        """
+        deadline = _deadline(timeout)
+        self._help(deadline)
+        return self._future.result(_remaining(deadline))
+
+    def exception(self, timeout: float | None = None) -> BaseException | None:
+        """Return the exception raised by the task (None on success)."""
+        deadline = _deadline(timeout)
+        self._help(deadline)
+        return self._future.exception(_remaining(deadline))
+
+    def add_done_callback(self, fn: Callable[["TaskFuture"], Any]) -> None:
+        """
+        Call fn(future) when the task finishes.
+
+        Called immediately if the task already finished. Exceptions raised by
+        fn are logged and ignored (concurrent.futures semantics).
+        """
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def __await__(self):
+        if not self.done():
+            # Agents are synchronous: run (or wait for) the task off the event loop
+            yield from asyncio.get_running_loop().run_in_executor(None, self._help).__await__()
+            yield from asyncio.wrap_future(self._future).__await__()
+        return self._future.result()
+
+    # ========================================================================
+    # KERNEL SIDE
+    # ========================================================================
+
+    def set_result(self, result: Any) -> None:
+        """Resolve the future (called by the kernel)."""
+        if not self._future.done():
+            self._future.set_result(result)
+
+    def set_exception(self, exc: BaseException) -> None:
+        """Fail the future (called by the kernel)."""
+        if not self._future.done():
+            self._future.set_exception(exc)
+
+    def _help(self, deadline: float | None = None) -> None:
+        """Run the task inline if it is still queued and the deadline has not passed."""
+        if self._runner is None or self._future.done():
+            return
+        if deadline is not None and time.monotonic() >= deadline:
+            return
+        self._runner(self.task_id)
+
+
+def wait_all(futures: Iterable[TaskFuture], timeout: float | None = None) -> list[Any]:
+    """
+    Wait for all futures and return their results in submission order.
+
+    Raises:
+        TimeoutError: If not all tasks finished within timeout seconds
+        Exception: The first failure, in submission order
+    """
+    futures = list(futures)
+    deadline = _deadline(timeout)
+    results = []
+    for future in futures:
+        # Past the deadline, queued tasks are no longer started inline
+        future._help(deadline)
+        results.append(future._future.result(_remaining(deadline)))
+    return results
+
+
+def as_completed(
+    futures: Iterable[TaskFuture], timeout: float | None = None
+) -> Iterator[TaskFuture]:
+    """
+    Yield futures as they finish.
+
+    Already finished futures are yielded first; queued tasks are then run
+    inline one at a time, and tasks executing elsewhere are waited for.
+
+    Raises:
+        TimeoutError: If the remaining tasks did not finish within timeout seconds
+    """
+    deadline = _deadline(timeout)
+    pending = list(dict.fromkeys(futures))
+
+    while pending:
+        finished = [f for f in pending if f.done()]
+        if not finished:
+            for future in pending:
+                future._help(deadline)
+                if future.done():
+                    break
+            else:
+                done, _ = concurrent.futures.wait(
+                    [f._future for f in pending],
+                    timeout=_remaining(deadline),
+                    return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                if not done:
+                    raise TimeoutError(f"{len(pending)} task(s) still pending")
+            continue
+
+        for future in finished:
+            pending.remove(future)
+            yield future
+
+        if deadline is not None and pending and time.monotonic() > deadline:
+            raise TimeoutError(f"{len(pending)} task(s) still pending")
+
+
+def _deadline(timeout: float | None) -> float | None:
+    return None if timeout is None else time.monotonic() + timeout
+
+
+def _remaining(deadline: float | None) -> float | None:
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
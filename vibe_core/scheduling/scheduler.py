@@ -5,6 +5,7 @@ This module implements the minimal FIFO scheduler (ARCH-021),
 which serves as the heartbeat for task distribution across agents.
 """
 
+import threading
 import uuid
 from collections import deque
 from dataclasses import dataclass, field
@@ -18,7 +19,7 @@ class Task:
 
     Attributes:
         id: Unique identifier for the task (auto-generated if not provided)
-        priority: Priority level (for future priority queue support)
+        priority: Priority level (higher runs first; equal priorities stay FIFO)
         agent_id: Identifier of the agent that submitted the task
         payload: The actual task data/instructions
     """
@@ -38,7 +39,8 @@ class VibeScheduler:
     agents and distributes them one by one in the order received.
 
     Design Principles:
-    - Simple FIFO queue (no priority yet, but Task has priority field for future)
+    - Simple FIFO queue; a task with a higher priority is queued ahead of
+      lower-priority tasks (all tasks default to priority 0 = plain FIFO)
     - Thread-safe operations (using deque)
     - Minimal dependencies (pure Python)
     - Clear task lifecycle tracking
@@ -47,6 +49,7 @@ class VibeScheduler:
     def __init__(self):
         """Initialize an empty task queue."""
         self._queue: deque[Task] = deque()
+        self._lock = threading.Lock()
 
     def submit_task(self, task: Task) -> str:
         """
@@ -63,7 +66,12 @@ class VibeScheduler:
             >>> task = Task(agent_id="agent-1", payload={"action": "compile"})
             >>> task_id = scheduler.submit_task(task)
         """
-        self._queue.append(task)
+        with self._lock:
+            # Insert behind every task of equal or higher priority (stable)
+            position = len(self._queue)
+            while position and self._queue[position - 1].priority < task.priority:
+                position -= 1
+            self._queue.insert(position, task)
         return task.id
 
     def next_task(self) -> Task | None:
@@ -80,10 +88,31 @@ class VibeScheduler:
             >>> next_task = scheduler.next_task()
             >>> print(next_task.agent_id)  # "agent-1"
         """
-        try:
-            return self._queue.popleft()
-        except IndexError:
-            return None
+        with self._lock:
+            try:
+                return self._queue.popleft()
+            except IndexError:
+                return None
+
+    def take_task(self, task_id: str) -> Task | None:
+        """
+        Remove a specific task from the queue, regardless of its position.
+
+        Used when a caller waits on one task and runs it directly instead of
+        draining the tasks queued ahead of it.
+
+        Args:
+            task_id: ID of the task to remove
+
+        Returns:
+            Task | None: The task, or None if it is no longer queued
+        """
+        with self._lock:
+            for task in self._queue:
+                if task.id == task_id:
+                    self._queue.remove(task)
+                    return task
+        return None
 
     def get_queue_status(self) -> dict:
         """
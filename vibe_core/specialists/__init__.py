@@ -12,9 +12,28 @@ Classes:
   - KnowledgeResult: Result of knowledge base queries
 """
 
-from .base_agent import BaseAgent, ExecutionResult, KnowledgeResult
-from .base_specialist import BaseSpecialist, MissionContext, SpecialistResult
-from .registry import AgentRegistry
+from typing import TYPE_CHECKING
+
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base_agent import BaseAgent, ExecutionResult, KnowledgeResult
+    from .base_specialist import BaseSpecialist, MissionContext, SpecialistResult
+    from .registry import AgentRegistry
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BaseAgent": ".base_agent",
+        "ExecutionResult": ".base_agent",
+        "KnowledgeResult": ".base_agent",
+        "BaseSpecialist": ".base_specialist",
+        "MissionContext": ".base_specialist",
+        "SpecialistResult": ".base_specialist",
+        "AgentRegistry": ".registry",
+    },
+)
 
 __all__ = [
     "AgentRegistry",
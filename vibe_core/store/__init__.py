@@ -1,5 +1,22 @@
 """Persistence layer for vibe-agency"""
 
-from .sqlite_store import SQLiteStore
+from typing import TYPE_CHECKING
 
-__all__ = ["SQLiteStore"]
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .agenda_store import AgendaStore, AgendaTask, get_agenda_store
+    from .sqlite_store import SQLiteStore
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AgendaStore": ".agenda_store",
+        "AgendaTask": ".agenda_store",
+        "get_agenda_store": ".agenda_store",
+        "SQLiteStore": ".sqlite_store",
+    },
+)
+
+__all__ = ["AgendaStore", "AgendaTask", "SQLiteStore", "get_agenda_store"]
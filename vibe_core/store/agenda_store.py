@@ -0,0 +1,449 @@
+"""
+Indexed agenda/backlog store (ARCH-045)
+
+SQLite table `agenda_tasks` is the source of truth for the agenda system.
+workspace/BACKLOG.md is a rendered, human-editable view of it:
+
+- Every mutation re-renders BACKLOG.md from the table
+- Hand edits are detected by file stat (mtime_ns, size, inode) and
+  merged into the table before the next query (unchanged tasks keep their
+  id and timestamps)
+- A deleted BACKLOG.md is re-rendered from the table, never imported as empty
+
+Priority-ordered queries (top-N, counts) are index lookups on
+(status, priority_rank, position) instead of full-file parses.
+
+Usage:
+    store = AgendaStore(Path("."))
+    store.add_task("Fix Phoenix Config", "HIGH")
+    store.top_pending(5, priorities=("HIGH", "MEDIUM"))
+    store.complete_task("phoenix")
+"""
+
+import os
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+PRIORITIES = ("HIGH", "MEDIUM", "LOW")
+_PRIORITY_RANK = {p: i for i, p in enumerate(PRIORITIES)}
+_UNTAGGED_RANK = len(PRIORITIES)
+
+OUTSTANDING_HEADER = "## Outstanding Tasks"
+COMPLETED_HEADER = "## Completed Tasks"
+
+_TASK_LINE = re.compile(r"^- \[([ xX])\]\s?(?:\[(HIGH|MEDIUM|LOW)\]\s*)?(.*)$")
+
+
+class BacklogFormatError(ValueError):
+    """BACKLOG.md is missing the Outstanding/Completed sections."""
+
+
+@dataclass
+class AgendaTask:
+    """One agenda entry."""
+
+    id: int
+    description: str
+    priority: str | None
+    status: str  # 'pending' | 'completed'
+    created_at: str | None = None
+    completed_at: str | None = None
+
+    @property
+    def text(self) -> str:
+        """Task text after the checkbox, e.g. "[HIGH] Fix Phoenix Config"."""
+        if self.priority:
+            return f"[{self.priority}] {self.description}"
+        return self.description
+
+    def to_markdown(self) -> str:
+        box = "x" if self.status == "completed" else " "
+        return f"- [{box}] {self.text}"
+
+
+class AgendaStore:
+    """SQLite-backed agenda with BACKLOG.md as a synchronized view."""
+
+    def __init__(self, root: Path, db_path: Path | None = None):
+        """
+        Args:
+            root: Project root (contains workspace/BACKLOG.md)
+            db_path: SQLite file (default: <root>/.vibe/state/agenda.db).
+                     Use ":memory:" for ephemeral testing.
+        """
+        self.root = Path(root)
+        self.backlog_path = self.root / "workspace" / "BACKLOG.md"
+        if db_path is None:
+            db_path = self.root / ".vibe" / "state" / "agenda.db"
+        if str(db_path) != ":memory:":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self._ensure_schema()
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    # ========================================================================
+    # SCHEMA
+    # ========================================================================
+
+    def _ensure_schema(self):
+        with self._lock:
+            self.conn.executescript("""
+                CREATE TABLE IF NOT EXISTS agenda_tasks (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    description TEXT NOT NULL,
+                    priority TEXT,
+                    priority_rank INTEGER NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    position INTEGER NOT NULL,
+                    created_at TEXT,
+                    completed_at TEXT,
+                    CHECK (status IN ('pending', 'completed'))
+                );
+                CREATE INDEX IF NOT EXISTS idx_agenda_status_priority
+                    ON agenda_tasks(status, priority_rank, position);
+                CREATE INDEX IF NOT EXISTS idx_agenda_status_position
+                    ON agenda_tasks(status, position);
+                CREATE TABLE IF NOT EXISTS agenda_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                );
+            """)
+            self.conn.commit()
+
+    def _get_meta(self, key: str) -> str | None:
+        row = self.conn.execute("SELECT value FROM agenda_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str | None):
+        self.conn.execute(
+            "INSERT INTO agenda_meta (key, value) VALUES (?, ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (key, value),
+        )
+
+    # ========================================================================
+    # BACKLOG.md SYNC
+    # ========================================================================
+
+    def _backlog_stat(self) -> str | None:
+        try:
+            st = os.stat(self.backlog_path)
+        except FileNotFoundError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}:{st.st_ino}"
+
+    def sync(self) -> bool:
+        """
+        Merge hand edits of BACKLOG.md if it changed since we last rendered/imported it.
+
+        A missing BACKLOG.md is only a missing view: it is re-rendered from
+        the table, and the table is left untouched.
+
+        Returns:
+            True if a re-import happened
+
+        Raises:
+            BacklogFormatError: If an existing BACKLOG.md has no task sections
+        """
+        with self._lock:
+            current = self._backlog_stat()
+            if current == self._get_meta("backlog_stat"):
+                return False
+
+            if current is None:
+                if self._has_tasks():
+                    self.render()
+                return False
+
+            content = self.backlog_path.read_text(encoding="utf-8")
+            self._import_markdown(content)
+            self._set_meta("backlog_stat", current)
+            self.conn.commit()
+            return True
+
+    def _has_tasks(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM agenda_tasks LIMIT 1").fetchone() is not None
+
+    def _import_markdown(self, content: str):
+        """Merge the tasks parsed from BACKLOG.md text into the table."""
+        outstanding_idx = content.find(OUTSTANDING_HEADER)
+        completed_idx = content.find(COMPLETED_HEADER)
+        if outstanding_idx == -1 or completed_idx == -1:
+            self.conn.rollback()
+            raise BacklogFormatError(
+                "Invalid BACKLOG.md format: missing Outstanding/Completed sections"
+            )
+        preamble = content[:outstanding_idx]
+        outstanding = content[outstanding_idx + len(OUTSTANDING_HEADER) : completed_idx]
+        completed = content[completed_idx + len(COMPLETED_HEADER) :]
+
+        outstanding_notes, outstanding_rows = self._parse_section(outstanding)
+        completed_notes, completed_rows = self._parse_section(completed)
+        self._merge_rows(outstanding_rows + completed_rows)
+
+        # Keep hand-written, non-task text so re-rendering doesn't drop it
+        self._set_meta("preamble", preamble)
+        self._set_meta("outstanding_notes", outstanding_notes)
+        self._set_meta("completed_notes", completed_notes)
+
+    @staticmethod
+    def _parse_section(section: str) -> tuple[str, list[tuple[str, str | None, str, int]]]:
+        """Split a section into its non-task lines and (description, priority, status, position)."""
+        notes = []
+        rows = []
+        for position, raw in enumerate(section.split("\n")):
+            line = raw.strip()
+            match = _TASK_LINE.match(line)
+            if not match:
+                if line:
+                    notes.append(line)
+                continue
+            box, priority, description = match.groups()
+            rows.append(
+                (description.strip(), priority, "pending" if box == " " else "completed", position)
+            )
+        return "\n".join(notes), rows
+
+    def _merge_rows(self, parsed: list[tuple[str, str | None, str, int]]):
+        """
+        Apply parsed BACKLOG.md tasks to the table.
+
+        Tasks are matched to existing rows by description, so re-prioritized,
+        re-ordered or checked-off tasks keep their id and created_at. Rows
+        whose task was removed from the file are deleted; new lines are inserted.
+        """
+        existing: dict[str, list[sqlite3.Row]] = {}
+        for row in self.conn.execute("SELECT * FROM agenda_tasks ORDER BY status, position, id"):
+            existing.setdefault(row["description"], []).append(row)
+
+        now = datetime.now().isoformat()
+        matched: set[int] = set()
+        for description, priority, status, position in parsed:
+            candidates = existing.get(description, [])
+            # Prefer a row in the same state, then any row with this description
+            row = next(
+                (r for r in candidates if r["status"] == status and r["id"] not in matched),
+                next((r for r in candidates if r["id"] not in matched), None),
+            )
+            rank = _PRIORITY_RANK.get(priority, _UNTAGGED_RANK)
+            if row is None:
+                self.conn.execute(
+                    "INSERT INTO agenda_tasks "
+                    "(description, priority, priority_rank, status, position, created_at, "
+                    "completed_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        description,
+                        priority,
+                        rank,
+                        status,
+                        position,
+                        now,
+                        now if status == "completed" else None,
+                    ),
+                )
+                continue
+
+            matched.add(row["id"])
+            completed_at = (row["completed_at"] or now) if status == "completed" else None
+            self.conn.execute(
+                "UPDATE agenda_tasks SET priority = ?, priority_rank = ?, status = ?, "
+                "position = ?, completed_at = ? WHERE id = ?",
+                (priority, rank, status, position, completed_at, row["id"]),
+            )
+
+        removed = [(r["id"],) for rows in existing.values() for r in rows if r["id"] not in matched]
+        self.conn.executemany("DELETE FROM agenda_tasks WHERE id = ?", removed)
+
+    def render(self):
+        """Write BACKLOG.md from the table and remember its stat for change detection."""
+        with self._lock:
+            preamble = self._get_meta("preamble") or "# VIBE AGENCY BACKLOG\n\n"
+            outstanding_notes = self._get_meta("outstanding_notes") or ""
+            completed_notes = self._get_meta("completed_notes")
+            if completed_notes is None:
+                completed_notes = "*(Archive of completed work)*"
+
+            parts = [preamble, OUTSTANDING_HEADER, "\n\n"]
+            if outstanding_notes:
+                parts.append(outstanding_notes + "\n")
+            for task in self.list_tasks("pending", _synced=True):
+                parts.append(task.to_markdown() + "\n")
+            parts.append("\n" + COMPLETED_HEADER + "\n\n")
+            if completed_notes:
+                parts.append(completed_notes + "\n")
+            for task in self.list_tasks("completed", _synced=True):
+                parts.append(task.to_markdown() + "\n")
+
+            self.backlog_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.backlog_path.with_suffix(".md.tmp")
+            tmp_path.write_text("".join(parts), encoding="utf-8")
+            tmp_path.replace(self.backlog_path)
+
+            self._set_meta("backlog_stat", self._backlog_stat())
+            self.conn.commit()
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def _row_to_task(self, row: sqlite3.Row) -> AgendaTask:
+        return AgendaTask(
+            id=row["id"],
+            description=row["description"],
+            priority=row["priority"],
+            status=row["status"],
+            created_at=row["created_at"],
+            completed_at=row["completed_at"],
+        )
+
+    def list_tasks(self, status: str = "pending", _synced: bool = False) -> list[AgendaTask]:
+        """All tasks with the given status, in BACKLOG.md order."""
+        with self._lock:
+            if not _synced:
+                self.sync()
+            rows = self.conn.execute(
+                "SELECT * FROM agenda_tasks WHERE status = ? ORDER BY position, id", (status,)
+            ).fetchall()
+            return [self._row_to_task(r) for r in rows]
+
+    def top_pending(self, limit: int, priorities: tuple[str, ...] = PRIORITIES) -> list[AgendaTask]:
+        """Highest-priority pending tasks (priority, then BACKLOG.md order)."""
+        with self._lock:
+            self.sync()
+            ranks = [_PRIORITY_RANK[p] for p in priorities]
+            placeholders = ", ".join("?" for _ in ranks)
+            rows = self.conn.execute(
+                f"SELECT * FROM agenda_tasks WHERE status = 'pending' "  # noqa: S608
+                f"AND priority_rank IN ({placeholders}) "
+                "ORDER BY priority_rank, position, id LIMIT ?",
+                (*ranks, limit),
+            ).fetchall()
+            return [self._row_to_task(r) for r in rows]
+
+    def is_empty(self) -> bool:
+        """True if the agenda holds no tasks at all (pending or completed)."""
+        with self._lock:
+            self.sync()
+            return not self._has_tasks()
+
+    def pending_counts(self) -> dict[str, int]:
+        """Pending task counts per priority tag, plus "total" (tagged tasks only)."""
+        with self._lock:
+            self.sync()
+            counts = dict.fromkeys(PRIORITIES, 0)
+            for row in self.conn.execute(
+                "SELECT priority, COUNT(*) FROM agenda_tasks "
+                "WHERE status = 'pending' AND priority IS NOT NULL GROUP BY priority"
+            ):
+                counts[row[0]] = row[1]
+            counts["total"] = sum(counts[p] for p in PRIORITIES)
+            return counts
+
+    # ========================================================================
+    # MUTATIONS
+    # ========================================================================
+
+    def add_task(self, description: str, priority: str = "MEDIUM") -> AgendaTask:
+        """Append a pending task and re-render BACKLOG.md."""
+        priority = priority.upper()
+        if priority not in _PRIORITY_RANK:
+            raise ValueError(f"priority must be one of {list(PRIORITIES)}, got {priority}")
+
+        with self._lock:
+            self.sync()
+            position = self.conn.execute(
+                "SELECT COALESCE(MAX(position), -1) + 1 FROM agenda_tasks WHERE status = 'pending'"
+            ).fetchone()[0]
+            cursor = self.conn.execute(
+                "INSERT INTO agenda_tasks "
+                "(description, priority, priority_rank, status, position, created_at) "
+                "VALUES (?, ?, ?, 'pending', ?, ?)",
+                (
+                    description,
+                    priority,
+                    _PRIORITY_RANK[priority],
+                    position,
+                    datetime.now().isoformat(),
+                ),
+            )
+            task_id = cursor.lastrowid
+            self.render()
+            row = self.conn.execute(
+                "SELECT * FROM agenda_tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+            return self._row_to_task(row)
+
+    def complete_task(self, search_term: str) -> AgendaTask | None:
+        """
+        Complete the first pending task whose text contains search_term (case-insensitive).
+
+        The task moves to the top of the Completed section.
+
+        Returns:
+            The completed task, or None if nothing matched
+        """
+        term = search_term.strip().lower()
+        with self._lock:
+            self.sync()
+            match = None
+            for task in self.list_tasks("pending", _synced=True):
+                if term in task.to_markdown().lower():
+                    match = task
+                    break
+            if match is None:
+                return None
+
+            position = self.conn.execute(
+                "SELECT COALESCE(MIN(position), 1) - 1 FROM agenda_tasks WHERE status = 'completed'"
+            ).fetchone()[0]
+            completed_at = datetime.now().isoformat()
+            self.conn.execute(
+                "UPDATE agenda_tasks SET status = 'completed', position = ?, completed_at = ? "
+                "WHERE id = ?",
+                (position, completed_at, match.id),
+            )
+            self.render()
+            match.status = "completed"
+            match.completed_at = completed_at
+            return match
+
+
+def agenda_exists(root: Path) -> bool:
+    """True if the project has an agenda (BACKLOG.md or the default agenda database)."""
+    root = Path(root)
+    return (root / "workspace" / "BACKLOG.md").exists() or (
+        root / ".vibe" / "state" / "agenda.db"
+    ).exists()
+
+
+_stores: dict[str, AgendaStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_agenda_store(root: Path) -> AgendaStore:
+    """Shared AgendaStore per project root (one connection per process)."""
+    root = Path(root).resolve()
+    key = str(root)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None or store.conn is None:
+            store = AgendaStore(root)
+            _stores[key] = store
+        return store
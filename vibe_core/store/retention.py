@@ -0,0 +1,313 @@
+"""
+Retention and cold-storage rollover for history tables.
+
+The ledger's task_history and the SQLiteStore tables tool_calls, decisions
+and session_narrative only ever grow. An Archiver keeps `hot_days` of rows
+in the live database and rolls older rows into gzip-compressed JSONL
+partitions, one file per table and day:
+
+    <archive_dir>/<table>/<YYYY-MM-DD>.jsonl.gz
+
+Rows are appended to their partition before they are deleted, in batches
+small enough to run from the kernel's idle ticks. A crash in between can
+duplicate a row in the archive but never lose one; readers de-duplicate by
+key. New databases are created with auto_vacuum=INCREMENTAL so freed pages
+go back to the filesystem a few at a time instead of through a full VACUUM;
+existing databases are only converted (one full VACUUM) when the policy
+opts in with convert_existing.
+
+Archived rows keep their live column values (JSON columns stay encoded),
+so callers decode them exactly like live rows.
+
+Example:
+    >>> archiver = Archiver(conn, "data/vibe.db", LEDGER_TABLES, RetentionPolicy(hot_days=30))
+    >>> archiver.housekeep()
+    {'archived': {'task_history': 120}, 'vacuumed_pages': 64}
+    >>> old = list(archiver.iter_archived("task_history", since="2024-01-01"))
+"""
+
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from vibe_core.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+# Days of history kept in the live database by default
+DEFAULT_HOT_DAYS = 30
+
+# Rows moved per table in one housekeeping pass (keeps idle ticks short)
+DEFAULT_BATCH_SIZE = 500
+
+# Free pages returned to the filesystem per housekeeping pass
+DEFAULT_VACUUM_PAGES = 256
+
+# Partition for rows whose time column is not an ISO 8601 date
+UNDATED_PARTITION = "undated"
+
+ARCHIVED_ROWS = get_registry().counter(
+    "vibe_archive_rows_total", "History rows rolled into cold storage", ("table",)
+)
+
+
+@dataclass(frozen=True)
+class ArchivedTable:
+    """A history table that can be rolled into the archive."""
+
+    name: str
+    key: str  # Unique column used to de-duplicate archived rows
+    time_column: str  # ISO 8601 timestamp; its date picks the partition
+
+
+LEDGER_TABLES = (ArchivedTable("task_history", "task_id", "timestamp"),)
+
+STORE_TABLES = (
+    ArchivedTable("tool_calls", "id", "timestamp"),
+    ArchivedTable("decisions", "id", "timestamp"),
+    ArchivedTable("session_narrative", "id", "date"),
+)
+
+
+@dataclass
+class RetentionPolicy:
+    """How much history stays hot and how much work one pass may do."""
+
+    hot_days: int = DEFAULT_HOT_DAYS
+    archive_dir: Path | str | None = None  # None = "archive" next to the database
+    batch_size: int = DEFAULT_BATCH_SIZE
+    vacuum_pages: int = DEFAULT_VACUUM_PAGES
+    # Convert a database created without auto_vacuum=INCREMENTAL with one
+    # full VACUUM (blocks the connection for the whole rewrite)
+    convert_existing: bool = False
+
+
+def enable_incremental_vacuum(conn: sqlite3.Connection) -> bool:
+    """
+    Request auto_vacuum=INCREMENTAL on a connection.
+
+    Takes effect immediately on a new database (call it before creating
+    tables or switching to WAL); an existing database needs one VACUUM,
+    which Archiver.housekeep() runs only if the policy sets convert_existing.
+
+    Returns:
+        bool: True if incremental auto-vacuum is already in effect
+    """
+    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+    return conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+
+
+class Archiver:
+    """
+    Rolls old rows of history tables into date-partitioned JSONL.gz files.
+
+    Without a policy nothing is rolled over, but existing partitions stay
+    readable and housekeep() still runs incremental vacuum.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        db_path: str,
+        tables: tuple[ArchivedTable, ...],
+        policy: RetentionPolicy | None = None,
+        lock: AbstractContextManager | None = None,  # e.g. the owner's RLock
+    ):
+        self.conn = conn
+        self.tables = {table.name: table for table in tables}
+        self.policy = policy
+        self._lock = lock or threading.RLock()
+
+        if policy is not None and policy.archive_dir is not None:
+            self.archive_dir: Path | None = Path(policy.archive_dir)
+        elif db_path != ":memory:":
+            self.archive_dir = Path(db_path).parent / "archive"
+        else:
+            self.archive_dir = None  # In-memory database without an archive_dir
+
+    def roll_over(self, now: datetime | None = None) -> dict[str, int]:
+        """
+        Move up to policy.batch_size rows per table older than hot_days.
+
+        Args:
+            now: Reference time (default: utcnow)
+
+        Returns:
+            Rows archived per table (tables with nothing to move are omitted)
+        """
+        if self.policy is None or self.archive_dir is None:
+            return {}
+        cutoff = ((now or datetime.utcnow()) - timedelta(days=self.policy.hot_days)).isoformat()
+
+        archived = {}
+        for table in self.tables.values():
+            moved = self._roll_over_table(table, cutoff)
+            if moved:
+                archived[table.name] = moved
+                ARCHIVED_ROWS.labels(table.name).inc(moved)
+        return archived
+
+    def incremental_vacuum(self, pages: int | None = None) -> int:
+        """
+        Return up to `pages` free pages to the filesystem.
+
+        A database that is not in incremental mode yet releases nothing,
+        unless the policy sets convert_existing: then it is converted with
+        a one-time VACUUM instead.
+
+        Returns:
+            int: Number of free pages released
+        """
+        pages = pages if pages is not None else self._vacuum_pages
+        with self._lock:
+            if self.conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                if self.policy is None or not self.policy.convert_existing:
+                    return 0
+                self.conn.commit()  # VACUUM can't run in a transaction
+                before = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+                logger.info("RETENTION: Converting database to auto_vacuum=INCREMENTAL")
+                self.conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                self.conn.execute("VACUUM")
+                return before
+            self.conn.commit()  # incremental_vacuum can't run in a transaction
+            before = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+            self.conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+            after = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+            return before - after
+
+    def housekeep(self, now: datetime | None = None) -> dict[str, Any]:
+        """Roll over old rows, then release free pages (one bounded pass)."""
+        archived = self.roll_over(now)
+        return {"archived": archived, "vacuumed_pages": self.incremental_vacuum()}
+
+    def partitions(self, table: str) -> list[tuple[str, Path]]:
+        """Archive partitions of a table as (day, path), oldest first."""
+        if self.archive_dir is None:
+            return []
+        table_dir = self.archive_dir / table
+        if not table_dir.is_dir():
+            return []
+        return sorted(
+            (path.name.removesuffix(".jsonl.gz"), path) for path in table_dir.glob("*.jsonl.gz")
+        )
+
+    def iter_archived(
+        self,
+        table: str,
+        since: str | None = None,
+        until: str | None = None,
+        where: Callable[[dict[str, Any]], bool] | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream archived rows of a table, partition by partition.
+
+        Args:
+            table: Table name (must be one of this archiver's tables)
+            since: Only partitions on or after this ISO date/timestamp
+            until: Only partitions on or before this ISO date/timestamp
+            where: Row filter applied after decoding
+            newest_first: Walk partitions (and rows within them) newest first
+
+        Yields:
+            Row dicts with the same columns as the live table
+
+        Notes:
+            - Duplicates (a crash between archive write and delete) are
+              dropped within a partition and against the partition walked
+              just before it, so memory stays bounded by two partitions' keys
+        """
+        spec = self.tables[table]
+        partitions = [
+            (day, path)
+            for day, path in self.partitions(table)
+            if day == UNDATED_PARTITION
+            or ((since is None or day >= since[:10]) and (until is None or day <= until[:10]))
+        ]
+        if newest_first:
+            partitions.reverse()
+
+        previous: set[Any] = set()
+        for _day, path in partitions:
+            rows = self._read_partition(path)
+            if newest_first:
+                rows.sort(key=lambda row: row.get(spec.time_column) or "", reverse=True)
+            seen: set[Any] = set()
+            for row in rows:
+                key = row.get(spec.key)
+                if key in seen or key in previous:
+                    continue
+                seen.add(key)
+                if where is None or where(row):
+                    yield row
+            previous = seen
+
+    @property
+    def _vacuum_pages(self) -> int:
+        return self.policy.vacuum_pages if self.policy is not None else DEFAULT_VACUUM_PAGES
+
+    def _roll_over_table(self, table: ArchivedTable, cutoff: str) -> int:
+        with self._lock:
+            cursor = self.conn.execute(
+                f"SELECT * FROM {table.name} WHERE {table.time_column} < ? "  # noqa: S608
+                f"ORDER BY {table.time_column} LIMIT ?",
+                (cutoff, self.policy.batch_size),
+            )
+            columns = [column[0] for column in cursor.description]
+            rows = [dict(zip(columns, row, strict=True)) for row in cursor.fetchall()]
+            if not rows:
+                return 0
+
+            by_day: dict[str, list[dict[str, Any]]] = {}
+            for row in rows:
+                by_day.setdefault(_partition_of(row[table.time_column]), []).append(row)
+            # Archive first: a failed write leaves the rows in the live table
+            for day, day_rows in by_day.items():
+                self._append_partition(table.name, day, day_rows)
+
+            with self.conn:
+                self.conn.executemany(
+                    f"DELETE FROM {table.name} WHERE {table.key} = ?",  # noqa: S608
+                    [(row[table.key],) for row in rows],
+                )
+        logger.debug(f"RETENTION: Archived {len(rows)} row(s) from {table.name}")
+        return len(rows)
+
+    def _append_partition(self, table: str, day: str, rows: list[dict[str, Any]]) -> None:
+        path = self.archive_dir / table / f"{day}.jsonl.gz"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = "".join(json.dumps(row, default=str) + "\n" for row in rows).encode("utf-8")
+        # Each append is its own gzip member; gzip readers concatenate them
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as gz:
+                gz.write(data)
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    def _read_partition(self, path: Path) -> list[dict[str, Any]]:
+        rows = []
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        rows.append(json.loads(line))
+        except (OSError, EOFError, json.JSONDecodeError) as e:
+            # A torn final member (crash mid-append) keeps the rows read so far
+            logger.warning(f"RETENTION: Partition {path} is truncated or corrupt: {e}")
+        return rows
+
+
+def _partition_of(value: Any) -> str:
+    try:
+        return date.fromisoformat(str(value)[:10]).isoformat()
+    except ValueError:
+        return UNDATED_PARTITION
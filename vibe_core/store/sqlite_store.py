@@ -12,14 +12,27 @@ Implements ARCH-002: SQLiteStore class with CRUD operations for:
 Schema: docs/tasks/ARCH-001_schema.sql (v2)
 """
 
+import itertools
 import json
 import os
 import sqlite3
 import threading
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from vibe_core.metrics import connect_metered
+from vibe_core.store.retention import (
+    STORE_TABLES,
+    Archiver,
+    RetentionPolicy,
+    enable_incremental_vacuum,
+)
+
+# Rows fetched per round-trip by the streaming iter_* readers
+DEFAULT_FETCH_BATCH_SIZE = 500
+
 
 class SQLiteStore:
     """
@@ -31,6 +44,7 @@ class SQLiteStore:
     - Thread-safe (check_same_thread=False)
     - Context manager support (with statement)
     - Row factory for dict-like access
+    - Optional retention (old tool calls, decisions and narrative are archived)
 
     Usage:
         # Production (persistent database)
@@ -43,7 +57,7 @@ class SQLiteStore:
             # Test code here...
     """
 
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, retention: RetentionPolicy | None = None):
         """
         Initialize SQLiteStore
 
@@ -51,6 +65,9 @@ class SQLiteStore:
             db_path: Path to SQLite database file (REQUIRED).
                      Use ":memory:" for ephemeral testing.
                      Use ".vibe/state/vibe_agency.db" for production.
+            retention: Keep this many days of tool calls, decisions and
+                       session narrative hot and archive the rest
+                       (None = keep everything live)
 
         Raises:
             ValueError: If db_path is None or empty string
@@ -77,8 +94,9 @@ class SQLiteStore:
             os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
 
         # Connect to database (creates file if not exists)
-        self.conn = sqlite3.connect(
+        self.conn = connect_metered(
             db_path,
+            "sqlite_store",  # Statement latency -> vibe_sqlite_query_seconds
             check_same_thread=False,  # Thread-safe
             isolation_level="DEFERRED",  # Use transactions for thread-safety
         )
@@ -89,6 +107,9 @@ class SQLiteStore:
         # Enable foreign key constraints (required for CASCADE DELETE)
         self.conn.execute("PRAGMA foreign_keys = ON")
 
+        # Incremental auto-vacuum must be requested before WAL (new databases)
+        enable_incremental_vacuum(self.conn)
+
         # Enable WAL mode for better concurrency (prevents database locks in tests)
         # WAL (Write-Ahead Logging) allows concurrent reads while writing
         if db_path != ":memory:":  # WAL not supported for :memory: databases
@@ -103,6 +124,8 @@ class SQLiteStore:
         if not tables_exist:
             self._load_schema()
 
+        self.archiver = Archiver(self.conn, db_path, STORE_TABLES, retention, lock=self._lock)
+
     def _load_schema(self):
         """
         Load schema from ARCH-001_schema.sql
@@ -129,6 +152,17 @@ class SQLiteStore:
             self.conn.executescript(schema_sql)
             self.conn.commit()
 
+    def housekeep(self) -> dict[str, Any]:
+        """
+        Run one bounded retention pass: archive old rows, release free pages.
+
+        Register it with VibeKernel.add_housekeeping() to run on idle ticks.
+
+        Returns:
+            Summary from Archiver.housekeep()
+        """
+        return self.archiver.housekeep()
+
     def _commit(self):
         """Commit transaction (for thread-safe writes)"""
         if self.conn:
@@ -148,6 +182,33 @@ class SQLiteStore:
         """Context manager exit (auto-close connection)"""
         self.close()
 
+    def _iter_query(
+        self, sql: str, params: tuple = (), batch_size: int = DEFAULT_FETCH_BATCH_SIZE
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Stream rows for a query using fetchmany().
+
+        Only one batch is held in memory at a time, so callers can walk
+        arbitrarily large tables (exports, migrations) with flat memory.
+
+        Args:
+            sql: SELECT statement
+            params: Query parameters
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            sqlite3.Row objects
+        """
+        cursor = self.conn.execute(sql, params)
+        try:
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            cursor.close()
+
     # ========================================================================
     # MISSION CRUD
     # ========================================================================
@@ -380,13 +441,27 @@ class SQLiteStore:
         Returns:
             List of mission dicts, ordered by created_at DESC
         """
-        cursor = self.conn.execute("SELECT * FROM missions ORDER BY created_at DESC")
-        return [self._parse_mission_row(row) for row in cursor.fetchall()]
+        return list(self.iter_missions())
 
     def get_all_missions(self) -> list[dict[str, Any]]:
         """Alias for get_mission_history()"""
         return self.get_mission_history()
 
+    def iter_missions(self, batch_size: int = DEFAULT_FETCH_BATCH_SIZE) -> Iterator[dict[str, Any]]:
+        """
+        Stream all missions without materializing the full history.
+
+        Args:
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Mission dicts, ordered by created_at DESC
+        """
+        for row in self._iter_query(
+            "SELECT * FROM missions ORDER BY created_at DESC", batch_size=batch_size
+        ):
+            yield self._parse_mission_row(row)
+
     def delete_mission(self, mission_id: int):
         """
         Delete mission (CASCADE DELETE removes related records)
@@ -546,29 +621,59 @@ class SQLiteStore:
             tool_call["result"] = json.loads(tool_call["result"])
         return tool_call
 
-    def get_tool_calls_for_mission(self, mission_id: int) -> list[dict[str, Any]]:
+    def get_tool_calls_for_mission(
+        self, mission_id: int, include_archived: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Get all tool calls for a mission
 
         Args:
             mission_id: Parent mission ID
+            include_archived: Also return calls rolled into the archive
 
         Returns:
             List of tool call dicts, ordered by timestamp
         """
-        cursor = self.conn.execute(
-            "SELECT * FROM tool_calls WHERE mission_id = ? ORDER BY timestamp",
-            (mission_id,),
-        )
-        tool_calls = []
-        for row in cursor.fetchall():
+        return list(self.iter_tool_calls(mission_id, include_archived=include_archived))
+
+    def iter_tool_calls(
+        self,
+        mission_id: int | None = None,
+        batch_size: int = DEFAULT_FETCH_BATCH_SIZE,
+        include_archived: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream tool calls (optionally for one mission) in batches.
+
+        Args:
+            mission_id: Parent mission ID (None = all missions)
+            batch_size: Rows fetched per round-trip
+            include_archived: Start with calls rolled into the archive (older
+                              than every live row)
+
+        Yields:
+            Tool call dicts with JSON fields deserialized, ordered by timestamp
+        """
+        archived: Iterator[dict[str, Any]] = iter(())
+        if include_archived:
+            archived = self._iter_archived("tool_calls", mission_id)
+        if mission_id is None:
+            rows = self._iter_query(
+                "SELECT * FROM tool_calls ORDER BY timestamp, id", batch_size=batch_size
+            )
+        else:
+            rows = self._iter_query(
+                "SELECT * FROM tool_calls WHERE mission_id = ? ORDER BY timestamp",
+                (mission_id,),
+                batch_size=batch_size,
+            )
+        for row in itertools.chain(archived, rows):
             tool_call = dict(row)
             if tool_call.get("args"):
                 tool_call["args"] = json.loads(tool_call["args"])
             if tool_call.get("result"):
                 tool_call["result"] = json.loads(tool_call["result"])
-            tool_calls.append(tool_call)
-        return tool_calls
+            yield tool_call
 
     # ========================================================================
     # DECISION PROVENANCE
@@ -615,12 +720,15 @@ class SQLiteStore:
         self._commit()
         return cursor.lastrowid
 
-    def get_decisions_for_mission(self, mission_id: int) -> list[dict[str, Any]]:
+    def get_decisions_for_mission(
+        self, mission_id: int, include_archived: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Get all decisions for a mission
 
         Args:
             mission_id: Parent mission ID
+            include_archived: Also return decisions rolled into the archive
 
         Returns:
             List of decision dicts, ordered by timestamp
@@ -629,8 +737,11 @@ class SQLiteStore:
             "SELECT * FROM decisions WHERE mission_id = ? ORDER BY timestamp",
             (mission_id,),
         )
+        rows = cursor.fetchall()
+        if include_archived:
+            rows = [*self._iter_archived("decisions", mission_id), *rows]
         decisions = []
-        for row in cursor.fetchall():
+        for row in rows:
             decision = dict(row)
             if decision.get("context"):
                 decision["context"] = json.loads(decision["context"])
@@ -785,6 +896,125 @@ class SQLiteStore:
             run["metrics"] = json.loads(run["metrics"])
         return run
 
+    # ========================================================================
+    # WORKFLOW CHECKPOINTS (GAD-902 resume)
+    # ========================================================================
+
+    def _ensure_checkpoints_table(self):
+        """
+        Ensure workflow_checkpoints table exists (created on demand).
+
+        One row per (run_id, node_id). checkpoint_key is a content hash of the
+        node definition plus its inputs, so a checkpoint is only reused while
+        neither changed.
+        """
+        if getattr(self, "_checkpoints_ready", False):
+            return
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS workflow_checkpoints (
+                    run_id TEXT NOT NULL,
+                    workflow_id TEXT NOT NULL,
+                    node_id TEXT NOT NULL,
+                    checkpoint_key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    input JSON,
+                    output JSON,
+                    error TEXT,
+                    cost_usd REAL NOT NULL DEFAULT 0,
+                    duration_seconds REAL NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (run_id, node_id)
+                )
+            """)
+            self.conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_workflow_checkpoints_workflow
+                ON workflow_checkpoints(workflow_id)
+            """)
+            self._commit()
+        self._checkpoints_ready = True
+
+    def save_checkpoint(
+        self,
+        run_id: str,
+        workflow_id: str,
+        node_id: str,
+        checkpoint_key: str,
+        status: str,
+        input_data: dict[str, Any] | None = None,
+        output_json: str | None = None,
+        error: str | None = None,
+        cost_usd: float = 0.0,
+        duration_seconds: float = 0.0,
+    ):
+        """
+        Record (or replace) the checkpoint of one workflow node.
+
+        Args:
+            run_id: Workflow run identifier
+            workflow_id: Workflow graph ID
+            node_id: Node ID
+            checkpoint_key: Content hash of node definition + inputs
+            status: Node status ('success', 'failed', ...)
+            input_data: Node inputs (context, upstream keys)
+            output_json: Node output, already JSON-encoded
+            error: Error message (failed nodes)
+            cost_usd: Cost of executing the node
+            duration_seconds: Execution time
+        """
+        self._ensure_checkpoints_table()
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT INTO workflow_checkpoints (
+                    run_id, workflow_id, node_id, checkpoint_key, status, input, output,
+                    error, cost_usd, duration_seconds, created_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (run_id, node_id) DO UPDATE SET
+                    checkpoint_key = excluded.checkpoint_key,
+                    status = excluded.status,
+                    input = excluded.input,
+                    output = excluded.output,
+                    error = excluded.error,
+                    cost_usd = excluded.cost_usd,
+                    duration_seconds = excluded.duration_seconds,
+                    created_at = excluded.created_at
+            """,
+                (
+                    run_id,
+                    workflow_id,
+                    node_id,
+                    checkpoint_key,
+                    status,
+                    json.dumps(input_data, default=str) if input_data is not None else None,
+                    output_json,
+                    error,
+                    cost_usd,
+                    duration_seconds,
+                    datetime.utcnow().isoformat() + "Z",
+                ),
+            )
+            self._commit()
+
+    def get_checkpoints(self, run_id: str) -> dict[str, dict[str, Any]]:
+        """
+        Get all node checkpoints of a workflow run.
+
+        Returns:
+            dict mapping node_id to checkpoint (input decoded, output left
+            JSON-encoded as stored)
+        """
+        self._ensure_checkpoints_table()
+        cursor = self.conn.execute("SELECT * FROM workflow_checkpoints WHERE run_id = ?", (run_id,))
+        checkpoints = {}
+        for row in cursor.fetchall():
+            checkpoint = dict(row)
+            if checkpoint.get("input"):
+                checkpoint["input"] = json.loads(checkpoint["input"])
+            checkpoints[checkpoint["node_id"]] = checkpoint
+        return checkpoints
+
     # ========================================================================
     # [ARCH-006] TASK MANAGEMENT (Hierarchical Sub-Task Tracking)
     # ========================================================================
@@ -953,14 +1183,26 @@ class SQLiteStore:
         Returns:
             List of all task dicts, parsed with JSON fields deserialized
         """
+        return list(self.iter_all_tasks())
+
+    def iter_all_tasks(
+        self, batch_size: int = DEFAULT_FETCH_BATCH_SIZE
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Stream all tasks in batches (ARCH-007 export path).
+
+        Args:
+            batch_size: Rows fetched per round-trip
+
+        Yields:
+            Task dicts, ordered by created_at, with JSON results deserialized
+        """
         self._ensure_tasks_table()
 
-        cursor = self.conn.execute(
-            "SELECT id, description, status, parent_id, result, created_at, updated_at FROM tasks ORDER BY created_at"
-        )
-        rows = cursor.fetchall()
-        tasks = []
-        for row in rows:
+        for row in self._iter_query(
+            "SELECT id, description, status, parent_id, result, created_at, updated_at FROM tasks ORDER BY created_at",
+            batch_size=batch_size,
+        ):
             task = {
                 "id": row[0],
                 "description": row[1],
@@ -976,8 +1218,7 @@ class SQLiteStore:
                     task["result"] = json.loads(task["result"])
                 except (json.JSONDecodeError, TypeError):
                     pass  # Keep as string if not valid JSON
-            tasks.append(task)
-        return tasks
+            yield task
 
     # ========================================================================
     # LEGACY MIGRATION (ARCH-003)
@@ -1125,12 +1366,15 @@ class SQLiteStore:
         self._commit()
         return cursor.lastrowid
 
-    def get_session_narrative(self, mission_id: int) -> list[dict[str, Any]]:
+    def get_session_narrative(
+        self, mission_id: int, include_archived: bool = False
+    ) -> list[dict[str, Any]]:
         """
         Get all session narrative for a mission (v2)
 
         Args:
             mission_id: Parent mission ID
+            include_archived: Also return sessions rolled into the archive
 
         Returns:
             List of session dicts, ordered by session_num
@@ -1139,7 +1383,18 @@ class SQLiteStore:
             "SELECT * FROM session_narrative WHERE mission_id = ? ORDER BY session_num",
             (mission_id,),
         )
-        return [dict(row) for row in cursor.fetchall()]
+        sessions = [dict(row) for row in cursor.fetchall()]
+        if include_archived:
+            sessions.extend(self._iter_archived("session_narrative", mission_id))
+            sessions.sort(key=lambda session: session["session_num"])
+        return sessions
+
+    def _iter_archived(self, table: str, mission_id: int | None) -> Iterator[dict[str, Any]]:
+        """Archived rows of a table, optionally for one mission."""
+        return self.archiver.iter_archived(
+            table,
+            where=None if mission_id is None else lambda row: row["mission_id"] == mission_id,
+        )
 
     # ========================================================================
     # v2: ARTIFACTS (SDLC Tracking)
@@ -1438,6 +1693,102 @@ class SQLiteStore:
     # v2: PROJECT MEMORY ADAPTER (Flattening Logic)
     # ========================================================================
 
+    def sync_project_memory(
+        self,
+        mission_id: int,
+        timestamp: str,
+        narrative: list[dict[str, Any]] | None = None,
+        concepts: list[str] | None = None,
+        concerns: list[str] | None = None,
+        trajectory: dict[str, Any] | None = None,
+    ):
+        """
+        Upsert a batch of project memory changes in one transaction (v2).
+
+        Narrative entries are keyed by (mission_id, session_num) and updated in
+        place; concepts/concerns are insert-if-missing; trajectory is upserted.
+        Safe to call with entries that already exist (no constraint errors).
+
+        Args:
+            mission_id: Parent mission ID
+            timestamp: ISO 8601 timestamp for new records
+            narrative: New or modified narrative entries
+            concepts: New domain concepts
+            concerns: New domain concerns
+            trajectory: Trajectory object (project_memory.json format), if changed
+        """
+        with self._lock:
+            try:
+                if narrative:
+                    self.conn.executemany(
+                        """
+                        INSERT INTO session_narrative (mission_id, session_num, summary, date, phase)
+                        VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT (mission_id, session_num) DO UPDATE SET
+                            summary = excluded.summary,
+                            date = excluded.date,
+                            phase = excluded.phase
+                    """,
+                        [
+                            (
+                                mission_id,
+                                entry.get("session", 0),
+                                entry.get("summary", ""),
+                                entry.get("date", timestamp),
+                                entry.get("phase", "UNKNOWN"),
+                            )
+                            for entry in narrative
+                        ],
+                    )
+                if concepts:
+                    self.conn.executemany(
+                        """
+                        INSERT INTO domain_concepts (mission_id, concept, timestamp)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT (mission_id, concept) DO NOTHING
+                    """,
+                        [(mission_id, concept, timestamp) for concept in concepts],
+                    )
+                if concerns:
+                    self.conn.executemany(
+                        """
+                        INSERT INTO domain_concerns (mission_id, concern, timestamp)
+                        VALUES (?, ?, ?)
+                        ON CONFLICT (mission_id, concern) DO NOTHING
+                    """,
+                        [(mission_id, concern, timestamp) for concern in concerns],
+                    )
+                if trajectory:
+                    completed = trajectory.get("completed", [])
+                    blockers = trajectory.get("blockers", [])
+                    self.conn.execute(
+                        """
+                        INSERT INTO trajectory (
+                            mission_id, current_phase, current_focus, completed_phases,
+                            blockers, updated_at
+                        )
+                        VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT (mission_id) DO UPDATE SET
+                            current_phase = excluded.current_phase,
+                            current_focus = excluded.current_focus,
+                            completed_phases = excluded.completed_phases,
+                            blockers = excluded.blockers,
+                            updated_at = excluded.updated_at
+                    """,
+                        (
+                            mission_id,
+                            trajectory.get("phase", "UNKNOWN"),
+                            trajectory.get("current_focus"),
+                            json.dumps(completed) if completed else None,
+                            json.dumps(blockers) if blockers else None,
+                            timestamp,
+                        ),
+                    )
+                self._commit()
+            except Exception:
+                self.conn.rollback()
+                raise
+
     def _map_project_memory_to_sql(self, memory: dict[str, Any], mission_id: int, timestamp: str):
         """
         Adapter: Flatten project_memory.json into SQL tables (v2)
@@ -1456,50 +1807,15 @@ class SQLiteStore:
 
         Note:
             This method is idempotent - can be called multiple times.
-            Duplicate concepts/concerns are ignored (UNIQUE constraint).
+            Full sync; ProjectMemoryManager sends only the delta via
+            sync_project_memory().
         """
-        # 1. Session narrative (array → rows)
-        narrative = memory.get("narrative", [])
-        for entry in narrative:
-            try:
-                self.add_session_narrative(
-                    mission_id=mission_id,
-                    session_num=entry.get("session", 0),
-                    summary=entry.get("summary", ""),
-                    date=entry.get("date", timestamp),
-                    phase=entry.get("phase", "UNKNOWN"),
-                )
-            except Exception:
-                # Skip duplicates (UNIQUE constraint on session_num)
-                pass
-
-        # 2. Domain concepts (array → rows)
         domain = memory.get("domain", {})
-        concepts = domain.get("concepts", [])
-        for concept in concepts:
-            try:
-                self.add_domain_concept(mission_id, concept, timestamp)
-            except Exception:
-                # Skip duplicates (UNIQUE constraint on concept)
-                pass
-
-        # 3. Domain concerns (array → rows)
-        concerns = domain.get("concerns", [])
-        for concern in concerns:
-            try:
-                self.add_domain_concern(mission_id, concern, timestamp)
-            except Exception:
-                # Skip duplicates (UNIQUE constraint on concern)
-                pass
-
-        # 4. Trajectory (object → row)
-        trajectory_obj = memory.get("trajectory", {})
-        if trajectory_obj:
-            self.set_trajectory(
-                mission_id=mission_id,
-                current_phase=trajectory_obj.get("phase", "UNKNOWN"),
-                current_focus=trajectory_obj.get("current_focus"),
-                completed_phases=trajectory_obj.get("completed", []),
-                blockers=trajectory_obj.get("blockers", []),
-                updated_at=timestamp,
-            )
+        self.sync_project_memory(
+            mission_id,
+            timestamp,
+            narrative=memory.get("narrative", []),
+            concepts=domain.get("concepts", []),
+            concerns=domain.get("concerns", []),
+            trajectory=memory.get("trajectory") or None,
+        )
@@ -1,12 +1,15 @@
 """Task Management System for GAD-701: VIBE MISSION CONTROL"""
 
+from .dependency_graph import DependencyCycleError, TaskGraph
 from .models import ActiveMission, Roadmap, Task, TaskStatus, ValidationCheck
 from .task_manager import TaskManager
 
 __all__ = [
     "ActiveMission",
+    "DependencyCycleError",
     "Roadmap",
     "Task",
+    "TaskGraph",
     "TaskManager",
     "TaskStatus",
     "ValidationCheck",
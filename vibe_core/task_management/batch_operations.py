@@ -2,7 +2,8 @@
 
 from typing import Any
 
-from .models import TaskManager, TaskStatus
+from .models import TaskStatus
+from .task_manager import TaskManager
 
 
 class BatchOperations:
@@ -31,8 +32,14 @@ class BatchOperations:
             "failed": [],
         }
 
+        # One dependency index for the whole batch (O(1) blocked checks)
+        graph = self.manager.get_task_graph()
+
         for task_id in task_ids:
             try:
+                if graph.is_blocked(task_id):
+                    blockers = ", ".join(sorted(graph.blockers(task_id)))
+                    raise ValueError(f"Task {task_id} is blocked by: {blockers}")
                 task = self.manager.start_task(task_id)
                 results["successful"].append(
                     {
@@ -160,21 +167,28 @@ class BatchOperations:
             "failed": [],
         }
 
-        for blocker_id, blocked_id in blocking_pairs:
-            try:
-                self.manager.block_task(blocker_id, blocked_id)
+        # Single roadmap read/write; each pair is cycle-checked against the index
+        try:
+            outcomes = self.manager.block_tasks(blocking_pairs)
+        except Exception as e:
+            outcomes = [
+                (blocker_id, blocked_id, str(e)) for blocker_id, blocked_id in blocking_pairs
+            ]
+
+        for blocker_id, blocked_id, error in outcomes:
+            if error is None:
                 results["successful"].append(
                     {
                         "blocker": blocker_id,
                         "blocked": blocked_id,
                     }
                 )
-            except Exception as e:
+            else:
                 results["failed"].append(
                     {
                         "blocker": blocker_id,
                         "blocked": blocked_id,
-                        "error": str(e),
+                        "error": error,
                     }
                 )
 
@@ -0,0 +1,265 @@
+"""Dependency Graph Index for roadmap task blocking (GAD-701 Task 4)
+
+In-memory DAG over roadmap tasks. Edges point from blocker to blocked task
+(blocker must be DONE before the blocked task can start).
+
+The index is maintained incrementally:
+- Each task keeps a count of blockers that are not DONE yet
+- Tasks with a zero count and a startable status form the "ready" frontier
+- Status changes and edge inserts/removals only touch direct neighbours
+
+Edge inserts are cycle-checked, so the graph always stays acyclic.
+"""
+
+from collections import deque
+from typing import Any
+
+from .models import Roadmap, TaskStatus
+
+# Statuses the next-task generator may hand out (mirrors its DONE/IN_PROGRESS skip rule)
+READY_STATUSES = frozenset({TaskStatus.TODO, TaskStatus.BLOCKED})
+
+
+class DependencyCycleError(ValueError):
+    """Raised when a blocking relationship would create a dependency cycle."""
+
+    def __init__(self, cycle: list[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency cycle detected: {' -> '.join(cycle)}")
+
+
+class TaskGraph:
+    """Incrementally maintained dependency index over roadmap tasks."""
+
+    def __init__(self):
+        self._status: dict[str, TaskStatus] = {}
+        self._weight: dict[str, int] = {}
+        self._blocked_by: dict[str, set[str]] = {}
+        self._blocking: dict[str, set[str]] = {}
+        self._pending: dict[str, int] = {}  # Number of known blockers not DONE
+        self._ready: set[str] = set()
+        self.phase_order: dict[str, int] = {}  # task_id -> position in roadmap phases
+
+    @classmethod
+    def from_roadmap(cls, roadmap: Roadmap) -> "TaskGraph":
+        """Build the index from a roadmap.
+
+        Raises:
+            DependencyCycleError: If the roadmap's blocked_by lists contain a cycle
+        """
+        graph = cls()
+
+        position = 0
+        for phase in roadmap.phases:
+            for task_id in phase.task_ids:
+                if task_id in roadmap.tasks and task_id not in graph.phase_order:
+                    graph.phase_order[task_id] = position
+                    position += 1
+
+        for task_id, task in roadmap.tasks.items():
+            graph.add_task(task_id, task.status, _remaining_mins(task))
+
+        for task_id, task in roadmap.tasks.items():
+            for blocker_id in task.blocked_by:
+                graph.add_edge(blocker_id, task_id)
+            for blocked_id in task.blocking_tasks:
+                graph.add_edge(task_id, blocked_id)
+
+        return graph
+
+    # ========================================================================
+    # MAINTENANCE
+    # ========================================================================
+
+    def add_task(self, task_id: str, status: TaskStatus, weight: int = 0) -> None:
+        """Add (or refresh) a task node."""
+        if task_id in self._status:
+            self._weight[task_id] = weight
+            self.set_status(task_id, status)
+            return
+
+        self._status[task_id] = status
+        self._weight[task_id] = weight
+        self._blocked_by.setdefault(task_id, set())
+        self._blocking.setdefault(task_id, set())
+
+        # Edges may reference this task before it was added
+        self._pending[task_id] = sum(1 for b in self._blocked_by[task_id] if self._is_open(b))
+        if status != TaskStatus.DONE:
+            for dependent in self._blocking[task_id]:
+                if dependent in self._status:
+                    self._pending[dependent] += 1
+                    self._refresh_ready(dependent)
+        self._refresh_ready(task_id)
+
+    def add_edge(self, blocker_id: str, blocked_id: str) -> bool:
+        """Record that blocker_id blocks blocked_id.
+
+        Returns:
+            True if the edge was new, False if it already existed
+
+        Raises:
+            DependencyCycleError: If the edge would close a cycle
+        """
+        if blocked_id in self._blocking.get(blocker_id, ()):
+            return False
+
+        cycle = self._find_path(blocked_id, blocker_id)
+        if cycle is not None:
+            raise DependencyCycleError([blocker_id, *cycle])
+
+        self._blocking.setdefault(blocker_id, set()).add(blocked_id)
+        self._blocked_by.setdefault(blocked_id, set()).add(blocker_id)
+        if self._is_open(blocker_id) and blocked_id in self._status:
+            self._pending[blocked_id] += 1
+            self._refresh_ready(blocked_id)
+        return True
+
+    def remove_edge(self, blocker_id: str, blocked_id: str) -> bool:
+        """Remove a blocking relationship.
+
+        Returns:
+            True if the edge existed
+        """
+        if blocked_id not in self._blocking.get(blocker_id, ()):
+            return False
+
+        self._blocking[blocker_id].discard(blocked_id)
+        self._blocked_by[blocked_id].discard(blocker_id)
+        if self._is_open(blocker_id) and blocked_id in self._status:
+            self._pending[blocked_id] -= 1
+            self._refresh_ready(blocked_id)
+        return True
+
+    def set_status(self, task_id: str, status: TaskStatus) -> None:
+        """Update a task's status and propagate to its dependents."""
+        if task_id not in self._status:
+            raise KeyError(task_id)
+
+        was_done = self._status[task_id] == TaskStatus.DONE
+        self._status[task_id] = status
+        is_done = status == TaskStatus.DONE
+
+        if was_done != is_done:
+            delta = -1 if is_done else 1
+            for dependent in self._blocking[task_id]:
+                if dependent in self._status:
+                    self._pending[dependent] += delta
+                    self._refresh_ready(dependent)
+        self._refresh_ready(task_id)
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self._status
+
+    def is_blocked(self, task_id: str) -> bool:
+        """True if any known blocker of task_id is not DONE (O(1))."""
+        return self._pending.get(task_id, 0) > 0
+
+    def blockers(self, task_id: str) -> set[str]:
+        """Direct blockers of task_id (known or not)."""
+        return set(self._blocked_by.get(task_id, ()))
+
+    def dependents(self, task_id: str) -> set[str]:
+        """Tasks directly blocked by task_id."""
+        return set(self._blocking.get(task_id, ()))
+
+    def ready(self) -> frozenset[str]:
+        """Frontier of tasks that can start now (startable status, no open blockers)."""
+        return frozenset(self._ready)
+
+    def topological_order(self) -> list[str]:
+        """All known tasks ordered so blockers come before the tasks they block."""
+        indegree = {
+            t: sum(1 for b in self._blocked_by[t] if b in self._status) for t in self._status
+        }
+        queue = deque(
+            sorted(
+                (t for t, d in indegree.items() if d == 0),
+                key=lambda t: self.phase_order.get(t, len(self.phase_order)),
+            )
+        )
+        order = []
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for dependent in self._blocking[task_id]:
+                if dependent in indegree:
+                    indegree[dependent] -= 1
+                    if indegree[dependent] == 0:
+                        queue.append(dependent)
+        return order
+
+    def critical_path(self) -> dict[str, Any]:
+        """Longest chain of unfinished work, weighted by remaining time budget.
+
+        Returns:
+            dict with 'tasks' (ordered task IDs) and 'total_mins'
+        """
+        best: dict[str, int] = {}
+        prev: dict[str, str | None] = {}
+
+        for task_id in self.topological_order():
+            if self._status[task_id] == TaskStatus.DONE:
+                continue
+            base, via = 0, None
+            for blocker_id in self._blocked_by[task_id]:
+                if blocker_id in best and best[blocker_id] > base:
+                    base, via = best[blocker_id], blocker_id
+            best[task_id] = base + self._weight[task_id]
+            prev[task_id] = via
+
+        if not best:
+            return {"tasks": [], "total_mins": 0}
+
+        end = max(best, key=best.get)
+        path = []
+        node: str | None = end
+        while node is not None:
+            path.append(node)
+            node = prev[node]
+        path.reverse()
+        return {"tasks": path, "total_mins": best[end]}
+
+    # ========================================================================
+    # INTERNAL
+    # ========================================================================
+
+    def _is_open(self, task_id: str) -> bool:
+        """Known and not DONE (unknown blockers never block, matching roadmap semantics)."""
+        status = self._status.get(task_id)
+        return status is not None and status != TaskStatus.DONE
+
+    def _refresh_ready(self, task_id: str) -> None:
+        if self._status.get(task_id) in READY_STATUSES and self._pending.get(task_id, 0) == 0:
+            self._ready.add(task_id)
+        else:
+            self._ready.discard(task_id)
+
+    def _find_path(self, start: str, target: str) -> list[str] | None:
+        """Path from start to target along blocking edges (DFS), or None."""
+        if start == target:
+            return [start]
+        parents: dict[str, str] = {start: start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in self._blocking.get(node, ()):
+                if nxt in parents:
+                    continue
+                parents[nxt] = node
+                if nxt == target:
+                    path = [target]
+                    while path[-1] != start:
+                        path.append(parents[path[-1]])
+                    path.reverse()
+                    return path
+                stack.append(nxt)
+        return None
+
+
+def _remaining_mins(task) -> int:
+    return max(task.time_budget_mins - task.time_used_mins, 0)
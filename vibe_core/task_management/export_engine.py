@@ -1,10 +1,175 @@
-"""Multi-format Export Engine for task reports (GAD-701 Task 7)"""
+"""Multi-format Export Engine for task reports (GAD-701 Task 7)
 
+Two export paths:
+- ExportEngine: roadmap reports rendered to a string (small, in-memory data)
+- write_jsonl/write_csv/write_markdown_table + export_rows: streaming writers
+  for large row iterables (e.g. SQLiteStore.iter_tool_calls()). Rows are
+  written straight to a file handle, so memory stays flat regardless of count.
+"""
+
+import csv
+import gzip
 import json
+from collections.abc import Iterable, Iterator
 from io import StringIO
-from typing import Any
-
-from .models import Roadmap, TaskStatus
+from pathlib import Path
+from typing import Any, TextIO
+
+from .models import Roadmap, Task, TaskStatus
+
+EXPORT_FORMATS = ("jsonl", "csv", "markdown")
+
+
+def open_export_file(path: Path | str, compress: bool | None = None) -> TextIO:
+    """Open a text file for export, optionally gzip-compressed.
+
+    Args:
+        path: Output file path
+        compress: Force gzip on/off. None = gzip if path ends with ".gz"
+
+    Returns:
+        Writable text file handle (caller closes it)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if compress is None:
+        compress = path.suffix == ".gz"
+    if compress:
+        return gzip.open(path, "wt", encoding="utf-8", newline="")
+    return open(path, "w", encoding="utf-8", newline="")
+
+
+def write_jsonl(rows: Iterable[dict[str, Any]], fh: TextIO) -> int:
+    """Write rows as JSON Lines (one object per line).
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    for row in rows:
+        fh.write(json.dumps(row, default=str))
+        fh.write("\n")
+        count += 1
+    return count
+
+
+def _flatten_cell(value: Any) -> Any:
+    """Render nested values as JSON so they fit in a single CSV/Markdown cell."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=str)
+    return "" if value is None else value
+
+
+def write_csv(
+    rows: Iterable[dict[str, Any]], fh: TextIO, fieldnames: list[str] | None = None
+) -> int:
+    """Write rows as CSV with proper quoting.
+
+    Args:
+        rows: Row dicts
+        fh: Output handle
+        fieldnames: Column order. None = keys of the first row
+
+    Returns:
+        Number of rows written
+    """
+    iterator: Iterator[dict[str, Any]] = iter(rows)
+    writer = None
+    if fieldnames is not None:
+        writer = csv.DictWriter(fh, fieldnames=fieldnames, extrasaction="ignore")
+        writer.writeheader()
+
+    count = 0
+    for row in iterator:
+        if writer is None:
+            writer = csv.DictWriter(fh, fieldnames=list(row.keys()), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow({k: _flatten_cell(v) for k, v in row.items()})
+        count += 1
+    return count
+
+
+def _escape_markdown_cell(value: Any) -> str:
+    return str(_flatten_cell(value)).replace("|", "\\|").replace("\n", " ")
+
+
+def write_markdown_table(
+    rows: Iterable[dict[str, Any]],
+    fh: TextIO,
+    fieldnames: list[str] | None = None,
+    title: str | None = None,
+) -> int:
+    """Write rows as a Markdown table.
+
+    Args:
+        rows: Row dicts
+        fh: Output handle
+        fieldnames: Column order. None = keys of the first row
+        title: Optional "# title" heading
+
+    Returns:
+        Number of rows written
+    """
+    if title:
+        fh.write(f"# {title}\n\n")
+
+    columns = fieldnames
+    count = 0
+    for row in rows:
+        if columns is None:
+            columns = list(row.keys())
+        if count == 0:
+            fh.write("| " + " | ".join(columns) + " |\n")
+            fh.write("|" + "---|" * len(columns) + "\n")
+        fh.write("| " + " | ".join(_escape_markdown_cell(row.get(c)) for c in columns) + " |\n")
+        count += 1
+    return count
+
+
+def export_rows(
+    rows: Iterable[dict[str, Any]],
+    path: Path | str,
+    fmt: str = "jsonl",
+    compress: bool | None = None,
+    fieldnames: list[str] | None = None,
+) -> int:
+    """Stream rows to a file in the given format.
+
+    Args:
+        rows: Row dicts (typically a SQLiteStore.iter_* generator)
+        path: Output file path (".gz" suffix enables gzip by default)
+        fmt: One of EXPORT_FORMATS
+        compress: Force gzip on/off
+        fieldnames: Column order for csv/markdown
+
+    Returns:
+        Number of rows written
+
+    Raises:
+        ValueError: If fmt is unknown
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format: {fmt} (expected one of {EXPORT_FORMATS})")
+
+    with open_export_file(path, compress) as fh:
+        if fmt == "jsonl":
+            return write_jsonl(rows, fh)
+        if fmt == "csv":
+            return write_csv(rows, fh, fieldnames)
+        return write_markdown_table(rows, fh, fieldnames)
+
+
+def _status_str(status: Any) -> str:
+    return status.value if hasattr(status, "value") else str(status)
+
+
+def _task_progress(task: Task) -> int:
+    """Task progress (%) from validation checks."""
+    if not task.validation_checks:
+        return 0
+    passing = sum(1 for check in task.validation_checks if check.status)
+    total = len(task.validation_checks)
+    return int((passing / total) * 100) if total > 0 else 0
 
 
 class ExportEngine:
@@ -51,6 +216,18 @@ class ExportEngine:
         indent = 2 if pretty else None
         return json.dumps(roadmap_dict, indent=indent)
 
+    def iter_task_rows(self) -> Iterator[dict[str, Any]]:
+        """Yield one flat dict per task (input for the streaming writers)."""
+        for task in self.roadmap.tasks.values():
+            yield {
+                "id": task.id,
+                "name": task.name,
+                "status": _status_str(task.status),
+                "priority": task.priority,
+                "created": task.created_at.isoformat() if task.created_at else "N/A",
+                "progress": _task_progress(task),
+            }
+
     def to_csv(self) -> str:
         """Export task summary to CSV format.
 
@@ -58,29 +235,27 @@ class ExportEngine:
             CSV string with task data
         """
         output = StringIO()
+        self.write_csv(output)
+        return output.getvalue()
 
-        # CSV Header
-        output.write("ID,Name,Status,Priority,Created,Progress\n")
-
-        # Task rows
-        for task in self.roadmap.tasks.values():
-            task_id = task.id
-            name = task.name.replace(",", ";")  # Escape commas
-            status = task.status.value if hasattr(task.status, "value") else str(task.status)
-            priority = str(task.priority)
-            created = task.created_at.isoformat() if task.created_at else "N/A"
-
-            # Calculate task progress from validation checks
-            if task.validation_checks:
-                passing = sum(1 for check in task.validation_checks if check.status)
-                total = len(task.validation_checks)
-                progress = int((passing / total) * 100) if total > 0 else 0
-            else:
-                progress = 0
-
-            output.write(f"{task_id},{name},{status},{priority},{created},{progress}%\n")
+    def write_csv(self, fh: TextIO) -> int:
+        """Stream task summary CSV to a file handle.
 
-        return output.getvalue()
+        Returns:
+            Number of task rows written
+        """
+        # CSV Header
+        fh.write("ID,Name,Status,Priority,Created,Progress\n")
+
+        count = 0
+        for row in self.iter_task_rows():
+            name = row["name"].replace(",", ";")  # Escape commas
+            fh.write(
+                f"{row['id']},{name},{row['status']},{row['priority']},"
+                f"{row['created']},{row['progress']}%\n"
+            )
+            count += 1
+        return count
 
     def to_markdown(self) -> str:
         """Export roadmap to Markdown format.
@@ -88,57 +263,60 @@ class ExportEngine:
         Returns:
             Markdown formatted report
         """
-        lines = []
+        output = StringIO()
+        self.write_markdown(output)
+        # Historical format: lines joined by "\n" without a trailing newline
+        return output.getvalue()[:-1]
+
+    def write_markdown(self, fh: TextIO) -> None:
+        """Stream the Markdown roadmap report to a file handle, phase by phase."""
+
+        def line(text: str = "") -> None:
+            fh.write(text + "\n")
 
         # Header
-        lines.append(f"# {self.roadmap.project_name}")
-        lines.append("")
-        lines.append("## Project Overview")
-        lines.append("")
+        line(f"# {self.roadmap.project_name}")
+        line()
+        line("## Project Overview")
+        line()
 
         # Summary stats
         total_tasks = len(self.roadmap.tasks)
         done_tasks = sum(1 for t in self.roadmap.tasks.values() if t.status == TaskStatus.DONE)
-        lines.append(
+        line(
             f"**Progress:** {done_tasks}/{total_tasks} tasks complete "
             f"({int((done_tasks / total_tasks) * 100) if total_tasks > 0 else 0}%)"
         )
-        lines.append("")
+        line()
 
         # Phases
-        lines.append("## Phases")
-        lines.append("")
+        line("## Phases")
+        line()
 
         for phase in self.roadmap.phases:
-            phase_tasks = [
-                self.roadmap.tasks[tid] for tid in phase.task_ids if tid in self.roadmap.tasks
-            ]
-
-            phase_status = (
-                phase.status.value if hasattr(phase.status, "value") else str(phase.status)
-            )
-            lines.append(f"### {phase.name}")
-            lines.append(f"**Status:** {phase_status} | **Progress:** {phase.progress}%")
-            lines.append("")
+            line(f"### {phase.name}")
+            line(f"**Status:** {_status_str(phase.status)} | **Progress:** {phase.progress}%")
+            line()
 
             # Phase tasks
-            for task in phase_tasks:
-                status = task.status.value if hasattr(task.status, "value") else str(task.status)
-                lines.append(f"- **{task.name}** [{status}] (Priority: {task.priority}/10)")
+            for tid in phase.task_ids:
+                task = self.roadmap.tasks.get(tid)
+                if task is None:
+                    continue
+                line(
+                    f"- **{task.name}** [{_status_str(task.status)}] (Priority: {task.priority}/10)"
+                )
 
                 if task.description:
-                    lines.append(f"  - {task.description}")
+                    line(f"  - {task.description}")
 
                 # Task progress
                 if task.validation_checks:
                     passing = sum(1 for c in task.validation_checks if c.status)
                     total = len(task.validation_checks)
-                    progress = int((passing / total) * 100) if total > 0 else 0
-                    lines.append(f"  - Validation: {passing}/{total} checks ({progress}%)")
-
-                lines.append("")
+                    line(f"  - Validation: {passing}/{total} checks ({_task_progress(task)}%)")
 
-        return "\n".join(lines)
+                line()
 
     def to_summary(self) -> dict[str, Any]:
         """Generate summary report as dict.
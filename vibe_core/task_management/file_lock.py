@@ -2,10 +2,44 @@
 
 import fcntl
 import json
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Any
 
 
+def file_stat_key(path: Path) -> tuple[int, int, int] | None:
+    """
+    Cheap change detector for cached file contents: (mtime_ns, size, inode).
+
+    The inode catches atomic replaces (temp file -> rename) even when mtime
+    and size happen to match. Returns None if the file doesn't exist.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@contextmanager
+def exclusive_lock(path: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock for a read-modify-write cycle on path.
+
+    Locks a sidecar "<name>.lock" file, because atomic_write_json replaces
+    the data file itself (a lock on the old inode would not protect the new one).
+    """
+    lock_path = path.with_name(path.name + ".lock")
+    with open(lock_path, "a") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
 def atomic_read_json(path: Path) -> dict[str, Any]:
     """
     Read JSON with file lock (prevents race conditions)
@@ -2,17 +2,22 @@
 
 from typing import Any
 
+from .dependency_graph import TaskGraph
 from .models import ActiveMission, Roadmap, TaskStatus
 
 
 def generate_next_task(
-    roadmap: Roadmap, mission: ActiveMission, use_priority: bool = True
+    roadmap: Roadmap,
+    mission: ActiveMission,
+    use_priority: bool = True,
+    graph: TaskGraph | None = None,
 ) -> dict[str, Any] | None:
     """
     Auto-select the next task based on roadmap state.
 
     Strategy (in priority order):
-    1. Find next TODO task in current phase (optionally sorted by priority)
+    1. Pick from the dependency frontier: tasks in any phase whose blockers
+       are all DONE (optionally sorted by priority)
     2. If all tasks in current phase are done, move to next phase
     3. If all phases complete, return None (project done)
 
@@ -21,6 +26,7 @@ def generate_next_task(
         mission: Current mission state
         use_priority: If True, select highest priority TODO task (default: True)
                      If False, select first TODO task in phase order
+        graph: Prebuilt dependency index (built from roadmap if omitted)
 
     Returns:
         dict with 'id' and 'name' keys, or None if no more tasks
@@ -34,28 +40,15 @@ def generate_next_task(
         >>> # Or select first TODO in order
         >>> result = generate_next_task(roadmap, mission, use_priority=False)
     """
-    # Strategy 1: Find next TODO task in any phase
-    candidate_tasks = []
+    # Strategy 1: Tasks on the dependency frontier, in phase order
+    if graph is None:
+        graph = TaskGraph.from_roadmap(roadmap)
 
-    for phase in roadmap.phases:
-        # Process tasks in phase order
-        for task_id in phase.task_ids:
-            if task_id not in roadmap.tasks:
-                continue  # Skip if task doesn't exist
-
-            task = roadmap.tasks[task_id]
-
-            # Skip already done or in-progress tasks
-            if task.status in (TaskStatus.DONE, TaskStatus.IN_PROGRESS):
-                continue
-
-            # Check if task is blocked by incomplete dependencies
-            if hasattr(task, "blocked_by") and task.blocked_by:
-                # Task is blocked, skip it
-                continue
-
-            # Found a TODO task - add to candidates
-            candidate_tasks.append((task_id, task))
+    frontier = sorted(
+        (task_id for task_id in graph.ready() if task_id in graph.phase_order),
+        key=graph.phase_order.__getitem__,
+    )
+    candidate_tasks = [(task_id, roadmap.tasks[task_id]) for task_id in frontier]
 
     # If use_priority, sort by priority (highest first) and return top task
     if use_priority and candidate_tasks:
@@ -83,7 +76,7 @@ def generate_next_task(
             for task_id in next_phase.task_ids:
                 if task_id in roadmap.tasks:
                     task = roadmap.tasks[task_id]
-                    if task.status == TaskStatus.TODO:
+                    if task.status == TaskStatus.TODO and not graph.is_blocked(task_id):
                         next_phase_tasks.append((task_id, task))
 
             if next_phase_tasks:
@@ -1,16 +1,59 @@
 """Task Manager - Central API for Task Management (GAD-701)"""
 
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
+from pydantic import BaseModel
 
-from .file_lock import atomic_read_json, atomic_write_json
+from .dependency_graph import TaskGraph
+from .file_lock import atomic_read_json, atomic_write_json, exclusive_lock, file_stat_key
 from .models import ActiveMission, Roadmap, Task, TaskStatus
 from .next_task_generator import generate_next_task
 from .validator_registry import run_validators
 
+# Process-level cache of parsed state files: path -> (stat key, parsed model).
+# Shared by all TaskManager instances; entries are validated against
+# (mtime_ns, size, inode) on every read, so external writers are picked up.
+_STATE_CACHE: dict[str, tuple[tuple[int, int, int], BaseModel]] = {}
+_STATE_CACHE_LOCK = threading.Lock()
+
+
+def _load_cached(path: Path, loader: Callable[[], BaseModel]) -> BaseModel:
+    """Return a private copy of the parsed file, re-parsing only if it changed."""
+    cache_key = str(path)
+    stat_key = file_stat_key(path)
+
+    with _STATE_CACHE_LOCK:
+        entry = _STATE_CACHE.get(cache_key)
+    if entry is None or entry[0] != stat_key:
+        model = loader()
+        # Re-stat: only cache if the file didn't change while we parsed it
+        if stat_key is not None and file_stat_key(path) == stat_key:
+            with _STATE_CACHE_LOCK:
+                _STATE_CACHE[cache_key] = (stat_key, model)
+        return model.model_copy(deep=True)
+
+    return entry[1].model_copy(deep=True)
+
+
+def _store_cached(path: Path, model: BaseModel) -> None:
+    """Write-through: record what we just wrote under the file's new stat key."""
+    stat_key = file_stat_key(path)
+    if stat_key is not None:
+        with _STATE_CACHE_LOCK:
+            _STATE_CACHE[str(path)] = (stat_key, model.model_copy(deep=True))
+
+
+def clear_state_cache() -> None:
+    """Drop all cached state (tests, or after out-of-band edits on coarse-mtime filesystems)."""
+    with _STATE_CACHE_LOCK:
+        _STATE_CACHE.clear()
+
 
 class TaskManager:
     """Central API for task management"""
@@ -21,6 +64,14 @@ class TaskManager:
         self.roadmap_file = vibe_root / ".vibe" / "config" / "roadmap.yaml"
         self.log_dir = vibe_root / ".vibe" / "history" / "mission_logs"
 
+        # Dependency index, rebuilt only when roadmap.yaml changes on disk
+        self._graph_key: tuple[int, int, int] | None = None
+        self._graph_roadmap: Roadmap | None = None
+        self._graph: TaskGraph | None = None
+
+        # Per-thread transaction state (see transaction())
+        self._txn = threading.local()
+
         # Ensure directories exist
         self.state_file.parent.mkdir(parents=True, exist_ok=True)
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -30,13 +81,27 @@ class TaskManager:
     # ========================================================================
 
     def get_active_mission(self) -> ActiveMission:
-        """Load current mission state (with FileLock)"""
+        """
+        Load current mission state.
+
+        Served from the process-level cache while active_mission.json is
+        unchanged on disk; otherwise re-read under FileLock and re-parsed.
+        Inside transaction() the same mission object is returned on every call.
+        """
+        txn_mission = getattr(self._txn, "mission", None)
+        if txn_mission is not None:
+            return txn_mission
+
         if not self.state_file.exists():
-            return ActiveMission()  # Empty mission
+            mission = ActiveMission()  # Empty mission
+        else:
+            mission = _load_cached(
+                self.state_file, lambda: ActiveMission(**atomic_read_json(self.state_file))
+            )
 
-        data = atomic_read_json(self.state_file)
-        # Add Pydantic validation and model creation
-        return ActiveMission(**data)
+        if getattr(self._txn, "depth", 0):
+            self._txn.mission = mission
+        return mission
 
     def get_current_task(self) -> Task | None:
         """Get the task agent should work on right now"""
@@ -51,10 +116,54 @@ class TaskManager:
 
         # Using a simple file read for YAML config, assuming the Agent/User handles the lock
         # The main state (.json) is what requires the atomic lock.
+        return _load_cached(self.roadmap_file, self._parse_roadmap)
+
+    def _parse_roadmap(self) -> Roadmap:
         with open(self.roadmap_file) as f:
             data = yaml.safe_load(f)
         return Roadmap(**data)
 
+    # ========================================================================
+    # TRANSACTIONS
+    # ========================================================================
+
+    @contextmanager
+    def transaction(self) -> Iterator["TaskManager"]:
+        """
+        Hold one exclusive state lock across a read-modify-write sequence.
+
+        Inside the block, get_active_mission() loads the mission once and
+        returns the same object; _save_mission() only marks it dirty. The
+        mission is written once on successful exit and discarded on error.
+        Nested transactions join the outer one.
+
+        Example:
+            >>> with manager.transaction():
+            ...     manager.start_task("task-001")
+            ...     manager.update_task_progress(time_spent_mins=15)
+        """
+        depth = getattr(self._txn, "depth", 0)
+        if depth:
+            self._txn.depth = depth + 1
+            try:
+                yield self
+            finally:
+                self._txn.depth -= 1
+            return
+
+        with exclusive_lock(self.state_file):
+            self._txn.depth = 1
+            self._txn.mission = None
+            self._txn.dirty = False
+            try:
+                yield self
+                if self._txn.dirty:
+                    self._write_mission(self._txn.mission)
+            finally:
+                self._txn.depth = 0
+                self._txn.mission = None
+                self._txn.dirty = False
+
     # ========================================================================
     # WRITE OPERATIONS (Atomic)
     # ========================================================================
@@ -71,31 +180,33 @@ class TaskManager:
         task.started_at = datetime.now()
 
         # Update active mission
-        mission = self.get_active_mission()
-        mission.current_task = task
-        mission.last_updated = datetime.now()
+        with self.transaction():
+            mission = self.get_active_mission()
+            mission.current_task = task
+            mission.last_updated = datetime.now()
 
-        self._save_mission(mission)
+            self._save_mission(mission)
         return task
 
     def update_task_progress(
         self, time_spent_mins: int = 0, blocking_reason: str | None = None
     ) -> Task:
         """Update current task progress"""
-        mission = self.get_active_mission()
+        with self.transaction():
+            mission = self.get_active_mission()
 
-        if not mission.current_task:
-            raise RuntimeError("No active task")
+            if not mission.current_task:
+                raise RuntimeError("No active task")
 
-        task = mission.current_task
-        task.time_used_mins += time_spent_mins
+            task = mission.current_task
+            task.time_used_mins += time_spent_mins
 
-        if blocking_reason:
-            task.status = TaskStatus.BLOCKED
-            task.blocking_reason = blocking_reason
+            if blocking_reason:
+                task.status = TaskStatus.BLOCKED
+                task.blocking_reason = blocking_reason
 
-        mission.last_updated = datetime.now()
-        self._save_mission(mission)
+            mission.last_updated = datetime.now()
+            self._save_mission(mission)
         return task
 
     # ========================================================================
@@ -104,37 +215,51 @@ class TaskManager:
 
     def validate_current_task(self) -> dict[str, Any]:
         """Run all validation checks for current task"""
-        mission = self.get_active_mission()
+        with self.transaction():
+            mission = self.get_active_mission()
 
-        if not mission.current_task:
-            return {"valid": False, "error": "No active task"}
+            if not mission.current_task:
+                return {"valid": False, "error": "No active task"}
 
-        task = mission.current_task
+            task = mission.current_task
 
-        # Run all validators
-        results = run_validators(task, self.vibe_root)
+            # Run all validators
+            results = run_validators(task, self.vibe_root)
 
-        # Update task validation status in the model
-        for check in task.validation_checks:
-            check.status = results.get(check.id, False)
-            check.last_check = datetime.now()
-            if not check.status:
-                check.error = results.get(f"{check.id}_error", "Check failed")
-            else:
-                check.error = None  # Clear previous error if passed
+            # Update task validation status in the model
+            for check in task.validation_checks:
+                check.status = results.get(check.id, False)
+                check.last_check = datetime.now()
+                if not check.status:
+                    check.error = results.get(f"{check.id}_error", "Check failed")
+                else:
+                    check.error = None  # Clear previous error if passed
 
-        self._save_mission(mission)
+            self._save_mission(mission)
 
-        return {
-            "valid": task.is_complete(),
-            "checks": {c.id: c.status for c in task.validation_checks},
-            "failed": [c.description for c in task.get_failed_checks()],
-        }
+            return {
+                "valid": task.is_complete(),
+                "checks": {c.id: c.status for c in task.validation_checks},
+                "failed": [c.description for c in task.get_failed_checks()],
+            }
 
     # ========================================================================
     # BLOCKING / DEPENDENCIES
     # ========================================================================
 
+    def get_task_graph(self) -> TaskGraph:
+        """
+        Dependency index over roadmap tasks.
+
+        Built once from roadmap.yaml and reused until the file changes on disk
+        (mtime/size/inode), so blocking queries don't re-parse the roadmap per call.
+
+        Raises:
+            FileNotFoundError: If the roadmap doesn't exist
+            DependencyCycleError: If the roadmap contains a dependency cycle
+        """
+        return self._load_dependency_index()[1]
+
     def block_task(self, blocker_id: str, blocked_id: str) -> None:
         """
         Create a blocking relationship: blocker_id blocks blocked_id.
@@ -148,24 +273,55 @@ class TaskManager:
 
         Raises:
             ValueError: If either task doesn't exist
+            DependencyCycleError: If the relationship would create a cycle
         """
-        roadmap = self.get_roadmap()
-
-        if blocker_id not in roadmap.tasks:
-            raise ValueError(f"Blocker task {blocker_id} not found")
+        self.block_tasks([(blocker_id, blocked_id)], raise_on_error=True)
 
-        if blocked_id not in roadmap.tasks:
-            raise ValueError(f"Blocked task {blocked_id} not found")
-
-        blocker = roadmap.tasks[blocker_id]
-        blocked = roadmap.tasks[blocked_id]
+    def block_tasks(
+        self, blocking_pairs: list[tuple[str, str]], raise_on_error: bool = False
+    ) -> list[tuple[str, str, str | None]]:
+        """
+        Create several blocking relationships with one roadmap read and write.
 
-        # Add relationships
-        if blocked_id not in blocker.blocking_tasks:
-            blocker.blocking_tasks.append(blocked_id)
+        Args:
+            blocking_pairs: List of (blocker_id, blocked_id) tuples
+            raise_on_error: Raise on the first invalid pair instead of recording it
 
-        if blocker_id not in blocked.blocked_by:
-            blocked.blocked_by.append(blocker_id)
+        Returns:
+            List of (blocker_id, blocked_id, error) - error is None on success
+        """
+        roadmap, graph = self._load_dependency_index()
+        results = []
+        changed = False
+
+        for blocker_id, blocked_id in blocking_pairs:
+            try:
+                if blocker_id not in roadmap.tasks:
+                    raise ValueError(f"Blocker task {blocker_id} not found")
+                if blocked_id not in roadmap.tasks:
+                    raise ValueError(f"Blocked task {blocked_id} not found")
+
+                graph.add_edge(blocker_id, blocked_id)  # Cycle check
+
+                blocker = roadmap.tasks[blocker_id]
+                blocked = roadmap.tasks[blocked_id]
+                if blocked_id not in blocker.blocking_tasks:
+                    blocker.blocking_tasks.append(blocked_id)
+                    changed = True
+                if blocker_id not in blocked.blocked_by:
+                    blocked.blocked_by.append(blocker_id)
+                    changed = True
+                results.append((blocker_id, blocked_id, None))
+            except ValueError as e:
+                if raise_on_error:
+                    if changed:
+                        self._save_roadmap(roadmap)
+                    raise
+                results.append((blocker_id, blocked_id, str(e)))
+
+        if changed:
+            self._save_roadmap(roadmap)
+        return results
 
     def unblock_task(self, blocker_id: str, blocked_id: str) -> None:
         """
@@ -175,50 +331,52 @@ class TaskManager:
             blocker_id: Task ID that was blocking
             blocked_id: Task ID that was being blocked
         """
-        roadmap = self.get_roadmap()
+        roadmap, graph = self._load_dependency_index()
+        changed = False
 
         if blocker_id in roadmap.tasks:
             blocker = roadmap.tasks[blocker_id]
             if blocked_id in blocker.blocking_tasks:
                 blocker.blocking_tasks.remove(blocked_id)
+                changed = True
 
         if blocked_id in roadmap.tasks:
             blocked = roadmap.tasks[blocked_id]
             if blocker_id in blocked.blocked_by:
                 blocked.blocked_by.remove(blocker_id)
+                changed = True
+
+        graph.remove_edge(blocker_id, blocked_id)
+        if changed:
+            self._save_roadmap(roadmap)
 
     def is_task_blocked(self, task_id: str) -> bool:
         """Check if a task is blocked by incomplete dependencies."""
-        roadmap = self.get_roadmap()
-
-        if task_id not in roadmap.tasks:
-            return False
-
-        task = roadmap.tasks[task_id]
-
-        # Check if any blocking tasks are not DONE
-        for blocker_id in task.blocked_by:
-            blocker = roadmap.tasks.get(blocker_id)
-            if blocker and blocker.status != TaskStatus.DONE:
-                return True
-
-        return False
+        return self.get_task_graph().is_blocked(task_id)
 
     def get_blocked_by_tasks(self, task_id: str) -> list[Task]:
         """Get list of tasks that are blocking this task."""
-        roadmap = self.get_roadmap()
+        roadmap = self._load_roadmap_index()
 
         if task_id not in roadmap.tasks:
             return []
 
-        task = roadmap.tasks[task_id]
-        blocked_by = []
+        return [
+            roadmap.tasks[blocker_id].model_copy(deep=True)
+            for blocker_id in roadmap.tasks[task_id].blocked_by
+            if blocker_id in roadmap.tasks
+        ]
 
-        for blocker_id in task.blocked_by:
-            if blocker_id in roadmap.tasks:
-                blocked_by.append(roadmap.tasks[blocker_id])
+    def get_ready_tasks(self) -> list[Task]:
+        """Tasks that can start now (no open blockers), highest priority first."""
+        roadmap, graph = self._load_dependency_index()
+        ready = [roadmap.tasks[tid] for tid in graph.ready()]
+        ready.sort(key=lambda t: (-t.priority, graph.phase_order.get(t.id, len(roadmap.tasks))))
+        return [t.model_copy(deep=True) for t in ready]
 
-        return blocked_by
+    def get_critical_path(self) -> dict[str, Any]:
+        """Longest chain of unfinished, dependent work (by remaining time budget)."""
+        return self.get_task_graph().critical_path()
 
     # ========================================================================
     # COMPLETION
@@ -230,12 +388,18 @@ class TaskManager:
 
         Returns next task or None if validation failed
         """
-        # Validate first
-        validation = self.validate_current_task()
+        with self.transaction():
+            # Validate first
+            validation = self.validate_current_task()
 
-        if not validation["valid"]:
-            raise RuntimeError(f"Task validation failed. Fix required: {validation['failed']}")
+            if validation["valid"]:
+                return self._finish_current_task()
 
+        # Raised after the transaction commits, so the failed checks stay on record
+        raise RuntimeError(f"Task validation failed. Fix required: {validation['failed']}")
+
+    def _finish_current_task(self) -> Task | None:
+        """Mark the validated current task done and start the next one (inside transaction())"""
         mission = self.get_active_mission()
         task = mission.current_task
 
@@ -250,10 +414,12 @@ class TaskManager:
         mission.total_tasks_completed += 1
         mission.total_time_spent_mins += task.time_used_mins
 
-        # Generate next task
+        # Generate next task (picks from the dependency frontier)
         roadmap = self.get_roadmap()
-        # The next_task_generator.py will be a simple stub for phase 1
-        next_task_info = generate_next_task(roadmap, mission)
+        graph = TaskGraph.from_roadmap(roadmap)
+        if task.id in graph:
+            graph.set_status(task.id, TaskStatus.DONE)
+        next_task_info = generate_next_task(roadmap, mission, graph=graph)
 
         if next_task_info and "id" in next_task_info:
             next_task_id = next_task_info["id"]
@@ -279,10 +445,46 @@ class TaskManager:
     # ========================================================================
 
     def _save_mission(self, mission: ActiveMission):
-        """Atomic write to state file"""
+        """Atomic write to state file (deferred to commit inside transaction())"""
+        if getattr(self._txn, "depth", 0):
+            self._txn.mission = mission
+            self._txn.dirty = True
+            return
+        self._write_mission(mission)
+
+    def _write_mission(self, mission: ActiveMission):
+        """Atomic write to state file, write-through to the state cache"""
         # model_dump is a Pydantic V2 method, use dict() for wider V1/V2 compatibility
         data = mission.model_dump()
         atomic_write_json(self.state_file, data)
+        _store_cached(self.state_file, mission)
+
+    def _save_roadmap(self, roadmap: Roadmap):
+        """Persist roadmap.yaml and refresh the dependency index key."""
+        with open(self.roadmap_file, "w") as f:
+            yaml.safe_dump(roadmap.model_dump(mode="json"), f, sort_keys=False)
+        _store_cached(self.roadmap_file, roadmap)
+        self._graph_key = file_stat_key(self.roadmap_file)
+        self._graph_roadmap = roadmap
+
+    def _load_roadmap_index(self) -> Roadmap:
+        """Return the shared roadmap, re-read only if roadmap.yaml changed (mtime/size/inode)."""
+        if not self.roadmap_file.exists():
+            raise FileNotFoundError(f"Roadmap not found: {self.roadmap_file}")
+
+        key = file_stat_key(self.roadmap_file)
+        if self._graph_roadmap is None or key != self._graph_key:
+            self._graph_roadmap = self.get_roadmap()
+            self._graph = None  # Rebuilt from the new roadmap on next use
+            self._graph_key = key
+        return self._graph_roadmap
+
+    def _load_dependency_index(self) -> tuple[Roadmap, TaskGraph]:
+        """Return (roadmap, graph), rebuilding only if roadmap.yaml changed (mtime/size/inode)."""
+        roadmap = self._load_roadmap_index()
+        if self._graph is None:
+            self._graph = TaskGraph.from_roadmap(roadmap)
+        return roadmap, self._graph
 
     def _archive_task(self, task: Task):
         """Save completed task to logs"""
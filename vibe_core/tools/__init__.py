@@ -5,11 +5,33 @@ Provides a clean protocol for agents to execute actions (file operations,
 API calls, etc.) without dirty hacks like exec() or string parsing.
 """
 
-from vibe_core.tools.agenda_tools import AddTaskTool, CompleteTaskTool, ListTasksTool
-from vibe_core.tools.delegate_tool import DelegateTool
-from vibe_core.tools.file_tools import ReadFileTool, WriteFileTool
-from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
-from vibe_core.tools.tool_registry import ToolRegistry
+from typing import TYPE_CHECKING
+
+from vibe_core._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from vibe_core.tools.agenda_tools import AddTaskTool, CompleteTaskTool, ListTasksTool
+    from vibe_core.tools.delegate_tool import DelegateTool
+    from vibe_core.tools.file_tools import ReadFileTool, WriteFileTool
+    from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
+    from vibe_core.tools.tool_registry import ToolRegistry
+
+# PEP 562: submodules are imported on first access, not with the package
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AddTaskTool": "vibe_core.tools.agenda_tools",
+        "CompleteTaskTool": "vibe_core.tools.agenda_tools",
+        "ListTasksTool": "vibe_core.tools.agenda_tools",
+        "DelegateTool": "vibe_core.tools.delegate_tool",
+        "ReadFileTool": "vibe_core.tools.file_tools",
+        "WriteFileTool": "vibe_core.tools.file_tools",
+        "Tool": "vibe_core.tools.tool_protocol",
+        "ToolCall": "vibe_core.tools.tool_protocol",
+        "ToolResult": "vibe_core.tools.tool_protocol",
+        "ToolRegistry": "vibe_core.tools.tool_registry",
+    },
+)
 
 __all__ = [
     "AddTaskTool",
@@ -4,14 +4,16 @@ Agenda Management Tools for vibe-agency OS (ARCH-045)
 Provides tools for managing the backlog/agenda system.
 These tools allow agents to add, list, and complete tasks in the persistent backlog.
 
-The backlog is stored as BACKLOG.md in the workspace directory for human readability
-and persistence across sessions.
+The agenda lives in an indexed SQLite store (vibe_core.store.agenda_store).
+BACKLOG.md in the workspace directory is rendered from it for human readability;
+hand edits to the file are re-imported automatically.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from vibe_core.store.agenda_store import AgendaStore, get_agenda_store
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -20,6 +22,11 @@ logger = logging.getLogger(__name__)
 BACKLOG_PATH = Path("workspace/BACKLOG.md")
 
 
+def _agenda_store() -> AgendaStore:
+    """Agenda store for the project owning BACKLOG_PATH (workspace/BACKLOG.md -> root)."""
+    return get_agenda_store(BACKLOG_PATH.parent.parent)
+
+
 class AddTaskTool(Tool):
     """
     Tool for adding a task to the agenda/backlog.
@@ -83,7 +90,8 @@ class AddTaskTool(Tool):
         """
         Execute task addition.
 
-        Appends a new task to the Outstanding Tasks section of BACKLOG.md.
+        Inserts a new pending task into the agenda store and re-renders
+        the Outstanding Tasks section of BACKLOG.md.
 
         Args:
             parameters: {
@@ -98,54 +106,10 @@ class AddTaskTool(Tool):
             description = parameters["description"].strip()
             priority = parameters.get("priority", "MEDIUM").upper()
 
-            # Ensure backlog file exists
             if not BACKLOG_PATH.exists():
                 logger.warning(f"Backlog file not found at {BACKLOG_PATH}, creating it")
-                BACKLOG_PATH.parent.mkdir(parents=True, exist_ok=True)
-                BACKLOG_PATH.write_text(
-                    "# VIBE AGENCY BACKLOG\n\n"
-                    "## Outstanding Tasks\n\n"
-                    "## Completed Tasks\n\n"
-                    "*(Archive of completed work)*\n"
-                )
-
-            # Read current backlog
-            content = BACKLOG_PATH.read_text()
-
-            # Find the Outstanding Tasks section
-            outstanding_idx = content.find("## Outstanding Tasks")
-            completed_idx = content.find("## Completed Tasks")
-
-            if outstanding_idx == -1 or completed_idx == -1:
-                return ToolResult(
-                    success=False,
-                    error="Invalid BACKLOG.md format: missing Outstanding/Completed sections",
-                )
-
-            # Extract the section between Outstanding Tasks and Completed Tasks
-            before_outstanding = content[:outstanding_idx]
-            outstanding_section = content[
-                outstanding_idx + len("## Outstanding Tasks") : completed_idx
-            ]
-            after_completed = content[completed_idx:]
-
-            # Add new task to outstanding section
-            new_task_line = f"- [ ] [{priority}] {description}\n"
-
-            # If outstanding section is empty or only whitespace, add at the beginning
-            if outstanding_section.strip() == "":
-                new_outstanding = "\n" + new_task_line + "\n"
-            else:
-                # Add before the Completed Tasks section
-                new_outstanding = outstanding_section.rstrip() + "\n" + new_task_line + "\n"
-
-            # Reconstruct the file
-            new_content = (
-                before_outstanding + "## Outstanding Tasks" + new_outstanding + after_completed
-            )
 
-            # Write back
-            BACKLOG_PATH.write_text(new_content)
+            _agenda_store().add_task(description, priority)
 
             logger.info(f"AddTaskTool: Added task '[{priority}] {description}' to backlog")
             return ToolResult(
@@ -203,7 +167,7 @@ class ListTasksTool(Tool):
         """
         Execute task listing.
 
-        Reads the backlog and returns tasks matching the status filter.
+        Queries the agenda store for tasks matching the status filter.
 
         Args:
             parameters: {
@@ -215,49 +179,16 @@ class ListTasksTool(Tool):
         """
         try:
             status = parameters.get("status", "pending").lower()
+            store = _agenda_store()
 
-            # Read backlog
-            if not BACKLOG_PATH.exists():
+            if store.is_empty():
                 return ToolResult(
                     success=True,
                     output="Backlog is empty (no tasks yet)",
                 )
 
-            content = BACKLOG_PATH.read_text()
-
-            # Extract the appropriate section
-            if status == "pending":
-                outstanding_idx = content.find("## Outstanding Tasks")
-                completed_idx = content.find("## Completed Tasks")
-
-                if outstanding_idx == -1 or completed_idx == -1:
-                    return ToolResult(
-                        success=False,
-                        error="Invalid BACKLOG.md format",
-                    )
-
-                section_content = content[
-                    outstanding_idx + len("## Outstanding Tasks") : completed_idx
-                ]
-                section_title = "OUTSTANDING TASKS"
-
-            else:  # completed
-                completed_idx = content.find("## Completed Tasks")
-                if completed_idx == -1:
-                    return ToolResult(
-                        success=False,
-                        error="Invalid BACKLOG.md format",
-                    )
-
-                section_content = content[completed_idx + len("## Completed Tasks") :]
-                section_title = "COMPLETED TASKS"
-
-            # Parse tasks from markdown
-            tasks = []
-            for line in section_content.split("\n"):
-                line = line.strip()
-                if line.startswith("- ["):
-                    tasks.append(line)
+            section_title = "OUTSTANDING TASKS" if status == "pending" else "COMPLETED TASKS"
+            tasks = store.list_tasks(status)
 
             if not tasks:
                 return ToolResult(
@@ -266,7 +197,7 @@ class ListTasksTool(Tool):
                 )
 
             # Format output
-            output = f"{section_title}:\n" + "\n".join(f"  {task}" for task in tasks)
+            output = f"{section_title}:\n" + "\n".join(f"  {task.to_markdown()}" for task in tasks)
 
             logger.info(f"ListTasksTool: Listed {len(tasks)} {status} tasks")
             return ToolResult(success=True, output=output)
@@ -336,80 +267,19 @@ class CompleteTaskTool(Tool):
         try:
             search_term = parameters["task_description"].strip()
 
-            # Read backlog
-            if not BACKLOG_PATH.exists():
-                return ToolResult(
-                    success=False,
-                    error="Backlog file not found",
-                )
-
-            content = BACKLOG_PATH.read_text()
-
-            # Find the sections
-            outstanding_idx = content.find("## Outstanding Tasks")
-            completed_idx = content.find("## Completed Tasks")
-
-            if outstanding_idx == -1 or completed_idx == -1:
-                return ToolResult(
-                    success=False,
-                    error="Invalid BACKLOG.md format",
-                )
-
-            before_outstanding = content[:outstanding_idx]
-            outstanding_section = content[
-                outstanding_idx + len("## Outstanding Tasks") : completed_idx
-            ]
-            after_completed = content[completed_idx:]
-
-            # Find and extract the task
-            lines = outstanding_section.split("\n")
-            found_task = None
-            found_index = -1
-
-            for i, line in enumerate(lines):
-                if line.strip().startswith("- [ ]") and search_term.lower() in line.lower():
-                    found_task = line
-                    found_index = i
-                    break
+            task = _agenda_store().complete_task(search_term)
 
-            if found_task is None:
+            if task is None:
                 return ToolResult(
                     success=False,
                     error=f"Task matching '{search_term}' not found in outstanding tasks",
                 )
 
-            # Mark as completed (check the box)
-            completed_task = found_task.replace("- [ ]", "- [x]", 1)
-
-            # Remove from outstanding and add to completed
-            new_outstanding_lines = lines[:found_index] + lines[found_index + 1 :]
-            new_outstanding = "\n".join(new_outstanding_lines)
-
-            # Add to completed section
-            completed_lines = after_completed.split("\n")
-            # Find the start of actual content in completed section (skip section header)
-            insert_idx = 1  # After "## Completed Tasks"
-            for i, line in enumerate(completed_lines):
-                if line.strip() and not line.strip().startswith("*"):
-                    insert_idx = i
-                    break
-
-            # Insert the completed task
-            completed_lines.insert(insert_idx, completed_task)
-            new_completed = "\n".join(completed_lines)
-
-            # Reconstruct the file
-            new_content = (
-                before_outstanding + "## Outstanding Tasks" + new_outstanding + "\n" + new_completed
-            )
-
-            # Write back
-            BACKLOG_PATH.write_text(new_content)
-
-            logger.info(f"CompleteTaskTool: Marked task as completed: {found_task.strip()}")
+            pending_line = f"- [ ] {task.text}"
+            logger.info(f"CompleteTaskTool: Marked task as completed: {pending_line}")
             return ToolResult(
                 success=True,
-                output=f"Task completed: {found_task.strip()}",
+                output=f"Task completed: {pending_line}",
             )
 
         except Exception as e:
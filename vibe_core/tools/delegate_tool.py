@@ -35,6 +35,7 @@ Why This Matters:
 import logging
 from typing import TYPE_CHECKING, Any
 
+from vibe_core.agent_protocol import AgentResponse
 from vibe_core.scheduling import Task
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
@@ -43,6 +44,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Default upper bound for delegate_task(wait=true)
+DEFAULT_WAIT_TIMEOUT_SECONDS = 600
+
 
 class DelegateTool(Tool):
     """
@@ -113,7 +117,7 @@ class DelegateTool(Tool):
             "Delegate a task to another agent (specialist). "
             "Use this to assign work to domain experts like 'specialist-planning', "
             "'specialist-coding', or 'specialist-testing'. "
-            "Returns task_id for tracking."
+            "Returns task_id for tracking, or the specialist's result when wait=true."
         )
 
     @property
@@ -159,6 +163,16 @@ class DelegateTool(Tool):
                     },
                 },
             },
+            "wait": {
+                "type": "boolean",
+                "required": False,
+                "description": "Wait for the specialist to finish and return its result",
+            },
+            "timeout_seconds": {
+                "type": "number",
+                "required": False,
+                "description": f"Max seconds to wait (default: {DEFAULT_WAIT_TIMEOUT_SECONDS})",
+            },
         }
 
     def validate(self, parameters: dict[str, Any]) -> None:
@@ -210,6 +224,14 @@ class DelegateTool(Tool):
                 f"payload.mission_id must be an integer, got {type(mission_id).__name__}"
             )
 
+        if "wait" in parameters and not isinstance(parameters["wait"], bool):
+            raise TypeError(f"wait must be a boolean, got {type(parameters['wait']).__name__}")
+
+        if "timeout_seconds" in parameters:
+            timeout = parameters["timeout_seconds"]
+            if not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0:
+                raise ValueError("timeout_seconds must be a positive number")
+
         # Security: Verify agent exists in kernel registry
         if agent_id not in self.kernel.agent_registry:
             available_agents = list(self.kernel.agent_registry.keys())
@@ -225,12 +247,15 @@ class DelegateTool(Tool):
         1. Extract agent_id and payload
         2. Create Task object
         3. Submit to kernel via kernel.submit()
-        4. Return task_id for tracking
+        4. Return task_id for tracking (or, with wait=true, the specialist's
+           result from the task's future)
 
         Args:
             parameters: {
                 "agent_id": "specialist-planning",
-                "payload": {"mission_id": 42, "phase": "PLANNING", ...}
+                "payload": {"mission_id": 42, "phase": "PLANNING", ...},
+                "wait": False,
+                "timeout_seconds": 600
             }
 
         Returns:
@@ -248,31 +273,72 @@ class DelegateTool(Tool):
         payload = parameters["payload"]
 
         try:
+            if parameters.get("wait", False):
+                from vibe_core.kernel import KernelStatus  # Late import (circular dependency)
+
+                # Queued tasks only run on a RUNNING kernel; don't wait on one that never will
+                if self.kernel.status != KernelStatus.RUNNING:
+                    return ToolResult(
+                        success=False,
+                        error=(
+                            f"Cannot wait for {agent_id}: kernel is not running "
+                            f"(status: {self.kernel.status.value})"
+                        ),
+                    )
+
             # Create task
             task = Task(agent_id=agent_id, payload=payload)
 
             # Submit to kernel
-            task_id = self.kernel.submit(task)
+            future = self.kernel.submit(task)
+            task_id = future.task_id
 
             logger.info(
                 f"DelegateTool: Delegated task to {agent_id} "
                 f"(task_id={task_id}, mission_id={payload.get('mission_id')})"
             )
 
+            metadata = {
+                "task_id": task_id,
+                "agent_id": agent_id,
+                "mission_id": payload.get("mission_id"),
+                "phase": payload.get("phase"),
+            }
+
+            if not parameters.get("wait", False):
+                return ToolResult(
+                    success=True,
+                    output={
+                        "task_id": task_id,
+                        "agent_id": agent_id,
+                        "status": "delegated",
+                        "message": f"Task delegated to {agent_id}",
+                    },
+                    metadata=metadata,
+                )
+
+            timeout = parameters.get("timeout_seconds", DEFAULT_WAIT_TIMEOUT_SECONDS)
+            try:
+                result = future.result(timeout=timeout)
+            except TimeoutError:
+                return ToolResult(
+                    success=False,
+                    error=f"Task {task_id} delegated to {agent_id} did not finish in {timeout}s",
+                    metadata=metadata,
+                )
+
+            if isinstance(result, AgentResponse):
+                result = result.to_dict()
+
             return ToolResult(
                 success=True,
                 output={
                     "task_id": task_id,
                     "agent_id": agent_id,
-                    "status": "delegated",
-                    "message": f"Task delegated to {agent_id}",
-                },
-                metadata={
-                    "task_id": task_id,
-                    "agent_id": agent_id,
-                    "mission_id": payload.get("mission_id"),
-                    "phase": payload.get("phase"),
+                    "status": "completed",
+                    "result": result,
                 },
+                metadata=metadata,
             )
 
         except Exception as e:
@@ -0,0 +1,362 @@
+"""
+Workspace File Index for the "Senses" tools (ARCH-042).
+
+Keeps an in-memory index of the workspace so SearchFileTool and
+ListDirectoryTool don't walk the whole tree on every call:
+
+- Directory tree (path trie): one node per directory with its files and subdirectories
+- Basename and extension maps for the common "name.py" / "*.py" queries
+- Ignored directories (.git, .venv, node_modules, ...) are pruned during the walk,
+  never descended into
+
+Refresh is incremental: every directory node remembers its mtime. Adding,
+removing or renaming an entry changes the parent directory's mtime, so a
+refresh is one stat() per indexed directory plus a rescan of the changed ones.
+
+Usage:
+    index = get_file_index(Path.cwd())
+    page = index.glob("*.py", under="vibe_core", limit=20)
+    print(page.total, page.paths)
+"""
+
+import fnmatch
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+
+logger = logging.getLogger(__name__)
+
+# Directories never descended into (listed, but not indexed)
+IGNORED_DIRS = frozenset(
+    {
+        ".git",
+        ".hg",
+        ".svn",
+        ".venv",
+        "venv",
+        "node_modules",
+        "__pycache__",
+        ".mypy_cache",
+        ".pytest_cache",
+        ".ruff_cache",
+        ".tox",
+        ".nox",
+    }
+)
+
+# Hidden entries are skipped, except the vibe state directory
+VISIBLE_HIDDEN = frozenset({".vibe"})
+
+_WILDCARDS = frozenset("*?[")
+
+
+def is_hidden(name: str) -> bool:
+    """Hidden (dot) names are filtered, except VISIBLE_HIDDEN."""
+    return name.startswith(".") and name not in VISIBLE_HIDDEN
+
+
+@dataclass
+class _DirNode:
+    """One directory in the index tree."""
+
+    mtime_ns: int
+    files: set[str] = field(default_factory=set)
+    dirs: set[str] = field(default_factory=set)  # Indexed subdirectories
+    pruned: set[str] = field(default_factory=set)  # Ignored subdirectories (listed only)
+
+
+@dataclass
+class GlobPage:
+    """One page of ranked glob results."""
+
+    paths: list[str]
+    total: int
+    offset: int
+    limit: int
+
+    @property
+    def next_offset(self) -> int | None:
+        end = self.offset + len(self.paths)
+        return end if end < self.total else None
+
+
+class WorkspaceFileIndex:
+    """Incrementally refreshed file index rooted at a workspace directory."""
+
+    def __init__(self, root: Path, refresh_interval: float = 0.0):
+        """
+        Args:
+            root: Workspace root (absolute)
+            refresh_interval: Minimum seconds between staleness checks
+                              (0 = validate on every query)
+        """
+        self.root = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._dirs: dict[str, _DirNode] = {}  # "" = root, else posix relpath
+        self._by_name: dict[str, set[str]] = {}
+        self._by_ext: dict[str, set[str]] = {}
+        self._last_refresh = 0.0
+        self._built = False
+
+    # ========================================================================
+    # BUILD / REFRESH
+    # ========================================================================
+
+    def refresh(self, force: bool = False) -> int:
+        """
+        Bring the index up to date.
+
+        Returns:
+            Number of directories rescanned
+        """
+        with self._lock:
+            now = time.monotonic()
+            if (
+                self._built
+                and not force
+                and self.refresh_interval
+                and now - self._last_refresh < self.refresh_interval
+            ):
+                return 0
+
+            if not self._built:
+                rescanned = self._scan_tree("")
+                self._built = True
+            else:
+                rescanned = 0
+                for rel_dir in list(self._dirs):
+                    node = self._dirs.get(rel_dir)
+                    if node is None:
+                        continue  # Removed while rescanning a parent
+                    try:
+                        mtime_ns = os.stat(self._abs(rel_dir)).st_mtime_ns
+                    except FileNotFoundError:
+                        self._drop_dir(rel_dir)
+                        rescanned += 1
+                        continue
+                    if mtime_ns != node.mtime_ns:
+                        rescanned += self._rescan_dir(rel_dir)
+
+            self._last_refresh = now
+            if rescanned:
+                logger.debug(f"FileIndex: rescanned {rescanned} dir(s) under {self.root}")
+            return rescanned
+
+    def _abs(self, rel_dir: str) -> str:
+        return os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+
+    def _scan_tree(self, rel_dir: str) -> int:
+        """Index rel_dir and everything below it (iterative, pruning ignored dirs)."""
+        count = 0
+        stack = [rel_dir]
+        while stack:
+            current = stack.pop()
+            subdirs = self._scan_dir(current)
+            count += 1
+            stack.extend(subdirs)
+        return count
+
+    def _scan_dir(self, rel_dir: str) -> list[str]:
+        """(Re)build a single directory node. Returns new subdirectories to index."""
+        abs_dir = self._abs(rel_dir)
+        try:
+            mtime_ns = os.stat(abs_dir).st_mtime_ns
+            entries = list(os.scandir(abs_dir))
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
+            self._drop_dir(rel_dir)
+            return []
+
+        node = _DirNode(mtime_ns=mtime_ns)
+        for entry in entries:
+            if is_hidden(entry.name):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name in IGNORED_DIRS:
+                        node.pruned.add(entry.name)
+                    else:
+                        node.dirs.add(entry.name)
+                elif entry.is_dir():
+                    node.pruned.add(entry.name)  # Symlinked dir: listed, never followed
+                elif entry.is_file():
+                    node.files.add(entry.name)
+            except OSError:
+                continue
+
+        old = self._dirs.get(rel_dir)
+        old_files = old.files if old else set()
+        for name in old_files - node.files:
+            self._unmap_file(_join(rel_dir, name), name)
+        for name in node.files - old_files:
+            self._map_file(_join(rel_dir, name), name)
+
+        self._dirs[rel_dir] = node
+        return [_join(rel_dir, d) for d in node.dirs if _join(rel_dir, d) not in self._dirs]
+
+    def _rescan_dir(self, rel_dir: str) -> int:
+        old_dirs = set(self._dirs[rel_dir].dirs)
+        new_subdirs = self._scan_dir(rel_dir)
+        node = self._dirs.get(rel_dir)
+        count = 1
+        for gone in old_dirs - (node.dirs if node else set()):
+            self._drop_dir(_join(rel_dir, gone))
+        for sub in new_subdirs:
+            count += self._scan_tree(sub)
+        return count
+
+    def _drop_dir(self, rel_dir: str):
+        """Remove a directory subtree from the index."""
+        prefix = rel_dir + "/"
+        for key in [k for k in self._dirs if k == rel_dir or k.startswith(prefix)]:
+            node = self._dirs.pop(key)
+            for name in node.files:
+                self._unmap_file(_join(key, name), name)
+
+    def _map_file(self, rel_path: str, name: str):
+        self._by_name.setdefault(name, set()).add(rel_path)
+        ext = os.path.splitext(name)[1]
+        if ext:
+            self._by_ext.setdefault(ext, set()).add(rel_path)
+
+    def _unmap_file(self, rel_path: str, name: str):
+        paths = self._by_name.get(name)
+        if paths:
+            paths.discard(rel_path)
+            if not paths:
+                del self._by_name[name]
+        ext = os.path.splitext(name)[1]
+        paths = self._by_ext.get(ext)
+        if paths:
+            paths.discard(rel_path)
+            if not paths:
+                del self._by_ext[ext]
+
+    # ========================================================================
+    # QUERIES
+    # ========================================================================
+
+    def glob(
+        self,
+        pattern: str,
+        under: str = "",
+        offset: int = 0,
+        limit: int = 50,
+        refresh: bool = True,
+    ) -> GlobPage:
+        """
+        Recursive glob over indexed files (rglob semantics), ranked and paginated.
+
+        Ranking: exact basename matches first, then shallower paths, then
+        alphabetical.
+
+        Args:
+            pattern: Glob like "*.py", "test_*.py", "tools/*.py"
+            under: Workspace-relative directory to restrict the search to
+            offset: Number of ranked results to skip
+            limit: Page size
+            refresh: Check for changes first (False if the caller just refreshed,
+                     e.g. via is_indexed(), so one query stats the tree once)
+
+        Returns:
+            GlobPage with workspace-relative posix paths
+        """
+        if refresh:
+            self.refresh()
+        under = _normalize_rel(under)
+        pattern = pattern.removeprefix("**/")
+
+        prefix = under + "/" if under else ""
+
+        with self._lock:
+            if "/" in pattern:
+                # Path patterns are matched relative to the search root
+                matched = [
+                    p
+                    for p in self._all_files()
+                    if p.startswith(prefix) and PurePosixPath(p[len(prefix) :]).match(pattern)
+                ]
+            elif not _WILDCARDS.intersection(pattern):
+                matched = list(self._by_name.get(pattern, ()))
+            elif (
+                pattern.startswith("*.")
+                and pattern.count(".") == 1
+                and not _WILDCARDS.intersection(pattern[1:])
+            ):
+                # Single-dot suffix: exactly the last extension (splitext). Multi-dot
+                # patterns like "*.test.py" fall through to fnmatch
+                matched = list(self._by_ext.get(pattern[1:], ()))
+            else:
+                matched = [
+                    path
+                    for name, paths in self._by_name.items()
+                    if fnmatch.fnmatchcase(name, pattern)
+                    for path in paths
+                ]
+
+        if prefix:
+            matched = [p for p in matched if p.startswith(prefix)]
+
+        basename = pattern.rsplit("/", 1)[-1]
+        matched.sort(key=lambda p: (p.rsplit("/", 1)[-1] != basename, p.count("/"), p))
+        return GlobPage(
+            paths=matched[offset : offset + limit], total=len(matched), offset=offset, limit=limit
+        )
+
+    def is_indexed(self, rel_dir: str) -> bool:
+        """True if rel_dir is part of the index (not missing, hidden or ignored)."""
+        self.refresh()
+        with self._lock:
+            return _normalize_rel(rel_dir) in self._dirs
+
+    def list_dir(self, rel_dir: str = "") -> tuple[list[str], list[str]] | None:
+        """
+        Direct children of an indexed directory.
+
+        Returns:
+            (dirs, files) sorted by name - pruned dirs included - or None if
+            the directory is not indexed (missing, hidden or ignored)
+        """
+        self.refresh()
+        with self._lock:
+            node = self._dirs.get(_normalize_rel(rel_dir))
+            if node is None:
+                return None
+            return sorted(node.dirs | node.pruned), sorted(node.files)
+
+    def _all_files(self) -> list[str]:
+        return [_join(d, name) for d, node in self._dirs.items() for name in node.files]
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "dirs": len(self._dirs),
+                "files": sum(len(n.files) for n in self._dirs.values()),
+            }
+
+
+def _join(rel_dir: str, name: str) -> str:
+    return f"{rel_dir}/{name}" if rel_dir else name
+
+
+def _normalize_rel(rel: str) -> str:
+    rel = PurePosixPath(rel).as_posix() if rel else ""
+    return "" if rel == "." else rel.strip("/")
+
+
+_indexes: dict[str, WorkspaceFileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(root: Path) -> WorkspaceFileIndex:
+    """Shared index per workspace root (built lazily on first query)."""
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = WorkspaceFileIndex(Path(key))
+            _indexes[key] = index
+        return index
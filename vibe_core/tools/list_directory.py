@@ -1,13 +1,15 @@
 """
 List Directory Tool for vibe-agency OS (ARCH-042).
 
-Empowers the agent to explore the filesystem "Senses".
+Empowers the agent to explore the filesystem "Senses". Indexed directories
+are answered from the shared WorkspaceFileIndex.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tools.file_index import get_file_index, is_hidden
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
@@ -84,16 +86,22 @@ class ListDirectoryTool(Tool):
             if not path.is_dir():
                 return ToolResult(success=False, error=f"Path is not a directory: {path}")
 
-            # List contents
-            items = []
-            for item in path.iterdir():
-                # Skip hidden files/dirs (simple security/noise filter)
-                if item.name.startswith(".") and item.name != ".vibe":
-                    # We might want to see .vibe, but generally skip .git, .env etc.
-                    continue
-
-                type_str = "DIR" if item.is_dir() else "FILE"
-                items.append(f"[{type_str}] {item.name}")
+            # List contents (index first, direct listing for ignored dirs)
+            listing = get_file_index(workspace_root).list_dir(
+                path.relative_to(workspace_root).as_posix()
+            )
+            if listing is not None:
+                dirs, files = listing
+                items = [f"[DIR] {name}" for name in dirs] + [f"[FILE] {name}" for name in files]
+            else:
+                items = []
+                for item in path.iterdir():
+                    # Skip hidden files/dirs (simple security/noise filter)
+                    if is_hidden(item.name):
+                        continue
+
+                    type_str = "DIR" if item.is_dir() else "FILE"
+                    items.append(f"[{type_str}] {item.name}")
 
             # Sort for deterministic output
             items.sort()
@@ -1,17 +1,22 @@
 """
 Search File Tool for vibe-agency OS (ARCH-042).
 
-Empowers the agent to find files by pattern.
+Empowers the agent to find files by pattern. Queries are answered from the
+shared WorkspaceFileIndex instead of walking the tree on every call.
 """
 
 import logging
 from pathlib import Path
 from typing import Any
 
+from vibe_core.tools.file_index import get_file_index, is_hidden
 from vibe_core.tools.tool_protocol import Tool, ToolResult
 
 logger = logging.getLogger(__name__)
 
+# Default page size (use "offset" to page through larger result sets)
+DEFAULT_LIMIT = 50
+
 
 class SearchFileTool(Tool):
     """
@@ -41,6 +46,16 @@ class SearchFileTool(Tool):
                 "required": False,
                 "description": "Root directory to search in (defaults to current working directory)",
             },
+            "limit": {
+                "type": "integer",
+                "required": False,
+                "description": f"Maximum results to return (default: {DEFAULT_LIMIT})",
+            },
+            "offset": {
+                "type": "integer",
+                "required": False,
+                "description": "Number of ranked results to skip (for paging)",
+            },
         }
 
     def validate(self, parameters: dict[str, Any]) -> None:
@@ -59,18 +74,27 @@ class SearchFileTool(Tool):
         if "path" in parameters and not isinstance(parameters["path"], str):
             raise TypeError("path must be a string")
 
+        for key in ("limit", "offset"):
+            if key in parameters:
+                value = parameters[key]
+                if not isinstance(value, int) or isinstance(value, bool) or value < 0:
+                    raise ValueError(f"{key} must be a non-negative integer")
+
     def execute(self, parameters: dict[str, Any]) -> ToolResult:
         """
         Execute file search.
 
         Args:
-            parameters: {"pattern": "*.py", "path": "optional/root"}
+            parameters: {"pattern": "*.py", "path": "optional/root", "limit": 50, "offset": 0}
 
         Returns:
-            ToolResult with list of matching file paths
+            ToolResult with ranked matching file paths (exact name matches first,
+            then shallower paths)
         """
         pattern = parameters["pattern"]
         path_str = parameters.get("path", ".")
+        limit = parameters.get("limit", DEFAULT_LIMIT)
+        offset = parameters.get("offset", 0)
 
         try:
             # Resolve search root
@@ -87,50 +111,60 @@ class SearchFileTool(Tool):
             if not search_root.exists():
                 return ToolResult(success=False, error=f"Path not found: {search_root}")
 
-            # Perform search (recursive)
-            # We use rglob for recursive search
-            matches = []
-
-            # Limit results to prevent overwhelming output
-            MAX_RESULTS = 50
-
-            for item in search_root.rglob(pattern):
-                # Security: Skip hidden directories like .git
-                if any(part.startswith(".") and part != ".vibe" for part in item.parts):
-                    continue
+            index = get_file_index(workspace_root)
+            rel_root = search_root.relative_to(workspace_root).as_posix()
 
-                if item.is_file():
-                    # Return relative path for readability
-                    try:
-                        rel_path = item.relative_to(workspace_root)
-                        matches.append(str(rel_path))
-                    except ValueError:
-                        # Should not happen given the security check, but safe fallback
-                        matches.append(str(item))
-
-                if len(matches) >= MAX_RESULTS:
-                    break
-
-            matches.sort()
+            if index.is_indexed(rel_root):  # Refreshes the index (once per query)
+                page = index.glob(
+                    pattern, under=rel_root, offset=offset, limit=limit, refresh=False
+                )
+                matches, total = page.paths, page.total
+            else:
+                # Ignored directory (e.g. node_modules): walk it directly
+                matches, total = self._walk(search_root, workspace_root, pattern, offset, limit)
 
             if not matches:
-                return ToolResult(success=True, output="No matches found.")
+                return ToolResult(
+                    success=True,
+                    output="No matches found.",
+                    metadata={"count": 0, "total": total, "truncated": False},
+                )
 
+            truncated = offset + len(matches) < total
             output = "\n".join(matches)
-            if len(matches) >= MAX_RESULTS:
-                output += f"\n\n(Truncated at {MAX_RESULTS} results)"
+            if truncated:
+                output += (
+                    f"\n\n(Showing {offset + 1}-{offset + len(matches)} of {total} results; "
+                    f"use offset={offset + len(matches)} for more)"
+                )
 
-            logger.info(
-                f"SearchFileTool: Found {len(matches)} matches for '{pattern}' in {search_root}"
-            )
+            logger.info(f"SearchFileTool: Found {total} matches for '{pattern}' in {search_root}")
 
             return ToolResult(
                 success=True,
                 output=output,
-                metadata={"count": len(matches), "truncated": len(matches) >= MAX_RESULTS},
+                metadata={
+                    "count": len(matches),
+                    "total": total,
+                    "offset": offset,
+                    "truncated": truncated,
+                },
             )
 
         except Exception as e:
             error_msg = f"Failed to search files: {type(e).__name__}: {e!s}"
             logger.error(f"SearchFileTool: {error_msg}", exc_info=True)
             return ToolResult(success=False, error=error_msg)
+
+    @staticmethod
+    def _walk(
+        search_root: Path, workspace_root: Path, pattern: str, offset: int, limit: int
+    ) -> tuple[list[str], int]:
+        """Unindexed fallback: rglob below search_root, skipping hidden parts."""
+        matches = sorted(
+            str(item.relative_to(workspace_root))
+            for item in search_root.rglob(pattern)
+            if item.is_file()
+            and not any(is_hidden(part) for part in item.relative_to(search_root).parts)
+        )
+        return matches[offset : offset + limit], len(matches)
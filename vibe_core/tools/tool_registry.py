@@ -6,9 +6,12 @@ Integrates Soul Governance (ARCH-029) for security by design.
 """
 
 import logging
+import time
 from typing import Optional
 
+from vibe_core.metrics import get_registry
 from vibe_core.tools.tool_protocol import Tool, ToolCall, ToolResult
+from vibe_core.tracing import span
 
 # Import Soul Governance (ARCH-029)
 try:
@@ -20,6 +23,13 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+_metrics = get_registry()
+TOOL_CALLS = _metrics.counter("vibe_tool_calls_total", "Tool calls by outcome", ("tool", "outcome"))
+TOOL_SECONDS = _metrics.histogram("vibe_tool_seconds", "Tool execution time", ("tool",))
+GOVERNANCE_BLOCKS = _metrics.counter(
+    "vibe_governance_blocks_total", "Tool calls blocked by governance", ("layer", "tool", "rule")
+)
+
 
 class ToolRegistry:
     """
@@ -168,6 +178,18 @@ class ToolRegistry:
             >>> result = registry.execute(call)
             >>> print(result.success)  # True
         """
+        started = time.perf_counter()
+        with span("tool.execute", tool=tool_call.tool_name) as sp:
+            result = self._execute(tool_call)
+            sp.set_attribute("success", result.success)
+            if not result.success:
+                sp.set_error(result.error or "tool failed")
+        TOOL_SECONDS.labels(tool_call.tool_name).observe(time.perf_counter() - started)
+        TOOL_CALLS.labels(tool_call.tool_name, "success" if result.success else "error").inc()
+        return result
+
+    def _execute(self, tool_call: ToolCall) -> ToolResult:
+        """Look up, govern, validate and run a tool call (see execute)."""
         tool_name = tool_call.tool_name
 
         # Step 1: Look up tool
@@ -183,10 +205,13 @@ class ToolRegistry:
 
         # Step 2: 🛡️ Soul Governance Check (ARCH-029)
         if self._invariant_checker:
-            soul_check: SoulResult = self._invariant_checker.check_tool_call(  # type: ignore
-                tool_name, tool_call.parameters
-            )
+            with span("governance.check", tool=tool_name) as check_span:
+                soul_check: SoulResult = self._invariant_checker.check_tool_call(  # type: ignore
+                    tool_name, tool_call.parameters
+                )
+                check_span.set_attribute("allowed", soul_check.allowed)
             if not soul_check.allowed:
+                GOVERNANCE_BLOCKS.labels("soul", tool_name, "invariant").inc()
                 logger.warning(f"⛔ SOUL BLOCKED {tool_name}: {soul_check.reason}")
                 return ToolResult(
                     success=False,
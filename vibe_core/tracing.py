@@ -0,0 +1,441 @@
+"""
+Structured tracing for vibe-agency OS.
+
+Lightweight in-process spans that show where a task spent its time.
+A span is opened with a context manager; the enclosing span is tracked in a
+ContextVar, so nested spans get their parent id without threading a handle
+through every call. Kernel, agents, tools, governance, prompt composition and
+providers open spans; finished spans land in a bounded ring buffer and in any
+attached sinks (JSONL file, SQLite database).
+
+The trace id of a kernel task is the task id, so `vibe trace <task_id>` can
+pull every span recorded for it and render a flame-style breakdown.
+
+Example:
+    >>> from vibe_core.tracing import span
+    >>> with span("tool.execute", tool="read_file") as sp:
+    ...     result = tool.execute(params)
+    ...     sp.set_attribute("success", result.success)
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+# Finished spans kept in memory (oldest are dropped first)
+RING_BUFFER_SIZE = 4096
+
+# Width of the timeline bar in format_trace()
+BAR_WIDTH = 30
+
+
+@dataclass
+class Span:
+    """One timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start: float  # Epoch seconds
+    duration_ms: float = 0.0
+    status: str = "OK"  # OK or ERROR
+    error: str | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException | str) -> None:
+        """Mark the span failed (for errors that are handled, not raised)."""
+        self.status = "ERROR"
+        if isinstance(error, BaseException):
+            self.error = f"{type(error).__name__}: {error}"
+        else:
+            self.error = error
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Span":
+        return cls(**data)
+
+
+class SpanSink(Protocol):
+    """Destination for finished spans."""
+
+    def write(self, span: Span) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class JsonlSpanSink:
+    """Appends finished spans to a JSONL file, one span per line."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def write(self, span: Span) -> None:
+        line = json.dumps(span.to_dict(), default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def read_trace(self, trace_id: str) -> list[Span]:
+        """All spans of a trace (full file scan)."""
+        with self._lock:
+            self._file.flush()
+        return read_jsonl_trace(self.path, trace_id)
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class SQLiteSpanSink:
+    """
+    Stores finished spans in a SQLite database.
+
+    Spans are indexed by trace id and by task id (the task_id attribute), so
+    a nested task can be looked up even though it shares its parent's trace.
+    """
+
+    def __init__(self, db_path: Path | str):
+        self.db_path = str(db_path)
+        if self.db_path != ":memory:":
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS spans (
+                span_id TEXT PRIMARY KEY,
+                trace_id TEXT NOT NULL,
+                parent_id TEXT,
+                task_id TEXT,
+                name TEXT NOT NULL,
+                start REAL NOT NULL,
+                duration_ms REAL NOT NULL,
+                status TEXT NOT NULL,
+                error TEXT,
+                attributes TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_spans_trace ON spans(trace_id);
+            CREATE INDEX IF NOT EXISTS idx_spans_task ON spans(task_id);
+            """
+        )
+        self.conn.commit()
+
+    def write(self, span: Span) -> None:
+        task_id = span.attributes.get("task_id")
+        with self._lock:
+            self.conn.execute(
+                """
+                INSERT OR REPLACE INTO spans
+                (span_id, trace_id, parent_id, task_id, name, start, duration_ms,
+                 status, error, attributes)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    span.span_id,
+                    span.trace_id,
+                    span.parent_id,
+                    str(task_id) if task_id is not None else None,
+                    span.name,
+                    span.start,
+                    span.duration_ms,
+                    span.status,
+                    span.error,
+                    json.dumps(span.attributes, default=str),
+                ),
+            )
+            self.conn.commit()
+
+    def read_trace(self, trace_id: str) -> list[Span]:
+        """
+        All spans of a trace, or of a task's subtree.
+
+        If trace_id is not a trace id but the task id of a nested task, the
+        spans under that task's outermost span are returned.
+        """
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM spans WHERE trace_id = ? ORDER BY start", (trace_id,)
+            ).fetchall()
+            if not rows:
+                task_rows = self.conn.execute(
+                    "SELECT trace_id FROM spans WHERE task_id = ? LIMIT 1", (trace_id,)
+                ).fetchall()
+                if task_rows:
+                    rows = self.conn.execute(
+                        "SELECT * FROM spans WHERE trace_id = ? ORDER BY start",
+                        (task_rows[0]["trace_id"],),
+                    ).fetchall()
+                    spans = [self._row_to_span(row) for row in rows]
+                    return task_subtree(spans, trace_id)
+        return [self._row_to_span(row) for row in rows]
+
+    @staticmethod
+    def _row_to_span(row: sqlite3.Row) -> Span:
+        return Span(
+            name=row["name"],
+            trace_id=row["trace_id"],
+            span_id=row["span_id"],
+            parent_id=row["parent_id"],
+            start=row["start"],
+            duration_ms=row["duration_ms"],
+            status=row["status"],
+            error=row["error"],
+            attributes=json.loads(row["attributes"]),
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
+
+
+class Tracer:
+    """
+    Creates spans and hands finished spans to the ring buffer and sinks.
+
+    Recording is cheap (a dataclass, two clock reads and a deque append), so
+    the tracer stays on by default. Sink failures are logged, never raised.
+    """
+
+    def __init__(self, buffer_size: int = RING_BUFFER_SIZE):
+        self.enabled = True
+        self._buffer: deque[Span] = deque(maxlen=buffer_size)
+        self._sinks: list[SpanSink] = []
+        self._current: ContextVar[Span | None] = ContextVar("vibe_current_span", default=None)
+
+    def add_sink(self, sink: SpanSink) -> None:
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: SpanSink) -> None:
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    @property
+    def sinks(self) -> list[SpanSink]:
+        return list(self._sinks)
+
+    def current_span(self) -> Span | None:
+        return self._current.get()
+
+    @contextmanager
+    def span(self, name: str, trace_id: str | None = None, **attributes: Any) -> Iterator[Span]:
+        """
+        Time the enclosed block as a span.
+
+        Args:
+            name: Dotted operation name (e.g. "kernel.execute_task")
+            trace_id: Trace to start if there is no enclosing span. Nested
+                      spans always join their parent's trace.
+            **attributes: Initial span attributes
+
+        Yields:
+            The open Span (set attributes or mark errors on it)
+        """
+        parent = self._current.get()
+        if parent is not None:
+            trace_id = parent.trace_id
+        elif trace_id is None:
+            trace_id = _new_id()
+
+        sp = Span(
+            name=name,
+            trace_id=str(trace_id),
+            span_id=_new_id(),
+            parent_id=parent.span_id if parent is not None else None,
+            start=time.time(),
+            attributes=attributes,
+        )
+        token = self._current.set(sp)
+        started = time.perf_counter()
+        try:
+            yield sp
+        except BaseException as e:
+            sp.set_error(e)
+            raise
+        finally:
+            sp.duration_ms = (time.perf_counter() - started) * 1000
+            self._current.reset(token)
+            if self.enabled:
+                self._finish(sp)
+
+    def _finish(self, sp: Span) -> None:
+        self._buffer.append(sp)
+        for sink in self._sinks:
+            try:
+                sink.write(sp)
+            except Exception as e:
+                logger.warning(f"TRACING: Sink {type(sink).__name__} failed: {e}")
+
+    def recent_spans(self, limit: int | None = None) -> list[Span]:
+        """Finished spans from the ring buffer, oldest first."""
+        spans = list(self._buffer)
+        return spans[-limit:] if limit else spans
+
+    def get_trace(self, trace_id: str) -> list[Span]:
+        """Spans of a trace (or task subtree) still held in the ring buffer."""
+        spans = [sp for sp in self._buffer if sp.trace_id == trace_id]
+        if not spans:
+            for sp in self._buffer:
+                if sp.attributes.get("task_id") == trace_id:
+                    related = [s for s in self._buffer if s.trace_id == sp.trace_id]
+                    return task_subtree(related, trace_id)
+        return sorted(spans, key=lambda s: s.start)
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+
+def _new_id() -> str:
+    return os.urandom(8).hex()
+
+
+def task_subtree(spans: list[Span], task_id: str) -> list[Span]:
+    """The outermost span tagged with task_id, plus everything below it."""
+    tagged = [sp for sp in spans if sp.attributes.get("task_id") == task_id]
+    if not tagged:
+        return []
+    tagged_ids = {sp.span_id for sp in tagged}
+    roots = {sp.span_id for sp in tagged if sp.parent_id not in tagged_ids}
+
+    children: dict[str | None, list[Span]] = {}
+    for sp in spans:
+        children.setdefault(sp.parent_id, []).append(sp)
+
+    result: list[Span] = []
+    stack = [sp for sp in tagged if sp.span_id in roots]
+    while stack:
+        sp = stack.pop()
+        result.append(sp)
+        stack.extend(children.get(sp.span_id, []))
+    return sorted(result, key=lambda s: s.start)
+
+
+def read_jsonl_trace(path: Path | str, trace_id: str) -> list[Span]:
+    """Read the spans of a trace (or task subtree) from a JSONL span file."""
+    path = Path(path)
+    if not path.exists():
+        return []
+
+    spans: list[Span] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                spans.append(Span.from_dict(json.loads(line)))
+            except (ValueError, TypeError):
+                continue  # Torn write at the end of the file
+
+    matching = [sp for sp in spans if sp.trace_id == trace_id]
+    if matching:
+        return sorted(matching, key=lambda s: s.start)
+
+    for sp in spans:
+        if sp.attributes.get("task_id") == trace_id:
+            related = [s for s in spans if s.trace_id == sp.trace_id]
+            return task_subtree(related, trace_id)
+    return []
+
+
+def format_trace(spans: list[Span], bar_width: int = BAR_WIDTH) -> str:
+    """
+    Render spans as an indented, flame-style timeline.
+
+    Each line shows the span name, total and self time (total minus direct
+    children), share of the trace, and a bar placed on the trace timeline.
+
+    Example output:
+        kernel.tick              1203.4 ms  self    0.2 ms 100.0% |##############################|
+          kernel.execute_task    1203.2 ms  self    1.1 ms 100.0% |##############################|
+            agent.process        1202.1 ms  self    3.0 ms  99.9% |##############################|
+              provider.invoke    1199.1 ms  self 1199.1 ms  99.6% | #############################|
+    """
+    if not spans:
+        return "(no spans)"
+
+    ids = {sp.span_id for sp in spans}
+    children: dict[str | None, list[Span]] = {}
+    for sp in spans:
+        parent = sp.parent_id if sp.parent_id in ids else None
+        children.setdefault(parent, []).append(sp)
+    for siblings in children.values():
+        siblings.sort(key=lambda s: s.start)
+
+    # The trace spans its root spans. Starts are wall-clock and durations are
+    # monotonic, so children may overhang their root slightly: clamp below.
+    roots = children.get(None, [])
+    trace_start = min(sp.start for sp in spans)
+    total_ms = max(max((sp.start - trace_start) * 1000 + sp.duration_ms for sp in roots), 1e-6)
+
+    rows: list[tuple[str, Span, float]] = []
+
+    def walk(sp: Span, depth: int) -> None:
+        kids = children.get(sp.span_id, [])
+        self_ms = max(sp.duration_ms - sum(k.duration_ms for k in kids), 0.0)
+        rows.append(("  " * depth + sp.name, sp, self_ms))
+        for kid in kids:
+            walk(kid, depth + 1)
+
+    for root in roots:
+        walk(root, 0)
+
+    label_width = max(len(label) for label, _, _ in rows)
+    lines = [f"Trace {spans[0].trace_id}: {len(spans)} span(s), {total_ms:.1f} ms"]
+    for label, sp, self_ms in rows:
+        offset = int((sp.start - trace_start) * 1000 / total_ms * bar_width)
+        width = min(max(1, round(sp.duration_ms / total_ms * bar_width)), bar_width)
+        offset = min(offset, bar_width - width)
+        bar = " " * offset + "#" * width + " " * (bar_width - offset - width)
+        share = min(sp.duration_ms / total_ms * 100, 100.0)
+        line = (
+            f"{label:<{label_width}}  {sp.duration_ms:9.1f} ms  self {self_ms:9.1f} ms "
+            f"{share:5.1f}% |{bar}|"
+        )
+        if sp.status != "OK":
+            line += f"  !! {sp.error}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+# Process-wide tracer
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer."""
+    return _tracer
+
+
+def span(name: str, trace_id: str | None = None, **attributes: Any):
+    """Open a span on the process-wide tracer (see Tracer.span)."""
+    return _tracer.span(name, trace_id=trace_id, **attributes)
+
+
+def current_span() -> Span | None:
+    """The innermost open span in this context, if any."""
+    return _tracer.current_span()